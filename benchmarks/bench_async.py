@@ -0,0 +1,53 @@
+"""Load test: event-loop latency while AsyncRenderer renders decks.
+
+    python benchmarks/bench_async.py [decks] [concurrency]
+
+A probe coroutine sleeps 5 ms in a loop and records how late it wakes up;
+the lag percentiles are what an asyncio web front end would add to every
+request while decks render.
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [ROOT, os.path.join(ROOT, "tests")]
+
+from slide_engine import AsyncRenderer
+from test_integration import GPEC_PLAN
+
+TICK = 0.005
+
+
+async def _probe(stop, lags):
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(TICK)
+        lags.append(time.perf_counter() - start - TICK)
+
+
+async def _run(executor, decks, concurrency):
+    async with AsyncRenderer(executor, max_concurrency=concurrency) as renderer:
+        await renderer.render(GPEC_PLAN)  # warm up workers
+        stop, lags = asyncio.Event(), []
+        probe = asyncio.ensure_future(_probe(stop, lags))
+        start = time.perf_counter()
+        await asyncio.gather(*(renderer.render(GPEC_PLAN) for _ in range(decks)))
+        elapsed = time.perf_counter() - start
+        stop.set()
+        await probe
+    lags.sort()
+    pct = lambda q: lags[min(len(lags) - 1, int(len(lags) * q))] * 1000
+    print(f"{executor:8} {decks} decks in {elapsed:.2f}s ({decks / elapsed:.1f} decks/s) "
+          f"loop lag p50 {pct(0.5):.1f} ms, p99 {pct(0.99):.1f} ms, max {lags[-1] * 1000:.1f} ms")
+
+
+def main(decks=16, concurrency=4):
+    for executor in ("thread", "process"):
+        asyncio.run(_run(executor, decks, concurrency))
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:]))
@@ -0,0 +1,46 @@
+"""A class submitting near-identical plans: coalescing and the result cache.
+
+    python benchmarks/bench_coalesce.py [requests] [distinct] [concurrency]
+
+`requests` render requests (default 120) for `distinct` different plans
+(default 6, variants of the GPEC plan) arrive in waves of `concurrency`
+(default 8) through AsyncRenderer: without coalescing, coalescing
+concurrent identical requests, and with a 64 MB result cache as well.
+"""
+
+import asyncio
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [ROOT, os.path.join(ROOT, "tests")]
+
+from slide_engine import AsyncRenderer
+from test_integration import GPEC_PLAN
+
+
+async def _run(requests, plans, concurrency, **options):
+    rng = random.Random(0)
+    async with AsyncRenderer(max_workers=2, **options) as renderer:
+        start = time.perf_counter()
+        for wave in range(0, requests, concurrency):
+            batch = [rng.choice(plans) for _ in range(min(concurrency, requests - wave))]
+            await asyncio.gather(*(renderer.render(plan) for plan in batch))
+        return time.perf_counter() - start, renderer.stats()
+
+
+def main(requests=120, distinct=6, concurrency=8):
+    plans = [dict(GPEC_PLAN, title=f"{GPEC_PLAN['title']} — groupe {i}")
+             for i in range(distinct)]
+    print(f"{requests} requests, {distinct} distinct plans, waves of {concurrency}")
+    for label, options in (("no coalescing", {}), ("coalescing", {"coalesce": True}),
+                           ("coalescing + cache", {"cache_bytes": 64 * 2**20})):
+        elapsed, stats = asyncio.run(_run(requests, plans, concurrency, **options))
+        detail = ", ".join(f"{k} {v}" for k, v in stats.items() if k not in ("max_bytes",))
+        print(f"  {label:<20} {elapsed:>6.2f} s  {requests / elapsed:>6.1f} req/s  ({detail})")
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:]))
@@ -0,0 +1,57 @@
+"""Handouts for many decks: from plans, from decks, and through python-pptx.
+
+    python benchmarks/bench_handout.py [decks]
+
+`decks` copies of the GPEC deck (default 200, 24 slides each, notes and
+charts included) get a Markdown handout three ways: from their plan, from
+the .pptx bytes with deck_slides() (lazy zip + iterparse), and by opening
+each deck with python-pptx and walking its text frames and notes. The
+render itself is timed for reference.
+"""
+
+import io
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [ROOT, os.path.join(ROOT, "tests")]
+
+from pptx import Presentation
+
+from slide_engine import render_plan_bytes
+from slide_engine.handout import deck_slides, handout, plan_slides
+from test_integration import GPEC_PLAN
+
+
+def _python_pptx(data):
+    out = []
+    for slide in Presentation(io.BytesIO(data)).slides:
+        out += [shape.text_frame.text for shape in slide.shapes if shape.has_text_frame]
+        if slide.has_notes_slide:
+            out.append(slide.notes_slide.notes_text_frame.text)
+    return "\n".join(out)
+
+
+def _timed(label, fn, count, reference=None):
+    start = time.perf_counter()
+    for _ in range(count):
+        fn()
+    per_deck = (time.perf_counter() - start) / count
+    ratio = f"  {100 * per_deck / reference:.1f}% of a render" if reference else ""
+    print(f"{label:<22} {per_deck * 1e3:>8.2f} ms/deck{ratio}")
+    return per_deck
+
+
+def main(decks=200):
+    data = render_plan_bytes(GPEC_PLAN)
+    print(f"{decks} decks of {len(GPEC_PLAN['slides'])} slides, {len(data) / 1e3:.0f} KB each")
+    render = _timed("render", lambda: render_plan_bytes(GPEC_PLAN), max(1, decks // 10))
+    _timed("handout from plan", lambda: "".join(handout(plan_slides(GPEC_PLAN))), decks, render)
+    _timed("handout from deck",
+           lambda: "".join(handout(deck_slides(io.BytesIO(data)))), decks, render)
+    _timed("python-pptx text", lambda: _python_pptx(data), max(1, decks // 10), render)
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:]))
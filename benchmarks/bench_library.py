@@ -0,0 +1,66 @@
+"""Slide library at scale: ingest, full-text search and splicing.
+
+    python benchmarks/bench_library.py [slides] [splice]
+
+Fills an on-disk library with `slides` slides (default 50000) by ingesting
+the rendered GPEC deck repeatedly, then times FTS5 searches and the render
+of a plan splicing `splice` library slides (default 20) between rendered
+ones, against rendering the same slides from their plan fragments.
+"""
+
+import io
+import os
+import random
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [ROOT, os.path.join(ROOT, "tests")]
+
+from slide_engine import render_plan
+from slide_engine.library import SlideLibrary
+from test_integration import GPEC_PLAN
+
+QUERIES = ["turnover", "compétences", "plan de succession", "title:GPEC", "effectifs NOT CDI"]
+
+
+def main(slides=50000, splice=20):
+    out = io.BytesIO()
+    render_plan(GPEC_PLAN).save(out)
+    deck = out.getvalue()
+    per_deck = len(GPEC_PLAN["slides"])
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "slides.db")
+        with SlideLibrary(path) as library:
+            start = time.perf_counter()
+            for i in range(-(-slides // per_deck)):
+                library.ingest(io.BytesIO(deck), GPEC_PLAN, name=f"deck{i}.pptx")
+            elapsed = time.perf_counter() - start
+            count = len(library)
+            print(f"ingest: {count} slides in {elapsed:.1f} s ({elapsed / count * 1e3:.2f} ms/slide), "
+                  f"database {os.path.getsize(path) / 1e6:.0f} MB")
+
+        with SlideLibrary(path) as library:
+            for query in QUERIES:
+                start = time.perf_counter()
+                for _ in range(20):
+                    hits = library.search(query)
+                print(f"search {query!r:<24} {(time.perf_counter() - start) / 20 * 1e3:>7.2f} ms "
+                      f"({len(hits)} hits)")
+
+            ids = random.Random(0).sample(range(1, count + 1), splice)
+            fragments = [library.get(slide_id).spec for slide_id in ids]
+            title = {"layout": "title", "title": "Formation"}
+            start = time.perf_counter()
+            library.render_plan({"slides": [title] + [{"layout": "library", "id": i} for i in ids]})
+            spliced = time.perf_counter() - start
+            start = time.perf_counter()
+            render_plan({"slides": [title] + fragments})
+            rendered = time.perf_counter() - start
+            print(f"{splice} slides: spliced {spliced * 1e3:.0f} ms, "
+                  f"rendered from their plan fragments {rendered * 1e3:.0f} ms")
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:]))
@@ -0,0 +1,55 @@
+"""Mail-merge throughput: the GPEC plan personalised for N employees.
+
+    python benchmarks/bench_mailmerge.py [records]
+
+Two of the 24 slides use placeholders (title subtitle and key stat); the
+baseline renders the whole filled-in plan per record.
+"""
+
+import copy
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [ROOT, os.path.join(ROOT, "tests")]
+
+from slide_engine import render_plan_bytes
+from slide_engine.mailmerge import MailMerge, fill
+from test_integration import GPEC_PLAN
+
+
+def _plan():
+    plan = copy.deepcopy(GPEC_PLAN)
+    plan["slides"][0]["subtitle"] = "Préparé pour {{name}} ({{team}})"
+    plan["slides"][3]["stat"] = "{{score}}"
+    return plan
+
+
+def _records(count):
+    for i in range(count):
+        yield {"name": f"Salarié {i}", "team": f"Équipe {i % 40}", "score": f"{i % 100}%"}
+
+
+def main(count=10000):
+    plan = _plan()
+    baseline = 20
+    start = time.perf_counter()
+    for record in _records(baseline):
+        render_plan_bytes(fill(plan, record))
+    full = (time.perf_counter() - start) / baseline
+
+    start = time.perf_counter()
+    merge = MailMerge(plan)
+    compiled = time.perf_counter() - start
+    start = time.perf_counter()
+    total = sum(len(data) for _, data in merge.render_all(_records(count)))
+    elapsed = time.perf_counter() - start
+    print(f"full render per record: {full * 1000:.1f} ms")
+    print(f"mail merge: compile {compiled * 1000:.0f} ms, {count} records in {elapsed:.1f}s "
+          f"({count / elapsed:.1f} decks/s, {elapsed / count * 1000:.1f} ms/deck, "
+          f"{total / count / 1024:.0f} KiB/deck) -> {full * count / elapsed:.1f}x")
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:]))
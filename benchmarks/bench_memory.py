@@ -0,0 +1,36 @@
+"""Soak run: thousands of decks in one process under the memory profile.
+
+    python benchmarks/bench_memory.py [decks] [slides] [sample_every]
+
+Prints the residual traced memory every `sample_every` decks, the growth per
+deck over the second half of the run and the peak RSS, and writes the full
+report (per layout and helper) to memory-report.txt.
+"""
+
+import os
+import resource
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [ROOT, os.path.join(ROOT, "tests")]
+
+from slide_engine.memprofile import soak
+from slide_engine.samples import generate_plan
+
+
+def main(decks=3000, slides=6, sample_every=250):
+    plans = [generate_plan(seed, slides) for seed in range(100)]
+    start = time.perf_counter()
+    profile = soak(plans, decks, sample_every, report="memory-report.txt")
+    elapsed = time.perf_counter() - start
+    for n, size in profile.residual:
+        print(f"after {n:>6} decks: {size / 1024:>9.1f} KiB traced")
+    (mid_n, mid), (end_n, end) = profile.residual[len(profile.residual) // 2], profile.residual[-1]
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f"{decks} decks x {slides} slides in {elapsed:.1f}s; second half growth "
+          f"{(end - mid) / max(end_n - mid_n, 1):.0f} B/deck; peak RSS {rss:.0f} MiB")
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:]))
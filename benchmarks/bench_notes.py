@@ -0,0 +1,54 @@
+"""Speaker notes: python-pptx's per-slide path against write_notes().
+
+    python benchmarks/bench_notes.py [slides...]
+
+Both build a deck of blank slides and give each one a notes paragraph. The
+per-slide path reads `slide.notes_slide` (a new notes part, found a free
+partname by scanning the package, placeholders cloned from the master);
+write_notes() clones once and scans once.
+"""
+
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [ROOT, os.path.join(ROOT, "tests")]
+
+from slide_engine import create_presentation
+from slide_engine.engine import _add_blank_slide
+from slide_engine.notes import write_notes
+
+NOTES = "Détailler chaque enjeu avec des exemples concrets de l'entreprise."
+
+
+def _deck(count):
+    prs = create_presentation()
+    return prs, [_add_blank_slide(prs) for _ in range(count)]
+
+
+def per_slide(count):
+    prs, slides = _deck(count)
+    start = time.perf_counter()
+    for slide in slides:
+        slide.notes_slide.notes_text_frame.text = NOTES
+    return time.perf_counter() - start
+
+
+def bulk(count):
+    prs, slides = _deck(count)
+    start = time.perf_counter()
+    write_notes(prs, [(slide, NOTES) for slide in slides])
+    return time.perf_counter() - start
+
+
+def main(*counts):
+    for count in counts or (50, 200, 1000):
+        slow, fast = per_slide(count), bulk(count)
+        print(f"{count:>5} slides: per-slide {slow * 1000:8.1f} ms "
+              f"({slow / count * 1000:.2f} ms/slide), write_notes {fast * 1000:7.1f} ms "
+              f"({fast / count * 1000:.3f} ms/slide), x{slow / fast:.0f}")
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:]))
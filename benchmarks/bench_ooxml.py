@@ -0,0 +1,55 @@
+"""Render + save: python-pptx shapes against slide XML written directly.
+
+    python benchmarks/bench_ooxml.py [repeats]
+
+The GPEC plan is repeated `repeats` times (default 10) and rendered to
+bytes with each backend, once as is and once without its two chart slides
+(each chart embeds a workbook written by xlsxwriter, the same cost for both
+backends). Both backends write the same parts; render and save are timed
+separately.
+"""
+
+import io
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [ROOT, os.path.join(ROOT, "tests")]
+
+from slide_engine import render_plan
+from slide_engine.ooxml import render_plan_ooxml
+from test_integration import GPEC_PLAN
+
+
+def best_of(fn, rounds=3):
+    times = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def _timings(render, plan):
+    deck = render(plan)
+    return best_of(lambda: render(plan)), best_of(lambda: deck.save(io.BytesIO()))
+
+
+def main(repeats=10):
+    no_charts = [s for s in GPEC_PLAN["slides"] if not s["layout"].endswith("_chart")]
+    for label, specs in (("with charts", GPEC_PLAN["slides"]), ("without charts", no_charts)):
+        plan = {"slides": specs * repeats}
+        print(f"{len(plan['slides'])} slides, {label}")
+        baseline = None
+        for backend, render in (("pptx", lambda p: render_plan(p, validate=False)),
+                                ("ooxml", lambda p: render_plan_ooxml(p, validate=False))):
+            build, save = _timings(render, plan)
+            total = build + save
+            baseline = baseline or total
+            print(f"  {backend:<6} render {build * 1e3:>7.0f} ms  save {save * 1e3:>7.0f} ms  "
+                  f"total {total * 1e3:>7.0f} ms  x{baseline / total:.2f}")
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:]))
@@ -0,0 +1,77 @@
+"""Updating one figure of a big deck: full round trip against open_for_patch().
+
+    python benchmarks/bench_patch.py [repeats...]
+
+The GPEC plan is repeated to build decks of growing size, then the bar chart
+data of one slide is replaced three ways:
+
+  python-pptx   Presentation(path), chart.replace_data(), prs.save()
+  eager         Package.open() (every member inflated), set_chart_data(), save()
+  patch         open_for_patch(), set_chart_data(), save(): untouched members
+                are copied compressed
+"""
+
+import io
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [ROOT, os.path.join(ROOT, "tests")]
+
+from pptx import Presentation
+from pptx.chart.data import CategoryChartData
+
+from slide_engine import render_plan
+from slide_engine.package import Package
+from slide_engine.patch import open_for_patch, set_chart_data
+from test_integration import GPEC_PLAN
+
+CATEGORIES, VALUES = ["2022", "2023", "2024"], [41, 38, 35]
+BAR_CHART = [spec["layout"] for spec in GPEC_PLAN["slides"]].index("bar_chart")
+
+
+def python_pptx(data):
+    prs = Presentation(io.BytesIO(data))
+    chart = next(s for s in prs.slides[BAR_CHART].shapes if s.has_chart).chart
+    chart_data = CategoryChartData()
+    chart_data.categories = CATEGORIES
+    chart_data.add_series("", VALUES)
+    chart.replace_data(chart_data)
+    prs.save(io.BytesIO())
+
+
+def eager(data):
+    pkg = Package.open(io.BytesIO(data))
+    set_chart_data(pkg, BAR_CHART, CATEGORIES, VALUES)
+    pkg.save(io.BytesIO())
+
+
+def patch(data):
+    pkg = open_for_patch(io.BytesIO(data))
+    set_chart_data(pkg, BAR_CHART, CATEGORIES, VALUES)
+    pkg.save(io.BytesIO())
+
+
+def best_of(fn, data, rounds=3):
+    times = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn(data)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main(*repeats):
+    print(f"{'slides':>6}  {'MB':>5}  {'python-pptx':>11}  {'eager':>8}  {'patch':>8}   ms")
+    for repeat in repeats or (1, 10, 50):
+        out = io.BytesIO()
+        render_plan({"slides": GPEC_PLAN["slides"] * repeat}).save(out)
+        data = out.getvalue()
+        cells = [best_of(fn, data) * 1000 for fn in (python_pptx, eager, patch)]
+        print(f"{len(GPEC_PLAN['slides']) * repeat:>6}  {len(data) / 1e6:>5.1f}  "
+              f"{cells[0]:>11.1f}  {cells[1]:>8.1f}  {cells[2]:>8.1f}")
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:]))
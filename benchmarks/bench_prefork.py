@@ -0,0 +1,67 @@
+"""Worker start-up: spawned, forked cold, and forked from a warmed parent.
+
+    python benchmarks/bench_prefork.py [decks] [rounds]
+
+Each round starts a one-worker pool and times its first GPEC deck (worker
+start-up included), then `decks` more decks (default 20). Spawned workers
+start a new interpreter and import everything; forked workers inherit the
+imports but not the warmed caches, unless forked by PreforkPool. PreforkPool
+is also run replacing its worker after every deck, the worst case of
+recycling, and reports the fork-to-ready time of its workers.
+"""
+
+import multiprocessing
+import os
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [ROOT, os.path.join(ROOT, "tests")]
+
+from slide_engine import render_plan_bytes
+from slide_engine.prefork import PreforkPool
+from test_integration import GPEC_PLAN
+
+
+def _round(pool, decks):
+    with pool:
+        start = time.perf_counter()
+        pool.submit(render_plan_bytes, GPEC_PLAN, False).result()
+        first = time.perf_counter() - start
+        start = time.perf_counter()
+        for future in [pool.submit(render_plan_bytes, GPEC_PLAN, False) for _ in range(decks)]:
+            future.result()
+        return first, (time.perf_counter() - start) / max(1, decks)
+
+
+def _report(label, make_pool, decks, rounds):
+    runs = [_round(make_pool(), decks) for _ in range(rounds)]
+    first = statistics.median(f for f, _ in runs)
+    steady = statistics.median(s for _, s in runs)
+    print(f"{label:<28} first deck {first * 1e3:>7.1f} ms  then {steady * 1e3:>6.1f} ms/deck")
+
+
+def main(decks=20, rounds=3):
+    # The plain fork must run before anything renders (and warms) this process
+    _report("fork, cold caches", lambda: ProcessPoolExecutor(
+        1, mp_context=multiprocessing.get_context("fork")), decks, 1)
+    _report("spawn", lambda: ProcessPoolExecutor(
+        1, mp_context=multiprocessing.get_context("spawn")), decks, rounds)
+    pools = []
+
+    def prefork(max_decks):
+        pools.append(PreforkPool(1, max_decks, warm=not pools))
+        return pools[-1]
+
+    _report("prefork", lambda: prefork(None), decks, rounds)
+    _report("prefork, recycled each deck", lambda: prefork(1), decks, rounds)
+    spawn_times = [t for pool in pools for t in pool.spawn_times]
+    print(f"parent warm-up {pools[0].warm_time * 1e3:.0f} ms (once); "
+          f"prefork worker spawn median {statistics.median(spawn_times) * 1e3:.1f} ms, "
+          f"max {max(spawn_times) * 1e3:.1f} ms over {len(spawn_times)} workers")
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:]))
@@ -0,0 +1,51 @@
+"""Saving big decks: python-pptx against parts compressed in a thread pool.
+
+    python benchmarks/bench_save.py [repeats] [threads...]
+
+The GPEC plan (charts with embedded workbooks included) is repeated
+`repeats` times (default 20), then saved with prs.save() and with
+save_parallel() for each thread count (default 1 2 4 8). Every variant
+writes the same members in the same order; only the wall time changes.
+zlib releases the GIL while deflating, so the speed-up is bounded by the
+number of CPUs (printed first) and by the share of parts under
+POOL_MIN_SIZE, which are still deflated inline.
+"""
+
+import io
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [ROOT, os.path.join(ROOT, "tests")]
+
+from slide_engine import render_plan
+from slide_engine.package import POOL_MIN_SIZE, presentation_members, save_parallel
+from test_integration import GPEC_PLAN
+
+
+def best_of(fn, rounds=3):
+    times = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main(repeats=20, *threads):
+    prs = render_plan({"slides": GPEC_PLAN["slides"] * repeats})
+    members = presentation_members(prs)
+    pooled = sum(len(blob) for _, blob in members if len(blob) >= POOL_MIN_SIZE)
+    total = sum(len(blob) for _, blob in members)
+    print(f"{os.cpu_count()} CPU(s); {len(prs.slides)} slides, {len(members)} members, "
+          f"{total / 1e6:.1f} MB uncompressed ({100 * pooled / total:.0f}% in pooled members)")
+    baseline = best_of(lambda: prs.save(io.BytesIO()))
+    print(f"{'prs.save()':<14} {baseline * 1e3:>8.0f} ms")
+    for count in threads or (1, 2, 4, 8):
+        elapsed = best_of(lambda: save_parallel(prs, io.BytesIO(), count))
+        print(f"{f'{count} thread(s)':<14} {elapsed * 1e3:>8.0f} ms  x{baseline / elapsed:.2f}")
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:]))
@@ -0,0 +1,66 @@
+"""Shape-heavy slides: per-shape adds against SlideBuilder.
+
+    python benchmarks/bench_shapes.py [shapes...]
+
+Each slide gets N shapes, alternately a labelled oval and a textbox (a team
+grid). Three paths are timed:
+
+  python-pptx   the engine helpers with python-pptx's default id allocation
+                (every add scans the slide for the highest id)
+  helpers       the engine helpers on an engine slide (ids from a counter)
+  builder       SlideBuilder: one XML string parsed once, sequential ids
+"""
+
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [ROOT, os.path.join(ROOT, "tests")]
+
+from pptx.util import Inches
+
+from slide_engine import create_presentation, design as D
+from slide_engine.builder import SlideBuilder
+from slide_engine.engine import _add_blank_slide, _add_oval, _add_textbox
+
+SIZE = Inches(0.5)
+
+
+def _positions(count):
+    for i in range(count // 2):
+        yield Inches(0.1 + (i % 20) * 0.65), Inches(0.1 + (i // 20 % 10) * 0.7), f"M{i}"
+
+
+def helpers(count, turbo=True):
+    slide = _add_blank_slide(create_presentation())
+    slide.shapes.turbo_add_enabled = turbo
+    start = time.perf_counter()
+    for left, top, label in _positions(count):
+        _add_oval(slide, left, top, SIZE, SIZE, D.NAVY, label, D.SMALL_SIZE)
+        _add_textbox(slide, left, top + SIZE, SIZE, SIZE, label, D.SMALL_SIZE)
+    return time.perf_counter() - start
+
+
+def builder(count):
+    slide = _add_blank_slide(create_presentation())
+    start = time.perf_counter()
+    build = SlideBuilder(slide)
+    for left, top, label in _positions(count):
+        build.oval(left, top, SIZE, SIZE, D.NAVY, label, D.SMALL_SIZE)
+        build.textbox(left, top + SIZE, SIZE, SIZE, label, D.SMALL_SIZE)
+    build.build()
+    return time.perf_counter() - start
+
+
+def main(*counts):
+    print(f"{'shapes':>6}  {'python-pptx':>12}  {'helpers':>12}  {'builder':>12}   (us/shape)")
+    for count in counts or (10, 100, 1000):
+        rounds = max(1, 2000 // count)
+        times = [min(fn(count) for _ in range(rounds)) / count * 1e6
+                 for fn in (lambda n: helpers(n, False), helpers, builder)]
+        print(f"{count:>6}  " + "  ".join(f"{t:>12.1f}" for t in times))
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:]))
@@ -0,0 +1,68 @@
+"""Appending slides to big decks: python-pptx against add_slides().
+
+    python benchmarks/bench_slides.py [slides...]
+
+python-pptx's `prs.slides.add_slide()` finds each new slide id, rId and the
+relationship to reuse by scanning the deck, so total time grows
+quadratically; add_slides() takes them from counters. Three paths:
+
+  python-pptx   prs.slides.add_slide(layout), one slide at a time
+  per slide     add_slides(prs, layout), one slide at a time (as the layouts do)
+  reserved      add_slides(prs, layout, N), all slides at once
+
+python-pptx is only timed up to MAX_BASELINE slides (it takes minutes at 5000).
+"""
+
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [ROOT, os.path.join(ROOT, "tests")]
+
+from slide_engine import add_slides, create_presentation
+
+MAX_BASELINE = 2000
+
+
+def python_pptx(count):
+    prs = create_presentation()
+    layout = prs.slide_layouts[6]
+    start = time.perf_counter()
+    for _ in range(count):
+        prs.slides.add_slide(layout)
+    return time.perf_counter() - start
+
+
+def per_slide(count):
+    prs = create_presentation()
+    layout = prs.slide_layouts[6]
+    start = time.perf_counter()
+    for _ in range(count):
+        add_slides(prs, layout)
+    return time.perf_counter() - start
+
+
+def reserved(count):
+    prs = create_presentation()
+    start = time.perf_counter()
+    add_slides(prs, prs.slide_layouts[6], count)
+    return time.perf_counter() - start
+
+
+def main(*counts):
+    print(f"{'slides':>6}  {'python-pptx':>14}  {'per slide':>14}  {'reserved':>14}   "
+          "total s (us/slide)")
+    for count in counts or (500, 1000, 2000, 5000):
+        cells = []
+        for fn in (python_pptx, per_slide, reserved):
+            if fn is python_pptx and count > MAX_BASELINE:
+                cells.append(f"{'-':>14}")
+                continue
+            elapsed = fn(count)
+            cells.append(f"{elapsed:>6.2f} ({elapsed / count * 1e6:>5.0f})")
+        print(f"{count:>6}  " + "  ".join(cells))
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:]))
@@ -0,0 +1,26 @@
+"""Throughput of validate_plan() in batch mode.
+
+    python benchmarks/bench_validate.py [plans] [slides]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from slide_engine import validate_plans
+from slide_engine.samples import generate_plan
+
+
+def main(count=20000, slides=12):
+    plans = [generate_plan(seed, slides) for seed in range(count)]
+    start = time.perf_counter()
+    invalid = sum(1 for _ in validate_plans(plans))
+    elapsed = time.perf_counter() - start
+    print(f"{count} plans x {slides} slides: {elapsed:.3f}s, "
+          f"{count / elapsed:,.0f} plans/s ({invalid} invalid)")
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:]))
@@ -0,0 +1,72 @@
+"""Watch mode latency: from plan save to updated .pptx.
+
+    python benchmarks/bench_watch.py [slides] [edits]
+
+A plan of `slides` slides (default 20, taken from the GPEC plan) is
+watched; each edit changes the title of one slide, and the time until the
+output file has been replaced is measured end to end (polling interval
+included). For reference, the full render + save of the same plan.
+"""
+
+import json
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [ROOT, os.path.join(ROOT, "tests")]
+
+from slide_engine import render_plan_file
+from slide_engine.watch import watch
+from test_integration import GPEC_PLAN
+
+INTERVAL = 0.01
+
+
+def main(slides=20, edits=20):
+    specs = (GPEC_PLAN["slides"] * (slides // len(GPEC_PLAN["slides"]) + 1))[:slides]
+    titled = [i for i, spec in enumerate(specs) if "title" in spec]
+    with tempfile.TemporaryDirectory() as tmp:
+        plan_path, output = os.path.join(tmp, "plan.json"), os.path.join(tmp, "plan.pptx")
+
+        start = time.perf_counter()
+        render_plan_file({"slides": specs}, output)
+        full = time.perf_counter() - start
+        os.unlink(output)
+
+        with open(plan_path, "w", encoding="utf-8") as f:
+            json.dump({"slides": specs}, f)
+        stop, builds = threading.Event(), []
+        thread = threading.Thread(target=watch, args=(plan_path, output),
+                                  kwargs={"interval": INTERVAL, "stop": stop,
+                                          "log": builds.append})
+        thread.start()
+        while not builds:
+            time.sleep(0.001)
+
+        latencies = []
+        for edit in range(edits):
+            index = titled[edit % len(titled)]
+            specs[index] = dict(specs[index], title=f"Titre {edit}")
+            count = len(builds)
+            start = time.perf_counter()
+            with open(plan_path, "w", encoding="utf-8") as f:
+                json.dump({"slides": specs}, f)
+            while len(builds) == count:
+                time.sleep(0.001)
+            latencies.append(time.perf_counter() - start)
+        stop.set()
+        thread.join()
+
+    print(f"{slides} slides: full render + save {full * 1e3:.0f} ms")
+    print(f"save -> updated .pptx over {edits} edits (polling every {INTERVAL * 1e3:.0f} ms): "
+          f"median {statistics.median(latencies) * 1e3:.0f} ms, "
+          f"max {max(latencies) * 1e3:.0f} ms")
+    print(f"last build: {builds[-1].split(': ', 1)[1]}")
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:]))
@@ -81,7 +81,7 @@ def main():
         print(f"[OK] python-pptx {pptx.__version__} is installed")
     except ImportError:
         print("[!!] python-pptx not found. Install it:")
-        print("     pip install python-pptx")
+        print("     pip install python-pptx==1.0.2")
 
     print()
     print("=" * 50)
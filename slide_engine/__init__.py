@@ -1,6 +1,13 @@
 """HR Slide Engine — Professional PowerPoint generation for HR presentations."""
 
-from .engine import create_presentation, save_presentation
+from .engine import add_slides, create_presentation, save_presentation
+from .aio import AsyncRenderer
+from .merge import merge_presentations
+from .mailmerge import MailMerge, mail_merge
+from .plan import render_plan, render_plan_bytes, render_plan_file, render_slide
+from .preview import render_preview, save_preview
+from .theme import Theme
+from .validate import PlanValidationError, check_plan, validate_plan, validate_plans
 from .layouts import (
     add_title_slide,
     add_agenda_slide,
@@ -21,11 +28,28 @@ from .layouts import (
     add_org_chart_slide,
     add_funnel_slide,
     add_team_grid_slide,
+    LAYOUTS,
 )
 
 __all__ = [
     "create_presentation",
     "save_presentation",
+    "add_slides",
+    "merge_presentations",
+    "MailMerge",
+    "mail_merge",
+    "render_plan",
+    "render_plan_bytes",
+    "render_plan_file",
+    "render_slide",
+    "AsyncRenderer",
+    "render_preview",
+    "save_preview",
+    "Theme",
+    "PlanValidationError",
+    "check_plan",
+    "validate_plan",
+    "validate_plans",
     "add_title_slide",
     "add_agenda_slide",
     "add_section_slide",
@@ -45,4 +69,5 @@ __all__ = [
     "add_org_chart_slide",
     "add_funnel_slide",
     "add_team_grid_slide",
+    "LAYOUTS",
 ]
@@ -0,0 +1,194 @@
+"""asyncio front end: render plans without blocking the event loop.
+
+Rendering and saving run in an executor owned by the renderer — threads by
+default, or worker processes (``executor="process"``), which keep the event
+loop fully responsive since python-pptx holds the GIL while building slides.
+``executor="prefork"`` forks the workers from a warmed process instead and
+replaces each after `max_decks` decks (see prefork.py); the warm-up and the
+forks run off the loop, in start().
+Plans are validated on the loop first (it takes microseconds), so bad plans
+fail without queueing.
+
+With `coalesce`, concurrent requests for the same plan (same plan_key(), see
+cache.py) share one render, and with `cache_bytes` finished decks are kept
+in a ResultCache of that many bytes and served from it:
+
+    async with AsyncRenderer(max_concurrency=4, coalesce=True,
+                             cache_bytes=256 * 2**20) as renderer:
+        data = await renderer.render(plan, timeout=10)
+        path = await renderer.save(plan, "out/deck")
+    print(renderer.stats())  # hits, misses, coalesced, ...
+"""
+
+import asyncio
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from .cache import ResultCache, plan_key
+from .plan import render_plan_bytes, render_plan_file
+from .prefork import PreforkPool
+from .validate import check_plan
+
+
+class AsyncRenderer:
+    """Render plans from coroutines through a managed executor.
+
+    `max_concurrency` bounds the decks in flight (queued further requests wait
+    on the loop); `timeout` is the default per-request limit in seconds, wait
+    for a slot included.
+    Cancelling a request (or hitting its timeout) drops it from the queue if
+    it has not started; a deck already being built finishes in the background
+    and its result is discarded, still holding its concurrency slot until then
+    so the limit is never exceeded. `max_decks` only applies to "prefork".
+
+    A coalesced render is cancelled only once every request waiting for it
+    has given up.
+    """
+
+    def __init__(self, executor="thread", max_workers=None, max_concurrency=None, timeout=None,
+                 max_decks=200, coalesce=False, cache_bytes=0):
+        if executor not in ("thread", "process", "prefork"):
+            raise ValueError(
+                f"executor must be 'thread', 'process' or 'prefork', got {executor!r}")
+        max_workers = max_workers or min(4, os.cpu_count() or 1)
+        self._executor = self._starting = None
+        if executor == "prefork":
+            self._make_executor = lambda: PreforkPool(max_workers, max_decks)
+        else:
+            pool = ThreadPoolExecutor if executor == "thread" else ProcessPoolExecutor
+            self._executor = pool(max_workers=max_workers)
+        self._limit = max_concurrency or max_workers
+        self._semaphore = None
+        self.timeout = timeout
+        self.coalesce = coalesce or cache_bytes > 0
+        self.cache = ResultCache(cache_bytes) if cache_bytes > 0 else None
+        self.coalesced = 0  # requests that joined a render already in flight
+        self._flights = {}  # plan key -> [task, number of waiting requests]
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.aclose()
+
+    async def start(self):
+        """Start the executor if it is not running yet, in a thread: a prefork
+        pool warms up and forks for a while. Called by the first request."""
+        if self._executor is not None:
+            return
+        if self._starting is None:
+            loop = asyncio.get_running_loop()
+            self._starting = loop.run_in_executor(None, self._make_executor)
+        starting = self._starting
+        try:
+            self._executor = await asyncio.shield(starting)
+        except BaseException:
+            if starting.done() and self._starting is starting:
+                self._starting = None  # failed: let the next request try again
+            raise
+
+    async def aclose(self):
+        """Shut the executor down once running decks are finished."""
+        if self._executor is None and self._starting is not None:
+            await asyncio.wait([self._starting])  # a pool still starting is shut down too
+            if self._starting.exception() is None:
+                self._executor = self._starting.result()
+        if self._executor is not None:
+            await asyncio.get_running_loop().run_in_executor(None, self._executor.shutdown)
+
+    async def _submit(self, fn, *args):
+        """Submit fn(*args) once a concurrency slot is free; returns its asyncio future."""
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._limit)
+        await self._semaphore.acquire()
+        try:
+            await self.start()
+            future = self._executor.submit(fn, *args)
+        except BaseException:
+            self._semaphore.release()
+            raise
+        # Released when the work itself ends, not when the awaiting task gives up
+        def release(_):
+            try:
+                loop.call_soon_threadsafe(self._semaphore.release)
+            except RuntimeError:
+                pass  # the loop is closed: nothing is left waiting for the slot
+        future.add_done_callback(release)
+        return asyncio.wrap_future(future)
+
+    async def _call(self, fn, *args):
+        """fn(*args) in the executor, once a concurrency slot is free."""
+        return await (await self._submit(fn, *args))
+
+    async def _run(self, timeout, fn, *args):
+        timeout = self.timeout if timeout is None else timeout
+        # The timeout covers the wait for a slot too: a queued request can expire
+        return await asyncio.wait_for(self._call(fn, *args), timeout)
+
+    async def _render_once(self, key, plan):
+        data = await self._call(render_plan_bytes, plan, False)
+        if self.cache is not None:
+            self.cache.put(key, data)
+        return data
+
+    async def _render_shared(self, plan, timeout):
+        key = plan_key(plan)
+        if self.cache is not None:
+            data = self.cache.get(key)
+            if data is not None:
+                return data
+        flight = self._flights.get(key)
+        if flight is None or flight[0].done():
+            flight = self._flights[key] = [asyncio.ensure_future(self._render_once(key, plan)), 0]
+
+            def landed(_, flight=flight):
+                if self._flights.get(key) is flight:
+                    del self._flights[key]
+            flight[0].add_done_callback(landed)
+        else:
+            self.coalesced += 1
+        flight[1] += 1
+        timeout = self.timeout if timeout is None else timeout
+        try:
+            return await asyncio.wait_for(asyncio.shield(flight[0]), timeout)
+        finally:
+            flight[1] -= 1
+            if flight[1] == 0 and not flight[0].done():
+                # Nobody left waiting: cancel the render, and forget it now so that
+                # a new request for the plan starts afresh instead of joining it
+                flight[0].cancel()
+                if self._flights.get(key) is flight:
+                    del self._flights[key]
+
+    async def render(self, plan, timeout=None):
+        """Render `plan` and return the .pptx bytes."""
+        check_plan(plan)
+        if self.coalesce:
+            return await self._render_shared(plan, timeout)
+        return await self._run(timeout, render_plan_bytes, plan, False)
+
+    async def save(self, plan, filename, timeout=None):
+        """Render `plan` to `filename` (.pptx appended if missing); returns the path."""
+        check_plan(plan)
+        if not self.coalesce:
+            return await self._run(timeout, render_plan_file, plan, filename, False)
+        data = await self._render_shared(plan, timeout)
+        if not filename.endswith(".pptx"):
+            filename += ".pptx"
+        await asyncio.get_running_loop().run_in_executor(None, _write, filename, data)
+        return filename
+
+    def stats(self):
+        """Request counters: cache hits and misses (see ResultCache.stats()),
+        and requests coalesced into a render already in flight."""
+        stats = self.cache.stats() if self.cache is not None else {}
+        stats["coalesced"] = self.coalesced
+        stats["in_flight"] = len(self._flights)
+        return stats
+
+
+def _write(filename, data):
+    with open(filename, "wb") as f:
+        f.write(data)
@@ -0,0 +1,200 @@
+"""Batched slide building for shape-heavy slides.
+
+Every python-pptx ``add_shape()``/``add_textbox()`` builds its element from
+a string of its own and, unless turbo mode is on, scans every id of the
+slide for the next shape id. SlideBuilder collects the shapes of a slide
+with the same arguments as the engine helpers, then writes them all in one
+pass: a single XML string parsed once, with sequential ids.
+
+    builder = SlideBuilder(slide)
+    for i, member in enumerate(members):
+        builder.oval(left(i), top, size, size, D.NAVY, initials(member))
+        builder.textbox(left(i), top + size, width, height, member)
+    shapes = builder.build()
+
+The shapes are identical to those of the engine helpers (_add_oval(),
+_add_textbox(), ...), named and numbered as python-pptx would.
+"""
+
+from xml.sax.saxutils import escape, quoteattr
+
+from pptx.enum.text import MSO_ANCHOR, PP_ALIGN
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls
+from pptx.util import Pt
+
+from . import design as D
+
+_ANCHORS = {MSO_ANCHOR.TOP: "t", MSO_ANCHOR.MIDDLE: "ctr", MSO_ANCHOR.BOTTOM: "b"}
+
+_SP = "<p:sp><p:nvSpPr>"
+_CHART_URI = "http://schemas.openxmlformats.org/drawingml/2006/chart"
+
+# python-pptx's theme-based style of new auto shapes
+_AUTOSHAPE_STYLE = (
+    '<p:style><a:lnRef idx="1"><a:schemeClr val="accent1"/></a:lnRef>'
+    '<a:fillRef idx="3"><a:schemeClr val="accent1"/></a:fillRef>'
+    '<a:effectRef idx="2"><a:schemeClr val="accent1"/></a:effectRef>'
+    '<a:fontRef idx="minor"><a:schemeClr val="lt1"/></a:fontRef></p:style>'
+)
+
+
+def _run_text(text):
+    """`text` escaped for one ``<a:t>``, control characters as python-pptx writes them."""
+    return "".join(c if c >= " " or c in "\t\n" else "_x%04X_" % ord(c) for c in escape(text))
+
+
+def _text(text):
+    """Runs of `text` as python-pptx writes them (line feeds become ``<a:br/>``)."""
+    runs = [_run_text(line) for line in text.replace("\v", "\n").split("\n")]
+    return "<a:br/>".join(f"<a:r><a:t>{run}</a:t></a:r>" if run else "" for run in runs)
+
+
+class SlideBuilder:
+    """Shapes for one slide, added to its shape tree in one pass by build()."""
+
+    def __init__(self, slide, font_name=D.FONT_FAMILY):
+        self.slide = slide
+        self.font_name = font_name
+        self._shapes = []  # (opening tags, name prefix, XML following the <p:cNvPr>)
+
+    def __len__(self):
+        return len(self._shapes)
+
+    def _rpr(self, tag, size, color, bold, font_name=None):
+        return (f'<a:{tag} sz="{size.centipoints}" b="{int(bool(bold))}">'
+                f'<a:solidFill><a:srgbClr val="{color}"/></a:solidFill>'
+                f'<a:latin typeface={quoteattr(font_name or self.font_name)}/></a:{tag}>')
+
+    def _autoshape(self, basename, prst, left, top, width, height, fill_color,
+                   border_color=None, text="", font_size=None, font_color=None,
+                   bold=False, alignment=PP_ALIGN.CENTER):
+        if border_color:
+            ln = (f'<a:ln w="{Pt(1)}"><a:solidFill><a:srgbClr val="{border_color}"/>'
+                  f'</a:solidFill></a:ln>')
+        else:
+            ln = "<a:ln><a:noFill/></a:ln>"
+        if text:
+            body = (f'<a:bodyPr rtlCol="0" anchor="ctr" wrap="square"/><a:lstStyle/>'
+                    f'<a:p><a:pPr algn="{PP_ALIGN.to_xml(alignment)}">'
+                    f'{self._rpr("defRPr", font_size, font_color, bold)}</a:pPr>'
+                    f'{_text(text)}</a:p>')
+        else:
+            body = '<a:bodyPr rtlCol="0" anchor="ctr"/><a:lstStyle/><a:p><a:pPr algn="ctr"/></a:p>'
+        self._shapes.append((_SP, basename, (
+            '<p:cNvSpPr/><p:nvPr/></p:nvSpPr>'
+            f'<p:spPr><a:xfrm><a:off x="{int(left)}" y="{int(top)}"/>'
+            f'<a:ext cx="{int(width)}" cy="{int(height)}"/></a:xfrm>'
+            f'<a:prstGeom prst="{prst}"><a:avLst/></a:prstGeom>'
+            f'<a:solidFill><a:srgbClr val="{fill_color}"/></a:solidFill>{ln}</p:spPr>'
+            f'{_AUTOSHAPE_STYLE}<p:txBody>{body}</p:txBody></p:sp>'
+        )))
+
+    def _textbox(self, left, top, width, height, body_pr, paragraphs):
+        self._shapes.append((_SP, "TextBox", (
+            '<p:cNvSpPr txBox="1"/><p:nvPr/>'
+            f'</p:nvSpPr><p:spPr><a:xfrm><a:off x="{int(left)}" y="{int(top)}"/>'
+            f'<a:ext cx="{int(width)}" cy="{int(height)}"/></a:xfrm>'
+            '<a:prstGeom prst="rect"><a:avLst/></a:prstGeom><a:noFill/></p:spPr>'
+            f'<p:txBody>{body_pr}<a:lstStyle/>{paragraphs}</p:txBody></p:sp>'
+        )))
+
+    # --- Shapes (arguments as the engine helpers, without `slide`) ---
+
+    def rectangle(self, left, top, width, height, fill_color):
+        self._autoshape("Rectangle", "rect", left, top, width, height, fill_color)
+
+    def line(self, left, top, width, height, color, line_width=Pt(2)):
+        self._autoshape("Rectangle", "rect", left, top, width, height, color)
+
+    def rounded_rectangle(self, left, top, width, height, fill_color, border_color=None,
+                          text="", font_size=D.BODY_SIZE, font_color=D.WHITE, bold=False,
+                          alignment=PP_ALIGN.CENTER):
+        self._autoshape("Rounded Rectangle", "roundRect", left, top, width, height,
+                        fill_color, border_color, text, font_size, font_color, bold, alignment)
+
+    def chevron(self, left, top, width, height, fill_color, text="",
+                font_size=D.SMALL_SIZE, font_color=D.WHITE):
+        self._autoshape("Chevron", "chevron", left, top, width, height, fill_color,
+                        None, text, font_size, font_color, True)
+
+    def oval(self, left, top, width, height, fill_color, text="",
+             font_size=D.BODY_SIZE, font_color=D.WHITE, bold=True):
+        self._autoshape("Oval", "ellipse", left, top, width, height, fill_color,
+                        None, text, font_size, font_color, bold)
+
+    def triangle(self, left, top, width, height, fill_color):
+        self._autoshape("Isosceles Triangle", "triangle", left, top, width, height, fill_color)
+
+    def textbox(self, left, top, width, height, text, font_size=D.BODY_SIZE,
+                font_color=D.DARK_TEXT, bold=False, alignment=PP_ALIGN.LEFT,
+                font_name=D.FONT_FAMILY, anchor=MSO_ANCHOR.TOP):
+        body_pr = f'<a:bodyPr wrap="square" anchor="{_ANCHORS.get(anchor, "t")}"><a:spAutoFit/></a:bodyPr>'
+        paragraph = (f'<a:p><a:pPr algn="{PP_ALIGN.to_xml(alignment)}">'
+                     f'{self._rpr("defRPr", font_size, font_color, bold, font_name)}</a:pPr>'
+                     f'{_text(text)}</a:p>')
+        self._textbox(left, top, width, height, body_pr, paragraph)
+
+    def multiline_textbox(self, left, top, width, height, lines, font_size=D.BODY_SIZE,
+                          font_color=D.DARK_TEXT, bold=False, alignment=PP_ALIGN.LEFT,
+                          font_name=D.FONT_FAMILY, line_spacing=None,
+                          bullet_color=None, bullet_char=None):
+        algn = PP_ALIGN.to_xml(alignment)
+        spacing = (f'<a:spcAft><a:spcPts val="{line_spacing.centipoints}"/></a:spcAft>'
+                   if line_spacing else "")
+        paragraphs = [] if lines else ["<a:p/>"]
+        for line in lines:
+            if bullet_char:
+                bullet_rpr = self._rpr("rPr", font_size, bullet_color or font_color, bold, font_name)
+                text_rpr = self._rpr("rPr", font_size, font_color, False, font_name)
+                ppr = f'<a:pPr algn="{algn}">{spacing}</a:pPr>' if spacing else f'<a:pPr algn="{algn}"/>'
+                paragraphs.append(
+                    f"<a:p>{ppr}<a:r>{bullet_rpr}<a:t>{_run_text(bullet_char)} </a:t></a:r>"
+                    f"<a:r>{text_rpr}<a:t>{_run_text(line)}</a:t></a:r></a:p>")
+            else:
+                paragraphs.append(
+                    f'<a:p><a:pPr algn="{algn}">{spacing}'
+                    f'{self._rpr("defRPr", font_size, font_color, bold, font_name)}</a:pPr>'
+                    f"{_text(line)}</a:p>")
+        body_pr = '<a:bodyPr wrap="square"><a:spAutoFit/></a:bodyPr>'
+        self._textbox(left, top, width, height, body_pr, "".join(paragraphs))
+
+    def chart_frame(self, left, top, width, height, rId):
+        """A chart's graphic frame, pointing at the chart part related as `rId`
+        (written by the caller: build() does not add chart parts)."""
+        self._shapes.append(("<p:graphicFrame><p:nvGraphicFramePr>", "Chart", (
+            '<p:cNvGraphicFramePr><a:graphicFrameLocks noGrp="1"/></p:cNvGraphicFramePr>'
+            f'<p:nvPr/></p:nvGraphicFramePr><p:xfrm><a:off x="{int(left)}" y="{int(top)}"/>'
+            f'<a:ext cx="{int(width)}" cy="{int(height)}"/></p:xfrm><a:graphic>'
+            f'<a:graphicData uri="{_CHART_URI}"><c:chart xmlns:c="{_CHART_URI}" r:id="{rId}"/>'
+            '</a:graphicData></a:graphic></p:graphicFrame>'
+        )))
+
+    # --- Output ---
+
+    def xml(self, first_id):
+        """The collected shapes as an XML string (namespace prefixes unbound),
+        numbered from shape id `first_id`."""
+        return "".join(
+            f'{head}<p:cNvPr id="{first_id + i}" name="{basename} {first_id + i - 1}"/>{rest}'
+            for i, (head, basename, rest) in enumerate(self._shapes))
+
+    def build(self):
+        """Append the collected shapes to the slide; returns them as python-pptx
+        shapes. The builder is empty afterwards."""
+        shapes = self.slide.shapes
+        first_id = shapes._next_shape_id
+        xml = self.xml(first_id)
+        group = parse_xml(f"<p:grpSp {nsdecls('a', 'p', 'r')}>{xml}</p:grpSp>")
+        elements = list(group)
+        sp_tree = shapes._spTree
+        ext_lst = sp_tree.find("{*}extLst")
+        for el in elements:
+            if ext_lst is not None:
+                ext_lst.addprevious(el)
+            else:
+                sp_tree.append(el)
+        if shapes._cached_max_shape_id is not None and elements:
+            shapes._cached_max_shape_id = first_id + len(elements) - 1
+        self._shapes = []
+        return [shapes._shape_factory(el) for el in elements]
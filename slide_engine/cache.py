@@ -0,0 +1,100 @@
+"""Plan keys and a byte-bounded LRU cache of rendered decks.
+
+Two plans that differ only in key order, whitespace or their output
+`filename` render the same deck, so they get the same key: the SHA-256 of
+the plan as canonical JSON (sorted keys, no spaces, without `filename`),
+plus the render options. SHA-256 rather than the SHA-1 used for snapshot
+digests, since a collision here would hand one user another's deck.
+
+    cache = ResultCache(max_bytes=256 * 2**20)
+    key = plan_key(plan)
+    data = cache.get(key)
+    if data is None:
+        data = render_plan_bytes(plan)
+        cache.put(key, data)
+
+AsyncRenderer uses both to coalesce identical requests (see aio.py).
+"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+
+# Plan fields that name the output without changing the deck
+OUTPUT_FIELDS = ("filename",)
+
+
+def canonical_plan(plan):
+    """`plan` as canonical JSON bytes: sorted keys, compact, output fields dropped."""
+    if isinstance(plan, dict):
+        plan = {k: v for k, v in plan.items() if k not in OUTPUT_FIELDS}
+    return json.dumps(plan, sort_keys=True, separators=(",", ":"),
+                      ensure_ascii=False).encode("utf-8")
+
+
+def plan_key(plan, **options):
+    """Hex SHA-256 of canonical_plan(`plan`) and the render `options`."""
+    h = hashlib.sha256(canonical_plan(plan))
+    if options:
+        h.update(b"\0" + json.dumps(options, sort_keys=True, default=str).encode("utf-8"))
+    return h.hexdigest()
+
+
+class ResultCache:
+    """Rendered decks by key, least recently used first out, at most
+    `max_bytes` of them in total. Thread-safe; counts hits, misses and
+    evictions."""
+
+    def __init__(self, max_bytes):
+        if max_bytes < 0:
+            raise ValueError(f"max_bytes must not be negative, got {max_bytes!r}")
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hits = self.misses = self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key):
+        """The cached bytes for `key` (now most recently used), or None."""
+        with self._lock:
+            data = self._entries.get(key)
+            if data is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return data
+
+    def put(self, key, data):
+        """Cache `data` under `key`, evicting the least recently used entries
+        to make room. Entries larger than the whole cache are not kept."""
+        if len(data) > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.size -= len(old)
+            self._entries[key] = data
+            self.size += len(data)
+            while self.size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.size -= len(evicted)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def stats(self):
+        """Counters and occupancy, as a dict."""
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions,
+                "entries": len(self._entries), "bytes": self.size,
+                "max_bytes": self.max_bytes}
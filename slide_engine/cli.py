@@ -0,0 +1,461 @@
+"""Command line interface: ``python -m slide_engine``.
+
+    python -m slide_engine render plan.json [-o deck.pptx]
+    cat plan.json | python -m slide_engine render - -o deck.pptx
+    python -m slide_engine render plan.json --backend ooxml
+    python -m slide_engine stream --jobs 4 --out-dir decks/ < plans.ndjson
+    python -m slide_engine stream --tar - < plans.ndjson > decks.tar
+    python -m slide_engine stream --jobs 4 --prefork 200 --out-dir decks/ < plans.ndjson
+    python -m slide_engine stream --out-dir decks/ --memprofile mem.txt < plans.ndjson
+    python -m slide_engine optimize decks/*.pptx --in-place
+    python -m slide_engine watch plan.json -o deck.pptx
+    python -m slide_engine handout decks/*.pptx --format text
+
+`stream` reads one JSON plan per line and renders them with a pool of
+workers. At most 2 x jobs decks are in flight and each is written out as soon
+as it (and every deck before it) is done, so memory stays constant however
+long the input is. Bad lines and failed renders are reported on stderr and
+skipped; a deck whose name is already taken (by an existing file in
+`--out-dir`, or an earlier member of the archive) gets its line number
+appended. With `--deterministic`, archive members are dated 1980-01-01 too.
+`--prefork N` forks the workers from a warmed process and replaces each
+after N decks (see prefork.py).
+`--memprofile` renders in-process under tracemalloc and writes a memory
+report (see memprofile.py); `--backend ooxml` writes the slide XML
+directly (see ooxml.py). `watch` rebuilds a deck each time its plan is
+saved, rendering only the slides that changed (see watch.py). `handout`
+writes the text of existing decks next to them, `render --handout` and
+`stream --handouts` alongside the decks they render (see handout.py).
+"""
+
+import argparse
+import calendar
+import io
+import json
+import os
+import re
+import sys
+import tarfile
+import time
+import zipfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from .handout import FORMATS as HANDOUT_FORMATS, handout, plan_slides, write_handout
+from .memprofile import MemoryProfile
+from .optimize import optimize_deck
+from .package import FIXED_DATE_TIME, Package
+from .plan import BACKENDS, render_plan_bytes
+from .prefork import PreforkPool
+from .validate import validate_plan
+from .watch import watch
+
+
+def _read_plan(source):
+    if source == "-":
+        return json.load(sys.stdin)
+    with open(source, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _deck_name(plan, number):
+    """A safe member name: the plan's `filename` without directories, or deck-<n>."""
+    name = plan.get("filename") if isinstance(plan, dict) else None
+    name = re.sub(r"[^\w.\- ]", "_", os.path.basename(str(name))) if name else ""
+    name = name or f"deck-{number:06d}"
+    return name if name.endswith(".pptx") else name + ".pptx"
+
+
+def _deck_names(plan, number):
+    """_deck_name(), then fallbacks with the line number for when it is taken."""
+    name = _deck_name(plan, number)
+    stem = name[:-len(".pptx")]
+    yield name
+    yield f"{stem}-{number}.pptx"
+    suffix = 1
+    while True:
+        yield f"{stem}-{number}-{suffix}.pptx"
+        suffix += 1
+
+
+def _render_bytes(plan, profile=None, deterministic=False, threads=1, backend="pptx"):
+    if profile is None:
+        return render_plan_bytes(plan, validate=False, deterministic=deterministic,
+                                 threads=threads, backend=backend)
+    buf = io.BytesIO()
+    profile.save(profile.render(plan, validate=False), buf)
+    if deterministic:
+        pkg, buf = Package.open(buf), io.BytesIO()
+        pkg.save(buf, deterministic=True, threads=threads)
+    return buf.getvalue()
+
+
+def _handout_bytes(plan, fmt):
+    return "".join(handout(plan_slides(plan), fmt, plan.get("title"))).encode("utf-8")
+
+
+def _print_errors(label, errors):
+    for error in errors:
+        print(f"{label}: {error}", file=sys.stderr)
+
+
+# === Output sinks ===
+#
+# write(name, data) returns False, writing nothing, when `name` is taken;
+# with `replace` it writes anyway. Taken names are found without keeping a
+# list of every deck: the directory sink asks the file system (O_EXCL), the
+# zip sink its central directory, which the format needs anyway. A tar stream
+# has no index, so the tar sink keeps one of member names, in place of the
+# TarInfo objects tarfile would otherwise hold on to.
+
+
+class _DirectorySink:
+    def __init__(self, path):
+        os.makedirs(path, exist_ok=True)
+        self.path = path
+
+    def write(self, name, data, replace=False):
+        try:
+            with open(os.path.join(self.path, name), "wb" if replace else "xb") as f:
+                f.write(data)
+        except FileExistsError:
+            return False
+        return True
+
+    def close(self):
+        pass
+
+
+class _TarSink:
+    def __init__(self, fileobj, deterministic=False):
+        self.tar = tarfile.open(fileobj=fileobj, mode="w|")
+        self.mtime = calendar.timegm(FIXED_DATE_TIME) if deterministic else None
+        self.names = set()
+
+    def write(self, name, data, replace=False):
+        if name in self.names and not replace:
+            return False
+        self.names.add(name)
+        info = tarfile.TarInfo(name)
+        info.size = len(data)
+        info.mtime = int(time.time()) if self.mtime is None else self.mtime
+        self.tar.addfile(info, io.BytesIO(data))
+        self.tar.members.clear()  # a stream is never read back
+        return True
+
+    def close(self):
+        self.tar.close()
+
+
+class _ZipSink:
+    def __init__(self, fileobj, deterministic=False):
+        # .pptx files are already deflated: store them as-is
+        self.zip = zipfile.ZipFile(fileobj, "w", zipfile.ZIP_STORED)
+        self.date_time = FIXED_DATE_TIME if deterministic else None
+
+    def write(self, name, data, replace=False):
+        try:
+            self.zip.getinfo(name)
+        except KeyError:
+            pass
+        else:
+            if not replace:
+                return False
+        info = zipfile.ZipInfo(name, self.date_time or time.localtime()[:6])
+        self.zip.writestr(info, data)
+        return True
+
+    def close(self):
+        self.zip.close()
+
+
+def _open_sink(args):
+    if args.out_dir:
+        return _DirectorySink(args.out_dir), None
+    target = args.tar or args.zip
+    fileobj = sys.stdout.buffer if target == "-" else open(target, "wb")
+    sink = (_TarSink if args.tar else _ZipSink)(fileobj, args.deterministic)
+    return sink, (None if target == "-" else fileobj)
+
+
+# === Commands ===
+
+
+def _cmd_render(args):
+    try:
+        plan = _read_plan(args.plan)
+    except ValueError as e:
+        _print_errors(args.plan, [f"invalid JSON: {e}"])
+        return 1
+    errors = validate_plan(plan)
+    if errors:
+        _print_errors(args.plan, errors)
+        return 1
+    if args.memprofile:
+        if args.backend != "pptx":
+            print("--memprofile profiles the pptx backend only", file=sys.stderr)
+            return 2
+        with MemoryProfile() as profile:
+            data = _render_bytes(plan, profile, args.deterministic, args.threads)
+            profile.write_report(args.memprofile)
+    else:
+        data = _render_bytes(plan, deterministic=args.deterministic, threads=args.threads,
+                             backend=args.backend)
+    if args.handout:
+        write_handout(plan, args.handout)
+    if args.output == "-":
+        sys.stdout.buffer.write(data)
+        return 0
+    output = args.output or plan.get("filename") or (
+        "presentation" if args.plan == "-" else os.path.splitext(args.plan)[0])
+    if not output.endswith(".pptx"):
+        output += ".pptx"
+    with open(output, "wb") as f:
+        f.write(data)
+    print(output)
+    return 0
+
+
+def _cmd_validate(args):
+    try:
+        errors = validate_plan(_read_plan(args.plan))
+    except ValueError as e:
+        errors = [f"invalid JSON: {e}"]
+    _print_errors(args.plan, errors)
+    return 1 if errors else 0
+
+
+def _iter_plans(lines):
+    """Yield (line number, plan) for each valid NDJSON line; report the others."""
+    for number, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        try:
+            plan = json.loads(line)
+        except ValueError as e:
+            _print_errors(f"line {number}", [f"invalid JSON: {e}"])
+            yield number, None
+            continue
+        errors = validate_plan(plan)
+        if errors:
+            _print_errors(f"line {number}", errors)
+            yield number, None
+            continue
+        yield number, plan
+
+
+def stream(lines, sink, jobs=1, profile=None, deterministic=False, handouts=None,
+           prefork=None):
+    """Render NDJSON `lines` into `sink`; returns (rendered, failed) counts.
+
+    With a MemoryProfile, decks are rendered in this process through it.
+    With `deterministic`, identical plans give byte-identical decks. With
+    `handouts` ("markdown" or "text"), each deck is followed by its handout.
+    With `prefork` (a number of decks), the workers are a PreforkPool, each
+    replaced after that many decks.
+    """
+    def write(number, plan, result):
+        """Write one deck, given `result()` returning its bytes; False if it failed."""
+        try:
+            data = result()
+        except Exception as e:  # one bad plan must not end the stream
+            _print_errors(f"line {number}", [f"{type(e).__name__}: {e}"])
+            return False
+        name = next(name for name in _deck_names(plan, number) if sink.write(name, data))
+        if handouts is not None:
+            ext = ".md" if handouts == "markdown" else ".txt"
+            sink.write(os.path.splitext(name)[0] + ext, _handout_bytes(plan, handouts),
+                       replace=True)
+        return True
+
+    rendered = failed = 0
+    if (jobs == 1 and not prefork) or profile is not None:
+        for number, plan in _iter_plans(lines):
+            if plan is None:
+                failed += 1
+                continue
+            ok = write(number, plan, lambda: _render_bytes(plan, profile, deterministic))
+            rendered += ok
+            failed += not ok
+            if profile is not None and ok and rendered % 100 == 0:
+                profile.sample_residual()
+        return rendered, failed
+
+    pending = deque()
+    pool = PreforkPool(jobs, prefork) if prefork else ProcessPoolExecutor(max_workers=jobs)
+    with pool:
+        for number, plan in _iter_plans(lines):
+            if plan is None:
+                failed += 1
+                continue
+            pending.append((number, plan,
+                            pool.submit(render_plan_bytes, plan, False, None, deterministic)))
+            while len(pending) >= 2 * jobs or (pending and pending[0][2].done()):
+                number, plan, future = pending.popleft()
+                ok = write(number, plan, future.result)
+                rendered += ok
+                failed += not ok
+        while pending:
+            number, plan, future = pending.popleft()
+            ok = write(number, plan, future.result)
+            rendered += ok
+            failed += not ok
+    return rendered, failed
+
+
+def _cmd_stream(args):
+    sink, fileobj = _open_sink(args)
+    source = sys.stdin if args.input == "-" else open(args.input, encoding="utf-8")
+    profile = MemoryProfile().start() if args.memprofile else None
+    try:
+        rendered, failed = stream(source, sink, args.jobs, profile, args.deterministic,
+                                  args.handouts, args.prefork)
+        if profile is not None:
+            profile.sample_residual()
+            profile.write_report(args.memprofile)
+    finally:
+        if profile is not None:
+            profile.stop()
+        sink.close()
+        if fileobj is not None:
+            fileobj.close()
+        if source is not sys.stdin:
+            source.close()
+    print(f"{rendered} deck(s) rendered, {failed} failed", file=sys.stderr)
+    return 1 if failed else 0
+
+
+def _cmd_optimize(args):
+    if args.output and len(args.decks) > 1:
+        build_parser().error("--output needs a single deck")
+    before = after = 0
+    for deck in args.decks:
+        if args.in_place:
+            target = deck + ".tmp"
+        else:
+            target = args.output or os.path.splitext(deck)[0] + ".min.pptx"
+        report = optimize_deck(deck, target, args.level, drop_thumbnail=args.drop_thumbnail)
+        if args.in_place:
+            os.replace(target, deck)
+            target = deck
+        if args.verbose:
+            print(report.format(), file=sys.stderr)
+        print(f"{target}: {report.before} -> {report.after} bytes")
+        before += report.before
+        after += report.after
+    if len(args.decks) > 1:
+        print(f"total: {before} -> {after} bytes (-{before - after})")
+    return 0
+
+
+def _cmd_handout(args):
+    if args.output and len(args.decks) > 1:
+        build_parser().error("--output needs a single deck")
+    ext = ".md" if args.format == "markdown" else ".txt"
+    for deck in args.decks:
+        if args.output == "-":
+            write_handout(deck, sys.stdout, args.format)
+            continue
+        target = write_handout(deck, args.output or os.path.splitext(deck)[0] + ext,
+                               args.format)
+        print(target)
+    return 0
+
+
+def _cmd_watch(args):
+    output = args.output or os.path.splitext(args.plan)[0]
+    if not output.endswith(".pptx"):
+        output += ".pptx"
+    print(f"watching {args.plan} -> {output} (Ctrl+C to stop)", file=sys.stderr)
+    try:
+        watch(args.plan, output, interval=args.interval, deterministic=args.deterministic)
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m slide_engine",
+                                     description="Render HR slide decks from JSON plans.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    render = commands.add_parser("render", help="render one plan to a .pptx file")
+    render.add_argument("plan", help="plan JSON file, or - for stdin")
+    render.add_argument("-o", "--output",
+                        help="output .pptx (default: the plan's filename; - for stdout)")
+    render.add_argument("--memprofile", metavar="REPORT",
+                        help="profile memory with tracemalloc and write a report")
+    render.add_argument("--deterministic", action="store_true",
+                        help="same plan, same bytes (fixed zip dates and member order)")
+    render.add_argument("--threads", type=int, default=1,
+                        help="compress the parts in this many threads (same output)")
+    render.add_argument("--backend", choices=BACKENDS, default="pptx",
+                        help="build slides with python-pptx or write their XML directly "
+                             "(same output)")
+    render.add_argument("--handout", metavar="FILE",
+                        help="also write the text handout (.md Markdown, .txt plain text)")
+    render.set_defaults(func=_cmd_render)
+
+    validate = commands.add_parser("validate", help="check a plan without rendering it")
+    validate.add_argument("plan", help="plan JSON file, or - for stdin")
+    validate.set_defaults(func=_cmd_validate)
+
+    stream_cmd = commands.add_parser("stream", help="render newline-delimited JSON plans")
+    stream_cmd.add_argument("input", nargs="?", default="-",
+                            help="NDJSON file (default: stdin)")
+    stream_cmd.add_argument("-j", "--jobs", type=int, default=1, help="worker processes")
+    out = stream_cmd.add_mutually_exclusive_group(required=True)
+    out.add_argument("--out-dir", help="write each deck into this directory")
+    out.add_argument("--tar", metavar="FILE", help="write a tar stream (- for stdout)")
+    out.add_argument("--zip", metavar="FILE", help="write a zip stream (- for stdout)")
+    stream_cmd.add_argument("--memprofile", metavar="REPORT",
+                            help="render in-process under tracemalloc and write a "
+                                 "memory report (implies --jobs 1)")
+    stream_cmd.add_argument("--deterministic", action="store_true",
+                            help="same plan, same bytes (fixed zip dates and member order)")
+    stream_cmd.add_argument("--handouts", choices=HANDOUT_FORMATS,
+                            help="write each deck's text handout next to it")
+    stream_cmd.add_argument("--prefork", type=int, metavar="DECKS",
+                            help="fork the workers from a warmed process, each replaced "
+                                 "after DECKS decks (needs os.fork())")
+    stream_cmd.set_defaults(func=_cmd_stream)
+
+    optimize = commands.add_parser("optimize", help="shrink existing .pptx files")
+    optimize.add_argument("decks", nargs="+", help=".pptx files")
+    target = optimize.add_mutually_exclusive_group()
+    target.add_argument("-o", "--output", help="output file (default: <deck>.min.pptx)")
+    target.add_argument("--in-place", action="store_true", help="replace the decks")
+    optimize.add_argument("-l", "--level", type=int, default=9, choices=range(10),
+                          metavar="0-9", help="zlib compression level (default: 9)")
+    optimize.add_argument("--drop-thumbnail", action="store_true",
+                          help="also remove the preview image (docProps/thumbnail.jpeg)")
+    optimize.add_argument("-v", "--verbose", action="store_true",
+                          help="print the bytes of every part before and after")
+    optimize.set_defaults(func=_cmd_optimize)
+
+    watch_cmd = commands.add_parser("watch", help="rebuild a deck whenever its plan changes")
+    watch_cmd.add_argument("plan", help="plan JSON file")
+    watch_cmd.add_argument("-o", "--output", help="output .pptx (default: next to the plan)")
+    watch_cmd.add_argument("--interval", type=float, default=0.05,
+                           help="seconds between checks of the plan (default: 0.05)")
+    watch_cmd.add_argument("--deterministic", action="store_true",
+                           help="same plan, same bytes (fixed zip dates and member order)")
+    watch_cmd.set_defaults(func=_cmd_watch)
+
+    handout_cmd = commands.add_parser("handout", help="text handouts of existing decks")
+    handout_cmd.add_argument("decks", nargs="+", help=".pptx files")
+    handout_cmd.add_argument("-o", "--output",
+                             help="output file (default: next to the deck; - for stdout)")
+    handout_cmd.add_argument("--format", choices=HANDOUT_FORMATS, default="markdown",
+                             help="markdown (default) or plain text")
+    handout_cmd.set_defaults(func=_cmd_handout)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if getattr(args, "jobs", 1) < 1:
+        build_parser().error("--jobs must be at least 1")
+    if getattr(args, "prefork", None) is not None and args.prefork < 1:
+        build_parser().error("--prefork must be at least 1")
+    return args.func(args)
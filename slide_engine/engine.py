@@ -1,34 +1,255 @@
-"""Core engine functions for HR Slide Engine."""
+"""Core engine functions for HR Slide Engine.
+
+Every helper takes the design tokens from `theme`: the design module by
+default, or a Theme (see theme.py). Token arguments left to None (font size,
+colour, family) take the theme's value.
+"""
+
+import weakref
+from copy import deepcopy
+from xml.sax.saxutils import quoteattr
 
 from pptx import Presentation
 from pptx.util import Inches, Pt, Emu
 from pptx.dml.color import RGBColor
 from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
-from pptx.oxml.ns import qn
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls, qn
+from pptx.opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TARGET_MODE as RTM, \
+    RELATIONSHIP_TYPE as RT
+from pptx.opc.package import _Relationship
+from pptx.opc.packuri import PackURI
+from pptx.parts.slide import SlideLayoutPart, SlidePart
 
 from . import design as D
+from .notes import write_notes
+from .package import save_deterministic, save_parallel
+
+
+class XmlFragments:
+    """Colour and font XML parsed once, then copied into shapes.
+
+    Setting a fill or a font through python-pptx builds the XML one property
+    at a time; copying a ready-made ``<a:solidFill>`` or ``<a:defRPr>`` is
+    about ten times cheaper. Fills of `colors` are parsed up front, other
+    combinations on first use.
+    """
+
+    def __init__(self, font_name=D.FONT_FAMILY, colors=()):
+        self.font_name = font_name
+        self._fills = {}
+        self._text_props = {}
+        for color in colors:
+            self.fill(color)
+
+    def fill(self, color):
+        """A new ``<a:solidFill>`` element of `color`."""
+        element = self._fills.get(color)
+        if element is None:
+            element = self._fills[color] = parse_xml(
+                f'<a:solidFill {nsdecls("a")}><a:srgbClr val="{color}"/></a:solidFill>')
+        return deepcopy(element)
+
+    def text_props(self, tag, size, color, bold, font_name=None):
+        """A new ``<a:defRPr>`` or ``<a:rPr>`` with size, colour, weight and font."""
+        font_name = font_name or self.font_name
+        key = (tag, size, color, bold, font_name)
+        element = self._text_props.get(key)
+        if element is None:
+            element = self._text_props[key] = parse_xml(
+                f'<a:{tag} {nsdecls("a")} sz="{size.centipoints}" b="{int(bool(bold))}">'
+                f'<a:solidFill><a:srgbClr val="{color}"/></a:solidFill>'
+                f'<a:latin typeface={quoteattr(font_name)}/></a:{tag}>'
+            )
+        return deepcopy(element)
+
+
+_XML = XmlFragments(D.FONT_FAMILY, (D.NAVY, D.ORANGE, D.WHITE, D.GRAY, D.DARK_TEXT, D.LIGHT_GRAY))
+
+
+def _xml(theme):
+    """The XmlFragments of `theme`: this module's for the design module."""
+    return _XML if theme is D else theme.xml
+
+
+def _fill_shape(shape, color, theme=D):
+    """Give a freshly added auto shape a solid fill."""
+    shape._element.spPr.insert_element_before(_xml(theme).fill(color), "a:ln", "a:effectLst",
+                                              "a:effectDag", "a:scene3d", "a:sp3d", "a:extLst")
+
+
+def _format_paragraph(p, size, color, bold, font_name=None, theme=D):
+    """Set the default run properties of paragraph `p` (like ``p.font.*``)."""
+    p._p.get_or_add_pPr().insert_element_before(
+        _xml(theme).text_props("defRPr", size, color, bold, font_name), "a:extLst")
+
+
+def _format_run(run, size, color, bold, font_name=None, theme=D):
+    """Set the properties of `run` (like ``run.font.*``)."""
+    run._r.insert(0, _xml(theme).text_props("rPr", size, color, bold, font_name))
 
 
-def create_presentation():
-    """Create a new 16:9 presentation."""
+def create_presentation(theme=D):
+    """Create a new 16:9 presentation, with the engine's title layout."""
     prs = Presentation()
-    prs.slide_width = D.SLIDE_WIDTH
-    prs.slide_height = D.SLIDE_HEIGHT
+    prs.slide_width = theme.SLIDE_WIDTH
+    prs.slide_height = theme.SLIDE_HEIGHT
+    _title_layout(prs, theme)
     return prs
 
 
-def save_presentation(prs, filename):
-    """Save presentation to file. Appends .pptx if missing."""
+# Name of the slide layout carrying the chrome shared by content slides
+TITLE_LAYOUT = "HR Title"
+
+
+def _title_layout_xml(theme=D):
+    """``<p:sldLayout>`` with a white background, a left-aligned title
+    placeholder and the orange underline, built from the tokens of `theme`."""
+    def xfrm(left, top, width, height):
+        return (f'<a:xfrm><a:off x="{left}" y="{top}"/>'
+                f'<a:ext cx="{width}" cy="{height}"/></a:xfrm>')
+
+    layout = parse_xml(
+        f'<p:sldLayout {nsdecls("a", "r", "p")} preserve="1" userDrawn="1">'
+        f'<p:cSld name="{TITLE_LAYOUT}"><p:bg><p:bgPr><a:effectLst/></p:bgPr></p:bg>'
+        '<p:spTree><p:nvGrpSpPr><p:cNvPr id="1" name=""/><p:cNvGrpSpPr/><p:nvPr/></p:nvGrpSpPr>'
+        '<p:grpSpPr/>'
+        '<p:sp><p:nvSpPr><p:cNvPr id="2" name="Title 1"/>'
+        '<p:cNvSpPr><a:spLocks noGrp="1"/></p:cNvSpPr><p:nvPr><p:ph type="title"/></p:nvPr>'
+        f'</p:nvSpPr><p:spPr>'
+        f'{xfrm(theme.MARGIN_LEFT, theme.MARGIN_TOP, theme.CONTENT_WIDTH, Inches(0.8))}'
+        '</p:spPr><p:txBody><a:bodyPr wrap="square" anchor="t"><a:spAutoFit/></a:bodyPr>'
+        '<a:lstStyle><a:lvl1pPr algn="l"/></a:lstStyle>'
+        '<a:p><a:r><a:t>Title</a:t></a:r></a:p></p:txBody></p:sp>'
+        '<p:sp><p:nvSpPr><p:cNvPr id="3" name="Underline"/><p:cNvSpPr/><p:nvPr userDrawn="1"/>'
+        f'</p:nvSpPr><p:spPr>{xfrm(theme.MARGIN_LEFT, Inches(1.5), Inches(2), Pt(3))}'
+        '<a:prstGeom prst="rect"><a:avLst/></a:prstGeom><a:ln><a:noFill/></a:ln></p:spPr></p:sp>'
+        '</p:spTree></p:cSld><p:clrMapOvr><a:masterClrMapping/></p:clrMapOvr></p:sldLayout>'
+    )
+    xml = _xml(theme)
+    layout.find(".//" + qn("p:bgPr")).insert(0, xml.fill(theme.WHITE))
+    layout.find(".//" + qn("a:lvl1pPr")).append(
+        xml.text_props("defRPr", theme.TITLE_SIZE, theme.NAVY, True))
+    underline = layout.findall(".//" + qn("p:spPr"))[1]
+    underline.insert(2, xml.fill(theme.ORANGE))
+    return layout
+
+
+def _title_layout(prs, theme=D):
+    """The title layout of `prs`, added to its first slide master (drawn with
+    `theme`) if missing."""
+    layout = prs.slide_layouts.get_by_name(TITLE_LAYOUT)
+    if layout is not None:
+        return layout
+    master = prs.slide_master
+    package = prs.part.package
+    part = SlideLayoutPart(package.next_partname("/ppt/slideLayouts/slideLayout%d.xml"),
+                           CT.PML_SLIDE_LAYOUT, package, _title_layout_xml(theme))
+    part.relate_to(master.part, RT.SLIDE_MASTER)
+    rId = master.part.relate_to(part, RT.SLIDE_LAYOUT)
+    ids = [int(el.get("id")) for el in prs.part._element.iter(qn("p:sldMasterId"))]
+    ids += [int(el.get("id")) for m in prs.slide_masters
+            for el in m._element.iter(qn("p:sldLayoutId"))]
+    entry = master._element.get_or_add_sldLayoutIdLst()._add_sldLayoutId()
+    entry.set("id", str(max(ids) + 1))
+    entry.rId = rId
+    return part.slide_layout
+
+
+def save_presentation(prs, filename, deterministic=False, threads=1):
+    """Save presentation to file. Appends .pptx if missing.
+
+    With `deterministic`, the same slides always give the same bytes (fixed
+    zip timestamps and member order, see package.save_deterministic()).
+    With `threads` > 1, parts are compressed in a thread pool (see
+    package.save_parallel()); the file is the same.
+    """
     if not filename.endswith(".pptx"):
         filename += ".pptx"
-    prs.save(filename)
+    if deterministic:
+        save_deterministic(prs, filename, threads)
+    elif threads > 1:
+        save_parallel(prs, filename, threads)
+    else:
+        prs.save(filename)
     return filename
 
 
+# Highest slide id python-pptx allocates by max + 1 (see CT_SlideIdList._next_id)
+MAX_SLIDE_ID = 2147483647
+
+# Per presentation part: [relationship count, last <p:sldId>, next slide number,
+# next rId number, highest slide id]; len() of an lxml element walks its
+# children, so slides are counted here rather than in the slide id list. The
+# highest id, not the last one's: after a reorder the last slide may have any id
+_SLIDE_COUNTERS = weakref.WeakKeyDictionary()
+
+
+def _slide_counters(prs):
+    """Counters for add_slides(), rescanned when slides or relationships of
+    `prs` were added or removed by other code since the last call."""
+    part, sld_id_lst = prs.part, prs.slides._sldIdLst
+    rels = part.rels
+    last = next(reversed(sld_id_lst), None)
+    counters = _SLIDE_COUNTERS.get(part)
+    if counters is None or counters[0] != len(rels) or counters[1] is not last:
+        numbers = [int(rId[3:]) for rId in rels if rId[:3] == "rId" and rId[3:].isdigit()]
+        slides = [rel.target_part.partname.idx or 0 for rel in rels.values()
+                  if rel.reltype == RT.SLIDE]
+        ids = [int(sld_id.get("id")) for sld_id in sld_id_lst]
+        counters = _SLIDE_COUNTERS[part] = [
+            len(rels), last, max([0] + slides) + 1, max([0] + numbers) + 1, max([255] + ids)]
+    return counters
+
+
+def add_slides(prs, layout, count=1):
+    """Append `count` slides on `layout`; returns them.
+
+    Like `prs.slides.add_slide(layout)` (placeholders cloned from the
+    layout), but slide ids, relationship ids and partnames come from
+    counters instead of a scan of the deck per slide, so appending N slides
+    is O(N). New partnames follow the highest one in use, so they never
+    collide after slides were deleted. Shape ids of the new slides are
+    allocated from a counter too.
+    """
+    counters = _slide_counters(prs)
+    part, sld_id_lst = prs.part, prs.slides._sldIdLst
+    rels = part.rels
+    slides = []
+    for _ in range(count):
+        _, last, number, rId_number, max_id = counters
+        partname = PackURI("/ppt/slides/slide%d.xml" % number)
+        slide_part = SlidePart.new(partname, part.package, layout.part)
+        rId = "rId%d" % rId_number
+        rels._rels[rId] = _Relationship(rels._base_uri, rId, RT.SLIDE, RTM.INTERNAL, slide_part)
+        slide = slide_part.slide
+        slide.shapes.clone_layout_placeholders(layout)
+        if max_id >= MAX_SLIDE_ID:
+            last = sld_id_lst.add_sldId(rId)  # python-pptx looks for a free id below
+        else:
+            last = sld_id_lst._add_sldId(id=max_id + 1, rId=rId)
+        counters[:] = [len(rels), last, number + 1, rId_number + 1, max(max_id, last.id)]
+        # Shape ids from a counter: python-pptx otherwise rescans every id per shape
+        slide.shapes.turbo_add_enabled = True
+        slides.append(slide)
+    return slides
+
+
 def _add_blank_slide(prs):
     """Add a blank slide to the presentation."""
     layout = prs.slide_layouts[6]  # Blank layout
-    return prs.slides.add_slide(layout)
+    return add_slides(prs, layout)[0]
+
+
+def _add_titled_slide(prs, title, theme=D):
+    """Add a slide on the title layout and fill in its title.
+
+    The background, title formatting and underline come from the layout, so
+    the slide itself only holds the title text and its content shapes.
+    """
+    slide = add_slides(prs, _title_layout(prs, theme))[0]
+    slide.shapes.title.text_frame.paragraphs[0].text = title
+    return slide
 
 
 def _set_slide_background(slide, color):
@@ -40,10 +261,10 @@ def _set_slide_background(slide, color):
 
 
 def _add_textbox(slide, left, top, width, height, text,
-                 font_size=D.BODY_SIZE, font_color=D.DARK_TEXT,
+                 font_size=None, font_color=None,
                  bold=False, alignment=PP_ALIGN.LEFT,
-                 font_name=D.FONT_FAMILY, anchor=MSO_ANCHOR.TOP):
-    """Add a textbox with formatted text to a slide."""
+                 font_name=None, anchor=MSO_ANCHOR.TOP, theme=D):
+    """Add a textbox with formatted text (body text of `theme` by default) to a slide."""
     txBox = slide.shapes.add_textbox(left, top, width, height)
     tf = txBox.text_frame
     tf.word_wrap = True
@@ -57,21 +278,23 @@ def _add_textbox(slide, left, top, width, height, text,
 
     p = tf.paragraphs[0]
     p.text = text
-    p.font.size = font_size
-    p.font.color.rgb = font_color
-    p.font.bold = bold
-    p.font.name = font_name
+    _format_paragraph(p, theme.BODY_SIZE if font_size is None else font_size,
+                      theme.DARK_TEXT if font_color is None else font_color, bold,
+                      font_name or theme.FONT_FAMILY, theme)
     p.alignment = alignment
 
     return txBox
 
 
 def _add_multiline_textbox(slide, left, top, width, height, lines,
-                           font_size=D.BODY_SIZE, font_color=D.DARK_TEXT,
+                           font_size=None, font_color=None,
                            bold=False, alignment=PP_ALIGN.LEFT,
-                           font_name=D.FONT_FAMILY, line_spacing=None,
-                           bullet_color=None, bullet_char=None):
-    """Add a textbox with multiple paragraphs."""
+                           font_name=None, line_spacing=None,
+                           bullet_color=None, bullet_char=None, theme=D):
+    """Add a textbox with multiple paragraphs (body text of `theme` by default)."""
+    font_size = theme.BODY_SIZE if font_size is None else font_size
+    font_color = theme.DARK_TEXT if font_color is None else font_color
+    font_name = font_name or theme.FONT_FAMILY
     txBox = slide.shapes.add_textbox(left, top, width, height)
     tf = txBox.text_frame
     tf.word_wrap = True
@@ -85,23 +308,15 @@ def _add_multiline_textbox(slide, left, top, width, height, lines,
         if bullet_char:
             run_bullet = p.add_run()
             run_bullet.text = f"{bullet_char} "
-            run_bullet.font.size = font_size
-            run_bullet.font.bold = bold
-            run_bullet.font.name = font_name
-            run_bullet.font.color.rgb = bullet_color or font_color
+            _format_run(run_bullet, font_size, bullet_color or font_color, bold, font_name,
+                        theme)
 
             run_text = p.add_run()
             run_text.text = line
-            run_text.font.size = font_size
-            run_text.font.bold = False
-            run_text.font.name = font_name
-            run_text.font.color.rgb = font_color
+            _format_run(run_text, font_size, font_color, False, font_name, theme)
         else:
             p.text = line
-            p.font.size = font_size
-            p.font.color.rgb = font_color
-            p.font.bold = bold
-            p.font.name = font_name
+            _format_paragraph(p, font_size, font_color, bold, font_name, theme)
 
         p.alignment = alignment
         if line_spacing:
@@ -111,42 +326,37 @@ def _add_multiline_textbox(slide, left, top, width, height, lines,
 
 
 def _add_speaker_notes(slide, notes_text):
-    """Add speaker notes to a slide."""
+    """Add speaker notes (plain text, see notes.py) to a slide."""
     if not notes_text:
         return
-    notes_slide = slide.notes_slide
-    tf = notes_slide.notes_text_frame
-    tf.text = notes_text
+    write_notes(slide.part.package.presentation_part.presentation, [(slide, notes_text)])
 
 
-def _add_rectangle(slide, left, top, width, height, fill_color):
+def _add_rectangle(slide, left, top, width, height, fill_color, theme=D):
     """Add a filled rectangle shape."""
     from pptx.enum.shapes import MSO_SHAPE
     shape = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, left, top, width, height)
-    shape.fill.solid()
-    shape.fill.fore_color.rgb = fill_color
+    _fill_shape(shape, fill_color, theme)
     shape.line.fill.background()  # No border
     return shape
 
 
-def _add_line(slide, left, top, width, height, color, line_width=Pt(2)):
+def _add_line(slide, left, top, width, height, color, line_width=Pt(2), theme=D):
     """Add a line shape."""
     from pptx.enum.shapes import MSO_SHAPE
     shape = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, left, top, width, height)
-    shape.fill.solid()
-    shape.fill.fore_color.rgb = color
+    _fill_shape(shape, color, theme)
     shape.line.fill.background()
     return shape
 
 
 def _add_rounded_rectangle(slide, left, top, width, height, fill_color,
-                           border_color=None, text="", font_size=D.BODY_SIZE,
-                           font_color=D.WHITE, bold=False, alignment=PP_ALIGN.CENTER):
+                           border_color=None, text="", font_size=None,
+                           font_color=None, bold=False, alignment=PP_ALIGN.CENTER, theme=D):
     """Add a rounded rectangle with optional text inside."""
     from pptx.enum.shapes import MSO_SHAPE
     shape = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, left, top, width, height)
-    shape.fill.solid()
-    shape.fill.fore_color.rgb = fill_color
+    _fill_shape(shape, fill_color, theme)
     if border_color:
         shape.line.color.rgb = border_color
         shape.line.width = Pt(1)
@@ -157,74 +367,68 @@ def _add_rounded_rectangle(slide, left, top, width, height, fill_color,
         tf = shape.text_frame
         tf.word_wrap = True
         tf.paragraphs[0].text = text
-        tf.paragraphs[0].font.size = font_size
-        tf.paragraphs[0].font.color.rgb = font_color
-        tf.paragraphs[0].font.bold = bold
-        tf.paragraphs[0].font.name = D.FONT_FAMILY
+        _format_paragraph(tf.paragraphs[0], theme.BODY_SIZE if font_size is None else font_size,
+                          theme.WHITE if font_color is None else font_color, bold,
+                          theme.FONT_FAMILY, theme)
         tf.paragraphs[0].alignment = alignment
         shape.text_frame._txBody.bodyPr.set("anchor", "ctr")
     return shape
 
 
 def _add_chevron(slide, left, top, width, height, fill_color, text="",
-                 font_size=D.SMALL_SIZE, font_color=D.WHITE):
+                 font_size=None, font_color=None, theme=D):
     """Add a chevron (pentagon/arrow) shape with text."""
     from pptx.enum.shapes import MSO_SHAPE
     shape = slide.shapes.add_shape(MSO_SHAPE.CHEVRON, left, top, width, height)
-    shape.fill.solid()
-    shape.fill.fore_color.rgb = fill_color
+    _fill_shape(shape, fill_color, theme)
     shape.line.fill.background()
 
     if text:
         tf = shape.text_frame
         tf.word_wrap = True
         tf.paragraphs[0].text = text
-        tf.paragraphs[0].font.size = font_size
-        tf.paragraphs[0].font.color.rgb = font_color
-        tf.paragraphs[0].font.bold = True
-        tf.paragraphs[0].font.name = D.FONT_FAMILY
+        _format_paragraph(tf.paragraphs[0], theme.SMALL_SIZE if font_size is None else font_size,
+                          theme.WHITE if font_color is None else font_color, True,
+                          theme.FONT_FAMILY, theme)
         tf.paragraphs[0].alignment = PP_ALIGN.CENTER
         shape.text_frame._txBody.bodyPr.set("anchor", "ctr")
     return shape
 
 
 def _add_oval(slide, left, top, width, height, fill_color, text="",
-              font_size=D.BODY_SIZE, font_color=D.WHITE, bold=True):
+              font_size=None, font_color=None, bold=True, theme=D):
     """Add an oval/circle shape with text."""
     from pptx.enum.shapes import MSO_SHAPE
     shape = slide.shapes.add_shape(MSO_SHAPE.OVAL, left, top, width, height)
-    shape.fill.solid()
-    shape.fill.fore_color.rgb = fill_color
+    _fill_shape(shape, fill_color, theme)
     shape.line.fill.background()
 
     if text:
         tf = shape.text_frame
         tf.word_wrap = True
         tf.paragraphs[0].text = text
-        tf.paragraphs[0].font.size = font_size
-        tf.paragraphs[0].font.color.rgb = font_color
-        tf.paragraphs[0].font.bold = bold
-        tf.paragraphs[0].font.name = D.FONT_FAMILY
+        _format_paragraph(tf.paragraphs[0], theme.BODY_SIZE if font_size is None else font_size,
+                          theme.WHITE if font_color is None else font_color, bold,
+                          theme.FONT_FAMILY, theme)
         tf.paragraphs[0].alignment = PP_ALIGN.CENTER
         shape.text_frame._txBody.bodyPr.set("anchor", "ctr")
     return shape
 
 
-def _add_triangle(slide, left, top, width, height, fill_color):
+def _add_triangle(slide, left, top, width, height, fill_color, theme=D):
     """Add an isoceles triangle shape."""
     from pptx.enum.shapes import MSO_SHAPE
     shape = slide.shapes.add_shape(MSO_SHAPE.ISOSCELES_TRIANGLE, left, top, width, height)
-    shape.fill.solid()
-    shape.fill.fore_color.rgb = fill_color
+    _fill_shape(shape, fill_color, theme)
     shape.line.fill.background()
     return shape
 
 
 def _add_chart_bar(slide, left, top, width, height, categories, values,
-                   chart_title=""):
+                   chart_title="", theme=D):
     """Add a bar chart to the slide."""
     from pptx.chart.data import CategoryChartData
-    from pptx.enum.chart import XL_CHART_TYPE, XL_LEGEND_POSITION
+    from pptx.enum.chart import XL_CHART_TYPE
 
     chart_data = CategoryChartData()
     chart_data.categories = categories
@@ -233,35 +437,38 @@ def _add_chart_bar(slide, left, top, width, height, categories, values,
     chart_frame = slide.shapes.add_chart(
         XL_CHART_TYPE.COLUMN_CLUSTERED, left, top, width, height, chart_data
     )
-    chart = chart_frame.chart
+    _style_bar_chart(chart_frame.chart, theme)
+    return chart_frame
+
+
+def _style_bar_chart(chart, theme=D):
+    """Orange bars, grey axis labels and light gridlines."""
     chart.has_legend = False
 
     # Style the bars with orange
     plot = chart.plots[0]
     series = plot.series[0]
     series.format.fill.solid()
-    series.format.fill.fore_color.rgb = D.ORANGE
+    series.format.fill.fore_color.rgb = theme.ORANGE
 
     # Style axes
     category_axis = chart.category_axis
     category_axis.tick_labels.font.size = Pt(12)
-    category_axis.tick_labels.font.name = D.FONT_FAMILY
-    category_axis.tick_labels.font.color.rgb = D.GRAY
+    category_axis.tick_labels.font.name = theme.FONT_FAMILY
+    category_axis.tick_labels.font.color.rgb = theme.GRAY
 
     value_axis = chart.value_axis
     value_axis.tick_labels.font.size = Pt(11)
-    value_axis.tick_labels.font.name = D.FONT_FAMILY
-    value_axis.tick_labels.font.color.rgb = D.GRAY
+    value_axis.tick_labels.font.name = theme.FONT_FAMILY
+    value_axis.tick_labels.font.color.rgb = theme.GRAY
     value_axis.has_major_gridlines = True
-    value_axis.major_gridlines.format.line.color.rgb = D.LIGHT_GRAY
+    value_axis.major_gridlines.format.line.color.rgb = theme.LIGHT_GRAY
 
-    return chart_frame
 
-
-def _add_chart_pie(slide, left, top, width, height, categories, values):
+def _add_chart_pie(slide, left, top, width, height, categories, values, theme=D):
     """Add a pie chart to the slide."""
     from pptx.chart.data import CategoryChartData
-    from pptx.enum.chart import XL_CHART_TYPE, XL_LEGEND_POSITION, XL_LABEL_POSITION
+    from pptx.enum.chart import XL_CHART_TYPE
 
     chart_data = CategoryChartData()
     chart_data.categories = categories
@@ -270,11 +477,17 @@ def _add_chart_pie(slide, left, top, width, height, categories, values):
     chart_frame = slide.shapes.add_chart(
         XL_CHART_TYPE.PIE, left, top, width, height, chart_data
     )
-    chart = chart_frame.chart
+    _style_pie_chart(chart_frame.chart, theme)
+    return chart_frame
+
+
+def _style_pie_chart(chart, theme=D):
+    """Palette slices, percentage labels and a legend below the pie."""
+    from pptx.enum.chart import XL_LEGEND_POSITION
 
     # Color each slice
     plot = chart.plots[0]
-    colors = D.PROCESS_COLORS
+    colors = theme.PROCESS_COLORS
     for i, point in enumerate(plot.series[0].points):
         point.format.fill.solid()
         point.format.fill.fore_color.rgb = colors[i % len(colors)]
@@ -286,13 +499,11 @@ def _add_chart_pie(slide, left, top, width, height, categories, values):
     data_labels.show_category_name = True
     data_labels.show_value = False
     data_labels.font.size = Pt(11)
-    data_labels.font.name = D.FONT_FAMILY
-    data_labels.font.color.rgb = D.DARK_TEXT
+    data_labels.font.name = theme.FONT_FAMILY
+    data_labels.font.color.rgb = theme.DARK_TEXT
 
     chart.has_legend = True
     chart.legend.position = XL_LEGEND_POSITION.BOTTOM
     chart.legend.font.size = Pt(11)
-    chart.legend.font.name = D.FONT_FAMILY
+    chart.legend.font.name = theme.FONT_FAMILY
     chart.legend.include_in_layout = False
-
-    return chart_frame
@@ -0,0 +1,252 @@
+"""Text handouts: titles, content and speaker notes, as Markdown or plain text.
+
+From a plan, the text comes straight from the slide fields: nothing is
+rendered, so a handout costs a fraction of its deck. From an existing deck,
+the zip is indexed without inflating it (see package.LazyParts) and each
+slide, notes slide and chart part is read with iterparse, shape by shape:
+
+    write_handout(plan, "gpec.md")           # during rendering
+    write_handout("gpec.pptx", "gpec.txt")   # from a deck, format by extension
+    for chunk in handout(deck_slides("gpec.pptx")):
+        out.write(chunk)
+
+Handouts are produced one slide at a time (an iterator of strings), so
+thousands of them stream with constant memory.
+"""
+
+import io
+import re
+from collections import namedtuple
+
+from lxml import etree
+
+from .merge import slide_partnames
+from .notes import _BULLET_RE, _HEADING_RE, _SPAN_RE
+from .package import A_NS, P_NS, R_NS, RT_NOTES_SLIDE, Package
+
+C_NS = "http://schemas.openxmlformats.org/drawingml/2006/chart"
+
+_A, _P, _C = "{%s}" % A_NS, "{%s}" % P_NS, "{%s}" % C_NS
+_SHAPE_TAGS = (_P + "sp", _P + "graphicFrame")
+_TITLE_TYPES = ("title", "ctrTitle")
+
+# A run holding only a bullet glyph and a space ("• ", "✓ "), as the layouts write them
+_BULLET_RUN_RE = re.compile(r"[^\w\s]\s")
+_WORD_RE = re.compile(r"\w")
+
+# `lines` are (level, text); `notes` is markdown-ish, as in a plan (see notes.py)
+HandoutSlide = namedtuple("HandoutSlide", "heading lines notes")
+
+
+def _one_line(text):
+    return " ".join(text.split())
+
+
+# === From a plan ===
+
+
+def _items(items, level=0):
+    return [(level, item) for item in items]
+
+
+def _pairs(pairs, level=0):
+    return [(level, f"{a} : {b}") for a, b in pairs]
+
+
+def _quadrants(s):
+    lines = []
+    for key in ("top_left", "top_right", "bottom_left", "bottom_right"):
+        lines += [(0, s[key]["title"])] + _items(s[key].get("items", []), 1)
+    return lines
+
+
+def _people(s):
+    person = "{name} : {title}".format
+    return [(0, person(**s["manager"]))] + [(1, person(**r)) for r in s["reports"]]
+
+
+# layout -> (heading, lines) of a plan entry
+PLAN_TEXT = {
+    "title": lambda s: (s["title"], _items([s["subtitle"]] if s.get("subtitle") else [])),
+    "agenda": lambda s: (s.get("title", "Agenda"), _items(s["items"])),
+    "section": lambda s: (s["title"], _items([s["subtitle"]] if s.get("subtitle") else [])),
+    "bullets": lambda s: (s["title"], _items(s["bullets"])),
+    "two_columns": lambda s: (s["title"], [(0, s["left_title"])] + _items(s["left_items"], 1)
+                              + [(0, s["right_title"])] + _items(s["right_items"], 1)),
+    "key_stat": lambda s: (s["stat"], _items([s["description"]])),
+    "quote": lambda s: (s["quote"], _items([f"— {s['author']}"] if s.get("author") else [])),
+    "conclusion": lambda s: (s["title"], _items(s["points"])),
+    "process_flow": lambda s: (s["title"], _items(s["steps"])),
+    "timeline": lambda s: (s["title"], _pairs(s["milestones"])),
+    "matrix": lambda s: (s["title"], _quadrants(s)),
+    "pyramid": lambda s: (s["title"], _items(s["levels"])),
+    "bar_chart": lambda s: (s["title"], _pairs(zip(s["categories"], map("{:g}".format, s["values"])))),
+    "pie_chart": lambda s: (s["title"], _pairs(zip(s["categories"], map("{:g}".format, s["values"])))),
+    "icon_cards": lambda s: (s["title"], _pairs((c["value"], c["label"]) for c in s["cards"])),
+    "org_chart": lambda s: (s["title"], _people(s)),
+    "funnel": lambda s: (s["title"], _pairs((st["label"], st["value"]) for st in s["stages"])),
+    "team_grid": lambda s: (s["title"], [
+        (0, f"{m['name']} : {m['role']}" + (f" ({m['desc']})" if m.get("desc") else ""))
+        for m in s["members"]]),
+}
+
+
+def plan_slides(plan):
+    """HandoutSlides of a (valid) plan, in order."""
+    for spec in plan["slides"]:
+        heading, lines = PLAN_TEXT[spec["layout"]](spec)
+        yield HandoutSlide(_one_line(heading), [(level, _one_line(text)) for level, text in lines],
+                           spec.get("notes", ""))
+
+
+# === From a deck ===
+
+
+def _paragraph(p):
+    """(bulleted, text) of an ``<a:p>``, without a leading bullet run."""
+    runs = [" " if el.tag == _A + "br" else el.text or ""
+            for el in p.iter(_A + "t", _A + "br")]
+    if len(runs) > 1 and _BULLET_RUN_RE.fullmatch(runs[0]):
+        runs = runs[1:]
+    return p.find(f"{_A}pPr/{_A}buChar") is not None, _one_line("".join(runs))
+
+
+def _shapes(blob):
+    """Yield (placeholder type or None, [(bulleted, text)], chart rId or None)
+    for each shape of a slide or notes part, streamed with iterparse."""
+    ph_type = chart = None
+    paragraphs = []
+    tags = (_A + "p", _P + "ph", _C + "chart") + _SHAPE_TAGS
+    for _, el in etree.iterparse(io.BytesIO(blob), events=("end",), tag=tags):
+        if el.tag == _A + "p":
+            bulleted, text = _paragraph(el)
+            if text:
+                paragraphs.append((bulleted, text))
+        elif el.tag == _P + "ph":
+            ph_type = el.get("type", "obj")
+        elif el.tag == _C + "chart":
+            chart = el.get("{%s}id" % R_NS)
+        else:
+            yield ph_type, paragraphs, chart
+            ph_type = chart = None
+            paragraphs = []
+            el.clear()
+            while el.getprevious() is not None:
+                del el.getparent()[0]
+
+
+def _chart_lines(blob):
+    lines = []
+    for _, ser in etree.iterparse(io.BytesIO(blob), events=("end",), tag=_C + "ser"):
+        categories = [v.text for v in ser.iterfind(f"{_C}cat//{_C}pt/{_C}v")]
+        values = [v.text for v in ser.iterfind(f"{_C}val//{_C}pt/{_C}v")]
+        lines += _pairs(zip(categories, values))
+        ser.clear()
+    return lines
+
+
+def _deck_slide(pkg, name):
+    heading, lines = None, []
+    for ph_type, paragraphs, chart in _shapes(pkg.parts[name]):
+        if chart is not None:
+            target = next(r.target for r in pkg.rels(name) if r.rId == chart)
+            lines += [text for _, text in _chart_lines(pkg.parts[target])]
+        texts = [text for _, text in paragraphs if _WORD_RE.search(text)]
+        if ph_type in _TITLE_TYPES and heading is None:
+            heading = " ".join(texts)
+        else:
+            lines += texts
+    if heading is None and lines:
+        heading = lines.pop(0)
+
+    notes = []
+    notes_name = pkg.related(name, RT_NOTES_SLIDE)
+    if notes_name is not None:
+        for ph_type, paragraphs, _ in _shapes(pkg.parts[notes_name]):
+            if ph_type == "body":
+                notes += [("- " if bulleted else "") + text for bulleted, text in paragraphs]
+    return HandoutSlide(heading or "", _items(lines), "\n".join(notes))
+
+
+def deck_slides(source):
+    """HandoutSlides of a .pptx path or file-like object, in presentation order.
+
+    The heading is the title placeholder, or else the first line of text;
+    charts give one ``category : value`` line per data point.
+    """
+    pkg = Package.open(source, lazy=True)
+    for name in slide_partnames(pkg):
+        yield _deck_slide(pkg, name)
+
+
+# === Output ===
+
+
+def _plain_notes(text):
+    lines = []
+    for line in text.split("\n"):
+        bullet, heading = _BULLET_RE.match(line), _HEADING_RE.match(line)
+        if bullet:
+            line = "• " + line[bullet.end():]
+        elif heading:
+            line = line[heading.end():]
+        lines.append(_SPAN_RE.sub(lambda m: m.group(1) or m.group(2) or m.group(3), line))
+    return lines
+
+
+def _markdown(number, slide):
+    out = [f"## {number}. {slide.heading}\n\n"]
+    out += [f"{'  ' * level}- {text}\n" for level, text in slide.lines]
+    if slide.lines:
+        out.append("\n")
+    if slide.notes:
+        out += [f"> {line}\n".replace("> \n", ">\n") for line in slide.notes.split("\n")]
+        out.append("\n")
+    return "".join(out)
+
+
+def _text(number, slide):
+    out = [f"{number}. {slide.heading}\n"]
+    out += [f"{'   ' * (level + 1)}{text}\n" for level, text in slide.lines]
+    if slide.notes:
+        out.append("   Notes:\n")
+        out += [f"     {line}\n".rstrip(" ") for line in _plain_notes(slide.notes)]
+    out.append("\n")
+    return "".join(out)
+
+
+FORMATS = {"markdown": _markdown, "text": _text}
+EXTENSIONS = {".md": "markdown", ".markdown": "markdown", ".txt": "text"}
+
+
+def handout(slides, fmt="markdown", title=None):
+    """Yield the handout of `slides` (HandoutSlides) as strings, one per
+    slide after an optional `title` heading."""
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown handout format: {fmt!r}")
+    if title:
+        yield f"# {title}\n\n" if fmt == "markdown" else f"{title}\n{'=' * len(title)}\n\n"
+    for number, slide in enumerate(slides, 1):
+        yield FORMATS[fmt](number, slide)
+
+
+def write_handout(source, target, fmt=None, title=None):
+    """Write the handout of a plan (dict) or a deck (path or file-like
+    object) to `target`, a path or text file. The format defaults to the
+    target's extension (``.md``, ``.txt``), else Markdown; a plan's
+    ``title`` field is used as `title`. Returns `target`."""
+    if isinstance(source, dict):
+        slides = plan_slides(source)
+        title = title or source.get("title")
+    else:
+        slides = deck_slides(source)
+    if fmt is None:
+        ext = "." + target.rpartition(".")[2].lower() if isinstance(target, str) else ""
+        fmt = EXTENSIONS.get(ext, "markdown")
+    chunks = handout(slides, fmt, title)
+    if isinstance(target, str):
+        with open(target, "w", encoding="utf-8") as f:
+            f.writelines(chunks)
+    else:
+        target.writelines(chunks)
+    return target
@@ -1,11 +1,14 @@
 """Layout functions for HR Slide Engine — 18 professional slide types."""
 
+import types
+
 from pptx.util import Inches, Pt
 from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
 
 from . import design as D
 from .engine import (
     _add_blank_slide,
+    _add_titled_slide,
     _set_slide_background,
     _add_textbox,
     _add_multiline_textbox,
@@ -21,60 +24,49 @@ from .engine import (
 )
 
 
-def add_title_slide(prs, title, subtitle="", notes=""):
+def add_title_slide(prs, title, subtitle="", notes="", theme=D):
     """Slide 1 — Title: navy background, white centered text."""
     slide = _add_blank_slide(prs)
-    _set_slide_background(slide, D.NAVY)
+    _set_slide_background(slide, theme.NAVY)
 
     # Title
     _add_textbox(
         slide,
-        left=D.MARGIN_LEFT, top=Inches(2.2),
-        width=D.CONTENT_WIDTH, height=Inches(1.5),
+        left=theme.MARGIN_LEFT, top=Inches(2.2),
+        width=theme.CONTENT_WIDTH, height=Inches(1.5),
         text=title,
-        font_size=Pt(36), font_color=D.WHITE,
+        font_size=Pt(36), font_color=theme.WHITE,
         bold=True, alignment=PP_ALIGN.CENTER,
         anchor=MSO_ANCHOR.BOTTOM,
+        theme=theme,
     )
 
     # Orange accent line
     line_width = Inches(3)
-    line_left = (D.SLIDE_WIDTH - line_width) // 2
-    _add_line(slide, line_left, Inches(3.8), line_width, Pt(3), D.ORANGE)
+    line_left = (theme.SLIDE_WIDTH - line_width) // 2
+    _add_line(slide, line_left, Inches(3.8), line_width, Pt(3), theme.ORANGE, theme=theme)
 
     # Subtitle
     if subtitle:
         _add_textbox(
             slide,
-            left=D.MARGIN_LEFT, top=Inches(4.1),
-            width=D.CONTENT_WIDTH, height=Inches(1.0),
+            left=theme.MARGIN_LEFT, top=Inches(4.1),
+            width=theme.CONTENT_WIDTH, height=Inches(1.0),
             text=subtitle,
-            font_size=D.SUBTITLE_SIZE, font_color=D.LIGHT_GRAY,
+            font_size=theme.SUBTITLE_SIZE, font_color=theme.LIGHT_GRAY,
             bold=False, alignment=PP_ALIGN.CENTER,
             anchor=MSO_ANCHOR.TOP,
+            theme=theme,
         )
 
     _add_speaker_notes(slide, notes)
     return slide
 
 
-def add_agenda_slide(prs, items, title="Agenda", notes=""):
+def add_agenda_slide(prs, items, title="Agenda", notes="", theme=D):
     """Slide 2 — Agenda: numbered list with orange numbers."""
-    slide = _add_blank_slide(prs)
-    _set_slide_background(slide, D.WHITE)
-
-    # Title
-    _add_textbox(
-        slide,
-        left=D.MARGIN_LEFT, top=D.MARGIN_TOP,
-        width=D.CONTENT_WIDTH, height=Inches(0.8),
-        text=title,
-        font_size=D.TITLE_SIZE, font_color=D.NAVY,
-        bold=True, alignment=PP_ALIGN.LEFT,
-    )
-
-    # Underline
-    _add_line(slide, D.MARGIN_LEFT, Inches(1.5), Inches(2), Pt(3), D.ORANGE)
+    # Title and underline come from the title layout
+    slide = _add_titled_slide(prs, title, theme=theme)
 
     # Items
     y_start = Inches(2.0)
@@ -85,38 +77,41 @@ def add_agenda_slide(prs, items, title="Agenda", notes=""):
         # Orange number
         _add_textbox(
             slide,
-            left=D.MARGIN_LEFT, top=y,
+            left=theme.MARGIN_LEFT, top=y,
             width=Inches(0.6), height=item_height,
             text=f"{i:02d}",
-            font_size=Pt(22), font_color=D.ORANGE,
+            font_size=Pt(22), font_color=theme.ORANGE,
             bold=True, alignment=PP_ALIGN.LEFT,
+            theme=theme,
         )
 
         # Item text
         _add_textbox(
             slide,
-            left=D.MARGIN_LEFT + Inches(0.7), top=y,
-            width=D.CONTENT_WIDTH - Inches(0.7), height=item_height,
+            left=theme.MARGIN_LEFT + Inches(0.7), top=y,
+            width=theme.CONTENT_WIDTH - Inches(0.7), height=item_height,
             text=item,
-            font_size=D.BODY_SIZE, font_color=D.DARK_TEXT,
+            font_size=theme.BODY_SIZE, font_color=theme.DARK_TEXT,
             bold=False, alignment=PP_ALIGN.LEFT,
+            theme=theme,
         )
 
     _add_speaker_notes(slide, notes)
     return slide
 
 
-def add_section_slide(prs, title, subtitle="", notes=""):
+def add_section_slide(prs, title, subtitle="", notes="", theme=D):
     """Slide 3 — Section divider: navy bar on the left, large title."""
     slide = _add_blank_slide(prs)
-    _set_slide_background(slide, D.WHITE)
+    _set_slide_background(slide, theme.WHITE)
 
     # Navy vertical bar
     _add_rectangle(
         slide,
         left=Inches(0.4), top=Inches(1.5),
-        width=D.SECTION_BAR_WIDTH, height=Inches(4.5),
-        fill_color=D.NAVY,
+        width=theme.SECTION_BAR_WIDTH, height=Inches(4.5),
+        fill_color=theme.NAVY,
+        theme=theme,
     )
 
     # Title
@@ -125,9 +120,10 @@ def add_section_slide(prs, title, subtitle="", notes=""):
         left=Inches(1.0), top=Inches(2.5),
         width=Inches(10.5), height=Inches(1.5),
         text=title,
-        font_size=Pt(32), font_color=D.NAVY,
+        font_size=Pt(32), font_color=theme.NAVY,
         bold=True, alignment=PP_ALIGN.LEFT,
         anchor=MSO_ANCHOR.BOTTOM,
+        theme=theme,
     )
 
     # Subtitle
@@ -137,41 +133,30 @@ def add_section_slide(prs, title, subtitle="", notes=""):
             left=Inches(1.0), top=Inches(4.2),
             width=Inches(10.5), height=Inches(0.8),
             text=subtitle,
-            font_size=D.SUBTITLE_SIZE, font_color=D.GRAY,
+            font_size=theme.SUBTITLE_SIZE, font_color=theme.GRAY,
             bold=False, alignment=PP_ALIGN.LEFT,
+            theme=theme,
         )
 
     _add_speaker_notes(slide, notes)
     return slide
 
 
-def add_bullets_slide(prs, title, bullets, notes=""):
+def add_bullets_slide(prs, title, bullets, notes="", theme=D):
     """Slide 4 — Bullet points: orange bullets, gray text."""
-    slide = _add_blank_slide(prs)
-    _set_slide_background(slide, D.WHITE)
-
-    # Title
-    _add_textbox(
-        slide,
-        left=D.MARGIN_LEFT, top=D.MARGIN_TOP,
-        width=D.CONTENT_WIDTH, height=Inches(0.8),
-        text=title,
-        font_size=D.TITLE_SIZE, font_color=D.NAVY,
-        bold=True, alignment=PP_ALIGN.LEFT,
-    )
-
-    # Underline
-    _add_line(slide, D.MARGIN_LEFT, Inches(1.5), Inches(2), Pt(3), D.ORANGE)
+    # Title and underline come from the title layout
+    slide = _add_titled_slide(prs, title, theme=theme)
 
     # Bullet items
     _add_multiline_textbox(
         slide,
-        left=D.MARGIN_LEFT + Inches(0.3), top=Inches(2.0),
-        width=D.CONTENT_WIDTH - Inches(0.3), height=Inches(4.5),
+        left=theme.MARGIN_LEFT + Inches(0.3), top=Inches(2.0),
+        width=theme.CONTENT_WIDTH - Inches(0.3), height=Inches(4.5),
         lines=bullets,
-        font_size=D.BODY_SIZE, font_color=D.GRAY,
-        bullet_char=D.BULLET_CHAR, bullet_color=D.ORANGE,
-        line_spacing=D.PARAGRAPH_SPACING,
+        font_size=theme.BODY_SIZE, font_color=theme.GRAY,
+        bullet_char=theme.BULLET_CHAR, bullet_color=theme.ORANGE,
+        line_spacing=theme.PARAGRAPH_SPACING,
+        theme=theme,
     )
 
     _add_speaker_notes(slide, notes)
@@ -179,30 +164,18 @@ def add_bullets_slide(prs, title, bullets, notes=""):
 
 
 def add_two_columns_slide(prs, title, left_title, left_items,
-                          right_title, right_items, notes=""):
+                          right_title, right_items, notes="", theme=D):
     """Slide 5 — Two columns: separated by a thin gray line."""
-    slide = _add_blank_slide(prs)
-    _set_slide_background(slide, D.WHITE)
-
-    # Title
-    _add_textbox(
-        slide,
-        left=D.MARGIN_LEFT, top=D.MARGIN_TOP,
-        width=D.CONTENT_WIDTH, height=Inches(0.8),
-        text=title,
-        font_size=D.TITLE_SIZE, font_color=D.NAVY,
-        bold=True, alignment=PP_ALIGN.LEFT,
-    )
-
-    _add_line(slide, D.MARGIN_LEFT, Inches(1.5), Inches(2), Pt(3), D.ORANGE)
+    # Title and underline come from the title layout
+    slide = _add_titled_slide(prs, title, theme=theme)
 
-    col_width = (D.CONTENT_WIDTH - D.COLUMN_GAP) / 2
-    left_x = D.MARGIN_LEFT
-    right_x = D.MARGIN_LEFT + col_width + D.COLUMN_GAP
+    col_width = (theme.CONTENT_WIDTH - theme.COLUMN_GAP) / 2
+    left_x = theme.MARGIN_LEFT
+    right_x = theme.MARGIN_LEFT + col_width + theme.COLUMN_GAP
 
     # Vertical separator
-    sep_x = D.MARGIN_LEFT + col_width + (D.COLUMN_GAP // 2)
-    _add_line(slide, sep_x, Inches(2.0), Pt(1), Inches(4.5), D.LIGHT_GRAY)
+    sep_x = theme.MARGIN_LEFT + col_width + (theme.COLUMN_GAP // 2)
+    _add_line(slide, sep_x, Inches(2.0), Pt(1), Inches(4.5), theme.LIGHT_GRAY, theme=theme)
 
     # Left column title
     _add_textbox(
@@ -210,8 +183,9 @@ def add_two_columns_slide(prs, title, left_title, left_items,
         left=left_x, top=Inches(2.0),
         width=col_width, height=Inches(0.6),
         text=left_title,
-        font_size=Pt(22), font_color=D.NAVY,
+        font_size=Pt(22), font_color=theme.NAVY,
         bold=True, alignment=PP_ALIGN.LEFT,
+        theme=theme,
     )
 
     # Left column items
@@ -220,9 +194,10 @@ def add_two_columns_slide(prs, title, left_title, left_items,
         left=left_x + Inches(0.2), top=Inches(2.7),
         width=col_width - Inches(0.2), height=Inches(3.8),
         lines=left_items,
-        font_size=Pt(18), font_color=D.GRAY,
-        bullet_char=D.BULLET_CHAR, bullet_color=D.ORANGE,
-        line_spacing=D.LINE_SPACING,
+        font_size=Pt(18), font_color=theme.GRAY,
+        bullet_char=theme.BULLET_CHAR, bullet_color=theme.ORANGE,
+        line_spacing=theme.LINE_SPACING,
+        theme=theme,
     )
 
     # Right column title
@@ -231,8 +206,9 @@ def add_two_columns_slide(prs, title, left_title, left_items,
         left=right_x, top=Inches(2.0),
         width=col_width, height=Inches(0.6),
         text=right_title,
-        font_size=Pt(22), font_color=D.NAVY,
+        font_size=Pt(22), font_color=theme.NAVY,
         bold=True, alignment=PP_ALIGN.LEFT,
+        theme=theme,
     )
 
     # Right column items
@@ -241,59 +217,63 @@ def add_two_columns_slide(prs, title, left_title, left_items,
         left=right_x + Inches(0.2), top=Inches(2.7),
         width=col_width - Inches(0.2), height=Inches(3.8),
         lines=right_items,
-        font_size=Pt(18), font_color=D.GRAY,
-        bullet_char=D.BULLET_CHAR, bullet_color=D.ORANGE,
-        line_spacing=D.LINE_SPACING,
+        font_size=Pt(18), font_color=theme.GRAY,
+        bullet_char=theme.BULLET_CHAR, bullet_color=theme.ORANGE,
+        line_spacing=theme.LINE_SPACING,
+        theme=theme,
     )
 
     _add_speaker_notes(slide, notes)
     return slide
 
 
-def add_key_stat_slide(prs, stat, description, notes=""):
+def add_key_stat_slide(prs, stat, description, notes="", theme=D):
     """Slide 6 — Key statistic: large orange number centered."""
     slide = _add_blank_slide(prs)
-    _set_slide_background(slide, D.WHITE)
+    _set_slide_background(slide, theme.WHITE)
 
     # Big stat
     _add_textbox(
         slide,
-        left=D.MARGIN_LEFT, top=Inches(1.8),
-        width=D.CONTENT_WIDTH, height=Inches(2.5),
+        left=theme.MARGIN_LEFT, top=Inches(1.8),
+        width=theme.CONTENT_WIDTH, height=Inches(2.5),
         text=stat,
-        font_size=D.STAT_SIZE, font_color=D.ORANGE,
+        font_size=theme.STAT_SIZE, font_color=theme.ORANGE,
         bold=True, alignment=PP_ALIGN.CENTER,
         anchor=MSO_ANCHOR.BOTTOM,
+        theme=theme,
     )
 
     # Description
     _add_textbox(
         slide,
-        left=D.MARGIN_LEFT, top=Inches(4.5),
-        width=D.CONTENT_WIDTH, height=Inches(1.5),
+        left=theme.MARGIN_LEFT, top=Inches(4.5),
+        width=theme.CONTENT_WIDTH, height=Inches(1.5),
         text=description,
-        font_size=D.BODY_SIZE, font_color=D.GRAY,
+        font_size=theme.BODY_SIZE, font_color=theme.GRAY,
         bold=False, alignment=PP_ALIGN.CENTER,
         anchor=MSO_ANCHOR.TOP,
+        theme=theme,
     )
 
     _add_speaker_notes(slide, notes)
     return slide
 
 
-def add_quote_slide(prs, quote, author="", notes=""):
+def add_quote_slide(prs, quote, author="", notes="", theme=D):
     """Slide 7 — Quote: light gray background, decorative quotation mark."""
     slide = _add_blank_slide(prs)
-    _set_slide_background(slide, D.LIGHT_GRAY)
+    _set_slide_background(slide, theme.LIGHT_GRAY)
 
     # Decorative large quote mark
     _add_textbox(
         slide,
         left=Inches(1.0), top=Inches(1.0),
         width=Inches(2.0), height=Inches(2.0),
-        text=D.QUOTE_CHAR,
-        font_size=Pt(120), font_color=D.ORANGE,
+        text=theme.QUOTE_CHAR,
+        font_size=Pt(120), font_color=theme.ORANGE,
         bold=False, alignment=PP_ALIGN.LEFT,
+        theme=theme,
     )
 
     # Quote text
@@ -302,9 +282,10 @@ def add_quote_slide(prs, quote, author="", notes=""):
         left=Inches(2.0), top=Inches(2.5),
         width=Inches(9.0), height=Inches(2.5),
         text=quote,
-        font_size=D.QUOTE_SIZE, font_color=D.NAVY,
+        font_size=theme.QUOTE_SIZE, font_color=theme.NAVY,
         bold=False, alignment=PP_ALIGN.LEFT,
         anchor=MSO_ANCHOR.MIDDLE,
+        theme=theme,
     )
 
     # Author
@@ -314,47 +295,51 @@ def add_quote_slide(prs, quote, author="", notes=""):
             left=Inches(2.0), top=Inches(5.3),
             width=Inches(9.0), height=Inches(0.6),
             text=f"— {author}",
-            font_size=D.SUBTITLE_SIZE, font_color=D.GRAY,
+            font_size=theme.SUBTITLE_SIZE, font_color=theme.GRAY,
             bold=False, alignment=PP_ALIGN.LEFT,
+            theme=theme,
         )
 
     _add_speaker_notes(slide, notes)
     return slide
 
 
-def add_conclusion_slide(prs, title, points, notes=""):
+def add_conclusion_slide(prs, title, points, notes="", theme=D):
     """Slide 8 — Conclusion: navy banner at top, checkmarks orange."""
     slide = _add_blank_slide(prs)
-    _set_slide_background(slide, D.WHITE)
+    _set_slide_background(slide, theme.WHITE)
 
     # Navy banner
     _add_rectangle(
         slide,
         left=Inches(0), top=Inches(0),
-        width=D.SLIDE_WIDTH, height=Inches(1.8),
-        fill_color=D.NAVY,
+        width=theme.SLIDE_WIDTH, height=Inches(1.8),
+        fill_color=theme.NAVY,
+        theme=theme,
     )
 
     # Title on banner
     _add_textbox(
         slide,
-        left=D.MARGIN_LEFT, top=Inches(0.4),
-        width=D.CONTENT_WIDTH, height=Inches(1.0),
+        left=theme.MARGIN_LEFT, top=Inches(0.4),
+        width=theme.CONTENT_WIDTH, height=Inches(1.0),
         text=title,
-        font_size=D.TITLE_SIZE, font_color=D.WHITE,
+        font_size=theme.TITLE_SIZE, font_color=theme.WHITE,
         bold=True, alignment=PP_ALIGN.LEFT,
         anchor=MSO_ANCHOR.MIDDLE,
+        theme=theme,
     )
 
     # Conclusion points with checkmarks
     _add_multiline_textbox(
         slide,
-        left=D.MARGIN_LEFT + Inches(0.3), top=Inches(2.3),
-        width=D.CONTENT_WIDTH - Inches(0.3), height=Inches(4.5),
+        left=theme.MARGIN_LEFT + Inches(0.3), top=Inches(2.3),
+        width=theme.CONTENT_WIDTH - Inches(0.3), height=Inches(4.5),
         lines=points,
-        font_size=D.BODY_SIZE, font_color=D.DARK_TEXT,
-        bullet_char=D.CHECKMARK_CHAR, bullet_color=D.ORANGE,
-        line_spacing=D.PARAGRAPH_SPACING,
+        font_size=theme.BODY_SIZE, font_color=theme.DARK_TEXT,
+        bullet_char=theme.CHECKMARK_CHAR, bullet_color=theme.ORANGE,
+        line_spacing=theme.PARAGRAPH_SPACING,
+        theme=theme,
     )
 
     _add_speaker_notes(slide, notes)
@@ -366,82 +351,61 @@ def add_conclusion_slide(prs, title, points, notes=""):
 # ===================================================================
 
 
-def add_process_flow_slide(prs, title, steps, notes=""):
+def add_process_flow_slide(prs, title, steps, notes="", theme=D):
     """Slide 9 — Process flow: connected chevron arrows, colored steps."""
-    slide = _add_blank_slide(prs)
-    _set_slide_background(slide, D.WHITE)
-
-    # Title
-    _add_textbox(
-        slide,
-        left=D.MARGIN_LEFT, top=D.MARGIN_TOP,
-        width=D.CONTENT_WIDTH, height=Inches(0.8),
-        text=title,
-        font_size=D.TITLE_SIZE, font_color=D.NAVY,
-        bold=True, alignment=PP_ALIGN.LEFT,
-    )
-    _add_line(slide, D.MARGIN_LEFT, Inches(1.5), Inches(2), Pt(3), D.ORANGE)
+    # Title and underline come from the title layout
+    slide = _add_titled_slide(prs, title, theme=theme)
 
     n = len(steps)
-    total_width = D.CONTENT_WIDTH
+    total_width = theme.CONTENT_WIDTH
     gap = Inches(0.05)
     chevron_w = (total_width - gap * (n - 1)) / n
     chevron_h = Inches(1.2)
     y_chevron = Inches(2.5)
-    colors = D.PROCESS_COLORS
+    colors = theme.PROCESS_COLORS
 
     for i, step in enumerate(steps):
-        x = D.MARGIN_LEFT + i * (chevron_w + gap)
+        x = theme.MARGIN_LEFT + i * (chevron_w + gap)
         color = colors[i % len(colors)]
         _add_chevron(slide, x, y_chevron, chevron_w, chevron_h, color,
-                     text=step, font_size=Pt(12), font_color=D.WHITE)
+                     text=step, font_size=Pt(12), font_color=theme.WHITE, theme=theme)
 
         # Step number circle above
         circle_size = Inches(0.5)
         circle_x = x + (chevron_w - circle_size) // 2
         _add_oval(slide, circle_x, Inches(1.85), circle_size, circle_size,
-                  color, text=str(i + 1), font_size=Pt(14), font_color=D.WHITE)
+                  color, text=str(i + 1), font_size=Pt(14), font_color=theme.WHITE, theme=theme)
 
     # Description area below
     desc_y = Inches(4.2)
     desc_w = total_width / n
     for i, step in enumerate(steps):
-        x = D.MARGIN_LEFT + i * desc_w
+        x = theme.MARGIN_LEFT + i * desc_w
         _add_textbox(
             slide, x, desc_y, desc_w, Inches(2.5),
             text=step,
-            font_size=Pt(13), font_color=D.GRAY,
+            font_size=Pt(13), font_color=theme.GRAY,
             alignment=PP_ALIGN.CENTER,
+            theme=theme,
         )
 
     _add_speaker_notes(slide, notes)
     return slide
 
 
-def add_timeline_slide(prs, title, milestones, notes=""):
+def add_timeline_slide(prs, title, milestones, notes="", theme=D):
     """Slide 10 — Timeline: horizontal line with milestones above/below.
 
     milestones: list of (date_label, description) tuples
     """
-    slide = _add_blank_slide(prs)
-    _set_slide_background(slide, D.WHITE)
-
-    # Title
-    _add_textbox(
-        slide,
-        left=D.MARGIN_LEFT, top=D.MARGIN_TOP,
-        width=D.CONTENT_WIDTH, height=Inches(0.8),
-        text=title,
-        font_size=D.TITLE_SIZE, font_color=D.NAVY,
-        bold=True, alignment=PP_ALIGN.LEFT,
-    )
-    _add_line(slide, D.MARGIN_LEFT, Inches(1.5), Inches(2), Pt(3), D.ORANGE)
+    # Title and underline come from the title layout
+    slide = _add_titled_slide(prs, title, theme=theme)
 
     # Horizontal timeline line
     line_y = Inches(4.0)
-    line_left = D.MARGIN_LEFT + Inches(0.3)
-    line_w = D.CONTENT_WIDTH - Inches(0.6)
-    _add_line(slide, line_left, line_y, line_w, Pt(4), D.NAVY)
+    line_left = theme.MARGIN_LEFT + Inches(0.3)
+    line_w = theme.CONTENT_WIDTH - Inches(0.6)
+    _add_line(slide, line_left, line_y, line_w, Pt(4), theme.NAVY, theme=theme)
 
     n = len(milestones)
     spacing = line_w / max(n - 1, 1) if n > 1 else line_w
@@ -458,7 +422,8 @@ def add_timeline_slide(prs, title, milestones, notes=""):
             slide,
             x_center - dot_size // 2, line_y - dot_size // 2,
             dot_size, dot_size,
-            D.ORANGE,
+            theme.ORANGE,
+            theme=theme,
         )
 
         text_w = Inches(2.2)
@@ -470,34 +435,40 @@ def add_timeline_slide(prs, title, milestones, notes=""):
             _add_textbox(
                 slide, text_x, Inches(2.2), text_w, Inches(0.5),
                 text=date_label,
-                font_size=Pt(14), font_color=D.ORANGE,
+                font_size=Pt(14), font_color=theme.ORANGE,
                 bold=True, alignment=PP_ALIGN.CENTER,
+                theme=theme,
             )
             # Description above
             _add_textbox(
                 slide, text_x, Inches(2.7), text_w, Inches(1.0),
                 text=description,
-                font_size=Pt(12), font_color=D.GRAY,
+                font_size=Pt(12), font_color=theme.GRAY,
                 alignment=PP_ALIGN.CENTER,
+                theme=theme,
             )
             # Vertical connector
-            _add_line(slide, x_center, Inches(3.7), Pt(2), Inches(0.3), D.LIGHT_GRAY)
+            _add_line(slide, x_center, Inches(3.7), Pt(2), Inches(0.3), theme.LIGHT_GRAY,
+                      theme=theme)
         else:
             # Vertical connector
-            _add_line(slide, x_center, line_y + dot_size // 2, Pt(2), Inches(0.3), D.LIGHT_GRAY)
+            _add_line(slide, x_center, line_y + dot_size // 2, Pt(2), Inches(0.3), theme.LIGHT_GRAY,
+                      theme=theme)
             # Date below
             _add_textbox(
                 slide, text_x, Inches(4.6), text_w, Inches(0.5),
                 text=date_label,
-                font_size=Pt(14), font_color=D.ORANGE,
+                font_size=Pt(14), font_color=theme.ORANGE,
                 bold=True, alignment=PP_ALIGN.CENTER,
+                theme=theme,
             )
             # Description below
             _add_textbox(
                 slide, text_x, Inches(5.1), text_w, Inches(1.0),
                 text=description,
-                font_size=Pt(12), font_color=D.GRAY,
+                font_size=Pt(12), font_color=theme.GRAY,
                 alignment=PP_ALIGN.CENTER,
+                theme=theme,
             )
 
     _add_speaker_notes(slide, notes)
@@ -505,24 +476,13 @@ def add_timeline_slide(prs, title, milestones, notes=""):
 
 
 def add_matrix_slide(prs, title, top_left, top_right, bottom_left, bottom_right,
-                     x_label="", y_label="", notes=""):
+                     x_label="", y_label="", notes="", theme=D):
     """Slide 11 — 2x2 Matrix: four colored quadrants with labels.
 
     Each quadrant is a dict: {"title": "...", "items": ["...", "..."]}
     """
-    slide = _add_blank_slide(prs)
-    _set_slide_background(slide, D.WHITE)
-
-    # Title
-    _add_textbox(
-        slide,
-        left=D.MARGIN_LEFT, top=D.MARGIN_TOP,
-        width=D.CONTENT_WIDTH, height=Inches(0.8),
-        text=title,
-        font_size=D.TITLE_SIZE, font_color=D.NAVY,
-        bold=True, alignment=PP_ALIGN.LEFT,
-    )
-    _add_line(slide, D.MARGIN_LEFT, Inches(1.5), Inches(2), Pt(3), D.ORANGE)
+    # Title and underline come from the title layout
+    slide = _add_titled_slide(prs, title, theme=theme)
 
     # Matrix dimensions
     matrix_left = Inches(1.8)
@@ -530,7 +490,7 @@ def add_matrix_slide(prs, title, top_left, top_right, bottom_left, bottom_right,
     cell_w = Inches(4.8)
     cell_h = Inches(2.5)
     gap = Inches(0.1)
-    colors = D.MATRIX_COLORS
+    colors = theme.MATRIX_COLORS
 
     quadrants = [
         (0, 0, top_left, colors[0]),
@@ -544,15 +504,16 @@ def add_matrix_slide(prs, title, top_left, top_right, bottom_left, bottom_right,
         y = matrix_top + row * (cell_h + gap)
 
         # Background rectangle
-        _add_rounded_rectangle(slide, x, y, cell_w, cell_h, bg_color)
+        _add_rounded_rectangle(slide, x, y, cell_w, cell_h, bg_color, theme=theme)
 
         # Quadrant title
         _add_textbox(
             slide, x + Inches(0.2), y + Inches(0.15),
             cell_w - Inches(0.4), Inches(0.5),
             text=data["title"],
-            font_size=Pt(16), font_color=D.NAVY,
+            font_size=Pt(16), font_color=theme.NAVY,
             bold=True, alignment=PP_ALIGN.LEFT,
+            theme=theme,
         )
 
         # Quadrant items
@@ -561,9 +522,10 @@ def add_matrix_slide(prs, title, top_left, top_right, bottom_left, bottom_right,
                 slide, x + Inches(0.3), y + Inches(0.7),
                 cell_w - Inches(0.5), cell_h - Inches(0.9),
                 lines=data["items"],
-                font_size=Pt(13), font_color=D.DARK_TEXT,
-                bullet_char=D.BULLET_CHAR, bullet_color=D.ORANGE,
+                font_size=Pt(13), font_color=theme.DARK_TEXT,
+                bullet_char=theme.BULLET_CHAR, bullet_color=theme.ORANGE,
                 line_spacing=Pt(4),
+                theme=theme,
             )
 
     # Axis labels
@@ -572,8 +534,9 @@ def add_matrix_slide(prs, title, top_left, top_right, bottom_left, bottom_right,
             slide, Inches(0.2), matrix_top + cell_h - Inches(0.3),
             Inches(1.4), Inches(0.5),
             text=y_label,
-            font_size=Pt(13), font_color=D.NAVY,
+            font_size=Pt(13), font_color=theme.NAVY,
             bold=True, alignment=PP_ALIGN.CENTER,
+            theme=theme,
         )
     if x_label:
         _add_textbox(
@@ -581,32 +544,22 @@ def add_matrix_slide(prs, title, top_left, top_right, bottom_left, bottom_right,
             matrix_top + 2 * cell_h + gap + Inches(0.15),
             cell_w + gap, Inches(0.4),
             text=x_label,
-            font_size=Pt(13), font_color=D.NAVY,
+            font_size=Pt(13), font_color=theme.NAVY,
             bold=True, alignment=PP_ALIGN.CENTER,
+            theme=theme,
         )
 
     _add_speaker_notes(slide, notes)
     return slide
 
 
-def add_pyramid_slide(prs, title, levels, notes=""):
+def add_pyramid_slide(prs, title, levels, notes="", theme=D):
     """Slide 12 — Pyramid: stacked horizontal bars narrowing upward.
 
     levels: list of strings from top (smallest) to bottom (widest)
     """
-    slide = _add_blank_slide(prs)
-    _set_slide_background(slide, D.WHITE)
-
-    # Title
-    _add_textbox(
-        slide,
-        left=D.MARGIN_LEFT, top=D.MARGIN_TOP,
-        width=D.CONTENT_WIDTH, height=Inches(0.8),
-        text=title,
-        font_size=D.TITLE_SIZE, font_color=D.NAVY,
-        bold=True, alignment=PP_ALIGN.LEFT,
-    )
-    _add_line(slide, D.MARGIN_LEFT, Inches(1.5), Inches(2), Pt(3), D.ORANGE)
+    # Title and underline come from the title layout
+    slide = _add_titled_slide(prs, title, theme=theme)
 
     n = len(levels)
     pyramid_top = Inches(2.0)
@@ -614,8 +567,8 @@ def add_pyramid_slide(prs, title, levels, notes=""):
     level_h = total_height / n
     max_width = Inches(10.0)
     min_width = Inches(3.0)
-    center_x = D.SLIDE_WIDTH // 2
-    colors = D.PYRAMID_COLORS
+    center_x = theme.SLIDE_WIDTH // 2
+    colors = theme.PYRAMID_COLORS
 
     for i, level_text in enumerate(levels):
         # Width narrows toward the top
@@ -627,56 +580,36 @@ def add_pyramid_slide(prs, title, levels, notes=""):
 
         _add_rounded_rectangle(
             slide, x, y, w, level_h - Inches(0.08), color,
-            text=level_text, font_size=Pt(16), font_color=D.WHITE, bold=True,
+            text=level_text, font_size=Pt(16), font_color=theme.WHITE, bold=True,
+            theme=theme,
         )
 
     _add_speaker_notes(slide, notes)
     return slide
 
 
-def add_bar_chart_slide(prs, title, categories, values, notes=""):
+def add_bar_chart_slide(prs, title, categories, values, notes="", theme=D):
     """Slide 13 — Bar chart: vertical bars with categories."""
-    slide = _add_blank_slide(prs)
-    _set_slide_background(slide, D.WHITE)
-
-    # Title
-    _add_textbox(
-        slide,
-        left=D.MARGIN_LEFT, top=D.MARGIN_TOP,
-        width=D.CONTENT_WIDTH, height=Inches(0.8),
-        text=title,
-        font_size=D.TITLE_SIZE, font_color=D.NAVY,
-        bold=True, alignment=PP_ALIGN.LEFT,
-    )
-    _add_line(slide, D.MARGIN_LEFT, Inches(1.5), Inches(2), Pt(3), D.ORANGE)
+    # Title and underline come from the title layout
+    slide = _add_titled_slide(prs, title, theme=theme)
 
     # Chart
     _add_chart_bar(
         slide,
-        left=D.MARGIN_LEFT + Inches(0.5), top=Inches(2.0),
-        width=D.CONTENT_WIDTH - Inches(1.0), height=Inches(4.8),
+        left=theme.MARGIN_LEFT + Inches(0.5), top=Inches(2.0),
+        width=theme.CONTENT_WIDTH - Inches(1.0), height=Inches(4.8),
         categories=categories, values=values,
+        theme=theme,
     )
 
     _add_speaker_notes(slide, notes)
     return slide
 
 
-def add_pie_chart_slide(prs, title, categories, values, notes=""):
+def add_pie_chart_slide(prs, title, categories, values, notes="", theme=D):
     """Slide 14 — Pie chart: colored segments with percentages."""
-    slide = _add_blank_slide(prs)
-    _set_slide_background(slide, D.WHITE)
-
-    # Title
-    _add_textbox(
-        slide,
-        left=D.MARGIN_LEFT, top=D.MARGIN_TOP,
-        width=D.CONTENT_WIDTH, height=Inches(0.8),
-        text=title,
-        font_size=D.TITLE_SIZE, font_color=D.NAVY,
-        bold=True, alignment=PP_ALIGN.LEFT,
-    )
-    _add_line(slide, D.MARGIN_LEFT, Inches(1.5), Inches(2), Pt(3), D.ORANGE)
+    # Title and underline come from the title layout
+    slide = _add_titled_slide(prs, title, theme=theme)
 
     # Pie chart
     _add_chart_pie(
@@ -684,31 +617,21 @@ def add_pie_chart_slide(prs, title, categories, values, notes=""):
         left=Inches(2.5), top=Inches(1.8),
         width=Inches(8.0), height=Inches(5.2),
         categories=categories, values=values,
+        theme=theme,
     )
 
     _add_speaker_notes(slide, notes)
     return slide
 
 
-def add_icon_cards_slide(prs, title, cards, notes=""):
+def add_icon_cards_slide(prs, title, cards, notes="", theme=D):
     """Slide 15 — Icon cards: grid of KPI/metric cards.
 
     cards: list of dicts {"value": "78%", "label": "Satisfaction", "color": RGBColor (optional)}
     Max 6 cards (2 rows x 3 cols or 1 row x 3-4).
     """
-    slide = _add_blank_slide(prs)
-    _set_slide_background(slide, D.WHITE)
-
-    # Title
-    _add_textbox(
-        slide,
-        left=D.MARGIN_LEFT, top=D.MARGIN_TOP,
-        width=D.CONTENT_WIDTH, height=Inches(0.8),
-        text=title,
-        font_size=D.TITLE_SIZE, font_color=D.NAVY,
-        bold=True, alignment=PP_ALIGN.LEFT,
-    )
-    _add_line(slide, D.MARGIN_LEFT, Inches(1.5), Inches(2), Pt(3), D.ORANGE)
+    # Title and underline come from the title layout
+    slide = _add_titled_slide(prs, title, theme=theme)
 
     n = len(cards)
     if n <= 3:
@@ -719,33 +642,34 @@ def add_icon_cards_slide(prs, title, cards, notes=""):
         cols, rows = 4, 2
 
     gap = Inches(0.3)
-    card_w = (D.CONTENT_WIDTH - gap * (cols - 1)) / cols
+    card_w = (theme.CONTENT_WIDTH - gap * (cols - 1)) / cols
     card_h = Inches(2.2) if rows == 1 else Inches(2.0)
     start_y = Inches(2.2) if rows == 1 else Inches(2.0)
-    colors = D.PROCESS_COLORS
+    colors = theme.PROCESS_COLORS
 
     for i, card in enumerate(cards):
         col = i % cols
         row = i // cols
-        x = D.MARGIN_LEFT + col * (card_w + gap)
+        x = theme.MARGIN_LEFT + col * (card_w + gap)
         y = start_y + row * (card_h + gap)
         color = card.get("color", colors[i % len(colors)])
 
         # Card background
-        _add_rounded_rectangle(slide, x, y, card_w, card_h, D.CARD_BG,
-                               border_color=D.LIGHT_GRAY)
+        _add_rounded_rectangle(slide, x, y, card_w, card_h, theme.CARD_BG,
+                               border_color=theme.LIGHT_GRAY, theme=theme)
 
         # Color accent bar at top of card
-        _add_rectangle(slide, x, y, card_w, Inches(0.08), color)
+        _add_rectangle(slide, x, y, card_w, Inches(0.08), color, theme=theme)
 
         # Big value
         _add_textbox(
             slide, x, y + Inches(0.2),
             card_w, Inches(1.0),
             text=card["value"],
-            font_size=D.CARD_TITLE_SIZE, font_color=color,
+            font_size=theme.CARD_TITLE_SIZE, font_color=color,
             bold=True, alignment=PP_ALIGN.CENTER,
             anchor=MSO_ANCHOR.BOTTOM,
+            theme=theme,
         )
 
         # Label
@@ -753,36 +677,26 @@ def add_icon_cards_slide(prs, title, cards, notes=""):
             slide, x + Inches(0.1), y + Inches(1.3),
             card_w - Inches(0.2), Inches(0.7),
             text=card["label"],
-            font_size=Pt(13), font_color=D.GRAY,
+            font_size=Pt(13), font_color=theme.GRAY,
             bold=False, alignment=PP_ALIGN.CENTER,
             anchor=MSO_ANCHOR.TOP,
+            theme=theme,
         )
 
     _add_speaker_notes(slide, notes)
     return slide
 
 
-def add_org_chart_slide(prs, title, manager, reports, notes=""):
+def add_org_chart_slide(prs, title, manager, reports, notes="", theme=D):
     """Slide 16 — Org chart: manager node on top, direct reports below.
 
     manager: dict {"name": "...", "title": "..."}
     reports: list of dicts {"name": "...", "title": "..."}
     """
-    slide = _add_blank_slide(prs)
-    _set_slide_background(slide, D.WHITE)
+    # Title and underline come from the title layout
+    slide = _add_titled_slide(prs, title, theme=theme)
 
-    # Title
-    _add_textbox(
-        slide,
-        left=D.MARGIN_LEFT, top=D.MARGIN_TOP,
-        width=D.CONTENT_WIDTH, height=Inches(0.8),
-        text=title,
-        font_size=D.TITLE_SIZE, font_color=D.NAVY,
-        bold=True, alignment=PP_ALIGN.LEFT,
-    )
-    _add_line(slide, D.MARGIN_LEFT, Inches(1.5), Inches(2), Pt(3), D.ORANGE)
-
-    center_x = D.SLIDE_WIDTH // 2
+    center_x = theme.SLIDE_WIDTH // 2
 
     # Manager node — navy rounded rectangle, centered
     mgr_w = Inches(3.0)
@@ -791,9 +705,10 @@ def add_org_chart_slide(prs, title, manager, reports, notes=""):
     mgr_y = Inches(2.0)
 
     _add_rounded_rectangle(
-        slide, mgr_x, mgr_y, mgr_w, mgr_h, D.NAVY,
+        slide, mgr_x, mgr_y, mgr_w, mgr_h, theme.NAVY,
         text=f"{manager['name']}\n{manager['title']}",
-        font_size=Pt(14), font_color=D.WHITE, bold=True,
+        font_size=Pt(14), font_color=theme.WHITE, bold=True,
+        theme=theme,
     )
 
     # Connector: vertical line from manager bottom to horizontal bar
@@ -801,10 +716,10 @@ def add_org_chart_slide(prs, title, manager, reports, notes=""):
     connector_y_start = mgr_y + mgr_h
     connector_y_end = Inches(3.5)
     _add_line(slide, center_x, connector_y_start, Pt(2),
-              connector_y_end - connector_y_start, D.LIGHT_GRAY)
+              connector_y_end - connector_y_start, theme.LIGHT_GRAY, theme=theme)
 
     # Report cards
-    report_w = min(Inches(2.2), (D.CONTENT_WIDTH - Inches(0.2) * (n - 1)) / n) if n > 0 else Inches(2.2)
+    report_w = min(Inches(2.2), (theme.CONTENT_WIDTH - Inches(0.2) * (n - 1)) / n) if n > 0 else Inches(2.2)
     gap = Inches(0.2)
     total_w = n * report_w + (n - 1) * gap if n > 0 else 0
     start_x = center_x - total_w // 2
@@ -815,7 +730,8 @@ def add_org_chart_slide(prs, title, manager, reports, notes=""):
         # Horizontal connector bar
         bar_left = start_x + report_w // 2
         bar_right = start_x + (n - 1) * (report_w + gap) + report_w // 2
-        _add_line(slide, bar_left, connector_y_end, bar_right - bar_left, Pt(2), D.LIGHT_GRAY)
+        _add_line(slide, bar_left, connector_y_end, bar_right - bar_left, Pt(2), theme.LIGHT_GRAY,
+                  theme=theme)
 
     for i, report in enumerate(reports):
         rx = start_x + i * (report_w + gap)
@@ -823,47 +739,37 @@ def add_org_chart_slide(prs, title, manager, reports, notes=""):
 
         # Vertical connector from bar to report card
         _add_line(slide, rx_center, connector_y_end, Pt(2),
-                  report_y - connector_y_end, D.LIGHT_GRAY)
+                  report_y - connector_y_end, theme.LIGHT_GRAY, theme=theme)
 
         # Report card — light gray with navy border
         _add_rounded_rectangle(
-            slide, rx, report_y, report_w, report_h, D.LIGHT_GRAY,
-            border_color=D.NAVY,
+            slide, rx, report_y, report_w, report_h, theme.LIGHT_GRAY,
+            border_color=theme.NAVY,
             text=f"{report['name']}\n{report['title']}",
-            font_size=Pt(12), font_color=D.NAVY, bold=False,
+            font_size=Pt(12), font_color=theme.NAVY, bold=False,
+            theme=theme,
         )
 
     _add_speaker_notes(slide, notes)
     return slide
 
 
-def add_funnel_slide(prs, title, stages, notes=""):
+def add_funnel_slide(prs, title, stages, notes="", theme=D):
     """Slide 17 — Funnel: centered horizontal bars decreasing in width.
 
     stages: list of dicts {"label": "Applied", "value": "150"}
     """
-    slide = _add_blank_slide(prs)
-    _set_slide_background(slide, D.WHITE)
-
-    # Title
-    _add_textbox(
-        slide,
-        left=D.MARGIN_LEFT, top=D.MARGIN_TOP,
-        width=D.CONTENT_WIDTH, height=Inches(0.8),
-        text=title,
-        font_size=D.TITLE_SIZE, font_color=D.NAVY,
-        bold=True, alignment=PP_ALIGN.LEFT,
-    )
-    _add_line(slide, D.MARGIN_LEFT, Inches(1.5), Inches(2), Pt(3), D.ORANGE)
+    # Title and underline come from the title layout
+    slide = _add_titled_slide(prs, title, theme=theme)
 
     n = len(stages)
-    center_x = D.SLIDE_WIDTH // 2
+    center_x = theme.SLIDE_WIDTH // 2
     max_width = Inches(8.0)
     min_width = Inches(3.0)
     funnel_top = Inches(2.0)
     total_height = Inches(4.5)
     bar_h = total_height / n
-    colors = D.PROCESS_COLORS
+    colors = theme.PROCESS_COLORS
 
     for i, stage in enumerate(stages):
         # Width decreases linearly
@@ -875,6 +781,7 @@ def add_funnel_slide(prs, title, stages, notes=""):
 
         _add_rounded_rectangle(
             slide, x, y, w, bar_h - Inches(0.08), color,
+            theme=theme,
         )
 
         # Label on the left side of the bar
@@ -882,9 +789,10 @@ def add_funnel_slide(prs, title, stages, notes=""):
             slide, x + Inches(0.3), y,
             w // 2 - Inches(0.3), bar_h - Inches(0.08),
             text=stage["label"],
-            font_size=Pt(15), font_color=D.WHITE,
+            font_size=Pt(15), font_color=theme.WHITE,
             bold=True, alignment=PP_ALIGN.LEFT,
             anchor=MSO_ANCHOR.MIDDLE,
+            theme=theme,
         )
 
         # Value on the right side of the bar
@@ -892,9 +800,10 @@ def add_funnel_slide(prs, title, stages, notes=""):
             slide, x + w // 2, y,
             w // 2 - Inches(0.3), bar_h - Inches(0.08),
             text=stage["value"],
-            font_size=Pt(15), font_color=D.WHITE,
+            font_size=Pt(15), font_color=theme.WHITE,
             bold=True, alignment=PP_ALIGN.RIGHT,
             anchor=MSO_ANCHOR.MIDDLE,
+            theme=theme,
         )
 
     # Triangle pointer at bottom
@@ -902,38 +811,27 @@ def add_funnel_slide(prs, title, stages, notes=""):
     tri_h = Inches(0.4)
     tri_x = center_x - tri_w // 2
     tri_y = funnel_top + total_height + Inches(0.1)
-    _add_triangle(slide, tri_x, tri_y, tri_w, tri_h, D.ORANGE)
+    _add_triangle(slide, tri_x, tri_y, tri_w, tri_h, theme.ORANGE, theme=theme)
 
     _add_speaker_notes(slide, notes)
     return slide
 
 
-def add_team_grid_slide(prs, title, members, notes=""):
+def add_team_grid_slide(prs, title, members, notes="", theme=D):
     """Slide 18 — Team grid: profile cards with initials in a grid.
 
     members: list of dicts {"name": "...", "role": "...", "desc": "..." (optional)}
     Max 6 members (2 rows x 3 cols).
     """
-    slide = _add_blank_slide(prs)
-    _set_slide_background(slide, D.WHITE)
-
-    # Title
-    _add_textbox(
-        slide,
-        left=D.MARGIN_LEFT, top=D.MARGIN_TOP,
-        width=D.CONTENT_WIDTH, height=Inches(0.8),
-        text=title,
-        font_size=D.TITLE_SIZE, font_color=D.NAVY,
-        bold=True, alignment=PP_ALIGN.LEFT,
-    )
-    _add_line(slide, D.MARGIN_LEFT, Inches(1.5), Inches(2), Pt(3), D.ORANGE)
+    # Title and underline come from the title layout
+    slide = _add_titled_slide(prs, title, theme=theme)
 
     n = min(len(members), 6)
     cols = min(n, 3)
     rows = 1 if n <= 3 else 2
 
     gap = Inches(0.4)
-    card_w = (D.CONTENT_WIDTH - gap * (cols - 1)) / cols
+    card_w = (theme.CONTENT_WIDTH - gap * (cols - 1)) / cols
     card_h = Inches(2.3) if rows == 1 else Inches(2.1)
     start_y = Inches(2.2) if rows == 1 else Inches(2.0)
 
@@ -941,12 +839,12 @@ def add_team_grid_slide(prs, title, members, notes=""):
         member = members[i]
         col = i % cols
         row = i // cols
-        x = D.MARGIN_LEFT + col * (card_w + gap)
+        x = theme.MARGIN_LEFT + col * (card_w + gap)
         y = start_y + row * (card_h + gap)
 
         # Card background
-        _add_rounded_rectangle(slide, x, y, card_w, card_h, D.LIGHT_GRAY,
-                               border_color=D.LIGHT_GRAY)
+        _add_rounded_rectangle(slide, x, y, card_w, card_h, theme.LIGHT_GRAY,
+                               border_color=theme.LIGHT_GRAY, theme=theme)
 
         # Initials circle
         circle_size = Inches(0.7)
@@ -959,7 +857,8 @@ def add_team_grid_slide(prs, title, members, notes=""):
 
         _add_oval(
             slide, circle_x, circle_y, circle_size, circle_size,
-            D.WHITE, text=initials, font_size=Pt(18), font_color=D.NAVY, bold=True,
+            theme.WHITE, text=initials, font_size=Pt(18), font_color=theme.NAVY, bold=True,
+            theme=theme,
         )
 
         # Name
@@ -967,8 +866,9 @@ def add_team_grid_slide(prs, title, members, notes=""):
             slide, x, circle_y + circle_size + Inches(0.1),
             card_w, Inches(0.4),
             text=member["name"],
-            font_size=Pt(14), font_color=D.NAVY,
+            font_size=Pt(14), font_color=theme.NAVY,
             bold=True, alignment=PP_ALIGN.CENTER,
+            theme=theme,
         )
 
         # Role
@@ -976,8 +876,9 @@ def add_team_grid_slide(prs, title, members, notes=""):
             slide, x, circle_y + circle_size + Inches(0.45),
             card_w, Inches(0.35),
             text=member["role"],
-            font_size=Pt(12), font_color=D.ORANGE,
+            font_size=Pt(12), font_color=theme.ORANGE,
             bold=True, alignment=PP_ALIGN.CENTER,
+            theme=theme,
         )
 
         # Description (optional)
@@ -987,9 +888,55 @@ def add_team_grid_slide(prs, title, members, notes=""):
                 slide, x + Inches(0.1), circle_y + circle_size + Inches(0.8),
                 card_w - Inches(0.2), Inches(0.5),
                 text=desc,
-                font_size=Pt(10), font_color=D.GRAY,
+                font_size=Pt(10), font_color=theme.GRAY,
                 bold=False, alignment=PP_ALIGN.CENTER,
+                theme=theme,
             )
 
     _add_speaker_notes(slide, notes)
     return slide
+
+
+# ===================================================================
+# REGISTRY — layout names used in JSON plans (see skill/SKILL.md)
+# ===================================================================
+
+
+LAYOUTS = {
+    "title": add_title_slide,
+    "agenda": add_agenda_slide,
+    "section": add_section_slide,
+    "bullets": add_bullets_slide,
+    "two_columns": add_two_columns_slide,
+    "key_stat": add_key_stat_slide,
+    "quote": add_quote_slide,
+    "conclusion": add_conclusion_slide,
+    "process_flow": add_process_flow_slide,
+    "timeline": add_timeline_slide,
+    "matrix": add_matrix_slide,
+    "pyramid": add_pyramid_slide,
+    "bar_chart": add_bar_chart_slide,
+    "pie_chart": add_pie_chart_slide,
+    "icon_cards": add_icon_cards_slide,
+    "org_chart": add_org_chart_slide,
+    "funnel": add_funnel_slide,
+    "team_grid": add_team_grid_slide,
+}
+
+
+def bind_layouts(helpers):
+    """Return a copy of LAYOUTS drawing through another set of engine helpers.
+
+    Layouts only reach the engine through the `_add_*` / `_set_*` names imported
+    at the top of this module. `helpers` maps some of those names to
+    replacements with the same signatures, `theme` keyword included (an SVG
+    backend, a recorder...); each
+    layout is cloned with those globals swapped in, so the geometry code is
+    shared and nothing is patched module-wide.
+    """
+    env = dict(globals())
+    env.update(helpers)
+    return {
+        name: types.FunctionType(fn.__code__, env, fn.__name__, fn.__defaults__)
+        for name, fn in LAYOUTS.items()
+    }
@@ -0,0 +1,314 @@
+"""A reusable slide library: ingest engine decks, search them, splice slides.
+
+Slides are stored in a local SQLite database as raw parts, so reusing one
+never renders it again. Each slide keeps the parts only it uses (slide,
+notes, charts, workbooks, media) as a small zip; the masters, layouts and
+theme of its deck are stored once per distinct template. Titles, slide text
+and speaker notes are indexed with FTS5:
+
+    with SlideLibrary("slides.db") as library:
+        library.ingest("gpec.pptx", plan)          # plan: layout and fragment per slide
+        hits = library.search("turnover")
+        deck = library.render_plan({"slides": [
+            {"layout": "title", "title": "Formation GPEC"},
+            {"layout": "library", "id": hits[0].id},
+        ]})
+        deck.save("formation.pptx")
+
+A ``{"layout": "library", "id": ...}`` entry of a plan is spliced from the
+library; every other entry is rendered as usual.
+"""
+
+import hashlib
+import io
+import json
+import sqlite3
+from collections import namedtuple
+
+from .merge import _DeckMerger, _open, slide_partnames
+from .package import (
+    A_NS,
+    RT_NOTES_MASTER,
+    RT_NOTES_SLIDE,
+    RT_SLIDE,
+    RT_SLIDE_LAYOUT,
+    Package,
+    parse_xml,
+    rels_name,
+)
+from .plan import render_plan as _render_plan
+from .surgery import delete_slides
+from .validate import PlanValidationError, validate_plan
+
+LIBRARY_LAYOUT = "library"
+
+# Targets a slide shares with the rest of its deck rather than owning
+_SHARED_RELTYPES = {RT_SLIDE_LAYOUT, RT_NOTES_MASTER, RT_SLIDE}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS templates (
+    id INTEGER PRIMARY KEY,
+    digest BLOB NOT NULL UNIQUE,
+    package BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS slides (
+    id INTEGER PRIMARY KEY,
+    template_id INTEGER NOT NULL REFERENCES templates (id),
+    layout TEXT,
+    title TEXT NOT NULL,
+    text TEXT NOT NULL,
+    notes TEXT NOT NULL,
+    spec TEXT,
+    source TEXT,
+    partname TEXT NOT NULL,
+    package BLOB NOT NULL
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS slide_text USING fts5(
+    title, text, notes, content='slides', content_rowid='id',
+    tokenize='unicode61 remove_diacritics 2'
+);
+"""
+
+LibrarySlide = namedtuple("LibrarySlide", "id layout title text notes spec source")
+
+
+# === Extraction ===
+
+
+def _paragraphs(blob):
+    """Text of the paragraphs of an XML part, one line each."""
+    lines = []
+    for p in parse_xml(blob).iter("{%s}p" % A_NS):
+        line = "".join(t.text or "" for t in p.iter("{%s}t" % A_NS))
+        if line.strip():
+            lines.append(line)
+    return lines
+
+
+def _owned_parts(pkg, slide):
+    """The slide and every part reachable from it but not shared with its deck."""
+    owned, stack = [slide], [slide]
+    while stack:
+        for rel in pkg.rels(stack.pop()):
+            if rel.external or rel.reltype in _SHARED_RELTYPES or rel.target in owned:
+                continue
+            owned.append(rel.target)
+            stack.append(rel.target)
+    return owned
+
+
+def _slide_package(pkg, slide):
+    """Zip of the parts `slide` owns, with their rels and content types."""
+    parts, overrides = {}, {}
+    for name in _owned_parts(pkg, slide):
+        parts[name] = pkg.parts[name]
+        if name in pkg.overrides:
+            overrides[name] = pkg.overrides[name]
+        if rels_name(name) in pkg.parts:
+            parts[rels_name(name)] = pkg.parts[rels_name(name)]
+    out = io.BytesIO()
+    Package(parts, dict(pkg.defaults), overrides).save(out)
+    return out.getvalue()
+
+
+def _template_digest(pkg):
+    h = hashlib.sha1()
+    for name in sorted(pkg.parts):
+        if not name.startswith("docProps/"):
+            h.update(name.encode() + b"\0" + pkg.parts[name])
+    return h.digest()
+
+
+# === Library ===
+
+
+class SlideLibrary:
+    """Slides of ingested decks in an SQLite database (":memory:" by default)."""
+
+    def __init__(self, path=":memory:"):
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript(_SCHEMA)
+        self._templates = {}  # template id -> Package
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.conn.close()
+
+    def __len__(self):
+        return self.conn.execute("SELECT COUNT(*) FROM slides").fetchone()[0]
+
+    # --- Ingestion ---
+
+    def ingest(self, source, plan=None, name=None):
+        """Store every slide of `source` (path, file-like object or
+        Presentation); returns their library ids, in deck order.
+
+        With the `plan` the deck was rendered from, each slide also records
+        its layout name and plan fragment. `name` labels the source deck
+        (default: the path, if `source` is one).
+        """
+        pkg = _open(source)
+        slides = slide_partnames(pkg)
+        specs = plan["slides"] if plan is not None else [None] * len(slides)
+        if len(specs) != len(slides):
+            raise ValueError(f"plan has {len(specs)} slide(s), the deck {len(slides)}")
+        if name is None and isinstance(source, str):
+            name = source
+        rows = []
+        for slide, spec in zip(slides, specs):
+            text = _paragraphs(pkg.parts[slide])
+            notes_slide = pkg.related(slide, RT_NOTES_SLIDE)
+            notes = _paragraphs(pkg.parts[notes_slide]) if notes_slide else []
+            title = (spec or {}).get("title") or next(iter(text), "")
+            rows.append((
+                spec["layout"] if spec else None, title, "\n".join(text), "\n".join(notes),
+                json.dumps(spec, ensure_ascii=False) if spec else None, name, slide,
+                _slide_package(pkg, slide),
+            ))
+        delete_slides(pkg, range(len(slides)))
+        with self.conn:
+            template_id = self._template_id(pkg)
+            ids = []
+            for row in rows:
+                cursor = self.conn.execute(
+                    "INSERT INTO slides (template_id, layout, title, text, notes, spec, source,"
+                    " partname, package) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (template_id,) + row)
+                ids.append(cursor.lastrowid)
+                self.conn.execute(
+                    "INSERT INTO slide_text (rowid, title, text, notes) VALUES (?, ?, ?, ?)",
+                    (cursor.lastrowid,) + row[1:4])
+        return ids
+
+    def _template_id(self, pkg):
+        digest = _template_digest(pkg)
+        row = self.conn.execute("SELECT id FROM templates WHERE digest = ?", (digest,)).fetchone()
+        if row is not None:
+            return row[0]
+        out = io.BytesIO()
+        pkg.save(out)
+        return self.conn.execute("INSERT INTO templates (digest, package) VALUES (?, ?)",
+                                 (digest, out.getvalue())).lastrowid
+
+    # --- Lookup ---
+
+    @staticmethod
+    def _slide(row):
+        spec = json.loads(row[5]) if row[5] is not None else None
+        return LibrarySlide(*row[:5], spec, row[6])
+
+    def get(self, slide_id):
+        """The LibrarySlide with id `slide_id` (ValueError if unknown)."""
+        row = self.conn.execute(
+            "SELECT id, layout, title, text, notes, spec, source FROM slides WHERE id = ?",
+            (slide_id,)).fetchone()
+        if row is None:
+            raise ValueError(f"Unknown library slide id: {slide_id!r}")
+        return self._slide(row)
+
+    def search(self, query, limit=20, layout=None):
+        """Best-ranked LibrarySlides for an FTS5 `query` (``turnover``,
+        ``"plan de succession"``, ``title:GPEC NOT notes:brouillon``...),
+        optionally restricted to one layout. Accents are ignored."""
+        sql = ("SELECT s.id, s.layout, s.title, s.text, s.notes, s.spec, s.source"
+               " FROM slide_text JOIN slides s ON s.id = slide_text.rowid"
+               " WHERE slide_text MATCH ?")
+        args = [query]
+        if layout is not None:
+            sql += " AND s.layout = ?"
+            args.append(layout)
+        sql += " ORDER BY slide_text.rank LIMIT ?"
+        args.append(limit)
+        return [self._slide(row) for row in self.conn.execute(sql, args)]
+
+    # --- Splicing ---
+
+    def _template(self, template_id):
+        template = self._templates.get(template_id)
+        if template is None:
+            blob = self.conn.execute("SELECT package FROM templates WHERE id = ?",
+                                     (template_id,)).fetchone()[0]
+            template = self._templates[template_id] = Package.open(io.BytesIO(blob))
+        return template
+
+    def _sources(self, slide_ids):
+        """(source package, slide partname) of each id, in the order given."""
+        wanted = list(dict.fromkeys(slide_ids))
+        rows = {}
+        for start in range(0, len(wanted), 500):
+            chunk = wanted[start:start + 500]
+            rows.update((row[0], row[1:]) for row in self.conn.execute(
+                "SELECT id, template_id, partname, package FROM slides WHERE id IN (%s)"
+                % ",".join("?" * len(chunk)), chunk))
+        missing = [i for i in wanted if i not in rows]
+        if missing:
+            raise ValueError(f"Unknown library slide id(s): {missing}")
+        for slide_id in slide_ids:
+            template_id, partname, blob = rows[slide_id]
+            src = self._template(template_id).copy()
+            slide_pkg = Package.open(io.BytesIO(blob))
+            src.parts.update(slide_pkg.parts)
+            src.overrides.update(slide_pkg.overrides)
+            yield src, partname
+
+    def _append(self, merger, slide_ids):
+        return [merger.append(src, [partname])[0] for src, partname in self._sources(slide_ids)]
+
+    def splice(self, pkg, slide_ids):
+        """Append the library slides `slide_ids` to `pkg` (a Package, see
+        surgery.open_deck()), in that order; returns `pkg`."""
+        merger = _DeckMerger(pkg)
+        self._append(merger, slide_ids)
+        return merger.finish()
+
+    def render_plan(self, plan, validate=True, theme=None):
+        """Render `plan`, splicing its ``{"layout": "library", "id": ...}``
+        entries from the library; returns the deck as a Package."""
+        specs = plan["slides"]
+        spliced = {i for i, spec in enumerate(specs)
+                   if isinstance(spec, dict) and spec.get("layout") == LIBRARY_LAYOUT}
+        if validate:
+            errors = self._validate(plan, spliced)
+            if errors:
+                raise PlanValidationError(errors)
+        rendered = dict(plan, slides=[s for i, s in enumerate(specs) if i not in spliced])
+        pkg = _open(_render_plan(rendered, validate=False, theme=theme))
+        merger = _DeckMerger(pkg)
+        rendered_entries = iter(list(merger.sld_id_lst))
+        library_entries = iter(self._append(merger, [specs[i]["id"] for i in sorted(spliced)]))
+        merger.sld_id_lst[:] = [next(library_entries) if i in spliced else next(rendered_entries)
+                                for i in range(len(specs))]
+        return merger.finish()
+
+    def render_plan_file(self, plan, filename, validate=True, theme=None):
+        """render_plan() to `filename` (.pptx appended if missing); returns the path."""
+        if not filename.endswith(".pptx"):
+            filename += ".pptx"
+        self.render_plan(plan, validate, theme).save(filename)
+        return filename
+
+    def _validate(self, plan, spliced):
+        # validate_plan() only reports the layout of library entries as unknown
+        unknown_layout = tuple(f"$.slides[{i}].layout:" for i in spliced)
+        errors = [e for e in validate_plan(plan) if not e.startswith(unknown_layout)]
+        ids = []
+        for i in spliced:
+            slide_id = plan["slides"][i].get("id")
+            if isinstance(slide_id, int) and not isinstance(slide_id, bool):
+                ids.append((i, slide_id))
+            else:
+                errors.append(f"$.slides[{i}].id: expected a library slide id (integer)")
+        wanted = list({slide_id for _, slide_id in ids})
+        known = set()
+        for start in range(0, len(wanted), 500):
+            chunk = wanted[start:start + 500]
+            known.update(row[0] for row in self.conn.execute(
+                "SELECT id FROM slides WHERE id IN (%s)" % ",".join("?" * len(chunk)), chunk))
+        errors += [f"$.slides[{i}].id: no library slide with id {slide_id}"
+                   for i, slide_id in ids if slide_id not in known]
+        return errors
@@ -0,0 +1,202 @@
+"""Mail merge: one plan with ``{{field}}`` placeholders, one deck per record.
+
+Slides without placeholders are rendered once into a template package; for
+every record only the slides that reference a field are rendered again, then
+spliced into a copy of the template, where they take their plan position.
+The template's parts are shared as raw bytes and compressed once, never
+re-parsed or re-deflated per record.
+
+    merge = MailMerge(plan)
+    for name, data in merge.render_all(read_records("employees.csv")):
+        ...
+"""
+
+import csv
+import io
+import os
+import re
+
+from .engine import create_presentation
+from .merge import _DeckMerger, slide_partnames
+from .package import Package, compress_member
+from .plan import render_plan
+from .validate import NUMBER, SCHEMA, check_plan
+
+_FIELD_RE = re.compile(r"\{\{\s*(\w+)\s*\}\}")
+
+
+def find_fields(value):
+    """Return the set of placeholder names used anywhere in `value`."""
+    if isinstance(value, str):
+        return set(_FIELD_RE.findall(value))
+    if isinstance(value, dict):
+        return set().union(*map(find_fields, value.values())) if value else set()
+    if isinstance(value, (list, tuple)):
+        return set().union(*map(find_fields, value)) if value else set()
+    return set()
+
+
+def fill(value, record):
+    """Substitute the placeholders of `value` with the fields of `record`.
+
+    A string that is exactly one placeholder takes the record value as-is,
+    so numbers (chart values) stay numbers.
+    """
+    if isinstance(value, str):
+        whole = _FIELD_RE.fullmatch(value)
+        try:
+            if whole:
+                return record[whole.group(1)]
+            return _FIELD_RE.sub(lambda m: str(record[m.group(1)]), value)
+        except KeyError as e:
+            raise ValueError(f"Record has no field {e.args[0]!r}") from None
+    if isinstance(value, dict):
+        return {k: fill(v, record) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [fill(v, record) for v in value]
+    return value
+
+
+def _number(text):
+    for kind in (int, float):
+        try:
+            return kind(text)
+        except ValueError:
+            pass
+    return text  # left for validation to report
+
+
+def coerce_numbers(value, spec):
+    """`value` with the numeric strings of its NUMBER fields (see validate.SCHEMA)
+    converted, as CSV records only hold strings."""
+    if spec is NUMBER and isinstance(value, str):
+        return _number(value)
+    if spec[0] == "list" and isinstance(value, list):
+        return [coerce_numbers(v, spec[1]) for v in value]
+    if spec[0] == "object" and isinstance(value, dict):
+        fields = dict(spec[1] + spec[2])
+        return {k: coerce_numbers(v, fields[k]) if k in fields else v for k, v in value.items()}
+    return value
+
+
+def _fill_slide(spec, record):
+    spec = fill(spec, record)
+    layout = spec.get("layout")
+    if isinstance(layout, str) and layout in SCHEMA:
+        spec = coerce_numbers(spec, SCHEMA[layout][0])
+    return spec
+
+
+def read_records(source):
+    """Yield the rows of a CSV path or text file object as dicts."""
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, newline="", encoding="utf-8-sig") as f:
+            yield from csv.DictReader(f)
+    else:
+        yield from csv.DictReader(source)
+
+
+def _save(prs):
+    stream = io.BytesIO()
+    prs.save(stream)
+    stream.seek(0)
+    return Package.open(stream)
+
+
+class MailMerge:
+    """A plan compiled for mail merge.
+
+    `batch` records have their per-record slides rendered into one shared
+    python-pptx presentation, so creating and saving it is paid once per batch.
+    """
+
+    def __init__(self, plan, batch=16):
+        self.slides = plan["slides"]
+        self.variant = [i for i, spec in enumerate(self.slides) if find_fields(spec)]
+        self.fields = find_fields([self.slides[i] for i in self.variant])
+        self.batch = batch
+        self.notes_markdown = plan.get("notes_markdown", False)
+
+        variant = set(self.variant)
+        invariant = [spec for i, spec in enumerate(self.slides) if i not in variant]
+        fixed = {"slides": invariant, "notes_markdown": self.notes_markdown}
+        check_plan(fixed)
+        prs = render_plan(fixed, validate=False)
+        prs.notes_master  # created up front so per-record notes map onto it
+        self.template = _save(prs)
+        for name in list(self.template.parts):
+            if not name.endswith(".rels"):
+                self.template.rels(name)  # parse once, shared by every copy
+        self.template.next_partname("ppt/slides/slide1.xml")
+        self._compressed = {blob: compress_member(blob) for blob in self.template.parts.values()}
+
+    def _render_batch(self, records):
+        """Render the per-record slides of `records` into one package."""
+        prs = create_presentation()
+        for record in records:
+            specs = [_fill_slide(self.slides[i], record) for i in self.variant]
+            record_plan = {"slides": specs, "notes_markdown": self.notes_markdown}
+            check_plan(record_plan)
+            render_plan(record_plan, prs, validate=False)
+        return _save(prs)
+
+    def _assemble(self, src, slides):
+        merger = _DeckMerger(self.template.copy())
+        added = iter(merger.append(src, slides))
+        fixed = iter(list(merger.sld_id_lst)[:len(self.slides) - len(self.variant)])
+        variant = set(self.variant)
+        order = [next(added) if i in variant else next(fixed) for i in range(len(self.slides))]
+        merger.sld_id_lst[:] = order
+        stream = io.BytesIO()
+        merger.finish().save(stream, cache=self._compressed)
+        return stream.getvalue()
+
+    def render_all(self, records, name="deck-{index:06d}"):
+        """Yield (filename, .pptx bytes) per record; `name` is formatted with the
+        record's fields and its 1-based ``index`` (which takes precedence over
+        a record field of that name)."""
+        per_record = len(self.variant)
+        batch = []
+        for index, record in enumerate(records, 1):
+            batch.append((index, record))
+            if len(batch) == self.batch:
+                yield from self._flush(batch, per_record, name)
+                batch = []
+        if batch:
+            yield from self._flush(batch, per_record, name)
+
+    def _flush(self, batch, per_record, name):
+        src = self._render_batch([record for _, record in batch])
+        slides = slide_partnames(src)
+        for k, (index, record) in enumerate(batch):
+            filename = name.format_map(dict(record, index=index))
+            if not filename.endswith(".pptx"):
+                filename += ".pptx"
+            yield filename, self._assemble(src, slides[k * per_record:(k + 1) * per_record])
+
+    def render(self, record):
+        """Return the .pptx bytes of the deck for a single record."""
+        return next(self.render_all([record]))[1]
+
+
+def mail_merge(plan, records, out_dir, name="deck-{index:06d}", batch=16):
+    """Write one deck per record into `out_dir`; returns the list of paths.
+
+    `records` is an iterable of dicts or a CSV path/file (see read_records()).
+    Two records given the same file name raise ValueError rather than one
+    deck overwriting the other.
+    """
+    if isinstance(records, (str, os.PathLike)) or hasattr(records, "read"):
+        records = read_records(records)
+    os.makedirs(out_dir, exist_ok=True)
+    paths, seen = [], {}
+    for index, (filename, data) in enumerate(MailMerge(plan, batch).render_all(records, name), 1):
+        path = os.path.join(out_dir, os.path.basename(filename))
+        if path in seen:
+            raise ValueError(f"Records {seen[path]} and {index} are both named "
+                             f"{os.path.basename(path)!r}; make `name` unique, e.g. with {{index}}")
+        seen[path] = index
+        with open(path, "wb") as f:
+            f.write(data)
+        paths.append(path)
+    return paths
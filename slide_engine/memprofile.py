@@ -0,0 +1,204 @@
+"""Opt-in memory profiling of rendering, to find where long batch runs grow.
+
+    with MemoryProfile() as profile:
+        for plan in plans:
+            profile.save(profile.render(plan), "out.pptx")
+    profile.write_report("memory.txt")
+
+Each layout function and every engine helper it calls is wrapped (through
+layouts.bind_layouts(), nothing is patched module-wide) to record the bytes
+still allocated when the call returns, as traced by tracemalloc; creating and
+saving the presentation are measured the same way. Bytes retained by a layout
+are its slide's shapes, which live as long as the deck: what must not grow is
+the *residual* memory once decks are released, which soak() samples.
+
+Automatic garbage collection is paused while profiling, so memory the
+collector frees is not credited to whichever call happened to trigger it;
+garbage is collected by sample_residual(), which soak() calls every few
+decks. Tracing makes rendering about twice as slow: keep it out of
+production runs.
+"""
+
+import functools
+import gc
+import io
+import tracemalloc
+from collections import defaultdict
+
+from . import engine
+from . import layouts as _layouts
+from .engine import save_presentation
+from .layouts import bind_layouts
+from .plan import render_plan
+
+# Engine helpers the layouts call (see bind_layouts())
+HELPER_NAMES = tuple(sorted(
+    name for name, value in vars(_layouts).items()
+    if name.startswith(("_add_", "_set_")) and callable(value)
+))
+
+_OWN_CODE = "(own code)"
+
+
+class MemoryProfile:
+    """Allocation statistics of the decks rendered through this profile.
+
+    `stats` maps (layout, helper) to [calls, retained bytes]; helper is None
+    for the layout call as a whole. Creating and saving presentations are
+    recorded as ("create_presentation", None) and ("save_presentation", None).
+    """
+
+    def __init__(self, theme=None, frames=1):
+        self.frames = frames
+        self.stats = defaultdict(lambda: [0, 0])
+        self.decks = 0
+        self.residual = []  # (decks rendered, traced bytes) samples
+        self._layout = None
+        self._started = False
+        self._gc_was_enabled = None
+        self._baseline = None
+        helpers = vars(engine)
+        wrapped = {name: self._wrap_helper(name, helpers[name]) for name in HELPER_NAMES}
+        layouts = bind_layouts(wrapped)
+        if theme is not None:
+            layouts = {name: functools.partial(fn, theme=theme) for name, fn in layouts.items()}
+        self.layouts = {name: self._wrap_layout(name, fn) for name, fn in layouts.items()}
+        self._create = (theme.create_presentation if theme is not None
+                        else engine.create_presentation)
+
+    # --- Tracing ---
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def start(self):
+        """Start tracemalloc (unless already tracing) and take the baseline."""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+            self._started = True
+        self._gc_was_enabled = gc.isenabled()
+        gc.disable()
+        gc.collect()
+        self._baseline = tracemalloc.take_snapshot()
+        return self
+
+    def stop(self):
+        """Stop tracemalloc if this profile started it; resume garbage collection."""
+        if self._gc_was_enabled:
+            gc.enable()
+        self._gc_was_enabled = None
+        if self._started:
+            tracemalloc.stop()
+            self._started = False
+
+    def _measure(self, key, fn, *args, **kwargs):
+        if not tracemalloc.is_tracing():
+            raise ValueError("MemoryProfile is not tracing; use it as a context manager")
+        before = tracemalloc.get_traced_memory()[0]
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            stat = self.stats[key]
+            stat[0] += 1
+            stat[1] += tracemalloc.get_traced_memory()[0] - before
+
+    def _wrap_helper(self, name, fn):
+        def helper(*args, **kwargs):
+            return self._measure((self._layout, name), fn, *args, **kwargs)
+        return helper
+
+    def _wrap_layout(self, name, fn):
+        def layout(*args, **kwargs):
+            self._layout = name
+            try:
+                return self._measure((name, None), fn, *args, **kwargs)
+            finally:
+                self._layout = None
+        return layout
+
+    # --- Rendering ---
+
+    def render(self, plan, validate=True):
+        """Render `plan` with the profiled layouts; returns the Presentation."""
+        prs = self._measure(("create_presentation", None), self._create)
+        self.decks += 1
+        return render_plan(plan, prs, self.layouts, validate)
+
+    def save(self, prs, target):
+        """Save `prs` to a path (see save_presentation()) or a file-like object."""
+        if hasattr(target, "write"):
+            return self._measure(("save_presentation", None), prs.save, target)
+        return self._measure(("save_presentation", None), save_presentation, prs, target)
+
+    def sample_residual(self):
+        """Collect the garbage of the decks dropped so far and record the
+        traced memory left (see `residual`)."""
+        gc.collect()
+        self.residual.append((self.decks, tracemalloc.get_traced_memory()[0]))
+
+    # --- Report ---
+
+    def report(self, top=10):
+        """A plain-text report: bytes retained per layout and helper, residual
+        memory samples and the `top` allocation sites grown since start()."""
+        lines = [f"Memory profile: {self.decks} deck(s)", "",
+                 f"{'layout / helper':<32}{'calls':>8}{'retained KiB':>14}{'avg B/call':>12}"]
+
+        def row(label, calls, size):
+            lines.append(f"{label:<32}{calls:>8}{size / 1024:>14.1f}{size // max(calls, 1):>12}")
+
+        layouts = sorted({layout for layout, helper in self.stats if helper is None},
+                         key=lambda name: -self.stats[name, None][1])
+        for layout in layouts:
+            calls, size = self.stats[layout, None]
+            row(layout, calls, size)
+            helpers = sorted(((h, s) for (l, h), s in self.stats.items()
+                              if l == layout and h is not None), key=lambda item: -item[1][1])
+            for helper, (h_calls, h_size) in helpers:
+                row("  " + helper, h_calls, h_size)
+                size -= h_size
+            if helpers:
+                row("  " + _OWN_CODE, calls, size)
+
+        if self.residual:
+            lines += ["", "Residual traced memory after releasing decks:"]
+            lines += [f"  after {n:>6} deck(s): {size / 1024:>10.1f} KiB"
+                      for n, size in self.residual]
+
+        if self._baseline is not None and tracemalloc.is_tracing():
+            ignore = [tracemalloc.Filter(False, tracemalloc.__file__),
+                      tracemalloc.Filter(False, __file__)]
+            current = tracemalloc.take_snapshot().filter_traces(ignore)
+            diff = current.compare_to(self._baseline.filter_traces(ignore), "lineno")
+            lines += ["", f"Top {top} allocation sites grown since start:"]
+            lines += [f"  {stat}" for stat in diff[:top]]
+        return "\n".join(lines) + "\n"
+
+    def write_report(self, filename, top=10):
+        """Write report() to `filename`; returns the path."""
+        with open(filename, "w", encoding="utf-8") as f:
+            f.write(self.report(top))
+        return filename
+
+
+def soak(plans, decks=2000, sample_every=100, theme=None, report=None):
+    """Render and save `decks` decks in this process, cycling over `plans`.
+
+    Returns the MemoryProfile, whose `residual` holds the traced memory after
+    every `sample_every` released decks: a leak shows as steady growth there.
+    The report is written to `report` if given.
+    """
+    plans = list(plans)
+    with MemoryProfile(theme) as profile:
+        for i in range(decks):
+            prs = profile.render(plans[i % len(plans)])
+            profile.save(prs, io.BytesIO())
+            del prs
+            if (i + 1) % sample_every == 0:
+                profile.sample_residual()
+        if report is not None:
+            profile.write_report(report)
+    return profile
@@ -0,0 +1,295 @@
+"""Merge decks produced by the engine into one .pptx without re-rendering."""
+
+import hashlib
+import io
+
+from .package import (
+    Package,
+    Rel,
+    P_NS,
+    R_NS,
+    RT_SLIDE,
+    RT_SLIDE_LAYOUT,
+    RT_SLIDE_MASTER,
+    RT_NOTES_SLIDE,
+    RT_NOTES_MASTER,
+    RT_IMAGE,
+    RT_MEDIA,
+    RT_VIDEO,
+    RT_AUDIO,
+    parse_xml,
+    serialize_xml,
+)
+
+# Relationship types whose targets are shared binaries, deduplicated by content
+_MEDIA_RELTYPES = {RT_IMAGE, RT_MEDIA, RT_VIDEO, RT_AUDIO}
+
+# Children of <p:presentation> that must precede the given element (schema order)
+_BEFORE_NOTES_MASTERS = ("sldMasterIdLst",)
+_BEFORE_SLIDES = ("sldMasterIdLst", "notesMasterIdLst", "handoutMasterIdLst")
+
+
+def merge_presentations(sources, filename):
+    """Concatenate the slides of several .pptx files into `filename`.
+
+    `sources` are paths, file-like objects or Presentation objects produced by
+    the engine.
+    The first deck is the base: its masters, layouts and theme are kept, and
+    identical ones in the other decks are mapped onto it rather than copied.
+    Slides, notes, charts and their embedded workbooks are copied as raw bytes
+    with fresh part names and ids. Appends .pptx if missing.
+    """
+    sources = list(sources)
+    if not sources:
+        raise ValueError("merge_presentations() needs at least one source deck")
+    if not filename.endswith(".pptx"):
+        filename += ".pptx"
+
+    merger = _DeckMerger(_open(sources[0]))
+    for source in sources[1:]:
+        merger.append(_open(source))
+    merger.finish().save(filename)
+    return filename
+
+
+def unlink(blob, rIds):
+    """Part XML `blob` without the elements that use the relationships `rIds`:
+    the hyperlinks (``<a:hlinkClick r:id=...>``) to slides that are gone."""
+    root = parse_xml(blob)
+    key = "{%s}id" % R_NS
+    for element in [e for e in root.iter() if e.get(key) in rIds]:
+        element.getparent().remove(element)
+    return serialize_xml(root)
+
+
+def _open(source):
+    """Open a path, file-like object or in-memory Presentation as a Package."""
+    if hasattr(source, "save"):
+        stream = io.BytesIO()
+        source.save(stream)
+        stream.seek(0)
+        source = stream
+    return Package.open(source)
+
+
+def slide_partnames(pkg):
+    """Member names of the slides of `pkg`, in presentation order."""
+    pres = pkg.main_document
+    targets = {r.rId: r.target for r in pkg.rels(pres)}
+    sld_id_lst = parse_xml(pkg.parts[pres]).find("{%s}sldIdLst" % P_NS)
+    return [
+        targets[el.get("{%s}id" % R_NS)]
+        for el in (sld_id_lst if sld_id_lst is not None else ())
+    ]
+
+
+def _insert_child(parent, child, after_tags):
+    """Insert `child` right after the last existing child named in `after_tags`."""
+    index = 0
+    for i, el in enumerate(parent):
+        if el.tag.rpartition("}")[2] in after_tags:
+            index = i + 1
+    parent.insert(index, child)
+
+
+class _DeckMerger:
+    """Append slides from other packages to a base package.
+
+    Every counter (slide id, master/layout id, presentation rId, part names) is
+    seeded once from the base, so each appended slide costs constant work.
+    """
+
+    def __init__(self, base):
+        self.base = base
+        self.pres_name = base.main_document
+        self.pres = parse_xml(base.parts[self.pres_name])
+        self.pres_rels = list(base.rels(self.pres_name))
+        self._next_rid = 1 + max(
+            (int(r.rId[3:]) for r in self.pres_rels if r.rId[3:].isdigit()), default=0
+        )
+
+        self.sld_id_lst = self._child("sldIdLst", _BEFORE_SLIDES)
+        self._next_slide_id = 1 + max(
+            (int(el.get("id")) for el in self.sld_id_lst), default=255
+        )
+        self._next_master_id = 1 + max(self._master_and_layout_ids(), default=2147483647)
+
+        self._families = {}
+        for rel in self.pres_rels:
+            if rel.reltype == RT_SLIDE_MASTER:
+                self._families.setdefault(self._family_signature(base, rel.target), rel.target)
+        self.notes_master = base.related(self.pres_name, RT_NOTES_MASTER)
+        self._media = {}
+        for rel_list in (base.rels(name) for name in list(base.parts) if name.endswith(".xml")):
+            for rel in rel_list:
+                if rel.reltype in _MEDIA_RELTYPES and not rel.external:
+                    self._media.setdefault(self._digest(base.parts[rel.target]), rel.target)
+
+    # --- presentation.xml bookkeeping ---
+
+    def _child(self, localname, after_tags):
+        el = self.pres.find("{%s}%s" % (P_NS, localname))
+        if el is None:
+            el = self.pres.makeelement("{%s}%s" % (P_NS, localname), {})
+            _insert_child(self.pres, el, after_tags)
+        return el
+
+    def _master_and_layout_ids(self):
+        lst = self.pres.find("{%s}sldMasterIdLst" % P_NS)
+        for el in (lst if lst is not None else ()):
+            yield int(el.get("id"))
+        for rel in self.pres_rels:
+            if rel.reltype == RT_SLIDE_MASTER:
+                master = parse_xml(self.base.parts[rel.target])
+                for layout_id in master.iter("{%s}sldLayoutId" % P_NS):
+                    yield int(layout_id.get("id"))
+
+    def _add_pres_rel(self, reltype, target):
+        rId = "rId%d" % self._next_rid
+        self._next_rid += 1
+        self.pres_rels.append(Rel(rId, reltype, target, False))
+        return rId
+
+    # --- Part copying ---
+
+    @staticmethod
+    def _digest(blob):
+        return hashlib.sha1(blob).digest()
+
+    def _family_signature(self, pkg, master):
+        """Hash a master together with its layouts and theme, ignoring part names."""
+        h = hashlib.sha1(pkg.parts[master])
+        for rel in pkg.rels(master):
+            h.update(rel.rId.encode() + rel.reltype.encode())
+            if not rel.external:
+                h.update(pkg.parts[rel.target])
+        return h.digest()
+
+    def _copy_part(self, src, name, rel_map):
+        """Copy part `name` of `src` under a fresh name and return that name.
+
+        `rel_map` maps source targets that are already present in the base
+        (layouts, masters, slides being merged) to their base names; every other
+        internal target is copied recursively, media being deduplicated by content.
+        """
+        if name in rel_map:
+            return rel_map[name]
+        blob = src.parts[name]
+        new_name = self.base.next_partname(name)
+        rel_map[name] = new_name
+        self.base.add_part(new_name, blob, src.content_type(name))
+        rels = []
+        for rel in src.rels(name):
+            if rel.external:
+                rels.append(rel)
+            elif rel.reltype in _MEDIA_RELTYPES:
+                rels.append(rel._replace(target=self._copy_media(src, rel.target)))
+            else:
+                rels.append(rel._replace(target=self._copy_part(src, rel.target, rel_map)))
+        self.base.set_rels(new_name, rels)
+        return new_name
+
+    def _copy_media(self, src, name):
+        blob = src.parts[name]
+        digest = self._digest(blob)
+        if digest not in self._media:
+            new_name = self.base.next_partname(name)
+            self.base.add_part(new_name, blob, src.content_type(name))
+            self._media[digest] = new_name
+        return self._media[digest]
+
+    def _map_family(self, src, master, rel_map):
+        """Map a source master and its layouts onto the base, copying them if new."""
+        signature = self._family_signature(src, master)
+        base_master = self._families.get(signature)
+        if base_master is not None:
+            base_targets = {r.rId: r.target for r in self.base.rels(base_master)}
+            rel_map[master] = base_master
+            for rel in src.rels(master):
+                if not rel.external:
+                    rel_map[rel.target] = base_targets[rel.rId]
+            return
+
+        new_master = self._copy_part(src, master, rel_map)
+        element = parse_xml(self.base.parts[new_master])
+        for layout_id in element.iter("{%s}sldLayoutId" % P_NS):
+            layout_id.set("id", str(self._next_master_id))
+            self._next_master_id += 1
+        self.base.parts[new_master] = serialize_xml(element)
+
+        rId = self._add_pres_rel(RT_SLIDE_MASTER, new_master)
+        lst = self._child("sldMasterIdLst", ())
+        entry = lst.makeelement("{%s}sldMasterId" % P_NS, {})
+        entry.set("id", str(self._next_master_id))
+        entry.set("{%s}id" % R_NS, rId)
+        self._next_master_id += 1
+        lst.append(entry)
+        self._families[signature] = new_master
+
+    def _map_notes_master(self, src, notes_master, rel_map):
+        if self.notes_master is None:
+            self.notes_master = self._copy_part(src, notes_master, rel_map)
+            rId = self._add_pres_rel(RT_NOTES_MASTER, self.notes_master)
+            lst = self._child("notesMasterIdLst", _BEFORE_NOTES_MASTERS)
+            entry = lst.makeelement("{%s}notesMasterId" % P_NS, {})
+            entry.set("{%s}id" % R_NS, rId)
+            lst.append(entry)
+        rel_map[notes_master] = self.notes_master
+
+    # --- Public steps ---
+
+    def append(self, src, slides=None, rel_map=None):
+        """Append the slides of package `src` (all of them, in presentation order,
+        or the member names listed in `slides`); returns their new sldId elements.
+
+        `rel_map` optionally pre-maps source parts onto existing base parts.
+        """
+        if slides is None:
+            slides = slide_partnames(src)
+
+        rel_map = dict(rel_map or {})
+        # Allocate slide names up front so slide-to-slide links resolve in one pass
+        for slide in slides:
+            rel_map[slide] = self.base.next_partname(slide)
+
+        entries = []
+        for slide in slides:
+            for rel in src.rels(slide):
+                if rel.reltype == RT_SLIDE_LAYOUT and rel.target not in rel_map:
+                    self._map_family(src, src.related(rel.target, RT_SLIDE_MASTER), rel_map)
+                elif rel.reltype == RT_NOTES_SLIDE:
+                    notes_master = src.related(rel.target, RT_NOTES_MASTER)
+                    if notes_master is not None and notes_master not in rel_map:
+                        self._map_notes_master(src, notes_master, rel_map)
+            entries.append(self._copy_slide(src, slide, rel_map))
+        return entries
+
+    def _copy_slide(self, src, slide, rel_map):
+        new_name = rel_map[slide]
+        rels, dropped = [], set()
+        for rel in src.rels(slide):
+            if rel.external:
+                rels.append(rel)
+            elif rel.reltype in _MEDIA_RELTYPES:
+                rels.append(rel._replace(target=self._copy_media(src, rel.target)))
+            elif rel.reltype == RT_SLIDE and rel.target not in rel_map:
+                dropped.add(rel.rId)  # link to a slide that is not part of the merge
+            else:
+                rels.append(rel._replace(target=self._copy_part(src, rel.target, rel_map)))
+        blob = unlink(src.parts[slide], dropped) if dropped else src.parts[slide]
+        self.base.add_part(new_name, blob, src.content_type(slide))
+        self.base.set_rels(new_name, rels)
+
+        rId = self._add_pres_rel(RT_SLIDE, new_name)
+        entry = self.sld_id_lst.makeelement("{%s}sldId" % P_NS, {})
+        entry.set("id", str(self._next_slide_id))
+        entry.set("{%s}id" % R_NS, rId)
+        self._next_slide_id += 1
+        self.sld_id_lst.append(entry)
+        return entry
+
+    def finish(self):
+        """Write presentation.xml and its rels back into the base package."""
+        self.base.parts[self.pres_name] = serialize_xml(self.pres)
+        self.base.set_rels(self.pres_name, self.pres_rels)
+        return self.base
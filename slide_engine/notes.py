@@ -0,0 +1,180 @@
+"""Speaker notes, written in one pass for a whole deck.
+
+python-pptx creates a notes slide the first time `slide.notes_slide` is
+read: it scans every part of the package for a free partname and clones the
+notes master's placeholders again, so adding notes to N slides costs O(N²).
+write_notes() clones the placeholders once into a template, scans the
+package once for the partnames in use and then only copies the template:
+
+    write_notes(prs, [(slide, "Présenter **les enjeux**"), ...])
+
+Notes text is one paragraph per line, written as is: the same XML as
+setting `notes_text_frame.text`. With `markdown` (a plan opts in with
+``"notes_markdown": true``), it is markdown-ish: ``- `` or ``* `` starts a
+bullet, ``# `` a bold heading, and ``**bold**``, ``*italic*`` or
+``_italic_`` format a span.
+"""
+
+import re
+import weakref
+from copy import deepcopy
+from xml.sax.saxutils import escape
+
+from pptx.opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
+from pptx.opc.packuri import PackURI
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls
+from pptx.oxml.slide import CT_NotesSlide
+from pptx.parts.slide import NotesSlidePart
+from pptx.slide import NotesSlide
+
+NOTES_PARTNAME = "/ppt/notesSlides/notesSlide%d.xml"
+
+BULLET = "•"
+BULLET_INDENT = 171450  # EMU, 0.1875"
+
+_BULLET_RE = re.compile(r"[-*•]\s+")
+_HEADING_RE = re.compile(r"#{1,3}\s+")
+_SPAN_RE = re.compile(
+    r"\*\*(?=\S)(.+?)(?<=\S)\*\*"          # **bold**
+    r"|\*(?=[^\s*])([^*]+?)(?<=\S)\*"      # *italic*
+    r"|(?<!\w)_(?=\S)([^_]+?)(?<=\S)_(?!\w)"  # _italic_
+)
+# Characters XML 1.0 cannot hold, written the way python-pptx escapes them
+_INVALID_XML_RE = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+# Notes slide template (placeholders cloned from the master), per notes master part
+_TEMPLATES = weakref.WeakKeyDictionary()
+
+# Per package: [partnames in use, last notes slide number given out], so that
+# adding notes slide by slide (add_*_slide(..., notes=...)) scans the package
+# once per deck rather than once per slide
+_NOTES_NUMBERS = weakref.WeakKeyDictionary()
+
+
+# === Text ===
+
+
+def _run(text, bold=False, italic=False):
+    text = _INVALID_XML_RE.sub(lambda m: "_x%04X_" % ord(m.group()), escape(text))
+    attrs = (' b="1"' if bold else "") + (' i="1"' if italic else "")
+    rpr = f"<a:rPr{attrs}/>" if attrs else ""
+    return f"<a:r>{rpr}<a:t>{text}</a:t></a:r>"
+
+
+def _runs(line, bold=False):
+    runs, pos = [], 0
+    for m in _SPAN_RE.finditer(line):
+        if m.start() > pos:
+            runs.append(_run(line[pos:m.start()], bold))
+        strong, emphasis = m.group(1), m.group(2) or m.group(3)
+        runs.append(_run(strong, True) if strong is not None else _run(emphasis, bold, True))
+        pos = m.end()
+    if pos < len(line):
+        runs.append(_run(line[pos:], bold))
+    return "".join(runs)
+
+
+def notes_paragraphs(text, markdown=False):
+    """Return the ``<a:p>`` elements of `text` as an XML string (namespace
+    prefixes unbound)."""
+    paragraphs = []
+    for line in text.split("\n"):
+        if not markdown:
+            paragraphs.append(f"<a:p>{_run(line) if line else ''}</a:p>")
+            continue
+        ppr, bold = "", False
+        bullet = _BULLET_RE.match(line)
+        heading = _HEADING_RE.match(line)
+        if bullet:
+            line = line[bullet.end():]
+            ppr = (f'<a:pPr marL="{BULLET_INDENT}" indent="-{BULLET_INDENT}">'
+                   f'<a:buChar char="{BULLET}"/></a:pPr>')
+        elif heading:
+            line, bold = line[heading.end():], True
+        paragraphs.append(f"<a:p>{ppr}{_runs(line, bold)}</a:p>")
+    return "".join(paragraphs)
+
+
+def _tx_body(text, markdown):
+    return parse_xml(f"<p:txBody {nsdecls('a', 'p')}><a:bodyPr/><a:lstStyle/>"
+                     f"{notes_paragraphs(text, markdown)}</p:txBody>")
+
+
+# === Notes slides ===
+
+
+def _template(notes_master_part):
+    template = _TEMPLATES.get(notes_master_part)
+    if template is None:
+        template = CT_NotesSlide.new()
+        NotesSlide(template, None).clone_master_placeholders(notes_master_part.notes_master)
+        _TEMPLATES[notes_master_part] = template
+    return template
+
+
+def _set_text(notes_element, text, markdown):
+    for sp in notes_element.iter("{*}sp"):
+        ph = sp.find("{*}nvSpPr/{*}nvPr/{*}ph")
+        if ph is not None and ph.get("type") == "body":
+            old = sp.find("{*}txBody")
+            if old is not None:
+                sp.remove(old)
+            sp.append(_tx_body(text, markdown))
+            return
+    raise ValueError("Notes master has no body placeholder")
+
+
+def forget_notes_numbers(prs):
+    """Rescan the notes partnames of `prs` on the next write_notes()."""
+    _NOTES_NUMBERS.pop(prs.part.package, None)
+
+
+def write_notes(prs, slide_notes, markdown=False):
+    """Set the speaker notes of many slides of `prs` at once.
+
+    `slide_notes` is an iterable of (slide, text); empty texts are skipped.
+    Slides that already have a notes slide get their text replaced. With
+    `markdown`, the texts are markdown-ish (see above).
+    Returns the number of notes slides created.
+
+    The partnames in use are scanned on the first call for a package and then
+    kept up to date by the following ones: a notes slide python-pptx creates
+    itself in between (reading `slide.notes_slide`) must be announced with
+    forget_notes_numbers().
+    """
+    slide_notes = [(slide, text) for slide, text in slide_notes if text]
+    if not slide_notes:
+        return 0
+    package = prs.part.package
+    notes_master_part = prs.part.notes_master_part
+    template = _template(notes_master_part)
+    numbers = _NOTES_NUMBERS.get(package)
+    created = 0
+    for slide, text in slide_notes:
+        slide_part = slide.part
+        try:
+            notes_part = slide_part.part_related_by(RT.NOTES_SLIDE)
+        except KeyError:
+            notes_part = None
+        if notes_part is not None:
+            _set_text(notes_part.notes_slide._element, text, markdown)
+            continue
+        if numbers is None:
+            numbers = _NOTES_NUMBERS[package] = [
+                {str(part.partname) for part in package.iter_parts()}, 0]
+        used, number = numbers
+        number += 1
+        while NOTES_PARTNAME % number in used:
+            number += 1
+        used.add(NOTES_PARTNAME % number)
+        numbers[1] = number
+        element = deepcopy(template)
+        _set_text(element, text, markdown)
+        notes_part = NotesSlidePart(PackURI(NOTES_PARTNAME % number), CT.PML_NOTES_SLIDE,
+                                    package, element)
+        notes_part.relate_to(notes_master_part, RT.NOTES_MASTER)
+        notes_part.relate_to(slide_part, RT.SLIDE)
+        slide_part.relate_to(notes_part, RT.NOTES_SLIDE)
+        created += 1
+    return created
@@ -0,0 +1,342 @@
+"""Direct OOXML backend — slides written as XML strings, no python-pptx shapes.
+
+The layouts of layouts.py run unchanged through bind_layouts(): the helpers
+below have the same signatures as those of engine.py but append markup to an
+OoxmlSlide (shapes go through SlideBuilder, so they are the XML the engine
+itself writes). On save the slides are dropped into a copy of a fresh deck
+held as raw parts (see package.Package); only presentation.xml is parsed.
+Charts still use python-pptx's chart XML writer and the engine's styling.
+
+    deck = render_plan_ooxml(plan)
+    deck.save("deck.pptx")
+
+or ``render_plan_bytes(plan, backend="ooxml")``, ``render --backend ooxml``.
+The parts written are the ones python-pptx writes for the same plan.
+"""
+
+import functools
+import weakref
+from copy import deepcopy
+
+from pptx.chart.chart import Chart
+from pptx.chart.data import CategoryChartData
+from pptx.enum.chart import XL_CHART_TYPE
+from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
+from pptx.opc.constants import CONTENT_TYPE as CT
+from pptx.oxml import parse_xml as parse_pptx_xml
+from pptx.oxml.ns import nsdecls
+from pptx.util import Pt
+
+from . import design as D
+from .builder import SlideBuilder, _text
+from .engine import TITLE_LAYOUT, _style_bar_chart, _style_pie_chart, create_presentation
+from .layouts import bind_layouts
+from .merge import _BEFORE_SLIDES, _insert_child
+from .notes import _set_text, _template
+from .package import (
+    P_NS,
+    R_NS,
+    RT_NOTES_MASTER,
+    RT_NOTES_SLIDE,
+    RT_SLIDE,
+    RT_SLIDE_LAYOUT,
+    XML_DECLARATION,
+    Package,
+    Rel,
+    parse_xml,
+    serialize_xml,
+)
+from .patch import RT_CHART, RT_PACKAGE
+from .plan import render_plan
+
+_SLIDE_OPEN = f'<p:sld {nsdecls("a", "p", "r")}><p:cSld>'
+_SP_TREE_OPEN = (
+    '<p:spTree><p:nvGrpSpPr><p:cNvPr id="1" name=""/><p:cNvGrpSpPr/><p:nvPr/></p:nvGrpSpPr>'
+    '<p:grpSpPr/>'
+)
+_SLIDE_CLOSE = "</p:spTree></p:cSld><p:clrMapOvr><a:masterClrMapping/></p:clrMapOvr></p:sld>"
+
+# Title placeholder as python-pptx clones it from the engine's title layout
+_TITLE_SP = (
+    '<p:sp><p:nvSpPr><p:cNvPr id="2" name="Title 1"/><p:cNvSpPr><a:spLocks noGrp="1"/>'
+    '</p:cNvSpPr><p:nvPr><p:ph type="title"/></p:nvPr></p:nvSpPr><p:spPr/>'
+    '<p:txBody><a:bodyPr/><a:lstStyle/>{}</p:txBody></p:sp>'
+)
+
+_CHART_PARTNAME = "ppt/charts/chart%d.xml"
+_XLSX_PARTNAME = "ppt/embeddings/Microsoft_Excel_Sheet%d.xlsx"
+_NOTES_PARTNAME = "ppt/notesSlides/notesSlide%d.xml"
+
+
+class OoxmlSlide:
+    """Markup of one slide: background, title, shapes, charts and notes."""
+
+    __slots__ = ("layout", "background", "title", "shapes", "charts", "notes")
+
+    def __init__(self, layout, shapes, title=None):
+        self.layout = layout  # member name of its slide layout
+        self.background = None
+        self.title = title
+        self.shapes = shapes  # SlideBuilder
+        self.charts = []  # (chart part, workbook), related as rId2, rId3...
+        self.notes = ""
+
+    def to_xml(self):
+        bg = ""
+        if self.background is not None:
+            bg = (f'<p:bg><p:bgPr><a:solidFill><a:srgbClr val="{self.background}"/>'
+                  '</a:solidFill><a:effectLst/></p:bgPr></p:bg>')
+        if self.title is None:
+            title, first_id = "", 2
+        else:
+            text = _text(self.title)
+            title, first_id = _TITLE_SP.format(f"<a:p>{text}</a:p>" if text else "<a:p/>"), 3
+        xml = (_SLIDE_OPEN + bg + _SP_TREE_OPEN + title + self.shapes.xml(first_id)
+               + _SLIDE_CLOSE)
+        return XML_DECLARATION + xml.encode("utf-8")
+
+
+class _DeckTemplate:
+    """A new deck of one theme as raw parts, with the parts slides refer to.
+
+    The notes master is only added to decks with notes, as python-pptx does.
+    """
+
+    def __init__(self, prs):
+        self.blank_layout = prs.slide_layouts[6].part.partname.membername
+        self.title_layout = prs.slide_layouts.get_by_name(TITLE_LAYOUT).part.partname.membername
+        self.pkg = Package.from_presentation(prs)
+        notes_master_part = prs.part.notes_master_part
+        self.notes_master = notes_master_part.partname.membername
+        self.notes_slide = _template(notes_master_part)
+        with_notes = Package.from_presentation(prs)
+        self.notes_parts = {name: blob for name, blob in with_notes.parts.items()
+                            if name not in self.pkg.parts}
+        self.notes_overrides = {name: content_type
+                                for name, content_type in with_notes.overrides.items()
+                                if name in self.notes_parts}
+
+
+_TEMPLATES = weakref.WeakKeyDictionary()  # Theme (design module by default) -> _DeckTemplate
+
+
+def _deck_template(theme):
+    key = theme if theme is not None else D
+    template = _TEMPLATES.get(key)
+    if template is None:
+        prs = theme.create_presentation() if theme is not None else create_presentation()
+        template = _TEMPLATES[key] = _DeckTemplate(prs)
+    return template
+
+
+class OoxmlDeck:
+    """Stand-in for a Presentation: the `prs` handed to the bound layouts.
+    With `notes_markdown`, speaker notes are markdown-ish (see notes.py)."""
+
+    def __init__(self, theme=None, notes_markdown=False):
+        self.template = _deck_template(theme)
+        self.slides = []
+        self.notes_markdown = notes_markdown
+
+    def to_package(self):
+        """The deck as a Package (see package.py)."""
+        template = self.template
+        pkg = template.pkg.copy()
+        pres_name = pkg.main_document
+        pres = parse_xml(pkg.parts[pres_name])
+        pres_rels = list(pkg.rels(pres_name))
+        next_rid = 1 + max(int(r.rId[3:]) for r in pres_rels if r.rId[3:].isdigit())
+        if self.slides:
+            sld_id_lst = pres.makeelement("{%s}sldIdLst" % P_NS, {})
+            _insert_child(pres, sld_id_lst, _BEFORE_SLIDES)
+
+        charts = notes = 0
+        for number, slide in enumerate(self.slides, 1):
+            name = "ppt/slides/slide%d.xml" % number
+            rels = [Rel("rId1", RT_SLIDE_LAYOUT, slide.layout, False)]
+            for chart_xml, workbook in slide.charts:
+                charts += 1
+                chart_name, xlsx_name = _CHART_PARTNAME % charts, _XLSX_PARTNAME % charts
+                pkg.defaults.setdefault("xlsx", CT.SML_SHEET)
+                pkg.add_part(xlsx_name, workbook, CT.SML_SHEET)
+                pkg.add_part(chart_name, chart_xml, CT.DML_CHART)
+                pkg.set_rels(chart_name, [Rel("rId1", RT_PACKAGE, xlsx_name, False)])
+                rels.append(Rel("rId%d" % (len(rels) + 1), RT_CHART, chart_name, False))
+            if slide.notes:
+                notes += 1
+                notes_name = _NOTES_PARTNAME % notes
+                element = deepcopy(template.notes_slide)
+                _set_text(element, slide.notes, self.notes_markdown)
+                pkg.add_part(notes_name, serialize_xml(element), CT.PML_NOTES_SLIDE)
+                pkg.set_rels(notes_name, [
+                    Rel("rId1", RT_NOTES_MASTER, template.notes_master, False),
+                    Rel("rId2", RT_SLIDE, name, False),
+                ])
+                rels.append(Rel("rId%d" % (len(rels) + 1), RT_NOTES_SLIDE, notes_name, False))
+            pkg.add_part(name, slide.to_xml(), CT.PML_SLIDE)
+            pkg.set_rels(name, rels)
+            rId = "rId%d" % next_rid
+            next_rid += 1
+            pres_rels.append(Rel(rId, RT_SLIDE, name, False))
+            sld_id = pres.makeelement("{%s}sldId" % P_NS, {})
+            sld_id.set("id", str(255 + number))
+            sld_id.set("{%s}id" % R_NS, rId)
+            sld_id_lst.append(sld_id)
+
+        if notes:
+            # Created on the first notes slide, so related after every slide
+            for name, blob in template.notes_parts.items():
+                pkg.parts[name] = blob
+            pkg.overrides.update(template.notes_overrides)
+            pres_rels.append(Rel("rId%d" % next_rid, RT_NOTES_MASTER, template.notes_master, False))
+        pkg.parts[pres_name] = serialize_xml(pres)
+        pkg.set_rels(pres_name, pres_rels)
+        return pkg
+
+    def save(self, target, deterministic=False, threads=1):
+        """Write the deck to a path or file-like object (see Package.save())."""
+        self.to_package().save(target, deterministic=deterministic, threads=threads)
+        return target
+
+
+# ===================================================================
+# HELPERS — same contract as engine.py
+# ===================================================================
+
+
+def _add_blank_slide(prs, theme=D):
+    slide = OoxmlSlide(prs.template.blank_layout, SlideBuilder(None, theme.FONT_FAMILY))
+    prs.slides.append(slide)
+    return slide
+
+
+def _add_titled_slide(prs, title, theme=D):
+    slide = OoxmlSlide(prs.template.title_layout, SlideBuilder(None, theme.FONT_FAMILY), title)
+    prs.slides.append(slide)
+    return slide
+
+
+def _set_slide_background(slide, color):
+    slide.background = color
+
+
+def _add_textbox(slide, left, top, width, height, text,
+                 font_size=None, font_color=None,
+                 bold=False, alignment=PP_ALIGN.LEFT,
+                 font_name=None, anchor=MSO_ANCHOR.TOP, theme=D):
+    slide.shapes.textbox(left, top, width, height, text,
+                         theme.BODY_SIZE if font_size is None else font_size,
+                         theme.DARK_TEXT if font_color is None else font_color, bold,
+                         alignment, font_name or theme.FONT_FAMILY, anchor)
+
+
+def _add_multiline_textbox(slide, left, top, width, height, lines,
+                           font_size=None, font_color=None,
+                           bold=False, alignment=PP_ALIGN.LEFT,
+                           font_name=None, line_spacing=None,
+                           bullet_color=None, bullet_char=None, theme=D):
+    slide.shapes.multiline_textbox(left, top, width, height, lines,
+                                   theme.BODY_SIZE if font_size is None else font_size,
+                                   theme.DARK_TEXT if font_color is None else font_color,
+                                   bold, alignment, font_name or theme.FONT_FAMILY,
+                                   line_spacing, bullet_color, bullet_char)
+
+
+def _add_speaker_notes(slide, notes_text):
+    slide.notes = notes_text or ""
+
+
+def _add_rectangle(slide, left, top, width, height, fill_color, theme=D):
+    slide.shapes.rectangle(left, top, width, height, fill_color)
+
+
+def _add_line(slide, left, top, width, height, color, line_width=Pt(2), theme=D):
+    slide.shapes.line(left, top, width, height, color, line_width)
+
+
+def _add_rounded_rectangle(slide, left, top, width, height, fill_color,
+                           border_color=None, text="", font_size=None,
+                           font_color=None, bold=False, alignment=PP_ALIGN.CENTER, theme=D):
+    slide.shapes.rounded_rectangle(left, top, width, height, fill_color, border_color, text,
+                                   theme.BODY_SIZE if font_size is None else font_size,
+                                   theme.WHITE if font_color is None else font_color,
+                                   bold, alignment)
+
+
+def _add_chevron(slide, left, top, width, height, fill_color, text="",
+                 font_size=None, font_color=None, theme=D):
+    slide.shapes.chevron(left, top, width, height, fill_color, text,
+                         theme.SMALL_SIZE if font_size is None else font_size,
+                         theme.WHITE if font_color is None else font_color)
+
+
+def _add_oval(slide, left, top, width, height, fill_color, text="",
+              font_size=None, font_color=None, bold=True, theme=D):
+    slide.shapes.oval(left, top, width, height, fill_color, text,
+                      theme.BODY_SIZE if font_size is None else font_size,
+                      theme.WHITE if font_color is None else font_color, bold)
+
+
+def _add_triangle(slide, left, top, width, height, fill_color, theme=D):
+    slide.shapes.triangle(left, top, width, height, fill_color)
+
+
+def _add_chart(slide, chart_type, style, left, top, width, height, categories, values,
+               theme):
+    chart_data = CategoryChartData()
+    chart_data.categories = categories
+    chart_data.add_series("", values)
+    chart_space = parse_pptx_xml(chart_data.xml_bytes(chart_type))
+    chart_space.get_or_add_externalData().rId = "rId1"  # the workbook
+    style(Chart(chart_space, None), theme)
+    slide.charts.append((serialize_xml(chart_space), chart_data.xlsx_blob))
+    slide.shapes.chart_frame(left, top, width, height, "rId%d" % (len(slide.charts) + 1))
+
+
+def _add_chart_bar(slide, left, top, width, height, categories, values,
+                   chart_title="", theme=D):
+    _add_chart(slide, XL_CHART_TYPE.COLUMN_CLUSTERED, _style_bar_chart,
+               left, top, width, height, categories, values, theme)
+
+
+def _add_chart_pie(slide, left, top, width, height, categories, values, theme=D):
+    _add_chart(slide, XL_CHART_TYPE.PIE, _style_pie_chart,
+               left, top, width, height, categories, values, theme)
+
+
+OOXML_LAYOUTS = bind_layouts({
+    "_add_blank_slide": _add_blank_slide,
+    "_add_titled_slide": _add_titled_slide,
+    "_set_slide_background": _set_slide_background,
+    "_add_textbox": _add_textbox,
+    "_add_multiline_textbox": _add_multiline_textbox,
+    "_add_speaker_notes": _add_speaker_notes,
+    "_add_rectangle": _add_rectangle,
+    "_add_line": _add_line,
+    "_add_rounded_rectangle": _add_rounded_rectangle,
+    "_add_chevron": _add_chevron,
+    "_add_oval": _add_oval,
+    "_add_triangle": _add_triangle,
+    "_add_chart_bar": _add_chart_bar,
+    "_add_chart_pie": _add_chart_pie,
+})
+
+_THEMED_LAYOUTS = weakref.WeakKeyDictionary()  # Theme -> layouts
+
+
+def ooxml_layouts(theme=None):
+    """The layouts drawing through this backend, with `theme`'s tokens if given."""
+    if theme is None:
+        return OOXML_LAYOUTS
+    layouts = _THEMED_LAYOUTS.get(theme)
+    if layouts is None:
+        layouts = _THEMED_LAYOUTS[theme] = {
+            name: functools.partial(fn, theme=theme) for name, fn in OOXML_LAYOUTS.items()
+        }
+    return layouts
+
+
+def render_plan_ooxml(plan, validate=True, theme=None):
+    """Render `plan` with the direct OOXML backend; returns an OoxmlDeck."""
+    deck = OoxmlDeck(theme, isinstance(plan, dict) and plan.get("notes_markdown", False))
+    return render_plan(plan, deck, ooxml_layouts(theme), validate)
@@ -0,0 +1,206 @@
+"""Shrink generated decks for long-term storage.
+
+Decks built on python-pptx's default template carry parts no slide uses: the
+slide layouts other than the ones the slides are on, the template's printer
+settings, and date/footer/slide number placeholders nobody fills in.
+optimize_package() removes them with everything only they referenced,
+minifies the remaining XML, and optimize_deck() writes the result at the
+chosen zlib level, reporting the bytes of every part before and after:
+
+    report = optimize_deck("gpec.pptx", "gpec.min.pptx")
+    print(report.format())
+"""
+
+import io
+import zipfile
+import zlib
+from collections import namedtuple
+
+from lxml import etree
+
+from .merge import slide_partnames
+from .package import (
+    P_NS,
+    R_NS,
+    RT_SLIDE_LAYOUT,
+    RT_SLIDE_MASTER,
+    Package,
+    parse_xml,
+    serialize_xml,
+)
+from .surgery import drop_orphans
+
+RT_PRINTER_SETTINGS = R_NS + "/printerSettings"
+RT_THUMBNAIL = "http://schemas.openxmlformats.org/package/2006/relationships/metadata/thumbnail"
+MC_NS = "http://schemas.openxmlformats.org/markup-compatibility/2006"
+
+# Placeholder types only shown when a slide carries one of its own
+FOOTER_TYPES = ("dt", "ftr", "sldNum")
+
+_XML_SPACE = "{http://www.w3.org/XML/1998/namespace}space"
+_P = "{%s}" % P_NS
+
+PartSize = namedtuple("PartSize", "name before after before_zip after_zip")
+
+
+# === Package clean-up ===
+
+
+def strip_unused_layouts(pkg):
+    """Unlink the slide layouts no slide is on (each master keeps at least one)."""
+    used = {pkg.related(slide, RT_SLIDE_LAYOUT) for slide in slide_partnames(pkg)}
+    for master in [r.target for r in pkg.rels(pkg.main_document)
+                   if r.reltype == RT_SLIDE_MASTER]:
+        rels = pkg.rels(master)
+        layouts = [r for r in rels if r.reltype == RT_SLIDE_LAYOUT]
+        keep = {r.rId for r in layouts if r.target in used} or {r.rId for r in layouts[:1]}
+        if len(keep) == len(layouts):
+            continue
+        root = parse_xml(pkg.parts[master])
+        for entry in root.iter(_P + "sldLayoutId"):
+            if entry.get("{%s}id" % R_NS) not in keep:
+                entry.getparent().remove(entry)
+        pkg.parts[master] = serialize_xml(root)
+        pkg.set_rels(master, [r for r in rels if r.reltype != RT_SLIDE_LAYOUT or r.rId in keep])
+
+
+def strip_footer_placeholders(pkg):
+    """Remove date, footer and slide number placeholders from the masters and
+    layouts when no slide carries a placeholder of that type."""
+    slides = [pkg.parts[name] for name in slide_partnames(pkg)]
+    unused = {t for t in FOOTER_TYPES
+              if not any(b'type="%s"' % t.encode() in blob for blob in slides)}
+    if not unused:
+        return
+    for name in list(pkg.parts):
+        if not name.startswith(("ppt/slideMasters/slideMaster", "ppt/slideLayouts/slideLayout")):
+            continue
+        if name.endswith(".rels"):
+            continue
+        root = parse_xml(pkg.parts[name])
+        doomed = [ph.getparent().getparent().getparent()
+                  for ph in root.iter(_P + "ph") if ph.get("type") in unused]
+        for sp in doomed:
+            sp.getparent().remove(sp)
+        if doomed:
+            pkg.parts[name] = serialize_xml(root)
+
+
+def _unlink(pkg, source, reltype):
+    rels = pkg.rels(source)
+    kept = [r for r in rels if r.reltype != reltype]
+    if len(kept) != len(rels):
+        pkg.set_rels(source, kept)
+
+
+def minify_xml(blob):
+    """Re-serialize an XML part without whitespace between elements and
+    without unused namespace declarations (mc:Ignorable prefixes are kept)."""
+    root = parse_xml(blob)
+    ignorable = set()
+    for el in root.iter(etree.Element):
+        if len(el) and el.get(_XML_SPACE) != "preserve":
+            if el.text is not None and not el.text.strip():
+                el.text = None
+            for child in el:
+                if child.tail is not None and not child.tail.strip():
+                    child.tail = None
+        for attr in ("{%s}Ignorable" % MC_NS, "Requires"):
+            ignorable.update((el.get(attr) or "").split())
+    etree.cleanup_namespaces(root, keep_ns_prefixes=sorted(ignorable))
+    return serialize_xml(root)
+
+
+def optimize_package(pkg, minify=True, drop_thumbnail=False):
+    """Shrink `pkg` in place; returns the names of the parts removed.
+
+    Unused slide layouts and footer placeholders, the printer settings and
+    (with `drop_thumbnail`) the preview image are unlinked, then every part
+    no longer reachable is dropped. With `minify` the XML parts are
+    re-serialized compactly; slides look the same either way.
+    """
+    strip_unused_layouts(pkg)
+    strip_footer_placeholders(pkg)
+    _unlink(pkg, pkg.main_document, RT_PRINTER_SETTINGS)
+    if drop_thumbnail:
+        _unlink(pkg, "", RT_THUMBNAIL)
+    removed = drop_orphans(pkg)
+    if minify:
+        for name, blob in list(pkg.parts.items()):
+            if (pkg.content_type(name) or "").endswith("xml") or name.endswith(".rels"):
+                pkg.parts[name] = minify_xml(blob)
+    return removed
+
+
+# === Decks and reports ===
+
+
+class OptimizeReport:
+    """Bytes of every part before and after (None once removed), plus the
+    sizes of the whole files."""
+
+    def __init__(self, parts, before, after):
+        self.parts = parts
+        self.before = before
+        self.after = after
+
+    @property
+    def saved(self):
+        return self.before - self.after
+
+    def format(self, top=None):
+        """A plain-text table of the parts, biggest compressed saving first."""
+        rows = sorted(self.parts, key=lambda p: (p.after_zip or 0) - p.before_zip)[:top]
+        width = max([len(p.name) for p in rows] + [4])
+        lines = [f"{'part':<{width}}  {'size':>17}  {'zipped':>15}"]
+        for p in rows:
+            after = "removed" if p.after is None else p.after
+            after_zip = "removed" if p.after_zip is None else p.after_zip
+            lines.append(f"{p.name:<{width}}  {p.before:>8}>{after:>8}  "
+                         f"{p.before_zip:>7}>{after_zip:>7}")
+        lines.append(f"file: {self.before} -> {self.after} bytes "
+                     f"(-{100 * self.saved / max(self.before, 1):.1f}%)")
+        return "\n".join(lines)
+
+
+def _read(source):
+    if hasattr(source, "save"):
+        buf = io.BytesIO()
+        source.save(buf)
+        return buf.getvalue()
+    if hasattr(source, "read"):
+        return source.read()
+    with open(source, "rb") as f:
+        return f.read()
+
+
+def _member_sizes(data):
+    with zipfile.ZipFile(io.BytesIO(data)) as zf:
+        return {i.filename: (i.file_size, i.compress_size) for i in zf.infolist()}
+
+
+def optimize_deck(source, target, level=zlib.Z_BEST_COMPRESSION, minify=True,
+                  drop_thumbnail=False):
+    """Write an optimized copy of `source` (path, file-like object or
+    Presentation) to `target` (path or file-like object); returns an
+    OptimizeReport. See optimize_package() for the options."""
+    data = _read(source)
+    pkg = Package.open(io.BytesIO(data))
+    optimize_package(pkg, minify, drop_thumbnail)
+    out = io.BytesIO()
+    pkg.save(out, level=level)
+    result = out.getvalue()
+
+    before, after = _member_sizes(data), _member_sizes(result)
+    parts = []
+    for name, (size, zipped) in before.items():
+        new_size, new_zipped = after.get(name, (None, None))
+        parts.append(PartSize(name, size, new_size, zipped, new_zipped))
+    parts += [PartSize(name, 0, size, 0, zipped)
+              for name, (size, zipped) in after.items() if name not in before]
+    if hasattr(target, "write"):
+        target.write(result)
+    else:
+        with open(target, "wb") as f:
+            f.write(result)
+    return OptimizeReport(parts, len(data), len(result))
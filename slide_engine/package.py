@@ -0,0 +1,565 @@
+"""Zip-level access to .pptx packages, bypassing the python-pptx object model.
+
+Parts are kept as raw bytes keyed by zip member name (``ppt/slides/slide1.xml``,
+no leading slash). Relationships are parsed on demand into ``Rel`` tuples whose
+internal targets are resolved to member names, so callers can rewire parts
+without caring about relative paths.
+"""
+
+import io
+import os
+import posixpath
+import re
+import struct
+import time
+import zipfile
+import zlib
+from collections import namedtuple
+from collections.abc import MutableMapping
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+
+from lxml import etree
+from pptx.opc.oxml import serialize_part_xml
+from pptx.opc.serialized import _ContentTypesItem
+
+# === Namespaces & relationship types ===
+CT_NS = "http://schemas.openxmlformats.org/package/2006/content-types"
+RELS_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+P_NS = "http://schemas.openxmlformats.org/presentationml/2006/main"
+A_NS = "http://schemas.openxmlformats.org/drawingml/2006/main"
+R_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+
+RT_OFFICE_DOCUMENT = R_NS + "/officeDocument"
+RT_SLIDE = R_NS + "/slide"
+RT_SLIDE_LAYOUT = R_NS + "/slideLayout"
+RT_SLIDE_MASTER = R_NS + "/slideMaster"
+RT_NOTES_SLIDE = R_NS + "/notesSlide"
+RT_NOTES_MASTER = R_NS + "/notesMaster"
+RT_THEME = R_NS + "/theme"
+RT_IMAGE = R_NS + "/image"
+RT_MEDIA = "http://schemas.microsoft.com/office/2007/relationships/media"
+RT_VIDEO = R_NS + "/video"
+RT_AUDIO = R_NS + "/audio"
+
+RT_CORE_PROPERTIES = \
+    "http://schemas.openxmlformats.org/package/2006/relationships/metadata/core-properties"
+DCTERMS_NS = "http://purl.org/dc/terms/"
+
+CONTENT_TYPES = "[Content_Types].xml"
+PACKAGE_RELS = "_rels/.rels"
+
+XML_DECLARATION = b"<?xml version='1.0' encoding='UTF-8' standalone='yes'?>\n"
+
+Rel = namedtuple("Rel", "rId reltype target external")
+
+_PARTNAME_RE = re.compile(r"^(.*?)(\d*)(\.[^./]+)$")
+
+
+def rels_name(partname):
+    """Return the member name of the .rels item belonging to `partname`."""
+    directory, filename = posixpath.split(partname)
+    return posixpath.join(directory, "_rels", filename + ".rels")
+
+
+def resolve_target(source, target):
+    """Resolve a relative rel target against the member name of its source part."""
+    if target.startswith("/"):
+        return target[1:]
+    return posixpath.normpath(posixpath.join(posixpath.dirname(source), target))
+
+
+def relative_target(source, target):
+    """Inverse of resolve_target(): express `target` relative to `source`."""
+    return posixpath.relpath(target, posixpath.dirname(source) or ".")
+
+
+def parse_xml(blob):
+    """Parse a part blob into an lxml element."""
+    return etree.fromstring(blob)
+
+
+def serialize_xml(element):
+    """Serialize an element the way python-pptx writes parts (standalone UTF-8)."""
+    return XML_DECLARATION + etree.tostring(element, encoding="UTF-8")
+
+
+class Package:
+    """An OPC package held in memory as ``{member name: bytes}``.
+
+    Content types and relationships are decoded lazily and written back on
+    save(); untouched parts are never parsed.
+    """
+
+    def __init__(self, parts, defaults, overrides):
+        self.parts = parts
+        self.defaults = defaults
+        self.overrides = overrides
+        self._rels = {}
+        self._counters = None
+
+    @classmethod
+    def open(cls, pkg_file, lazy=False):
+        """Read every member of a .pptx path or file-like object.
+
+        With `lazy`, only the zip directory is read: members are decompressed
+        on first access and those never assigned are copied compressed, byte
+        for byte, on save (see LazyParts).
+        """
+        if lazy:
+            parts = LazyParts(pkg_file)
+        else:
+            with zipfile.ZipFile(pkg_file) as zf:
+                parts = {info.filename: zf.read(info) for info in zf.infolist()}
+        return cls._from_parts(parts)
+
+    @classmethod
+    def from_presentation(cls, prs):
+        """The package of a python-pptx Presentation, as prs.save() would write
+        it, without zipping it first."""
+        return cls._from_parts(dict(presentation_members(prs)))
+
+    @classmethod
+    def _from_parts(cls, parts):
+        types = parse_xml(parts.pop(CONTENT_TYPES))
+        defaults = {
+            el.get("Extension").lower(): el.get("ContentType")
+            for el in types.iter("{%s}Default" % CT_NS)
+        }
+        overrides = {
+            el.get("PartName")[1:]: el.get("ContentType")
+            for el in types.iter("{%s}Override" % CT_NS)
+        }
+        return cls(parts, defaults, overrides)
+
+    def copy(self):
+        """A copy sharing the part blobs (bytes are immutable), cheap to take per output."""
+        pkg = Package(self.parts.copy(), dict(self.defaults), dict(self.overrides))
+        pkg._rels = dict(self._rels)
+        pkg._counters = dict(self._counters) if self._counters is not None else None
+        return pkg
+
+    # --- Content types ---
+
+    def content_type(self, partname):
+        """Return the content type of `partname` (override first, then default)."""
+        if partname in self.overrides:
+            return self.overrides[partname]
+        return self.defaults.get(posixpath.splitext(partname)[1][1:].lower())
+
+    def add_part(self, partname, blob, content_type):
+        """Store `blob` as `partname`, registering an override when required."""
+        self.parts[partname] = blob
+        if self.content_type(partname) != content_type:
+            self.overrides[partname] = content_type
+
+    def drop_part(self, partname):
+        """Remove a part, its rels item and its content type override."""
+        self.parts.pop(partname, None)
+        self.parts.pop(rels_name(partname), None)
+        self.overrides.pop(partname, None)
+        self._rels.pop(partname, None)
+
+    # --- Relationships ---
+
+    def rels(self, partname):
+        """Return the relationships of `partname` ("" for the package) as Rels."""
+        if partname not in self._rels:
+            blob = self.parts.get(rels_name(partname) if partname else PACKAGE_RELS)
+            rels = []
+            if blob is not None:
+                for el in parse_xml(blob).iter("{%s}Relationship" % RELS_NS):
+                    external = el.get("TargetMode") == "External"
+                    target = el.get("Target")
+                    if not external:
+                        target = resolve_target(partname, target)
+                    rels.append(Rel(el.get("Id"), el.get("Type"), target, external))
+            self._rels[partname] = rels
+        return self._rels[partname]
+
+    def set_rels(self, partname, rels):
+        """Replace the relationships of `partname` and re-serialize its rels item."""
+        rels = list(rels)
+        self._rels[partname] = rels
+        name = rels_name(partname) if partname else PACKAGE_RELS
+        if not rels:
+            self.parts.pop(name, None)
+            return
+        root = etree.Element("{%s}Relationships" % RELS_NS, nsmap={None: RELS_NS})
+        for rel in rels:
+            el = etree.SubElement(root, "{%s}Relationship" % RELS_NS)
+            el.set("Id", rel.rId)
+            el.set("Type", rel.reltype)
+            if rel.external:
+                el.set("Target", rel.target)
+                el.set("TargetMode", "External")
+            else:
+                el.set("Target", relative_target(partname, rel.target))
+        self.parts[name] = serialize_xml(root)
+
+    def related(self, partname, reltype):
+        """Return the target of the first rel of `reltype` from `partname`, or None."""
+        for rel in self.rels(partname):
+            if rel.reltype == reltype and not rel.external:
+                return rel.target
+        return None
+
+    @property
+    def main_document(self):
+        """Member name of the presentation part (``ppt/presentation.xml``)."""
+        return self.related("", RT_OFFICE_DOCUMENT)
+
+    # --- Partnames ---
+
+    def next_partname(self, like):
+        """Return a fresh member name numbered like `like` (``slide7.xml`` -> ``slideN.xml``).
+
+        Counters are seeded from one scan of the package, so allocating N names
+        costs O(N) rather than rescanning every part for each new name.
+        """
+        if self._counters is None:
+            self._counters = {}
+            for name in self.parts:
+                prefix, number, ext = _PARTNAME_RE.match(name).groups()
+                key = (prefix, ext)
+                self._counters[key] = max(self._counters.get(key, 0), int(number or 0))
+        prefix, _, ext = _PARTNAME_RE.match(like).groups()
+        key = (prefix, ext)
+        n = self._counters.get(key, 0) + 1
+        while prefix + str(n) + ext in self.parts:
+            n += 1
+        self._counters[key] = n
+        return prefix + str(n) + ext
+
+    # --- Serialization ---
+
+    def content_types_xml(self):
+        """Build ``[Content_Types].xml`` for the parts currently in the package."""
+        root = etree.Element("{%s}Types" % CT_NS, nsmap={None: CT_NS})
+        for ext, content_type in sorted(self.defaults.items()):
+            etree.SubElement(root, "{%s}Default" % CT_NS,
+                             Extension=ext, ContentType=content_type)
+        for partname in sorted(self.overrides):
+            if partname in self.parts:
+                etree.SubElement(root, "{%s}Override" % CT_NS,
+                                 PartName="/" + partname,
+                                 ContentType=self.overrides[partname])
+        return serialize_xml(root)
+
+    def save(self, pkg_file, compression=zipfile.ZIP_DEFLATED, cache=None,
+             level=zlib.Z_DEFAULT_COMPRESSION, deterministic=False, threads=1):
+        """Write the package to a path or file-like object.
+
+        `cache` maps blobs to precompressed members (see compress_member()),
+        for saving many copies of one template without recompressing the
+        parts they share. `level` is the zlib compression level.
+
+        With `deterministic`, the same parts always give the same bytes:
+        members are written in name order with FIXED_DATE_TIME, and embedded
+        packages (chart workbooks) get the same treatment plus fixed
+        creation dates. With `threads` > 1 members are compressed in a thread
+        pool (see write_zip()); the bytes written are the same.
+        """
+        members = [(CONTENT_TYPES, self.content_types_xml())]
+        raw = getattr(self.parts, "raw", lambda name: None)
+        if not deterministic:
+            members += [(name, raw(name) or self.parts[name]) for name in self.parts]
+            return write_zip(pkg_file, members, compression, cache, level, threads=threads)
+        members += sorted(
+            (name, _deterministic_blob(name, self.parts[name])
+             if name.startswith("ppt/embeddings/") else raw(name) or self.parts[name])
+            for name in self.parts)
+        write_zip(pkg_file, members, compression, cache, level, FIXED_DATE_TIME, threads)
+
+
+def _deterministic_blob(name, blob):
+    """`blob`, or the deterministic re-save of an embedded OPC package."""
+    if not name.startswith("ppt/embeddings/") or blob[:4] != b"PK\x03\x04":
+        return blob
+    try:
+        pkg = Package.open(io.BytesIO(blob))
+    except (KeyError, zipfile.BadZipFile):
+        return blob  # not an OPC package: keep as-is
+    core = pkg.related("", RT_CORE_PROPERTIES)
+    if core in pkg.parts:
+        root = parse_xml(pkg.parts[core])
+        for tag in ("created", "modified"):
+            for el in root.iter("{%s}%s" % (DCTERMS_NS, tag)):
+                el.text = "%04d-%02d-%02dT%02d:%02d:%02dZ" % FIXED_DATE_TIME
+        pkg.parts[core] = serialize_xml(root)
+    out = io.BytesIO()
+    pkg.save(out, deterministic=True)
+    return out.getvalue()
+
+
+def presentation_members(prs):
+    """(member name, blob) pairs of a python-pptx Presentation, in the order
+    prs.save() writes them."""
+    package = prs.part.package
+    parts = list(package.iter_parts())
+    members = [(CONTENT_TYPES, serialize_part_xml(_ContentTypesItem.xml_for(parts))),
+               (PACKAGE_RELS, package._rels.xml)]
+    for part in parts:
+        members.append((part.partname.membername, part.blob))
+        if part._rels:
+            members.append((part.partname.rels_uri.membername, part.rels.xml))
+    return members
+
+
+def save_deterministic(prs, target, threads=1):
+    """Save a python-pptx Presentation (to a path or file-like object) so the
+    same slides always give the same bytes; see Package.save()."""
+    Package.from_presentation(prs).save(target, deterministic=True, threads=threads)
+
+
+def save_parallel(prs, target, threads=None):
+    """Save a python-pptx Presentation like prs.save(), compressing its parts
+    in `threads` threads (default: one per CPU); see write_zip()."""
+    write_zip(target, presentation_members(prs), threads=threads or os.cpu_count() or 1)
+
+
+# A member copied as stored in its source zip (see LazyParts.raw())
+RawMember = namedtuple("RawMember", "crc payload size compression")
+
+
+class LazyParts(MutableMapping):
+    """Member blobs of a zip, decompressed on first access.
+
+    The archive is read into memory once; only its directory is decoded.
+    Members never assigned keep their compressed bytes, which raw() returns
+    so save() copies them without inflating or deflating anything.
+    """
+
+    def __init__(self, pkg_file):
+        if hasattr(pkg_file, "read"):
+            self._data = pkg_file.read()
+        else:
+            with open(pkg_file, "rb") as f:
+                self._data = f.read()
+        with zipfile.ZipFile(io.BytesIO(self._data)) as zf:
+            self._infos = {info.filename: info for info in zf.infolist()}
+        self._names = dict.fromkeys(self._infos)  # member order
+        self._blobs = {}
+        self._dirty = set()
+
+    @property
+    def loaded(self):
+        """Names of the members decompressed or assigned so far."""
+        return set(self._blobs)
+
+    def raw(self, name):
+        """The member as stored in the source zip, or None once assigned."""
+        info = self._infos.get(name)
+        if info is None or name in self._dirty:
+            return None
+        offset = info.header_offset
+        name_len, extra_len = struct.unpack_from("<2H", self._data, offset + 26)
+        start = offset + _LOCAL_HEADER.size + name_len + extra_len
+        return RawMember(info.CRC, self._data[start:start + info.compress_size],
+                         info.file_size, info.compress_type)
+
+    def __getitem__(self, name):
+        blob = self._blobs.get(name)
+        if blob is None:
+            member = self.raw(name)
+            if member is None:  # deleted
+                raise KeyError(name)
+            crc, payload, _, compression = member
+            if compression == zipfile.ZIP_DEFLATED:
+                blob = zlib.decompress(payload, -zlib.MAX_WBITS)
+            elif compression == zipfile.ZIP_STORED:
+                blob = payload
+            else:
+                with zipfile.ZipFile(io.BytesIO(self._data)) as zf:
+                    blob = zf.read(self._infos[name])
+            if zlib.crc32(blob) != crc:
+                raise zipfile.BadZipFile(f"Bad CRC-32 for file {name!r}")
+            self._blobs[name] = blob
+        return blob
+
+    def __setitem__(self, name, blob):
+        self._blobs[name] = blob
+        self._dirty.add(name)
+        self._names.setdefault(name)
+
+    def __delitem__(self, name):
+        if name not in self._names:
+            raise KeyError(name)
+        del self._names[name]
+        self._blobs.pop(name, None)
+        self._dirty.add(name)
+
+    def __contains__(self, name):
+        return name in self._names
+
+    def __iter__(self):
+        return iter(list(self._names))
+
+    def __len__(self):
+        return len(self._names)
+
+    def copy(self):
+        """A copy sharing the source archive and the blobs loaded so far."""
+        other = LazyParts.__new__(LazyParts)
+        other._data, other._infos = self._data, self._infos
+        other._names, other._blobs, other._dirty = dict(self._names), dict(self._blobs), set(self._dirty)
+        return other
+
+
+# === Slide layouts ===
+
+_P = "{%s}" % P_NS
+_A = "{%s}" % A_NS
+
+
+def _placeholder_key(sp):
+    ph = sp.find(f"{_P}nvSpPr/{_P}nvPr/{_P}ph")
+    return None if ph is None else (ph.get("idx") or ph.get("type", "body"))
+
+
+def _inherit_placeholder(sp, base):
+    """Copy of placeholder `sp` completed with what it inherits from `base`:
+    position, body properties and the level-1 paragraph defaults."""
+    sp = deepcopy(sp)
+    sp_pr = sp.find(f"{_P}spPr")
+    base_xfrm = base.find(f"{_P}spPr/{_A}xfrm")
+    if sp_pr is not None and sp_pr.find(f"{_A}xfrm") is None and base_xfrm is not None:
+        sp_pr.insert(0, deepcopy(base_xfrm))
+    body, base_body = sp.find(f"{_P}txBody"), base.find(f"{_P}txBody")
+    if body is None or base_body is None:
+        return sp
+    body_pr, base_body_pr = body.find(f"{_A}bodyPr"), base_body.find(f"{_A}bodyPr")
+    if body_pr is not None and base_body_pr is not None:
+        for key, value in base_body_pr.items():
+            if body_pr.get(key) is None:
+                body_pr.set(key, value)
+    level = base_body.find(f"{_A}lstStyle/{_A}lvl1pPr")
+    if level is None:
+        return sp
+    for p in body.iterfind(f"{_A}p"):
+        p_pr = p.find(f"{_A}pPr")
+        if p_pr is None:
+            p_pr = p.makeelement(f"{_A}pPr", {})
+            p.insert(0, p_pr)
+        for key, value in level.items():
+            if p_pr.get(key) is None:
+                p_pr.set(key, value)
+        def_rpr = level.find(f"{_A}defRPr")
+        if p_pr.find(f"{_A}defRPr") is None and def_rpr is not None:
+            p_pr.append(deepcopy(def_rpr))
+    return sp
+
+
+def displayed_shapes(sld, layout=None):
+    """Return (background ``<p:bgPr>`` or None, shape elements) of slide `sld`
+    as it is displayed on its `layout`.
+
+    The layout's own shapes come first (its placeholders are prompts and are
+    not shown); the slide's placeholders are returned as copies completed
+    with the position and text defaults of the matching layout placeholder.
+    Master-level inheritance is not followed: the engine's master only holds
+    placeholders.
+    """
+    background = sld.find(f"{_P}cSld/{_P}bg/{_P}bgPr")
+    tree = sld.find(f"{_P}cSld/{_P}spTree")
+    shapes = [el for el in tree if el.tag not in (f"{_P}nvGrpSpPr", f"{_P}grpSpPr")]
+    if layout is None:
+        return background, shapes
+    if background is None:
+        background = layout.find(f"{_P}cSld/{_P}bg/{_P}bgPr")
+    inherited, bases = [], {}
+    for el in layout.find(f"{_P}cSld/{_P}spTree"):
+        if el.tag in (f"{_P}nvGrpSpPr", f"{_P}grpSpPr"):
+            continue
+        key = _placeholder_key(el) if el.tag == f"{_P}sp" else None
+        if key is None:
+            inherited.append(el)
+        else:
+            bases[key] = el
+    for el in shapes:
+        key = _placeholder_key(el) if el.tag == f"{_P}sp" else None
+        inherited.append(_inherit_placeholder(el, bases[key]) if key in bases else el)
+    return background, inherited
+
+
+# === Zip writing ===
+
+_LOCAL_HEADER = struct.Struct("<4s5H3L2H")
+_CENTRAL_HEADER = struct.Struct("<4s6H3L5H2L")
+_END_RECORD = struct.Struct("<4s4H2LH")
+_EXTERNAL_ATTR = 0o600 << 16  # rw------- regular file, as zipfile.writestr()
+
+# Timestamp of every member of a deterministic save (the earliest a zip holds)
+FIXED_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+
+# Smaller blobs are deflated inline: a thread pool round trip costs more
+POOL_MIN_SIZE = 4096
+
+
+def compress_member(blob, compression=zipfile.ZIP_DEFLATED, level=zlib.Z_DEFAULT_COMPRESSION):
+    """Return (crc32, payload) of `blob` as stored in a zip member."""
+    if compression == zipfile.ZIP_STORED:
+        return zlib.crc32(blob), blob
+    deflate = zlib.compressobj(level, zlib.DEFLATED, -15)
+    return zlib.crc32(blob), deflate.compress(blob) + deflate.flush()
+
+
+def _compress_in_pool(members, compression, level, cache, threads):
+    """`members` with the blobs worth a thread compressed into RawMembers."""
+    members = list(members)
+    jobs = [i for i, (_, blob) in enumerate(members)
+            if not isinstance(blob, RawMember) and len(blob) >= POOL_MIN_SIZE
+            and (cache is None or blob not in cache)]
+    if len(jobs) < 2:
+        return members
+    with ThreadPoolExecutor(threads) as pool:
+        results = pool.map(lambda i: compress_member(members[i][1], compression, level), jobs)
+        for i, (crc, payload) in zip(jobs, results):
+            name, blob = members[i]
+            members[i] = (name, RawMember(crc, payload, len(blob), compression))
+    return members
+
+
+def write_zip(zip_file, members, compression=zipfile.ZIP_DEFLATED, cache=None,
+              level=zlib.Z_DEFAULT_COMPRESSION, date_time=None, threads=1):
+    """Write `(name, blob)` members as a zip archive to a path or file-like object.
+
+    Equivalent to ZipFile.writestr() for each member, except that blobs found
+    in `cache` ({blob: (crc, payload)}) are copied without recompressing, and
+    RawMember members are written exactly as given.
+    Members are dated `date_time` (a time.localtime()-like tuple), now by default.
+
+    With `threads` > 1, blobs of POOL_MIN_SIZE bytes or more are deflated
+    in a thread pool first (zlib releases the GIL); members are still written
+    in the order given, so the output does not depend on `threads`.
+    """
+    if not hasattr(zip_file, "write"):
+        with open(zip_file, "wb") as f:
+            return write_zip(f, members, compression, cache, level, date_time, threads)
+    if threads > 1 and compression != zipfile.ZIP_STORED:
+        members = _compress_in_pool(members, compression, level, cache, threads)
+    year, month, day, hour, minute, second = (date_time or time.localtime())[:6]
+    dos_time = hour << 11 | minute << 5 | second // 2
+    dos_date = (year - 1980) << 9 | month << 5 | day
+    offset, central = 0, []
+    for name, blob in members:
+        if isinstance(blob, RawMember):
+            crc, payload, size, method = blob
+        else:
+            entry = cache.get(blob) if cache is not None else None
+            crc, payload = entry or compress_member(blob, compression, level)
+            size, method = len(blob), compression
+        raw_name = name.encode("utf-8")
+        flags = 0 if raw_name.isascii() else 0x800
+        fields = (20, flags, method, dos_time, dos_date, crc, len(payload), size)
+        zip_file.write(_LOCAL_HEADER.pack(b"PK\x03\x04", *fields, len(raw_name), 0))
+        zip_file.write(raw_name)
+        zip_file.write(payload)
+        central.append(_CENTRAL_HEADER.pack(
+            b"PK\x01\x02", 20, *fields, len(raw_name), 0, 0, 0, 0, _EXTERNAL_ATTR, offset
+        ) + raw_name)
+        offset += _LOCAL_HEADER.size + len(raw_name) + len(payload)
+    directory = b"".join(central)
+    zip_file.write(directory)
+    zip_file.write(_END_RECORD.pack(
+        b"PK\x05\x06", 0, 0, len(central), len(central), len(directory), offset, 0))
@@ -0,0 +1,118 @@
+"""Targeted updates of existing decks: touch one figure, copy everything else.
+
+open_for_patch() indexes the zip without decompressing it. Only the parts an
+edit reads are parsed, and on save every other member is copied from the
+source archive as stored (see package.LazyParts), so updating one figure
+costs the same on a 10-slide deck as on a 1000-slide one:
+
+    pkg = open_for_patch("bilan-social.pptx")
+    set_key_stat(pkg, 4, "11,8 %")
+    replace_text(pkg, 7, "2023", "2024")
+    set_chart_data(pkg, 12, ["2022", "2023", "2024"], [41, 38, 35])
+    pkg.save("bilan-social.pptx")
+"""
+
+from pptx.chart.chart import Chart
+from pptx.chart.data import CategoryChartData
+from pptx.chart.xmlwriter import SeriesXmlRewriterFactory
+from pptx.oxml import parse_xml as parse_pptx_xml
+from pptx.oxml.ns import nsdecls
+
+from .builder import _text
+from .merge import slide_partnames
+from .package import A_NS, P_NS, R_NS, Package, parse_xml, serialize_xml
+from .surgery import _check_index
+
+RT_CHART = R_NS + "/chart"
+RT_PACKAGE = R_NS + "/package"
+C_NS = "http://schemas.openxmlformats.org/drawingml/2006/chart"
+
+
+def open_for_patch(source):
+    """Open a .pptx path or file-like object for targeted edits (a lazy Package)."""
+    return Package.open(source, lazy=True)
+
+
+def _slide(pkg, index):
+    slides = slide_partnames(pkg)
+    return slides[_check_index(index, len(slides))]
+
+
+def replace_text(pkg, index, old, new):
+    """Replace `old` with `new` in the text runs of the slide at `index`.
+
+    Matches are looked for run by run, as text split across differently
+    formatted runs is not contiguous. Returns the number of runs changed;
+    the slide part is only rewritten when that is not zero.
+    """
+    name = _slide(pkg, index)
+    root = parse_xml(pkg.parts[name])
+    changed = 0
+    for t in root.iter("{%s}t" % A_NS):
+        if t.text and old in t.text:
+            t.text = t.text.replace(old, new)
+            changed += 1
+    if changed:
+        pkg.parts[name] = serialize_xml(root)
+    return changed
+
+
+def _set_paragraph_text(p, text):
+    for el in p.findall("{%s}r" % A_NS) + p.findall("{%s}br" % A_NS):
+        p.remove(el)
+    end = p.find("{%s}endParaRPr" % A_NS)
+    for el in parse_xml(f"<a:p {nsdecls('a')}>{_text(text)}</a:p>".encode("utf-8")):
+        if end is not None:
+            end.addprevious(el)
+        else:
+            p.append(el)
+
+
+def set_key_stat(pkg, index, stat=None, description=None):
+    """Set the figure and/or the description of a key_stat slide (see
+    add_key_stat_slide()); None leaves a text as it is."""
+    name = _slide(pkg, index)
+    root = parse_xml(pkg.parts[name])
+    boxes = [sp for sp in root.iter("{%s}sp" % P_NS)
+             if sp.find("{%s}nvSpPr/{%s}cNvSpPr[@txBox='1']" % (P_NS, P_NS)) is not None]
+    if len(boxes) != 2:
+        raise ValueError(f"slide {index} is not a key_stat slide")
+    for sp, text in zip(boxes, (stat, description)):
+        if text is not None:
+            _set_paragraph_text(sp.find("{%s}txBody/{%s}p" % (P_NS, A_NS)), text)
+    pkg.parts[name] = serialize_xml(root)
+
+
+def _chart_partname(pkg, slide, chart):
+    targets = {r.rId: r.target for r in pkg.rels(slide) if r.reltype == RT_CHART}
+    charts = [targets[el.get("{%s}id" % R_NS)]
+              for el in parse_xml(pkg.parts[slide]).iter("{%s}chart" % C_NS)]
+    if not -len(charts) <= chart < len(charts):
+        raise IndexError(f"chart index {chart} out of range for {len(charts)} chart(s)")
+    return charts[chart]
+
+
+def set_chart_data(pkg, index, categories, values, chart=0):
+    """Replace the categories and values of a single-series chart on the slide
+    at `index` (`chart` counts the charts of the slide in document order).
+
+    The series XML is rewritten the way python-pptx's `replace_data()` does,
+    keeping the series name and formatting, and the embedded workbook is
+    replaced by one holding the new data.
+    """
+    name = _chart_partname(pkg, _slide(pkg, index), chart)
+    chart_space = parse_pptx_xml(pkg.parts[name])
+    plot_chart = Chart(chart_space, None)
+    series = list(plot_chart.series)
+    if len(series) != 1:
+        raise ValueError(f"set_chart_data() expects a single-series chart, "
+                         f"{name} has {len(series)}")
+    chart_data = CategoryChartData()
+    chart_data.categories = categories
+    chart_data.add_series(series[0].name, values)
+    rewriter = SeriesXmlRewriterFactory(plot_chart.chart_type, chart_data)
+    rewriter.replace_series_data(chart_space)
+    pkg.parts[name] = serialize_xml(chart_space)
+    workbook = pkg.related(name, RT_PACKAGE)
+    if workbook is not None:
+        pkg.parts[workbook] = chart_data.xlsx_blob
@@ -0,0 +1,124 @@
+"""Render the JSON plans produced by the skill (see skill/SKILL.md)."""
+
+import io
+
+from pptx.presentation import Presentation
+
+from .engine import create_presentation, save_presentation
+from .layouts import LAYOUTS
+from .notes import write_notes
+from .package import save_deterministic, save_parallel
+from .validate import check_plan
+
+# Ways of writing a deck: python-pptx objects, or XML strings (see ooxml.py)
+BACKENDS = ("pptx", "ooxml")
+
+# Positional arguments (after `prs`) of each layout function, read from a slide spec
+SLIDE_ARGS = {
+    "title": lambda s: (s["title"], s.get("subtitle", ""), s.get("notes", "")),
+    "agenda": lambda s: (s["items"], s.get("title", "Agenda"), s.get("notes", "")),
+    "section": lambda s: (s["title"], s.get("subtitle", ""), s.get("notes", "")),
+    "bullets": lambda s: (s["title"], s["bullets"], s.get("notes", "")),
+    "two_columns": lambda s: (
+        s["title"], s["left_title"], s["left_items"],
+        s["right_title"], s["right_items"], s.get("notes", ""),
+    ),
+    "key_stat": lambda s: (s["stat"], s["description"], s.get("notes", "")),
+    "quote": lambda s: (s["quote"], s.get("author", ""), s.get("notes", "")),
+    "conclusion": lambda s: (s["title"], s["points"], s.get("notes", "")),
+    # Visual layouts
+    "process_flow": lambda s: (s["title"], s["steps"], s.get("notes", "")),
+    "timeline": lambda s: (s["title"], [tuple(m) for m in s["milestones"]], s.get("notes", "")),
+    "matrix": lambda s: (
+        s["title"], s["top_left"], s["top_right"], s["bottom_left"], s["bottom_right"],
+        s.get("x_label", ""), s.get("y_label", ""), s.get("notes", ""),
+    ),
+    "pyramid": lambda s: (s["title"], s["levels"], s.get("notes", "")),
+    "bar_chart": lambda s: (s["title"], s["categories"], s["values"], s.get("notes", "")),
+    "pie_chart": lambda s: (s["title"], s["categories"], s["values"], s.get("notes", "")),
+    "icon_cards": lambda s: (s["title"], s["cards"], s.get("notes", "")),
+    "org_chart": lambda s: (s["title"], s["manager"], s["reports"], s.get("notes", "")),
+    "funnel": lambda s: (s["title"], s["stages"], s.get("notes", "")),
+    "team_grid": lambda s: (s["title"], s["members"], s.get("notes", "")),
+}
+
+
+def render_slide(prs, spec, layouts=LAYOUTS):
+    """Add the slide described by one plan entry (`{"layout": ..., ...}`)."""
+    layout = spec["layout"]
+    if layout not in layouts:
+        raise ValueError(f"Unknown layout: {layout!r}")
+    return layouts[layout](prs, *SLIDE_ARGS[layout](spec))
+
+
+def render_plan(plan, prs=None, layouts=LAYOUTS, validate=True, theme=None):
+    """Add every slide of `plan` to `prs` (a new presentation by default).
+
+    The whole plan is validated first (see validate.py), so a bad plan raises
+    PlanValidationError with every problem before any slide is built. With a
+    `theme` (see theme.py) its layouts are used instead of `layouts`.
+    Speaker notes of a python-pptx presentation are written once all slides
+    exist, in one pass (see notes.py); they are markdown-ish when the plan
+    sets ``"notes_markdown": true``.
+    """
+    if validate:
+        check_plan(plan)
+    if theme is not None:
+        layouts = theme.layouts
+    if prs is None:
+        prs = theme.create_presentation() if theme is not None else create_presentation()
+    notes = []
+    bulk_notes = isinstance(prs, Presentation)
+    for spec in plan["slides"]:
+        if bulk_notes and spec.get("notes"):
+            notes.append((render_slide(prs, dict(spec, notes=""), layouts), spec["notes"]))
+        else:
+            render_slide(prs, spec, layouts)
+    write_notes(prs, notes, plan.get("notes_markdown", False))
+    return prs
+
+
+def _render_ooxml(plan, validate, theme, backend):
+    """The OoxmlDeck of `plan` for backend "ooxml", None for "pptx"."""
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend: {backend!r}")
+    if backend == "pptx":
+        return None
+    from .ooxml import render_plan_ooxml  # ooxml.py builds on this module
+
+    return render_plan_ooxml(plan, validate, theme)
+
+
+def render_plan_bytes(plan, validate=True, theme=None, deterministic=False, threads=1,
+                      backend="pptx"):
+    """Render `plan` and return the .pptx file contents.
+
+    With `deterministic`, identical plans give identical bytes (usable as a
+    cache key or ETag). `threads` > 1 compresses the parts in a thread pool.
+    `backend` "ooxml" writes the slide XML directly (see ooxml.py).
+    """
+    buf = io.BytesIO()
+    deck = _render_ooxml(plan, validate, theme, backend)
+    if deck is not None:
+        deck.save(buf, deterministic, threads)
+        return buf.getvalue()
+    prs = render_plan(plan, validate=validate, theme=theme)
+    if deterministic:
+        save_deterministic(prs, buf, threads)
+    elif threads > 1:
+        save_parallel(prs, buf, threads)
+    else:
+        prs.save(buf)
+    return buf.getvalue()
+
+
+def render_plan_file(plan, filename, validate=True, theme=None, deterministic=False,
+                     threads=1, backend="pptx"):
+    """Render `plan` to `filename` (.pptx appended if missing); returns the path."""
+    deck = _render_ooxml(plan, validate, theme, backend)
+    if deck is not None:
+        if not filename.endswith(".pptx"):
+            filename += ".pptx"
+        return deck.save(filename, deterministic, threads)
+    prs = render_plan(plan, validate=validate, theme=theme)
+    return save_presentation(prs, filename, deterministic, threads)
@@ -0,0 +1,148 @@
+"""Pre-fork render workers: warm the parent once, fork workers from it.
+
+A fresh worker process pays for importing python-pptx and lxml, for the
+first parse of the deck templates, and for the lazy imports of the chart
+code (XML writers, xlsxwriter for the embedded workbook) before its first
+deck. PreforkPool pays for all of it once, in the parent: warm_up() renders
+a deck of every layout with both backends, then the workers are forked from
+it and share that state copy-on-write. Each worker moves the inherited
+objects out of its garbage collector's reach as it starts (gc.freeze()), so
+its collections do not touch, and copy, every inherited page; the parent's
+collector is left alone. Each worker is replaced, again by a fork of the
+warmed parent, after `max_decks` decks, which bounds its memory growth.
+
+    with PreforkPool(jobs=4, max_decks=200) as pool:
+        futures = [pool.submit(render_plan_bytes, plan) for plan in plans]
+        decks = [f.result() for f in futures]
+    print(pool.spawn_times)  # seconds from fork to ready, one per worker
+
+The pool has the submit()/shutdown() interface of concurrent.futures
+executors, so stream() (``--prefork``) and AsyncRenderer
+(``executor="prefork"``) use it in place of a ProcessPoolExecutor. It needs
+os.fork(): Linux and macOS only.
+"""
+
+import gc
+import multiprocessing
+import random
+import threading
+import time
+from concurrent.futures import Future
+
+from .layouts import LAYOUTS
+from .plan import BACKENDS, render_plan_bytes
+from .samples import SLIDE_FACTORIES
+from .validate import validate_plan
+
+_SPAWN_TIME = None  # in a worker: seconds from fork to ready, until its first deck reports it
+
+
+def warmup_plan():
+    """A small plan with one slide of every layout, notes and charts included."""
+    rng = random.Random(0)
+    slides = []
+    for layout in sorted(LAYOUTS):
+        spec = dict(SLIDE_FACTORIES[layout](rng), layout=layout, notes="- **Warm**-up")
+        if "categories" in spec:
+            spec["values"] = list(range(1, len(spec["categories"]) + 1))
+        slides.append(spec)
+    return {"title": "Warm-up", "slides": slides}
+
+
+def warm_up(themes=()):
+    """Load everything a render needs into this process: render the warm-up
+    plan with every backend, for the default design and each of `themes`.
+    Returns the seconds taken."""
+    start = time.perf_counter()
+    plan = warmup_plan()
+    validate_plan(plan)
+    for theme in (None, *themes):
+        for backend in BACKENDS:
+            render_plan_bytes(plan, validate=False, theme=theme, backend=backend)
+    gc.collect()  # so that workers do not inherit the warm-up's garbage
+    return time.perf_counter() - start
+
+
+if "fork" in multiprocessing.get_all_start_methods():
+    class _Worker(multiprocessing.context.ForkProcess):
+        def start(self):
+            self.forked_at = time.monotonic()  # copied into the child by the fork
+            super().start()
+
+    class _ForkContext(multiprocessing.context.ForkContext):
+        Process = _Worker
+
+    _CONTEXT = _ForkContext()
+else:
+    _CONTEXT = None
+
+
+def _ready():
+    """Worker initializer, right after the fork."""
+    global _SPAWN_TIME
+    gc.freeze()  # inherited objects: never scanned, so their pages stay shared
+    _SPAWN_TIME = time.monotonic() - multiprocessing.current_process().forked_at
+
+
+def _call(fn, args, kwargs):
+    """Run one task in a worker; its first task also reports the spawn time."""
+    global _SPAWN_TIME
+    spawn_time, _SPAWN_TIME = _SPAWN_TIME, None
+    return spawn_time, fn(*args, **kwargs)
+
+
+class PreforkPool:
+    """A pool of `jobs` worker processes forked from this (warmed) process.
+
+    `max_decks` is the number of tasks after which a worker exits and is
+    replaced (None: never). With `warm`, warm_up() runs first, for `themes`
+    too. `spawn_times` collects each worker's fork-to-ready time in seconds,
+    reported with its first task; `tasks` counts the finished ones.
+    """
+
+    def __init__(self, jobs=None, max_decks=200, warm=True, themes=()):
+        if _CONTEXT is None:
+            raise ValueError("pre-fork workers need os.fork(), unavailable on this platform")
+        if max_decks is not None and max_decks < 1:
+            raise ValueError(f"max_decks must be at least 1, got {max_decks!r}")
+        self.warm_time = warm_up(themes) if warm else 0.0
+        self.spawn_times = []
+        self.tasks = 0
+        self._lock = threading.Lock()
+        self._pool = _CONTEXT.Pool(jobs, _ready, maxtasksperchild=max_decks)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
+
+    def _done(self, future, outcome):
+        spawn_time, result = outcome
+        with self._lock:
+            self.tasks += 1
+            if spawn_time is not None:
+                self.spawn_times.append(spawn_time)
+        future.set_result(result)
+
+    def submit(self, fn, *args, **kwargs):
+        """Run fn(*args, **kwargs) in a worker; returns a concurrent.futures.Future.
+
+        `fn` must be importable by name (a module-level function), as with a
+        ProcessPoolExecutor. The future is running from the start: once
+        submitted, a task cannot be cancelled.
+        """
+        future = Future()
+        future.set_running_or_notify_cancel()
+        self._pool.apply_async(_call, (fn, args, kwargs),
+                               callback=lambda outcome: self._done(future, outcome),
+                               error_callback=future.set_exception)
+        return future
+
+    def shutdown(self, wait=True):
+        """Stop the workers once the submitted tasks are done (`wait`), or now."""
+        if wait:
+            self._pool.close()
+            self._pool.join()
+        else:
+            self._pool.terminate()
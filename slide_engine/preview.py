@@ -0,0 +1,373 @@
+"""HTML/SVG preview backend — renders plans without building a .pptx.
+
+The preview reuses the layout functions of layouts.py through bind_layouts():
+the helpers below have the same signatures as those of engine.py but append
+SVG markup to a slide instead of python-pptx shapes. Geometry stays in EMU
+until it is written out in CSS pixels (96 dpi), so what you see is what the
+deck will contain, minus PowerPoint's own text layout.
+"""
+
+import math
+from html import escape
+
+from pptx.util import Inches, Pt
+from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
+
+from . import design as D
+from .layouts import bind_layouts
+from .plan import render_plan
+
+EMU_PER_PX = 9525
+
+# Default text frame insets used by PowerPoint (0.1" left/right, 0.05" top/bottom)
+INSET_X = 91440
+INSET_Y = 45720
+
+_ALIGN_CSS = {
+    PP_ALIGN.LEFT: "left",
+    PP_ALIGN.CENTER: "center",
+    PP_ALIGN.RIGHT: "right",
+    PP_ALIGN.JUSTIFY: "justify",
+}
+_ANCHOR_CSS = {
+    MSO_ANCHOR.TOP: "flex-start",
+    MSO_ANCHOR.MIDDLE: "center",
+    MSO_ANCHOR.BOTTOM: "flex-end",
+}
+
+PAGE_CSS = (
+    "body{margin:0;padding:24px;background:#E5E7EB;font-family:Calibri,Carlito,sans-serif}"
+    "section{margin:0 auto 24px;max-width:1280px}"
+    "svg{display:block;width:100%;height:auto;box-shadow:0 1px 4px rgba(0,0,0,.25)}"
+    "aside{color:#4B5563;font-size:13px;padding:6px 2px;white-space:pre-wrap}"
+    ".t{display:flex;flex-direction:column;width:100%;height:100%;box-sizing:border-box;"
+    "overflow:hidden;word-wrap:break-word;line-height:1.2}"
+    ".t p{margin:0}"
+)
+
+
+def _px(emu):
+    """EMU -> CSS px, trimmed to two decimals."""
+    return f"{emu / EMU_PER_PX:.2f}".rstrip("0").rstrip(".")
+
+
+def _hex(color):
+    return f"#{color}"
+
+
+class PreviewSlide:
+    """SVG elements of one slide, in z-order."""
+
+    __slots__ = ("background", "elements", "notes")
+
+    def __init__(self):
+        self.background = D.WHITE
+        self.elements = []
+        self.notes = ""
+
+    def to_svg(self):
+        width, height = _px(D.SLIDE_WIDTH), _px(D.SLIDE_HEIGHT)
+        return (
+            f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {width} {height}">'
+            f'<rect width="{width}" height="{height}" fill="{_hex(self.background)}"/>'
+            + "".join(self.elements)
+            + "</svg>"
+        )
+
+
+class PreviewDeck:
+    """Stand-in for a Presentation: the `prs` handed to the bound layouts."""
+
+    def __init__(self):
+        self.slides = []
+
+    def to_html(self, title="Preview"):
+        body = []
+        for i, slide in enumerate(self.slides, 1):
+            notes = f"<aside>{escape(slide.notes)}</aside>" if slide.notes else ""
+            body.append(f'<section id="slide-{i}">{slide.to_svg()}{notes}</section>')
+        return (
+            f'<!DOCTYPE html><html><head><meta charset="utf-8"><title>{escape(title)}</title>'
+            f"<style>{PAGE_CSS}</style></head><body>{''.join(body)}</body></html>"
+        )
+
+
+# ===================================================================
+# HELPERS — same contract as engine.py
+# ===================================================================
+
+
+def _add_blank_slide(prs, theme=D):
+    slide = PreviewSlide()
+    prs.slides.append(slide)
+    return slide
+
+
+def _add_titled_slide(prs, title, theme=D):
+    # What the engine's title layout shows: title box and orange underline
+    slide = _add_blank_slide(prs)
+    _add_textbox(slide, theme.MARGIN_LEFT, theme.MARGIN_TOP, theme.CONTENT_WIDTH, Inches(0.8),
+                 title, font_size=theme.TITLE_SIZE, font_color=theme.NAVY, bold=True,
+                 theme=theme)
+    _add_line(slide, theme.MARGIN_LEFT, Inches(1.5), Inches(2), Pt(3), theme.ORANGE)
+    return slide
+
+
+def _set_slide_background(slide, color):
+    slide.background = color
+
+
+def _text_block(left, top, width, height, paragraphs, alignment, anchor,
+                inset_x=INSET_X, inset_y=INSET_Y):
+    """A foreignObject holding HTML paragraphs, so the browser does the wrapping."""
+    style = (
+        f"padding:{_px(inset_y)}px {_px(inset_x)}px;"
+        f"justify-content:{_ANCHOR_CSS.get(anchor, 'flex-start')};"
+        f"text-align:{_ALIGN_CSS.get(alignment, 'left')}"
+    )
+    return (
+        f'<foreignObject x="{_px(left)}" y="{_px(top)}" width="{_px(width)}" '
+        f'height="{_px(height)}"><div xmlns="http://www.w3.org/1999/xhtml" class="t" '
+        f'style="{style}">{"".join(paragraphs)}</div></foreignObject>'
+    )
+
+
+def _span(text, font_size, font_color, bold, font_name):
+    weight = "bold" if bold else "normal"
+    return (
+        f'<span style="font:{weight} {_px(font_size)}px {escape(font_name)};'
+        f'color:{_hex(font_color)}">{escape(text).replace(chr(10), "<br/>")}</span>'
+    )
+
+
+def _add_textbox(slide, left, top, width, height, text,
+                 font_size=None, font_color=None,
+                 bold=False, alignment=PP_ALIGN.LEFT,
+                 font_name=None, anchor=MSO_ANCHOR.TOP, theme=D):
+    paragraph = "<p>%s</p>" % _span(text, theme.BODY_SIZE if font_size is None else font_size,
+                                    theme.DARK_TEXT if font_color is None else font_color,
+                                    bold, font_name or theme.FONT_FAMILY)
+    slide.elements.append(
+        _text_block(left, top, width, height, [paragraph], alignment, anchor)
+    )
+
+
+def _add_multiline_textbox(slide, left, top, width, height, lines,
+                           font_size=None, font_color=None,
+                           bold=False, alignment=PP_ALIGN.LEFT,
+                           font_name=None, line_spacing=None,
+                           bullet_color=None, bullet_char=None, theme=D):
+    font_size = theme.BODY_SIZE if font_size is None else font_size
+    font_color = theme.DARK_TEXT if font_color is None else font_color
+    font_name = font_name or theme.FONT_FAMILY
+    margin = f' style="margin-bottom:{_px(line_spacing)}px"' if line_spacing else ""
+    paragraphs = []
+    for line in lines:
+        if bullet_char:
+            runs = (_span(f"{bullet_char} ", font_size, bullet_color or font_color, bold, font_name)
+                    + _span(line, font_size, font_color, False, font_name))
+        else:
+            runs = _span(line, font_size, font_color, bold, font_name)
+        paragraphs.append(f"<p{margin}>{runs}</p>")
+    slide.elements.append(
+        _text_block(left, top, width, height, paragraphs, alignment, MSO_ANCHOR.TOP)
+    )
+
+
+def _add_speaker_notes(slide, notes_text):
+    slide.notes = notes_text or ""
+
+
+def _rect(left, top, width, height, fill_color, rx=0, border_color=None):
+    stroke = f' stroke="{_hex(border_color)}" stroke-width="{_px(Pt(1))}"' if border_color else ""
+    radius = f' rx="{_px(rx)}"' if rx else ""
+    return (
+        f'<rect x="{_px(left)}" y="{_px(top)}" width="{_px(width)}" height="{_px(height)}"'
+        f'{radius} fill="{_hex(fill_color)}"{stroke}/>'
+    )
+
+
+def _polygon(points, fill_color):
+    coords = " ".join(f"{_px(x)},{_px(y)}" for x, y in points)
+    return f'<polygon points="{coords}" fill="{_hex(fill_color)}"/>'
+
+
+def _shape_text(slide, left, top, width, height, text, font_size, font_color, bold,
+                font_name, alignment=PP_ALIGN.CENTER):
+    if text:
+        paragraph = f"<p>{_span(text, font_size, font_color, bold, font_name)}</p>"
+        slide.elements.append(
+            _text_block(left, top, width, height, [paragraph], alignment, MSO_ANCHOR.MIDDLE)
+        )
+
+
+def _add_rectangle(slide, left, top, width, height, fill_color, theme=D):
+    slide.elements.append(_rect(left, top, width, height, fill_color))
+
+
+def _add_line(slide, left, top, width, height, color, line_width=Pt(2), theme=D):
+    slide.elements.append(_rect(left, top, width, height, color))
+
+
+def _add_rounded_rectangle(slide, left, top, width, height, fill_color,
+                           border_color=None, text="", font_size=None,
+                           font_color=None, bold=False, alignment=PP_ALIGN.CENTER, theme=D):
+    # PowerPoint's default corner radius is 16.667% of the shorter side
+    rx = int(min(width, height) * 0.16667)
+    slide.elements.append(_rect(left, top, width, height, fill_color, rx, border_color))
+    _shape_text(slide, left, top, width, height, text,
+                theme.BODY_SIZE if font_size is None else font_size,
+                theme.WHITE if font_color is None else font_color, bold,
+                theme.FONT_FAMILY, alignment)
+
+
+def _add_chevron(slide, left, top, width, height, fill_color, text="",
+                 font_size=None, font_color=None, theme=D):
+    depth = min(width, height) // 2
+    right, bottom, middle = left + width, top + height, top + height // 2
+    slide.elements.append(_polygon([
+        (left, top), (right - depth, top), (right, middle),
+        (right - depth, bottom), (left, bottom), (left + depth, middle),
+    ], fill_color))
+    _shape_text(slide, left + depth, top, width - 2 * depth, height, text,
+                theme.SMALL_SIZE if font_size is None else font_size,
+                theme.WHITE if font_color is None else font_color, True, theme.FONT_FAMILY)
+
+
+def _add_oval(slide, left, top, width, height, fill_color, text="",
+              font_size=None, font_color=None, bold=True, theme=D):
+    slide.elements.append(
+        f'<ellipse cx="{_px(left + width / 2)}" cy="{_px(top + height / 2)}" '
+        f'rx="{_px(width / 2)}" ry="{_px(height / 2)}" fill="{_hex(fill_color)}"/>'
+    )
+    _shape_text(slide, left, top, width, height, text,
+                theme.BODY_SIZE if font_size is None else font_size,
+                theme.WHITE if font_color is None else font_color, bold, theme.FONT_FAMILY)
+
+
+def _add_triangle(slide, left, top, width, height, fill_color, theme=D):
+    slide.elements.append(_polygon([
+        (left + width // 2, top), (left + width, top + height), (left, top + height),
+    ], fill_color))
+
+
+def _nice_ceiling(value):
+    """Round a positive axis maximum up to 1, 2 or 5 times a power of ten."""
+    if value <= 0:
+        return 1
+    magnitude = 10 ** math.floor(math.log10(value))
+    for step in (1, 2, 5, 10):
+        if value <= step * magnitude:
+            return step * magnitude
+    return 10 * magnitude
+
+
+def _add_chart_bar(slide, left, top, width, height, categories, values,
+                   chart_title="", theme=D):
+    values = [float(v) for v in values]
+    axis_max = _nice_ceiling(max(values, default=0))
+    axis_w, label_h = Pt(40), Pt(24)
+    plot_left, plot_top = left + axis_w, top + Pt(10)
+    plot_w, plot_h = width - axis_w - Pt(10), height - label_h - Pt(10)
+
+    parts = []
+    for i in range(6):
+        y = plot_top + plot_h - plot_h * i // 5
+        parts.append(_rect(plot_left, y, plot_w, Pt(0.75), theme.LIGHT_GRAY))
+        parts.append(
+            f'<text x="{_px(plot_left - Pt(6))}" y="{_px(y + Pt(4))}" text-anchor="end" '
+            f'font-size="{_px(Pt(11))}" fill="{_hex(theme.GRAY)}">{axis_max * i / 5:g}</text>'
+        )
+
+    n = max(len(values), 1)
+    slot = plot_w / n
+    bar_w = slot * 0.6  # default gap width of 150% of a bar
+    for i, (category, value) in enumerate(zip(categories, values)):
+        bar_h = plot_h * max(value, 0) / axis_max
+        x = plot_left + i * slot + (slot - bar_w) / 2
+        parts.append(_rect(int(x), int(plot_top + plot_h - bar_h), int(bar_w), int(bar_h),
+                           theme.ORANGE))
+        parts.append(
+            f'<text x="{_px(plot_left + i * slot + slot / 2)}" y="{_px(plot_top + plot_h + Pt(16))}" '
+            f'text-anchor="middle" font-size="{_px(Pt(12))}" fill="{_hex(theme.GRAY)}">'
+            f"{escape(str(category))}</text>"
+        )
+    slide.elements.append(f'<g font-family="{theme.FONT_FAMILY}">{"".join(parts)}</g>')
+
+
+def _add_chart_pie(slide, left, top, width, height, categories, values, theme=D):
+    values = [float(v) for v in values]
+    total = sum(values) or 1.0
+    legend_h = Pt(30)
+    radius = min(width, height - legend_h) * 0.4
+    cx, cy = left + width / 2, top + (height - legend_h) / 2
+    colors = theme.PROCESS_COLORS
+
+    parts = []
+    angle = -math.pi / 2  # first slice starts at 12 o'clock, like PowerPoint
+    for i, (category, value) in enumerate(zip(categories, values)):
+        sweep = 2 * math.pi * value / total
+        color = _hex(colors[i % len(colors)])
+        if sweep >= 2 * math.pi - 1e-9:
+            parts.append(f'<circle cx="{_px(cx)}" cy="{_px(cy)}" r="{_px(radius)}" fill="{color}"/>')
+        elif sweep > 0:
+            x1, y1 = cx + radius * math.cos(angle), cy + radius * math.sin(angle)
+            x2, y2 = cx + radius * math.cos(angle + sweep), cy + radius * math.sin(angle + sweep)
+            large = 1 if sweep > math.pi else 0
+            parts.append(
+                f'<path d="M{_px(cx)},{_px(cy)} L{_px(x1)},{_px(y1)} '
+                f'A{_px(radius)},{_px(radius)} 0 {large} 1 {_px(x2)},{_px(y2)} Z" fill="{color}"/>'
+            )
+        mid = angle + sweep / 2
+        lx, ly = cx + radius * 1.2 * math.cos(mid), cy + radius * 1.2 * math.sin(mid)
+        anchor = "start" if math.cos(mid) > 0.1 else "end" if math.cos(mid) < -0.1 else "middle"
+        parts.append(
+            f'<text x="{_px(lx)}" y="{_px(ly)}" text-anchor="{anchor}" font-size="{_px(Pt(11))}" '
+            f'fill="{_hex(theme.DARK_TEXT)}">{escape(str(category))} {value / total:.0%}</text>'
+        )
+        angle += sweep
+
+    n = max(len(values), 1)
+    for i, category in enumerate(categories):
+        x = left + width * (i + 0.5) / n
+        y = top + height - legend_h / 2
+        parts.append(
+            f'<rect x="{_px(x - Pt(30))}" y="{_px(y - Pt(4))}" width="{_px(Pt(8))}" '
+            f'height="{_px(Pt(8))}" fill="{_hex(colors[i % len(colors)])}"/>'
+            f'<text x="{_px(x - Pt(18))}" y="{_px(y + Pt(4))}" font-size="{_px(Pt(11))}" '
+            f'fill="{_hex(theme.DARK_TEXT)}">{escape(str(category))}</text>'
+        )
+    slide.elements.append(f'<g font-family="{theme.FONT_FAMILY}">{"".join(parts)}</g>')
+
+
+PREVIEW_LAYOUTS = bind_layouts({
+    "_add_blank_slide": _add_blank_slide,
+    "_add_titled_slide": _add_titled_slide,
+    "_set_slide_background": _set_slide_background,
+    "_add_textbox": _add_textbox,
+    "_add_multiline_textbox": _add_multiline_textbox,
+    "_add_speaker_notes": _add_speaker_notes,
+    "_add_rectangle": _add_rectangle,
+    "_add_line": _add_line,
+    "_add_rounded_rectangle": _add_rounded_rectangle,
+    "_add_chevron": _add_chevron,
+    "_add_oval": _add_oval,
+    "_add_triangle": _add_triangle,
+    "_add_chart_bar": _add_chart_bar,
+    "_add_chart_pie": _add_chart_pie,
+})
+
+
+def render_preview(plan):
+    """Render a JSON plan to a standalone HTML page, one inline SVG per slide."""
+    deck = render_plan(plan, PreviewDeck(), PREVIEW_LAYOUTS)
+    return deck.to_html(plan.get("title", "Preview"))
+
+
+def save_preview(plan, filename):
+    """Write render_preview(plan) to `filename`. Appends .html if missing."""
+    if not filename.endswith(".html"):
+        filename += ".html"
+    with open(filename, "w", encoding="utf-8") as f:
+        f.write(render_preview(plan))
+    return filename
@@ -0,0 +1,80 @@
+"""Sample slides and plans, generated from a seed.
+
+SLIDE_FACTORIES builds the fields of a slide of every layout from a
+random.Random, with varied text lengths and item counts; generate_plan()
+strings them into a whole plan. Snapshot regression tests, benchmarks and
+the prefork warm-up all render these.
+
+    plan = generate_plan(42, slides=10)
+"""
+
+import random
+
+from .layouts import LAYOUTS
+
+
+_WORDS = ("compétences", "mobilité", "formation", "GPEC", "talents", "QVT", "bilan",
+          "entretien", "recrutement", "parcours", "management", "dialogue", "social")
+
+
+def _text(rng, low=1, high=6):
+    return " ".join(rng.choice(_WORDS) for _ in range(rng.randint(low, high))).capitalize()
+
+
+def _items(rng, low=1, high=6):
+    return [_text(rng) for _ in range(rng.randint(low, high))]
+
+
+def _person(rng):
+    return {"name": f"{_text(rng, 1, 1)} {_text(rng, 1, 1)}", "title": _text(rng, 1, 3)}
+
+
+# Fields of a slide of each layout; the charts' values are left to the caller
+SLIDE_FACTORIES = {
+    "title": lambda r: {"title": _text(r, 3, 10), "subtitle": _text(r)},
+    "agenda": lambda r: {"items": _items(r, 2, 7)},
+    "section": lambda r: {"title": _text(r), "subtitle": _text(r)},
+    "bullets": lambda r: {"title": _text(r), "bullets": _items(r)},
+    "two_columns": lambda r: {"title": _text(r), "left_title": _text(r, 1, 3),
+                              "left_items": _items(r), "right_title": _text(r, 1, 3),
+                              "right_items": _items(r)},
+    "key_stat": lambda r: {"stat": f"{r.randint(1, 99)}%", "description": _text(r, 4, 12)},
+    "quote": lambda r: {"quote": _text(r, 8, 30), "author": _text(r, 1, 3)},
+    "conclusion": lambda r: {"title": _text(r), "points": _items(r)},
+    "process_flow": lambda r: {"title": _text(r), "steps": _items(r, 2, 6)},
+    "timeline": lambda r: {"title": _text(r), "milestones": [
+        [str(2000 + i), _text(r)] for i in range(r.randint(1, 7))]},
+    "matrix": lambda r: dict(
+        {"title": _text(r), "x_label": _text(r, 0, 2), "y_label": _text(r, 0, 2)},
+        **{q: {"title": _text(r, 1, 2), "items": _items(r, 0, 4)}
+           for q in ("top_left", "top_right", "bottom_left", "bottom_right")}),
+    "pyramid": lambda r: {"title": _text(r), "levels": _items(r, 2, 6)},
+    "bar_chart": lambda r: {"title": _text(r), "categories": _items(r, 2, 8)},
+    "pie_chart": lambda r: {"title": _text(r), "categories": _items(r, 2, 6)},
+    "icon_cards": lambda r: {"title": _text(r), "cards": [
+        {"value": f"{r.randint(1, 99)}%", "label": _text(r, 1, 3)}
+        for _ in range(r.randint(1, 8))]},
+    "org_chart": lambda r: {"title": _text(r), "manager": _person(r),
+                            "reports": [_person(r) for _ in range(r.randint(1, 6))]},
+    "funnel": lambda r: {"title": _text(r), "stages": [
+        {"label": _text(r, 1, 3), "value": str(r.randint(1, 999))}
+        for _ in range(r.randint(2, 6))]},
+    "team_grid": lambda r: {"title": _text(r), "members": [
+        {"name": f"{_text(r, 1, 1)} {_text(r, 1, 1)}", "role": _text(r, 1, 2),
+         "desc": _text(r, 0, 3)}
+        for _ in range(r.randint(1, 6))]},
+}
+
+
+def generate_plan(seed, slides=6):
+    """A reproducible pseudo-random plan exercising the layouts with varied sizes."""
+    rng = random.Random(seed)
+    specs = []
+    for _ in range(slides):
+        layout = rng.choice(sorted(LAYOUTS))
+        spec = {"layout": layout, "notes": _text(rng, 0, 12)}
+        spec.update(SLIDE_FACTORIES[layout](rng))
+        if layout in ("bar_chart", "pie_chart"):
+            spec["values"] = [rng.randint(1, 100) for _ in spec["categories"]]
+        specs.append(spec)
+    return {"title": f"Plan {seed}", "slides": specs}
@@ -0,0 +1,205 @@
+"""Geometry snapshots of rendered decks, for regression tests at scale.
+
+A snapshot reduces every slide to a sorted list of compact entries
+
+    [kind, x, y, cx, cy, fill, text_hash]
+
+read straight from the slide XML: `kind` is the preset geometry ("rect",
+"roundRect", ...), "textbox", "chart:bar"/"chart:pie" or "bg" for the slide
+background; the box is in EMU; `fill` is the solid fill (plus "|ln:" and the
+outline colour if any). `text_hash` covers the *effective* text formatting
+(run properties fall back to the paragraph's defRPr), so a refactor that
+moves formatting between elements without changing the output keeps the
+same snapshot.
+"""
+
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from lxml import etree
+
+from .package import P_NS, R_NS, displayed_shapes
+from .plan import render_plan
+from .samples import generate_plan
+
+A_NS = "http://schemas.openxmlformats.org/drawingml/2006/main"
+C_NS = "http://schemas.openxmlformats.org/drawingml/2006/chart"
+
+_A = "{%s}" % A_NS
+_P = "{%s}" % P_NS
+_C = "{%s}" % C_NS
+
+UPDATE_ENV = "SLIDE_ENGINE_UPDATE_SNAPSHOTS"
+
+
+def _fill(sp_pr):
+    if sp_pr is None:
+        return ""
+    clr = sp_pr.find(f"{_A}solidFill/{_A}srgbClr")
+    fill = clr.get("val") if clr is not None else "none"
+    line = sp_pr.find(f"{_A}ln/{_A}solidFill/{_A}srgbClr")
+    return f"{fill}|ln:{line.get('val')}" if line is not None else fill
+
+
+def _run_props(props, inherited):
+    if props is None:
+        return inherited
+    size, bold, color, font = inherited
+    clr = props.find(f"{_A}solidFill/{_A}srgbClr")
+    latin = props.find(f"{_A}latin")
+    return (
+        props.get("sz", size),
+        props.get("b", bold),
+        clr.get("val") if clr is not None else color,
+        latin.get("typeface") if latin is not None else font,
+    )
+
+
+def _text_hash(tx_body):
+    """Hash of the text and its effective formatting, or "" for empty bodies."""
+    if tx_body is None:
+        return ""
+    body_pr = tx_body.find(f"{_A}bodyPr")
+    parts = [body_pr.get("anchor", "") if body_pr is not None else ""]
+    has_text = False
+    for p in tx_body.iterfind(f"{_A}p"):
+        p_pr = p.find(f"{_A}pPr")
+        default = _run_props(p_pr.find(f"{_A}defRPr") if p_pr is not None else None,
+                             (None, None, None, None))
+        spc = p.find(f"{_A}pPr/{_A}spcAft/{_A}spcPts")
+        parts.append("¶%s|%s" % (p_pr.get("algn", "") if p_pr is not None else "",
+                                 spc.get("val") if spc is not None else ""))
+        for r in p.iterfind(f"{_A}r"):
+            text = r.findtext(f"{_A}t") or ""
+            has_text = has_text or bool(text)
+            parts.append(repr((text,) + _run_props(r.find(f"{_A}rPr"), default)))
+    if not has_text:
+        return ""
+    return hashlib.sha1("\x1f".join(parts).encode("utf-8")).hexdigest()[:16]
+
+
+def _box(xfrm):
+    if xfrm is None:
+        return [0, 0, 0, 0]
+    off, ext = xfrm.find(f"{_A}off"), xfrm.find(f"{_A}ext")
+    return [int(off.get("x")), int(off.get("y")), int(ext.get("cx")), int(ext.get("cy"))]
+
+
+def _chart_entry(frame, related):
+    ref = frame.find(f".//{_C}chart")
+    chart = related(ref.get(f"{{{R_NS}}}id"))
+    plot = chart.find(f".//{_C}plotArea")
+    kind = next((el.tag[len(_C):-len("Chart")] for el in plot if el.tag.endswith("Chart")), "")
+    data = etree.tostring(plot, method="c14n")
+    digest = hashlib.sha1(data).hexdigest()[:16]
+    return [f"chart:{kind}"] + _box(frame.find(f"{_P}xfrm")) + ["", digest]
+
+
+def snapshot_slide_xml(sld, related=None, layout=None):
+    """Snapshot one ``<p:sld>`` element; `related(rId)` returns chart elements.
+
+    With its ``<p:sldLayout>``, the layout's shapes and background are part of
+    the snapshot and placeholders take their position and text defaults from
+    it, so a title drawn by the layout snapshots like one drawn on the slide.
+    """
+    entries = []
+    bg, shapes = displayed_shapes(sld, layout)
+    if bg is not None:
+        entries.append(["bg", 0, 0, 0, 0, _fill(bg), ""])
+    for el in shapes:
+        if el.tag == f"{_P}sp":
+            sp_pr = el.find(f"{_P}spPr")
+            c_nv_sp_pr = el.find(f"{_P}nvSpPr/{_P}cNvSpPr")
+            if (c_nv_sp_pr is not None and c_nv_sp_pr.get("txBox") == "1"
+                    or el.find(f"{_P}nvSpPr/{_P}nvPr/{_P}ph") is not None):
+                kind = "textbox"
+            else:
+                geom = sp_pr.find(f"{_A}prstGeom")
+                kind = geom.get("prst") if geom is not None else "custom"
+            entries.append([kind] + _box(sp_pr.find(f"{_A}xfrm"))
+                           + [_fill(sp_pr), _text_hash(el.find(f"{_P}txBody"))])
+        elif el.tag == f"{_P}graphicFrame" and related is not None:
+            entries.append(_chart_entry(el, related))
+    entries.sort()
+    return entries
+
+
+def snapshot_presentation(prs):
+    """Snapshot every slide of an in-memory python-pptx Presentation."""
+    snapshot = []
+    for slide in prs.slides:
+        part = slide.part
+        snapshot.append(snapshot_slide_xml(
+            slide._element, lambda rId, part=part: part.related_part(rId)._element,
+            slide.slide_layout._element,
+        ))
+    return snapshot
+
+
+def snapshot_plan(plan):
+    """Render `plan` and return its snapshot."""
+    return snapshot_presentation(render_plan(plan))
+
+
+def snapshot_digest(snapshot):
+    """A short stable hash of a snapshot, for storing thousands of them."""
+    data = json.dumps(snapshot, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha1(data.encode("utf-8")).hexdigest()
+
+
+def diff_snapshots(expected, actual):
+    """Return human-readable differences between two snapshots ([] when equal)."""
+    diffs = []
+    if len(expected) != len(actual):
+        diffs.append(f"slide count: expected {len(expected)}, got {len(actual)}")
+    for i, (exp, act) in enumerate(zip(expected, actual), 1):
+        exp_set = {tuple(e) for e in exp}
+        act_set = {tuple(e) for e in act}
+        for entry in sorted(exp_set - act_set):
+            diffs.append(f"slide {i}: missing {list(entry)}")
+        for entry in sorted(act_set - exp_set):
+            diffs.append(f"slide {i}: unexpected {list(entry)}")
+    return diffs
+
+
+def assert_matches_golden(snapshot, path):
+    """Compare `snapshot` with the golden JSON file at `path`.
+
+    The golden file is (re)written instead when the SLIDE_ENGINE_UPDATE_SNAPSHOTS
+    environment variable is set; a missing one fails the comparison.
+    """
+    if os.environ.get(UPDATE_ENV):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(snapshot, f, ensure_ascii=False, indent=0)
+            f.write("\n")
+        return
+    if not os.path.exists(path):
+        raise AssertionError(f"no golden snapshot at {path}; "
+                             f"run with {UPDATE_ENV}=1 to create it")
+    with open(path, encoding="utf-8") as f:
+        golden = json.load(f)
+    diffs = diff_snapshots(golden, json.loads(json.dumps(snapshot)))
+    if diffs:
+        shown = "\n  ".join(diffs[:20])
+        raise AssertionError(f"{len(diffs)} snapshot difference(s) vs {path}:\n  {shown}")
+
+
+def _plan_digest(args):
+    seed, slides = args
+    return str(seed), snapshot_digest(snapshot_plan(generate_plan(seed, slides)))
+
+
+def plan_digests(seeds, slides=6, jobs=1):
+    """{seed: snapshot digest} for generate_plan(seed) — the bulk regression check.
+
+    With `jobs` > 1 the plans are rendered across a process pool, which is how
+    thousands of plans are checked in reasonable time.
+    """
+    tasks = [(seed, slides) for seed in seeds]
+    if jobs == 1:
+        return dict(map(_plan_digest, tasks))
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        return dict(pool.map(_plan_digest, tasks, chunksize=16))
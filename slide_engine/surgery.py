@@ -0,0 +1,128 @@
+"""Edit the slide list of existing decks without re-rendering any slide.
+
+All functions work on a zip-level Package (see package.py), opened with
+open_deck() from a path, a file-like object or a python-pptx Presentation:
+
+    pkg = open_deck("gpec.pptx")
+    duplicate_slide(pkg, 2)          # copy slide 3 (XML, notes, charts) after itself
+    move_slide(pkg, 10, 0)
+    delete_slides(pkg, [7, 8])       # with their notes and charts
+    pkg.save("gpec-v2.pptx")
+
+    export_slides("gpec.pptx", range(0, 6), "gpec-part1")
+"""
+
+from .merge import _DeckMerger, _open, slide_partnames, unlink
+from .package import P_NS, R_NS, RT_SLIDE, parse_xml, serialize_xml
+
+
+def open_deck(source):
+    """Open a path, file-like object or Presentation as an editable Package."""
+    return _open(source)
+
+
+def _slide_list(pkg):
+    name = pkg.main_document
+    pres = parse_xml(pkg.parts[name])
+    return name, pres, pres.find("{%s}sldIdLst" % P_NS)
+
+
+def _check_index(index, count):
+    if not -count <= index < count:
+        raise IndexError(f"slide index {index} out of range for {count} slide(s)")
+    return index % count
+
+
+def move_slide(pkg, old_index, new_index):
+    """Move the slide at `old_index` so that it ends up at `new_index`."""
+    name, pres, lst = _slide_list(pkg)
+    count = len(lst) if lst is not None else 0
+    entry = lst[_check_index(old_index, count)]
+    lst.remove(entry)
+    lst.insert(_check_index(new_index, count), entry)
+    pkg.parts[name] = serialize_xml(pres)
+
+
+def duplicate_slide(pkg, index, new_index=None):
+    """Copy the slide at `index` and insert it at `new_index` (right after it by
+    default); returns the index of the copy.
+
+    The slide XML is copied as-is; its notes slide, charts and their embedded
+    workbooks get copies of their own, while layouts and media are shared.
+    """
+    slides = slide_partnames(pkg)
+    index = _check_index(index, len(slides))
+    merger = _DeckMerger(pkg)
+    # Links to the other slides of the deck keep pointing at them
+    merger.append(pkg, [slides[index]], {s: s for s in slides if s != slides[index]})
+    merger.finish()
+    new_index = index + 1 if new_index is None else _check_index(new_index, len(slides) + 1)
+    move_slide(pkg, len(slides), new_index)
+    return new_index
+
+
+def delete_slides(pkg, indices):
+    """Delete the slides at `indices` and every part only they were using
+    (notes slides, charts, embedded workbooks, media)."""
+    slides = slide_partnames(pkg)
+    doomed = {slides[_check_index(i, len(slides))] for i in indices}
+    name, pres, lst = _slide_list(pkg)
+    rels = pkg.rels(name)
+    by_rid = {rel.rId: rel.target for rel in rels}
+    for entry in list(lst if lst is not None else ()):
+        if by_rid[entry.get("{%s}id" % R_NS)] in doomed:
+            lst.remove(entry)
+    pkg.parts[name] = serialize_xml(pres)
+    pkg.set_rels(name, [rel for rel in rels if rel.target not in doomed])
+    for slide in slides:
+        if slide not in doomed:
+            dropped = {rel.rId for rel in pkg.rels(slide)
+                       if rel.reltype == RT_SLIDE and rel.target in doomed}
+            if dropped:
+                pkg.parts[slide] = unlink(pkg.parts[slide], dropped)
+                pkg.set_rels(slide, [rel for rel in pkg.rels(slide) if rel.rId not in dropped])
+    for slide in doomed:
+        pkg.drop_part(slide)
+    return drop_orphans(pkg)
+
+
+def delete_slide(pkg, index):
+    """Delete one slide; see delete_slides()."""
+    return delete_slides(pkg, [index])
+
+
+def drop_orphans(pkg):
+    """Remove parts no longer reachable from the package relationships;
+    returns their names."""
+    reachable, stack = set(), [""]
+    while stack:
+        for rel in pkg.rels(stack.pop()):
+            if not rel.external and rel.target not in reachable and rel.target in pkg.parts:
+                reachable.add(rel.target)
+                stack.append(rel.target)
+    orphans = [n for n in pkg.parts if n not in reachable and not n.endswith(".rels")]
+    for name in orphans:
+        pkg.drop_part(name)
+    return orphans
+
+
+def export_slides(source, indices, filename):
+    """Write the slides at `indices` (in that order) of `source` to `filename`.
+
+    Appends .pptx if missing; returns the path.
+    """
+    pkg = open_deck(source)
+    slides = slide_partnames(pkg)
+    keep = [_check_index(i, len(slides)) for i in indices]
+    if len(set(keep)) != len(keep):
+        raise ValueError("export_slides() indices must be unique; use duplicate_slide()")
+    name, pres, lst = _slide_list(pkg)
+    if lst is not None:  # a deck without slides may have no list at all
+        entries, kept = list(lst), set(keep)
+        lst[:] = [entries[i] for i in keep] + [e for i, e in enumerate(entries) if i not in kept]
+        pkg.parts[name] = serialize_xml(pres)
+    delete_slides(pkg, range(len(keep), len(slides)))
+    if not filename.endswith(".pptx"):
+        filename += ".pptx"
+    pkg.save(filename)
+    return filename
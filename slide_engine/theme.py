@@ -0,0 +1,66 @@
+"""Runtime themes: a client's colours and fonts without patching design.py.
+
+A Theme holds its own copy of the design tokens. The engine helpers and the
+layout functions take the tokens from their `theme` argument (the design
+module by default), and a Theme's layouts pass it along, so several themed
+decks can be rendered side by side — even from concurrent threads — without
+reloading any module. Colour fills and font properties are pre-built as XML
+fragments once, when the theme is created.
+
+    brand = Theme("acme", NAVY=RGBColor(0x00, 0x33, 0x66), FONT_FAMILY="Arial")
+    prs = render_plan(plan, theme=brand)
+"""
+
+import functools
+
+from pptx.dml.color import RGBColor
+
+from . import design as D
+from . import engine
+from .layouts import LAYOUTS
+
+TOKENS = {name: getattr(D, name) for name in dir(D) if name.isupper()}
+
+# Lists of colours that follow the palette tokens they were built from
+_PALETTES = ("PROCESS_COLORS", "PYRAMID_COLORS", "MATRIX_COLORS")
+
+
+class Theme:
+    """Design tokens plus the layouts drawing with them.
+
+    Tokens are read like the design module (``theme.NAVY``); any token of
+    design.py can be overridden by keyword. Palettes and content sizes are
+    derived again from the overridden colours and margins unless given too.
+    """
+
+    def __init__(self, name="default", **tokens):
+        unknown = sorted(set(tokens) - set(TOKENS))
+        if unknown:
+            raise ValueError(f"Unknown design token(s): {', '.join(unknown)}")
+        self.name = name
+
+        values = dict(TOKENS, **tokens)
+        swaps = {TOKENS[k]: v for k, v in tokens.items() if isinstance(TOKENS[k], RGBColor)}
+        for palette in _PALETTES:
+            if palette not in tokens:
+                values[palette] = [swaps.get(color, color) for color in TOKENS[palette]]
+        if "CONTENT_WIDTH" not in tokens:
+            values["CONTENT_WIDTH"] = (values["SLIDE_WIDTH"] - values["MARGIN_LEFT"]
+                                       - values["MARGIN_RIGHT"])
+        if "CONTENT_HEIGHT" not in tokens:
+            values["CONTENT_HEIGHT"] = (values["SLIDE_HEIGHT"] - values["MARGIN_TOP"]
+                                        - values["MARGIN_BOTTOM"])
+        for key, value in values.items():
+            setattr(self, key, value)
+
+        colors = [v for v in values.values() if isinstance(v, RGBColor)]
+        colors += [c for palette in _PALETTES for c in values[palette]]
+        self.xml = engine.XmlFragments(values["FONT_FAMILY"], colors)
+        self.layouts = {name: functools.partial(fn, theme=self) for name, fn in LAYOUTS.items()}
+
+    def create_presentation(self):
+        """A new presentation whose title layout is drawn with this theme."""
+        return engine.create_presentation(self)
+
+    def __repr__(self):
+        return f"Theme({self.name!r})"
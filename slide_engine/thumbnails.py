@@ -0,0 +1,351 @@
+"""PNG thumbnails of generated decks, drawn with Pillow straight from slide XML.
+
+Only the vocabulary this engine emits is understood: solid backgrounds,
+rect / roundRect / ellipse / chevron / triangle shapes with solid fills, text
+boxes and shape text, the shapes and title placeholder of the engine's slide
+layout, and the bar and pie charts of engine.py. Anything else is skipped,
+which is good enough for portal thumbnails and needs no LibreOffice.
+"""
+
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+from PIL import Image, ImageDraw, ImageFont
+
+from . import design as D
+from .package import Package, P_NS, R_NS, RT_SLIDE_LAYOUT, displayed_shapes, parse_xml
+
+A_NS = "http://schemas.openxmlformats.org/drawingml/2006/main"
+C_NS = "http://schemas.openxmlformats.org/drawingml/2006/chart"
+
+_A = "{%s}" % A_NS
+_P = "{%s}" % P_NS
+_C = "{%s}" % C_NS
+
+# Tried in order; Pillow looks bare file names up in the system font folders
+FONT_CANDIDATES = {
+    False: ("calibri.ttf", "Carlito-Regular.ttf", "DejaVuSans.ttf",
+            "LiberationSans-Regular.ttf", "Arial.ttf"),
+    True: ("calibrib.ttf", "Carlito-Bold.ttf", "DejaVuSans-Bold.ttf",
+           "LiberationSans-Bold.ttf", "Arial Bold.ttf"),
+}
+
+DEFAULT_WIDTH = 640
+DEFAULT_TEXT_COLOR = "#" + str(D.DARK_TEXT)
+SHAPE_TEXT_COLOR = "#FFFFFF"  # p:style fontRef lt1 used by auto shapes
+INSET_X = 91440
+INSET_Y = 45720
+
+
+@lru_cache(maxsize=None)
+def _font(size_px, bold):
+    size_px = max(int(size_px), 1)
+    for name in FONT_CANDIDATES[bold]:
+        try:
+            return ImageFont.truetype(name, size_px)
+        except OSError:
+            continue
+    return ImageFont.load_default(size_px)
+
+
+def _srgb(parent):
+    """'#RRGGBB' of the a:solidFill/a:srgbClr under `parent`, or None."""
+    if parent is None:
+        return None
+    clr = parent.find(f"{_A}solidFill/{_A}srgbClr")
+    return "#" + clr.get("val") if clr is not None else None
+
+
+class _Rasterizer:
+    """Draw the slides of one package at a fixed scale."""
+
+    def __init__(self, pkg, width):
+        self.pkg = pkg
+        pres = parse_xml(pkg.parts[pkg.main_document])
+        sld_sz = pres.find(f"{_P}sldSz")
+        self.slide_w = int(sld_sz.get("cx")) if sld_sz is not None else D.SLIDE_WIDTH
+        self.slide_h = int(sld_sz.get("cy")) if sld_sz is not None else D.SLIDE_HEIGHT
+        self.scale = width / self.slide_w
+        self.size = (width, max(1, round(self.slide_h * self.scale)))
+        targets = {r.rId: r.target for r in pkg.rels(pkg.main_document)}
+        lst = pres.find(f"{_P}sldIdLst")
+        self.slides = [targets[el.get(f"{{{R_NS}}}id")] for el in (lst if lst is not None else ())]
+        self._layouts = {}
+
+    def _layout(self, slide_name):
+        name = self.pkg.related(slide_name, RT_SLIDE_LAYOUT)
+        if name is None:
+            return None
+        if name not in self._layouts:
+            self._layouts[name] = parse_xml(self.pkg.parts[name])
+        return self._layouts[name]
+
+    def px(self, emu):
+        return emu * self.scale
+
+    def render(self, slide_name):
+        root = parse_xml(self.pkg.parts[slide_name])
+        bg_pr, shapes = displayed_shapes(root, self._layout(slide_name))
+        image = Image.new("RGB", self.size, _srgb(bg_pr) or "#FFFFFF")
+        draw = ImageDraw.Draw(image)
+        rel_targets = {r.rId: r.target for r in self.pkg.rels(slide_name)}
+        for el in shapes:
+            if el.tag == f"{_P}sp":
+                self._shape(draw, el)
+            elif el.tag == f"{_P}graphicFrame":
+                self._graphic_frame(draw, el, rel_targets)
+        return image
+
+    # --- Shapes ---
+
+    def _box(self, xfrm):
+        off, ext = xfrm.find(f"{_A}off"), xfrm.find(f"{_A}ext")
+        x, y = self.px(int(off.get("x"))), self.px(int(off.get("y")))
+        return x, y, x + self.px(int(ext.get("cx"))), y + self.px(int(ext.get("cy")))
+
+    def _shape(self, draw, sp):
+        sp_pr = sp.find(f"{_P}spPr")
+        xfrm = sp_pr.find(f"{_A}xfrm")
+        if xfrm is None:
+            return
+        box = self._box(xfrm)
+        fill = _srgb(sp_pr)
+        line = sp_pr.find(f"{_A}ln")
+        outline = _srgb(line)
+        geom = sp_pr.find(f"{_A}prstGeom")
+        prst = geom.get("prst") if geom is not None else "rect"
+        if fill or outline:
+            self._geometry(draw, prst, box, fill, outline)
+
+        tx_body = sp.find(f"{_P}txBody")
+        if tx_body is not None:
+            is_textbox = (sp.find(f"{_P}nvSpPr/{_P}cNvSpPr").get("txBox") == "1"
+                          or sp.find(f"{_P}nvSpPr/{_P}nvPr/{_P}ph") is not None)
+            if prst == "chevron":
+                depth = min(box[2] - box[0], box[3] - box[1]) / 2
+                box = (box[0] + depth, box[1], box[2] - depth, box[3])
+            self._text(draw, tx_body, box, DEFAULT_TEXT_COLOR if is_textbox else SHAPE_TEXT_COLOR)
+
+    def _geometry(self, draw, prst, box, fill, outline):
+        x0, y0, x1, y1 = box
+        x1, y1 = max(x1, x0 + 1), max(y1, y0 + 1)  # hairlines stay visible
+        width = max(1, round(self.px(12700))) if outline else 0
+        if prst == "roundRect":
+            radius = min(x1 - x0, y1 - y0) * 0.16667
+            draw.rounded_rectangle((x0, y0, x1, y1), radius, fill=fill, outline=outline, width=width)
+        elif prst == "ellipse":
+            draw.ellipse((x0, y0, x1, y1), fill=fill, outline=outline, width=width)
+        elif prst == "chevron":
+            depth, mid = min(x1 - x0, y1 - y0) / 2, (y0 + y1) / 2
+            points = [(x0, y0), (x1 - depth, y0), (x1, mid),
+                      (x1 - depth, y1), (x0, y1), (x0 + depth, mid)]
+            draw.polygon(points, fill=fill, outline=outline)
+        elif prst == "triangle":
+            draw.polygon([((x0 + x1) / 2, y0), (x1, y1), (x0, y1)], fill=fill, outline=outline)
+        else:
+            draw.rectangle((x0, y0, x1, y1), fill=fill, outline=outline, width=width)
+
+    # --- Text ---
+
+    def _run_style(self, props, inherited):
+        size, bold, color = inherited
+        if props is not None:
+            if props.get("sz"):
+                size = int(props.get("sz")) / 100
+            if props.get("b") is not None:
+                bold = props.get("b") in ("1", "true")
+            color = _srgb(props) or color
+        return size, bold, color
+
+    def _text(self, draw, tx_body, box, default_color):
+        body_pr = tx_body.find(f"{_A}bodyPr")
+        anchor = body_pr.get("anchor", "t") if body_pr is not None else "t"
+        x0 = box[0] + self.px(INSET_X)
+        x1 = box[2] - self.px(INSET_X)
+        max_w = max(x1 - x0, 1)
+
+        lines = []  # (width, height, align, [(text, font, color)], space_after)
+        for p in tx_body.iter(f"{_A}p"):
+            p_pr = p.find(f"{_A}pPr")
+            style = self._run_style(
+                p_pr.find(f"{_A}defRPr") if p_pr is not None else None, (18, False, default_color)
+            )
+            align = p_pr.get("algn", "l") if p_pr is not None else "l"
+            spc = p.find(f"{_A}pPr/{_A}spcAft/{_A}spcPts")
+            space_after = self.px(int(spc.get("val")) * 127) if spc is not None else 0
+            words = []
+            for r in p.iter(f"{_A}r"):
+                size, bold, color = self._run_style(r.find(f"{_A}rPr"), style)
+                font = _font(self.px(size * 12700), bold)
+                for i, chunk in enumerate((r.findtext(f"{_A}t") or "").split("\n")):
+                    if i:
+                        words.append(None)  # forced line break
+                    words.extend((w, font, color) for w in chunk.split(" ") if w)
+            if not words:
+                continue
+            lines.extend(self._wrap(words, max_w, align))
+            if lines:
+                lines[-1][4] = space_after
+
+        total_h = sum(line[1] + line[4] for line in lines)
+        if anchor == "ctr":
+            y = (box[1] + box[3] - total_h) / 2
+        elif anchor == "b":
+            y = box[3] - self.px(INSET_Y) - total_h
+        else:
+            y = box[1] + self.px(INSET_Y)
+        for width, height, align, runs, space_after in lines:
+            x = {"ctr": (x0 + x1 - width) / 2, "r": x1 - width}.get(align, x0)
+            for text, font, color in runs:
+                draw.text((x, y), text, font=font, fill=color)
+                x += font.getlength(text + " ")
+            y += height + space_after
+
+    def _wrap(self, words, max_w, align):
+        lines, current, width, height = [], [], 0.0, 0.0
+        for word in words + [None]:
+            if word is not None:
+                text, font, color = word
+                w = font.getlength(text)
+                gap = font.getlength(" ") if current else 0
+                if not current or width + gap + w <= max_w:
+                    current.append(word)
+                    width += gap + w
+                    height = max(height, font.size * 1.2)
+                    continue
+            if current:
+                lines.append([width, height, align, current, 0])
+            current, width, height = [], 0.0, 0.0
+            if word is not None:
+                text, font, color = word
+                current, width, height = [word], font.getlength(text), font.size * 1.2
+        return lines
+
+    # --- Charts ---
+
+    def _graphic_frame(self, draw, frame, rel_targets):
+        chart_ref = frame.find(f".//{_C}chart")
+        xfrm = frame.find(f"{_P}xfrm")
+        if chart_ref is None or xfrm is None:
+            return
+        chart = parse_xml(self.pkg.parts[rel_targets[chart_ref.get(f"{{{R_NS}}}id")]])
+        box = self._box(xfrm)
+        bar = chart.find(f".//{_C}barChart")
+        pie = chart.find(f".//{_C}pieChart")
+        if bar is not None:
+            self._bar_chart(draw, bar, box)
+        elif pie is not None:
+            self._pie_chart(draw, pie, box)
+
+    @staticmethod
+    def _series(ser):
+        values = [float(v.text) for v in ser.iterfind(f"{_C}val//{_C}pt/{_C}v")]
+        categories = [v.text or "" for v in ser.iterfind(f"{_C}cat//{_C}pt/{_C}v")]
+        return categories, values
+
+    def _bar_chart(self, draw, bar, box):
+        ser = bar.find(f"{_C}ser")
+        if ser is None:
+            return
+        categories, values = self._series(ser)
+        color = _srgb(ser.find(f"{_C}spPr")) or "#" + str(D.ORANGE)
+        x0, y0, x1, y1 = box
+        font = _font(self.px(11 * 12700), False)
+        plot_x0, plot_y1 = x0 + font.getlength("0000"), y1 - font.size * 2
+        top = max(values, default=0)
+        top = top if top > 0 else 1  # an all-negative or empty series: no bars to scale
+        magnitude = 10 ** math.floor(math.log10(top))
+        axis_max = next(s * magnitude for s in (1, 2, 5, 10) if top <= s * magnitude)
+        for i in range(6):
+            y = plot_y1 - (plot_y1 - y0) * i / 5
+            draw.line((plot_x0, y, x1, y), fill="#" + str(D.LIGHT_GRAY))
+            draw.text((plot_x0 - 4, y), f"{axis_max * i / 5:g}", font=font,
+                      fill="#" + str(D.GRAY), anchor="rm")
+        slot = (x1 - plot_x0) / max(len(values), 1)
+        for i, value in enumerate(values):
+            h = (plot_y1 - y0) * max(value, 0) / axis_max
+            bx = plot_x0 + i * slot + slot * 0.2
+            draw.rectangle((bx, plot_y1 - h, bx + slot * 0.6, plot_y1), fill=color)
+            if i < len(categories):
+                draw.text((plot_x0 + (i + 0.5) * slot, plot_y1 + 4), categories[i], font=font,
+                          fill="#" + str(D.GRAY), anchor="ma")
+
+    def _pie_chart(self, draw, pie, box):
+        ser = pie.find(f"{_C}ser")
+        if ser is None:
+            return
+        categories, values = self._series(ser)
+        colors = {
+            int(dpt.find(f"{_C}idx").get("val")): _srgb(dpt.find(f"{_C}spPr"))
+            for dpt in ser.iterfind(f"{_C}dPt")
+        }
+        x0, y0, x1, y1 = box
+        font = _font(self.px(11 * 12700), False)
+        legend_h = font.size * 2
+        radius = min(x1 - x0, y1 - y0 - legend_h) * 0.4
+        cx, cy = (x0 + x1) / 2, (y0 + y1 - legend_h) / 2
+        total = sum(values) or 1.0
+        start = -90.0
+        for i, value in enumerate(values):
+            sweep = 360.0 * value / total
+            color = colors.get(i) or "#" + str(D.PROCESS_COLORS[i % len(D.PROCESS_COLORS)])
+            draw.pieslice((cx - radius, cy - radius, cx + radius, cy + radius),
+                          start, start + sweep, fill=color)
+            start += sweep
+        for i, category in enumerate(categories):
+            x = x0 + (x1 - x0) * (i + 0.5) / max(len(categories), 1)
+            color = colors.get(i) or "#" + str(D.PROCESS_COLORS[i % len(D.PROCESS_COLORS)])
+            key_y = y1 - legend_h / 2
+            draw.rectangle((x - font.size, key_y - 3, x - font.size + 6, key_y + 3), fill=color)
+            draw.text((x - font.size + 10, key_y), category, font=font,
+                      fill=DEFAULT_TEXT_COLOR, anchor="lm")
+
+
+def rasterize_presentation(pkg_file, width=DEFAULT_WIDTH):
+    """Return one PIL image per slide of a .pptx path or file-like object."""
+    rasterizer = _Rasterizer(Package.open(pkg_file), width)
+    return [rasterizer.render(name) for name in rasterizer.slides]
+
+
+def save_thumbnails(pkg_file, out_dir, width=DEFAULT_WIDTH, stem=None):
+    """Write ``<stem>-<n>.png`` for every slide into `out_dir`; return the paths.
+    `stem` defaults to the deck's file name without extension."""
+    os.makedirs(out_dir, exist_ok=True)
+    stem = stem or os.path.splitext(os.path.basename(str(pkg_file)))[0]
+    paths = []
+    for i, image in enumerate(rasterize_presentation(pkg_file, width), 1):
+        path = os.path.join(out_dir, f"{stem}-{i}.png")
+        image.save(path, optimize=False)
+        paths.append(path)
+    return paths
+
+
+def _save_thumbnails_job(args):
+    return save_thumbnails(*args)
+
+
+def _unique_stems(pkg_files):
+    """File name stems of `pkg_files`, with ``_2``, ``_3``... appended to repeats
+    (decks of the same name in different directories)."""
+    stems, used = [], set()
+    for path in pkg_files:
+        stem = base = os.path.splitext(os.path.basename(str(path)))[0]
+        number = 1
+        while stem in used:
+            number += 1
+            stem = f"{base}_{number}"
+        used.add(stem)
+        stems.append(stem)
+    return stems
+
+
+def save_thumbnails_batch(pkg_files, out_dir, width=DEFAULT_WIDTH, jobs=None):
+    """save_thumbnails() for many decks across a process pool; paths per deck.
+    Decks sharing a file name get distinct stems (see _unique_stems())."""
+    pkg_files = [str(path) for path in pkg_files]
+    tasks = [(path, out_dir, width, stem)
+             for path, stem in zip(pkg_files, _unique_stems(pkg_files))]
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        return list(pool.map(_save_thumbnails_job, tasks))
@@ -0,0 +1,236 @@
+"""Fail-fast validation of JSON plans before any slide is rendered.
+
+SCHEMA mirrors the documented plan format of skill/SKILL.md and is compiled
+once, at import, so validating a plan does no schema interpretation — fast
+enough for batch checks of tens of thousands of plans per second. Every error
+is reported with its JSON path (``$.slides[3].left_items[1]``).
+"""
+
+from numbers import Real
+
+
+class PlanValidationError(ValueError):
+    """Raised by check_plan(); `errors` lists every problem found."""
+
+    def __init__(self, errors):
+        self.errors = errors
+        super().__init__(f"{len(errors)} error(s) in plan:\n  " + "\n  ".join(errors))
+
+    def __reduce__(self):
+        # Raised in worker processes: pickle the errors, not the message
+        return type(self), (self.errors,)
+
+
+# === Schema ===
+#
+# Field specs are plain tuples so they can be compiled two ways: into one
+# generated predicate per layout (the fast path, a single expression with no
+# calls per field) and into reporting closures that are only run on slides
+# the predicate rejects, to collect every error with its JSON path.
+
+STR = ("str",)
+NUMBER = ("number",)
+PAIR = ("pair",)
+
+
+def list_of(item, min_items=0):
+    return ("list", item, min_items)
+
+
+def obj(required, optional=None):
+    """Object with required and optional fields; unknown keys are tolerated."""
+    return ("object", tuple(required.items()), tuple((optional or {}).items()))
+
+
+_STRS = list_of(STR)
+_QUADRANT = obj({"title": STR}, {"items": _STRS})
+_PERSON = obj({"name": STR, "title": STR})
+_SAME_LENGTH = (("categories", "values"),)
+
+# layout -> (slide object spec, pairs of list fields that must have equal lengths)
+SCHEMA = {
+    "title": (obj({"title": STR}, {"subtitle": STR}), ()),
+    "agenda": (obj({"items": list_of(STR, 1)}, {"title": STR}), ()),
+    "section": (obj({"title": STR}, {"subtitle": STR}), ()),
+    "bullets": (obj({"title": STR, "bullets": list_of(STR, 1)}), ()),
+    "two_columns": (obj({"title": STR, "left_title": STR, "left_items": _STRS,
+                         "right_title": STR, "right_items": _STRS}), ()),
+    "key_stat": (obj({"stat": STR, "description": STR}), ()),
+    "quote": (obj({"quote": STR}, {"author": STR}), ()),
+    "conclusion": (obj({"title": STR, "points": list_of(STR, 1)}), ()),
+    "process_flow": (obj({"title": STR, "steps": list_of(STR, 1)}), ()),
+    "timeline": (obj({"title": STR, "milestones": list_of(PAIR, 1)}), ()),
+    "matrix": (obj({"title": STR, "top_left": _QUADRANT, "top_right": _QUADRANT,
+                    "bottom_left": _QUADRANT, "bottom_right": _QUADRANT},
+                   {"x_label": STR, "y_label": STR}), ()),
+    "pyramid": (obj({"title": STR, "levels": list_of(STR, 1)}), ()),
+    "bar_chart": (obj({"title": STR, "categories": list_of(STR, 1),
+                       "values": list_of(NUMBER, 1)}), _SAME_LENGTH),
+    "pie_chart": (obj({"title": STR, "categories": list_of(STR, 1),
+                       "values": list_of(NUMBER, 1)}), _SAME_LENGTH),
+    "icon_cards": (obj({"title": STR, "cards": list_of(obj({"value": STR, "label": STR}), 1)}), ()),
+    "org_chart": (obj({"title": STR, "manager": _PERSON, "reports": list_of(_PERSON)}), ()),
+    "funnel": (obj({"title": STR, "stages": list_of(obj({"label": STR, "value": STR}), 1)}), ()),
+    "team_grid": (obj({"title": STR, "members": list_of(
+        obj({"name": STR, "role": STR}, {"desc": STR}), 1)}), ()),
+}
+
+
+# === Fast path: one generated predicate per layout ===
+
+
+def _expr(spec, var, depth=0):
+    kind = spec[0]
+    if kind == "str":
+        return f"isinstance({var}, str)"
+    if kind == "number":
+        return (f"({var}.__class__ is int or {var}.__class__ is float or "
+                f"(isinstance({var}, Real) and not isinstance({var}, bool)))")
+    if kind == "pair":
+        return (f"(isinstance({var}, (list, tuple)) and len({var}) == 2 and "
+                f"isinstance({var}[0], str) and isinstance({var}[1], str))")
+    if kind == "list":
+        item = f"x{depth}"
+        size = f" and len({var}) >= {spec[2]}" if spec[2] else ""
+        return (f"(isinstance({var}, list){size} and "
+                f"all({_expr(spec[1], item, depth + 1)} for {item} in {var}))")
+    required, optional = spec[1], spec[2]
+    terms = [f"isinstance({var}, dict)"]
+    terms += [f"{key!r} in {var} and {_expr(s, f'{var}[{key!r}]', depth)}" for key, s in required]
+    terms += [f"({key!r} not in {var} or {_expr(s, f'{var}[{key!r}]', depth)})"
+              for key, s in optional]
+    return "(" + " and ".join(terms) + ")"
+
+
+def _compile_predicate(spec, same_length):
+    terms = [_expr(spec, "s")] + [f"len(s[{a!r}]) == len(s[{b!r}])" for a, b in same_length]
+    namespace = {"Real": Real}
+    exec(f"def ok(s):\n    return {' and '.join(terms)}\n", namespace)
+    return namespace["ok"]
+
+
+# === Slow path: reporting closures, check(value, path, key, errors) ===
+#
+# `path` is the parent's JSON path and `key` the field name or list index; the
+# full path is only formatted when an error is reported.
+
+
+def _at(path, key):
+    return f"{path}[{key}]" if isinstance(key, int) else f"{path}.{key}"
+
+
+def _reporter(spec):
+    kind = spec[0]
+    if kind in ("str", "number"):
+        ok = _compile_predicate(spec, ())
+        expected = "a string" if kind == "str" else "a number"
+
+        def check(value, path, key, errors):
+            if not ok(value):
+                errors.append(f"{_at(path, key)}: expected {expected}, got {type(value).__name__}")
+    elif kind == "pair":
+        def check(value, path, key, errors):
+            if not isinstance(value, (list, tuple)) or len(value) != 2:
+                errors.append(f"{_at(path, key)}: expected a [label, description] pair")
+                return
+            for i, v in enumerate(value):
+                if not isinstance(v, str):
+                    errors.append(f"{_at(path, key)}[{i}]: expected a string, "
+                                  f"got {type(v).__name__}")
+    elif kind == "list":
+        item, min_items = _reporter(spec[1]), spec[2]
+
+        def check(value, path, key, errors):
+            if not isinstance(value, list):
+                errors.append(f"{_at(path, key)}: expected a list, got {type(value).__name__}")
+                return
+            if len(value) < min_items:
+                errors.append(f"{_at(path, key)}: expected at least {min_items} item(s), "
+                              f"got {len(value)}")
+            here = _at(path, key)
+            for i, v in enumerate(value):
+                item(v, here, i, errors)
+    else:
+        required = [(key, _reporter(s)) for key, s in spec[1]]
+        optional = [(key, _reporter(s)) for key, s in spec[2]]
+
+        def check(value, path, key, errors):
+            here = _at(path, key) if key is not None else path
+            if not isinstance(value, dict):
+                errors.append(f"{here}: expected an object, got {type(value).__name__}")
+                return
+            for name, field in required:
+                if name in value:
+                    field(value[name], here, name, errors)
+                else:
+                    errors.append(f"{here}: missing required field '{name}'")
+            for name, field in optional:
+                if name in value:
+                    field(value[name], here, name, errors)
+    return check
+
+
+def _compile(spec, same_length):
+    spec = ("object", spec[1], spec[2] + (("notes", STR),))
+    ok = _compile_predicate(spec, same_length)
+    report = _reporter(spec)
+
+    def check(slide, index, errors):
+        if ok(slide):
+            return
+        path = f"$.slides[{index}]"
+        report(slide, path, None, errors)
+        for a, b in same_length:
+            if isinstance(slide.get(a), list) and isinstance(slide.get(b), list) \
+                    and len(slide[a]) != len(slide[b]):
+                errors.append(f"{path}: '{a}' has {len(slide[a])} item(s) "
+                              f"but '{b}' has {len(slide[b])}")
+    return check
+
+
+_VALIDATORS = {layout: _compile(*entry) for layout, entry in SCHEMA.items()}
+_KNOWN = ", ".join(sorted(SCHEMA))
+
+
+def validate_plan(plan):
+    """Return the list of errors in `plan` (empty when the plan is valid)."""
+    errors = []
+    if not isinstance(plan, dict):
+        return [f"$: expected an object, got {type(plan).__name__}"]
+    slides = plan.get("slides")
+    if not isinstance(slides, list):
+        return ["$: missing required list 'slides'"]
+    for key in ("title", "filename"):
+        if key in plan and not isinstance(plan[key], str):
+            errors.append(f"$.{key}: expected a string, got {type(plan[key]).__name__}")
+    if "notes_markdown" in plan and not isinstance(plan["notes_markdown"], bool):
+        errors.append(f"$.notes_markdown: expected a boolean, "
+                      f"got {type(plan['notes_markdown']).__name__}")
+    for i, spec in enumerate(slides):
+        if not isinstance(spec, dict):
+            errors.append(f"$.slides[{i}]: expected an object, got {type(spec).__name__}")
+            continue
+        layout = spec.get("layout")
+        validator = _VALIDATORS.get(layout) if isinstance(layout, str) else None
+        if validator is None:
+            errors.append(f"$.slides[{i}].layout: unknown layout {spec.get('layout')!r} "
+                          f"(expected one of {_KNOWN})")
+            continue
+        validator(spec, i, errors)
+    return errors
+
+
+def check_plan(plan):
+    """Raise PlanValidationError listing every problem in `plan`."""
+    errors = validate_plan(plan)
+    if errors:
+        raise PlanValidationError(errors)
+    return plan
+
+
+def validate_plans(plans):
+    """Batch mode: yield (index, errors) for each invalid plan of an iterable."""
+    for i, plan in enumerate(plans):
+        errors = validate_plan(plan)
+        if errors:
+            yield i, errors
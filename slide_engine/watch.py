@@ -0,0 +1,143 @@
+"""Watch a plan file and rebuild its deck incrementally on every save.
+
+    python -m slide_engine watch plan.json -o deck.pptx
+
+The Presentation stays in memory between builds. Each slide is remembered
+with its plan fragment: on a change only slides whose fragment is new are
+rendered, the others are kept (moved if the plan reordered them) and slides
+gone from the plan are unlinked. The deck is then written to a temporary
+file next to the output and moved over it, so a viewer never opens a
+half-written .pptx. An invalid plan is reported and the last good deck kept.
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+from collections import defaultdict
+
+from .engine import create_presentation
+from .layouts import LAYOUTS
+from .notes import write_notes
+from .package import save_deterministic
+from .plan import render_slide
+from .validate import PlanValidationError, check_plan
+
+
+def _fragment_key(spec, markdown_notes=False):
+    if markdown_notes and spec.get("notes"):
+        spec = dict(spec, notes=("markdown", spec["notes"]))
+    return json.dumps(spec, sort_keys=True, ensure_ascii=False)
+
+
+class IncrementalRenderer:
+    """A deck kept in step with successive versions of a plan."""
+
+    def __init__(self, theme=None):
+        self.theme = theme
+        self.layouts = theme.layouts if theme is not None else LAYOUTS
+        self.prs = None
+        self._slides = []  # (fragment key, <p:sldId>) in deck order
+
+    def update(self, plan):
+        """Bring the deck in line with `plan` (validated first); returns the
+        number of slides rendered."""
+        check_plan(plan)
+        if self.prs is None:
+            self.prs = (self.theme.create_presentation() if self.theme is not None
+                        else create_presentation())
+        sld_id_lst = self.prs.slides._sldIdLst
+        unused = defaultdict(list)
+        for key, entry in self._slides:
+            unused[key].append(entry)
+
+        markdown = plan.get("notes_markdown", False)
+        slides, rendered = [], 0
+        for spec in plan["slides"]:
+            key = _fragment_key(spec, markdown)
+            if unused[key]:
+                entry = unused[key].pop(0)
+            else:
+                if markdown and spec.get("notes"):
+                    slide = render_slide(self.prs, dict(spec, notes=""), self.layouts)
+                    write_notes(self.prs, [(slide, spec["notes"])], markdown=True)
+                else:
+                    render_slide(self.prs, spec, self.layouts)
+                entry = next(reversed(sld_id_lst))
+                rendered += 1
+            slides.append((key, entry))
+
+        for entries in unused.values():
+            for entry in entries:
+                sld_id_lst.remove(entry)
+                self.prs.part.drop_rel(entry.rId)
+        sld_id_lst[:] = [entry for _, entry in slides]
+        self._slides = slides
+        return rendered
+
+
+def write_atomic(prs, output, deterministic=False):
+    """Save `prs` to `output` through a temporary file in the same directory."""
+    directory = os.path.dirname(os.path.abspath(output))
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix=".~", suffix=".pptx")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            if deterministic:
+                save_deterministic(prs, f)
+            else:
+                prs.save(f)
+        os.replace(tmp, output)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+    return output
+
+
+def _log(message):
+    print(message, file=sys.stderr, flush=True)
+
+
+def watch(plan_path, output, theme=None, interval=0.05, deterministic=False, stop=None,
+          log=_log):
+    """Rebuild `output` from `plan_path` whenever the plan file changes.
+
+    The file is polled every `interval` seconds; runs until `stop` (a
+    threading.Event) is set, or forever. Returns the number of builds.
+    """
+    renderer = IncrementalRenderer(theme)
+    last_stat = last_data = None
+    builds = 0
+    while stop is None or not stop.is_set():
+        try:
+            stat = os.stat(plan_path)
+            stat = (stat.st_mtime_ns, stat.st_size)
+        except FileNotFoundError:
+            stat = None
+        if stat is not None and stat != last_stat:
+            last_stat = stat
+            start = time.perf_counter()
+            with open(plan_path, "rb") as f:
+                data = f.read()
+            if data != last_data:
+                last_data = data
+                try:
+                    plan = json.loads(data)
+                    rendered = renderer.update(plan)
+                except ValueError as e:  # invalid JSON or PlanValidationError
+                    errors = e.errors if isinstance(e, PlanValidationError) else [str(e)]
+                    log("\n".join(f"{plan_path}: {error}" for error in errors))
+                except Exception as e:  # a render failure must not end the session
+                    log(f"{plan_path}: {type(e).__name__}: {e}")
+                    # The deck may hold part of the failed build: start afresh next time
+                    renderer = IncrementalRenderer(theme)
+                else:
+                    write_atomic(renderer.prs, output, deterministic)
+                    builds += 1
+                    log(f"{output}: {rendered}/{len(plan['slides'])} slide(s) rendered "
+                        f"in {(time.perf_counter() - start) * 1000:.0f} ms")
+        if stop is not None:
+            stop.wait(interval)
+        else:
+            time.sleep(interval)
+    return builds
@@ -0,0 +1,183 @@
+"""Tests for the asyncio rendering API."""
+
+import asyncio
+import io
+import os
+import sys
+import threading
+import time
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pptx import Presentation
+
+from slide_engine import AsyncRenderer, PlanValidationError, aio
+from test_integration import GPEC_PLAN
+
+SMALL_PLAN = {"slides": [{"layout": "section", "title": "Partie I"}]}
+
+
+def _counting(calls):
+    def render(plan, validate):
+        calls.append(plan)
+        time.sleep(0.05)
+        return b"deck %d" % len(calls)
+    return render
+
+
+def _slow(active, peak, lock):
+    with lock:
+        active[0] += 1
+        peak[0] = max(peak[0], active[0])
+    time.sleep(0.05)
+    with lock:
+        active[0] -= 1
+
+
+class TestAsyncRenderer:
+    def test_render_returns_pptx_bytes(self):
+        async def main():
+            async with AsyncRenderer() as renderer:
+                return await renderer.render(GPEC_PLAN)
+        prs = Presentation(io.BytesIO(asyncio.run(main())))
+        assert len(prs.slides) == len(GPEC_PLAN["slides"])
+
+    def test_save(self, tmp_path):
+        async def main():
+            async with AsyncRenderer() as renderer:
+                return await renderer.save(SMALL_PLAN, str(tmp_path / "deck"))
+        path = asyncio.run(main())
+        assert path.endswith("deck.pptx") and os.path.exists(path)
+
+    def test_invalid_plan_fails_before_queueing(self):
+        async def main():
+            async with AsyncRenderer() as renderer:
+                await renderer.render({"slides": [{"layout": "bullets"}]})
+        with pytest.raises(PlanValidationError):
+            asyncio.run(main())
+
+    def test_timeout(self):
+        async def main():
+            async with AsyncRenderer(timeout=0.001) as renderer:
+                await renderer.render(GPEC_PLAN)
+        with pytest.raises(asyncio.TimeoutError):
+            asyncio.run(main())
+
+    def test_timeout_covers_the_wait_for_a_slot(self):
+        async def main():
+            async with AsyncRenderer(max_concurrency=1) as renderer:
+                running = asyncio.ensure_future(renderer._run(None, time.sleep, 0.5))
+                await asyncio.sleep(0.01)
+                start = time.perf_counter()
+                with pytest.raises(asyncio.TimeoutError):
+                    await renderer._run(0.05, time.sleep, 0)
+                waited = time.perf_counter() - start
+                await running
+            return waited
+        assert asyncio.run(main()) < 0.3
+
+    def test_render_finishing_after_the_loop_closed(self, caplog):
+        renderer = AsyncRenderer(max_workers=1)
+
+        async def main():
+            with pytest.raises(asyncio.TimeoutError):
+                await renderer._run(0.01, time.sleep, 0.2)
+        asyncio.run(main())
+        renderer._executor.shutdown()  # the render ends now, with the loop closed
+        assert "exception calling callback" not in caplog.text
+
+    def test_concurrency_limit_holds_across_cancellation(self):
+        active, peak, lock = [0], [0], threading.Lock()
+
+        async def main():
+            async with AsyncRenderer(max_workers=4, max_concurrency=2) as renderer:
+                tasks = [asyncio.ensure_future(renderer._run(None, _slow, active, peak, lock))
+                         for _ in range(6)]
+                await asyncio.sleep(0.01)
+                tasks[0].cancel()  # already running: keeps its slot until done
+                await asyncio.gather(*tasks, return_exceptions=True)
+        asyncio.run(main())
+        assert peak[0] == 2
+
+    def test_event_loop_stays_responsive(self):
+        lags = []
+
+        async def probe(stop):
+            while not stop.is_set():
+                start = time.perf_counter()
+                await asyncio.sleep(0.005)
+                lags.append(time.perf_counter() - start - 0.005)
+
+        async def main():
+            async with AsyncRenderer(max_concurrency=2) as renderer:
+                stop = asyncio.Event()
+                task = asyncio.ensure_future(probe(stop))
+                await asyncio.gather(*(renderer.render(GPEC_PLAN) for _ in range(4)))
+                stop.set()
+                await task
+        asyncio.run(main())
+        assert lags and max(lags) < 0.25
+
+    def test_unknown_executor(self):
+        with pytest.raises(ValueError):
+            AsyncRenderer(executor="fiber")
+
+
+class TestCoalescing:
+    def test_identical_requests_share_one_render(self, monkeypatch):
+        calls = []
+        monkeypatch.setattr(aio, "render_plan_bytes", _counting(calls))
+
+        async def main():
+            async with AsyncRenderer(coalesce=True) as renderer:
+                decks = await asyncio.gather(
+                    renderer.render(GPEC_PLAN), renderer.render(dict(GPEC_PLAN, filename="x")),
+                    renderer.render(SMALL_PLAN))
+                return decks, renderer.stats()
+        decks, stats = asyncio.run(main())
+        assert len(calls) == 2 and decks[0] == decks[1] != decks[2]
+        assert stats == {"coalesced": 1, "in_flight": 0}
+
+    def test_result_cache(self, monkeypatch, tmp_path):
+        calls = []
+        monkeypatch.setattr(aio, "render_plan_bytes", _counting(calls))
+
+        async def main():
+            async with AsyncRenderer(cache_bytes=1024) as renderer:
+                first = await renderer.render(SMALL_PLAN)
+                path = await renderer.save(SMALL_PLAN, str(tmp_path / "deck"))
+                return first, path, renderer.stats()
+        first, path, stats = asyncio.run(main())
+        assert len(calls) == 1 and open(path, "rb").read() == first
+        assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 1, 1)
+
+    def test_render_cancelled_once_nobody_waits(self, monkeypatch):
+        calls = []
+        monkeypatch.setattr(aio, "render_plan_bytes", _counting(calls))
+
+        async def main():
+            async with AsyncRenderer(max_workers=1, coalesce=True) as renderer:
+                blocker = asyncio.ensure_future(renderer.render(GPEC_PLAN))
+                await asyncio.sleep(0.01)
+                with pytest.raises(asyncio.TimeoutError):
+                    await renderer.render(SMALL_PLAN, timeout=0.01)  # still queued: dropped
+                await blocker
+                return renderer.stats()
+        assert asyncio.run(main())["in_flight"] == 0
+        assert calls == [GPEC_PLAN]
+
+    def test_request_after_cancelled_flight(self, monkeypatch):
+        calls = []
+        monkeypatch.setattr(aio, "render_plan_bytes", _counting(calls))
+
+        async def main():
+            async with AsyncRenderer(max_workers=1, coalesce=True) as renderer:
+                first = asyncio.ensure_future(renderer.render(SMALL_PLAN))
+                await asyncio.sleep(0)
+                first.cancel()  # the last waiter: the shared render is cancelled too
+                await asyncio.sleep(0)
+                data = await renderer.render(SMALL_PLAN)  # not the cancelled flight
+                return first, data
+        first, data = asyncio.run(main())
+        assert first.cancelled() and data.startswith(b"deck")
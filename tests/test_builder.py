@@ -0,0 +1,71 @@
+"""Tests for the batched slide builder."""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lxml import etree
+from pptx.enum.text import MSO_ANCHOR, PP_ALIGN
+from pptx.util import Pt
+
+from slide_engine import create_presentation, design as D, engine
+from slide_engine.builder import SlideBuilder
+from slide_engine.engine import _add_blank_slide, _add_rectangle
+
+# (helper name without the _add_ prefix, positional args, keyword args)
+CALLS = [
+    ("rectangle", (1, 2, 3, 4, D.NAVY), {}),
+    ("line", (1, 2, 3, 4, D.ORANGE), {}),
+    ("rounded_rectangle", (1, 2, 3, 4, D.NAVY, D.ORANGE, "Hé <b>{x}\nz", Pt(14), D.WHITE, True), {}),
+    ("rounded_rectangle", (1, 2, 3, 4, D.NAVY), {}),
+    ("chevron", (1, 2, 3, 4, D.NAVY, "Étape"), {}),
+    ("oval", (1, 2, 3, 4, D.NAVY, "AB"), {}),
+    ("triangle", (1, 2, 3, 4, D.NAVY), {}),
+    ("textbox", (1, 2, 3, 4, "Texte & co\x07"),
+     {"anchor": MSO_ANCHOR.MIDDLE, "alignment": PP_ALIGN.RIGHT, "bold": True}),
+    ("multiline_textbox", (1, 2, 3, 4, ["a", "b"]), {"line_spacing": Pt(6)}),
+    ("multiline_textbox", (1, 2, 3, 4, []), {}),
+    ("multiline_textbox", (1, 2, 3, 4, ["a", "b"]),
+     {"bullet_char": "•", "bullet_color": D.ORANGE, "line_spacing": Pt(4)}),
+]
+
+
+def _xml(slide):
+    return [etree.tostring(el) for el in slide.shapes._spTree]
+
+
+class TestSlideBuilder:
+    def test_same_xml_as_helpers(self):
+        prs = create_presentation()
+        expected, built = _add_blank_slide(prs), _add_blank_slide(prs)
+        for name, args, kwargs in CALLS:
+            getattr(engine, "_add_" + name)(expected, *args, **kwargs)
+        builder = SlideBuilder(built)
+        for name, args, kwargs in CALLS:
+            getattr(builder, name)(*args, **kwargs)
+        assert len(builder) == len(CALLS)
+        shapes = builder.build()
+        assert len(builder) == 0
+        assert [s.shape_id for s in shapes] == list(range(2, 2 + len(CALLS)))
+        assert _xml(built) == _xml(expected)
+
+    def test_ids_continue_with_helpers(self):
+        slide = _add_blank_slide(create_presentation())
+        _add_rectangle(slide, 0, 0, 1, 1, D.NAVY)
+        builder = SlideBuilder(slide)
+        for _ in range(3):
+            builder.oval(0, 0, 1, 1, D.NAVY)
+        builder.build()
+        _add_rectangle(slide, 0, 0, 1, 1, D.NAVY)
+        assert [s.shape_id for s in slide.shapes] == [2, 3, 4, 5, 6]
+        assert slide.shapes[1].name == "Oval 2"
+
+    def test_without_turbo_mode(self):
+        prs = create_presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[0])  # title + subtitle placeholders
+        builder = SlideBuilder(slide)
+        builder.textbox(0, 0, 1, 1, "x")
+        (shape,) = builder.build()
+        assert shape.shape_id == 4 and shape.text_frame.text == "x"
+        assert slide.shapes.add_textbox(0, 0, 1, 1).shape_id == 5
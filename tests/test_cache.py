@@ -0,0 +1,47 @@
+"""Tests for plan keys and the rendered deck cache."""
+
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from slide_engine.cache import ResultCache, canonical_plan, plan_key
+from test_integration import GPEC_PLAN
+
+
+class TestPlanKey:
+    def test_order_spacing_and_filename_do_not_count(self):
+        shuffled = json.loads(json.dumps(dict(reversed(list(GPEC_PLAN.items()))), indent=2))
+        assert plan_key(dict(shuffled, filename="autre.pptx")) == plan_key(GPEC_PLAN)
+        assert canonical_plan({"b": 1, "a": "é"}) == '{"a":"é","b":1}'.encode("utf-8")
+
+    def test_content_and_options_count(self):
+        changed = dict(GPEC_PLAN, slides=GPEC_PLAN["slides"][1:])
+        assert plan_key(changed) != plan_key(GPEC_PLAN)
+        assert plan_key(GPEC_PLAN, backend="ooxml") != plan_key(GPEC_PLAN)
+        assert len(plan_key(GPEC_PLAN)) == 64
+
+
+class TestResultCache:
+    def test_lru_bounded_by_bytes(self):
+        cache = ResultCache(max_bytes=10)
+        cache.put("a", b"aaaa")
+        cache.put("b", b"bbbb")
+        assert cache.get("a") == b"aaaa"  # now b is the least recently used
+        cache.put("c", b"cccc")
+        assert "b" not in cache and cache.get("b") is None
+        cache.put("big", b"x" * 11)
+        assert "big" not in cache
+        assert cache.stats() == {"hits": 1, "misses": 1, "evictions": 1, "entries": 2,
+                                 "bytes": 8, "max_bytes": 10}
+
+    def test_replace_entry(self):
+        cache = ResultCache(max_bytes=10)
+        cache.put("a", b"aaaa")
+        cache.put("a", b"aaaaaaaa")
+        assert len(cache) == 1 and cache.size == 8
+        with pytest.raises(ValueError, match="max_bytes"):
+            ResultCache(-1)
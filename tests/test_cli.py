@@ -0,0 +1,156 @@
+"""Tests for the python -m slide_engine command line."""
+
+import io
+import json
+import os
+import sys
+import tarfile
+import zipfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pptx import Presentation
+
+from slide_engine import cli
+from slide_engine.cli import main
+from test_integration import GPEC_PLAN
+
+SMALL_PLAN = {"slides": [{"layout": "section", "title": "Partie I"}]}
+
+
+def _broken_render(*args):
+    raise RuntimeError("boom")
+
+
+def _ndjson(*plans, extra=()):
+    return "".join(json.dumps(p) + "\n" for p in plans) + "".join(extra)
+
+
+class TestRender:
+    def test_from_file(self, tmp_path):
+        src = tmp_path / "gpec.json"
+        src.write_text(json.dumps(GPEC_PLAN), encoding="utf-8")
+        out = tmp_path / "deck"
+        assert main(["render", str(src), "-o", str(out)]) == 0
+        assert len(Presentation(str(out) + ".pptx").slides) == len(GPEC_PLAN["slides"])
+
+    def test_default_output_next_to_plan(self, tmp_path):
+        src = tmp_path / "plan.json"
+        src.write_text(json.dumps(SMALL_PLAN), encoding="utf-8")
+        assert main(["render", str(src)]) == 0
+        assert (tmp_path / "plan.pptx").exists()
+
+    def test_from_stdin_to_stdout(self, monkeypatch, capsysbinary):
+        monkeypatch.setattr(sys, "stdin", io.StringIO(json.dumps(SMALL_PLAN)))
+        assert main(["render", "-", "-o", "-"]) == 0
+        data = capsysbinary.readouterr().out
+        assert len(Presentation(io.BytesIO(data)).slides) == 1
+
+    def test_deterministic(self, tmp_path):
+        src = tmp_path / "gpec.json"
+        src.write_text(json.dumps(GPEC_PLAN), encoding="utf-8")
+        for name in ("a", "b"):
+            assert main(["render", str(src), "-o", str(tmp_path / name),
+                         "--deterministic"]) == 0
+        assert (tmp_path / "a.pptx").read_bytes() == (tmp_path / "b.pptx").read_bytes()
+
+    def test_invalid_plan(self, tmp_path, capsys):
+        src = tmp_path / "bad.json"
+        src.write_text('{"slides": [{"layout": "bullets"}]}', encoding="utf-8")
+        assert main(["render", str(src)]) == 1
+        assert "missing required field 'bullets'" in capsys.readouterr().err
+        assert main(["validate", str(src)]) == 1
+
+    def test_malformed_json(self, tmp_path, capsys):
+        src = tmp_path / "bad.json"
+        src.write_text("{bad", encoding="utf-8")
+        assert main(["render", str(src)]) == 1
+        assert main(["validate", str(src)]) == 1
+        err = capsys.readouterr().err
+        assert err.count(f"{src}: invalid JSON") == 2
+
+
+class TestStream:
+    def test_out_dir_skips_bad_lines(self, tmp_path, monkeypatch, capsys):
+        plans = _ndjson(dict(SMALL_PLAN, filename="a"), dict(SMALL_PLAN, filename="../b"),
+                        SMALL_PLAN, extra=["{oops\n", "\n"])
+        monkeypatch.setattr(sys, "stdin", io.StringIO(plans))
+        assert main(["stream", "--out-dir", str(tmp_path / "out")]) == 1
+        assert sorted(os.listdir(tmp_path / "out")) == ["a.pptx", "b.pptx", "deck-000003.pptx"]
+        assert "line 4: invalid JSON" in capsys.readouterr().err
+
+    def test_tar_with_workers_keeps_input_order(self, tmp_path):
+        src = tmp_path / "plans.ndjson"
+        src.write_text(_ndjson(*(dict(SMALL_PLAN, filename=f"p{i}") for i in range(6))),
+                       encoding="utf-8")
+        out = tmp_path / "decks.tar"
+        assert main(["stream", str(src), "--jobs", "2", "--tar", str(out)]) == 0
+        with tarfile.open(out) as tar:
+            assert tar.getnames() == [f"p{i}.pptx" for i in range(6)]
+
+    def test_render_errors_and_same_names(self, tmp_path, monkeypatch, capsys):
+        bad = {"slides": [{"layout": ["x"]}]}
+        same = dict(SMALL_PLAN, filename="same")
+        monkeypatch.setattr(sys, "stdin", io.StringIO(_ndjson(same, bad, same, same)))
+        assert main(["stream", "--out-dir", str(tmp_path / "out")]) == 1
+        assert sorted(os.listdir(tmp_path / "out")) == ["same-3.pptx", "same-4.pptx",
+                                                         "same.pptx"]
+        err = capsys.readouterr().err
+        assert "line 2: $.slides[0].layout: unknown layout" in err
+        assert "3 deck(s) rendered, 1 failed" in err
+
+    def test_existing_files_are_kept(self, tmp_path, monkeypatch):
+        out = tmp_path / "out"
+        out.mkdir()
+        (out / "same.pptx").write_bytes(b"kept")
+        monkeypatch.setattr(sys, "stdin", io.StringIO(_ndjson(dict(SMALL_PLAN, filename="same"))))
+        assert main(["stream", "--out-dir", str(out)]) == 0
+        assert (out / "same.pptx").read_bytes() == b"kept"
+        assert sorted(os.listdir(out)) == ["same-1.pptx", "same.pptx"]
+
+    def test_same_names_in_archives(self, tmp_path):
+        same = dict(SMALL_PLAN, filename="same")
+        src = tmp_path / "plans.ndjson"
+        src.write_text(_ndjson(same, same, same), encoding="utf-8")
+        assert main(["stream", str(src), "--tar", str(tmp_path / "decks.tar")]) == 0
+        with tarfile.open(tmp_path / "decks.tar") as tar:
+            assert tar.getnames() == ["same.pptx", "same-2.pptx", "same-3.pptx"]
+        assert main(["stream", str(src), "--zip", str(tmp_path / "decks.zip")]) == 0
+        with zipfile.ZipFile(tmp_path / "decks.zip") as archive:
+            assert archive.namelist() == ["same.pptx", "same-2.pptx", "same-3.pptx"]
+
+    def test_deterministic_archives(self, tmp_path):
+        src = tmp_path / "plans.ndjson"
+        src.write_text(_ndjson(SMALL_PLAN, SMALL_PLAN), encoding="utf-8")
+        for fmt in ("tar", "zip"):
+            outputs = []
+            for name in ("a", "b"):
+                out = tmp_path / f"{name}.{fmt}"
+                assert main(["stream", str(src), f"--{fmt}", str(out), "--deterministic"]) == 0
+                outputs.append(out.read_bytes())
+            assert outputs[0] == outputs[1]
+        with tarfile.open(tmp_path / "a.tar") as tar:
+            assert {info.mtime for info in tar.getmembers()} == {315532800}  # 1980-01-01
+
+    def test_worker_error_is_counted(self, tmp_path, monkeypatch, capsys):
+        monkeypatch.setattr(sys, "stdin", io.StringIO(_ndjson(SMALL_PLAN, SMALL_PLAN)))
+        monkeypatch.setattr(cli, "render_plan_bytes", _broken_render)
+        assert main(["stream", "--jobs", "2", "--out-dir", str(tmp_path / "out")]) == 1
+        assert os.listdir(tmp_path / "out") == []
+        err = capsys.readouterr().err
+        assert "line 1: RuntimeError: boom" in err and "0 deck(s) rendered, 2 failed" in err
+
+    def test_zip_to_stdout(self, tmp_path, monkeypatch, capsysbinary):
+        monkeypatch.setattr(sys, "stdin", io.StringIO(_ndjson(SMALL_PLAN, SMALL_PLAN)))
+        assert main(["stream", "--zip", "-"]) == 0
+        archive = zipfile.ZipFile(io.BytesIO(capsysbinary.readouterr().out))
+        assert archive.namelist() == ["deck-000001.pptx", "deck-000002.pptx"]
+
+    def test_memprofile_report(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(sys, "stdin", io.StringIO(_ndjson(SMALL_PLAN, SMALL_PLAN)))
+        report = tmp_path / "mem.txt"
+        assert main(["stream", "--jobs", "2", "--out-dir", str(tmp_path / "out"),
+                     "--memprofile", str(report)]) == 0
+        assert len(os.listdir(tmp_path / "out")) == 2
+        text = report.read_text(encoding="utf-8")
+        assert "Memory profile: 2 deck(s)" in text and "section" in text
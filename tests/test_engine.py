@@ -1,13 +1,17 @@
 """Unit tests for slide_engine — each layout individually."""
 
+import io
 import os
 import sys
 import pytest
+from pptx import Presentation
+from pptx.util import Inches
 
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from slide_engine import (
+    add_slides,
     create_presentation,
     save_presentation,
     add_title_slide,
@@ -49,6 +53,85 @@ class TestCreatePresentation:
         assert prs.slide_height == Inches(7.5)
 
 
+class TestTitleLayout:
+    def test_layout_added_once(self):
+        from slide_engine.engine import TITLE_LAYOUT, _title_layout
+        prs = create_presentation()
+        assert _title_layout(prs) == prs.slide_layouts.get_by_name(TITLE_LAYOUT)
+        assert len(prs.slide_layouts) == 12
+
+    def test_slide_only_holds_title_and_content(self, prs):
+        from slide_engine.engine import TITLE_LAYOUT
+        slide = add_bullets_slide(prs, "Points", ["A", "B"])
+        assert slide.slide_layout.name == TITLE_LAYOUT
+        assert slide.shapes.title.text == "Points"
+        assert len(slide.shapes) == 2
+        underline = [s for s in slide.slide_layout.shapes if not s.is_placeholder]
+        assert [(s.top, s.width) for s in underline] == [(Inches(1.5), Inches(2))]
+
+    def test_added_to_foreign_presentation(self, tmp_path):
+        from pptx import Presentation
+        prs = Presentation()
+        add_agenda_slide(prs, ["A"])
+        prs.save(str(tmp_path / "deck.pptx"))
+        reopened = Presentation(str(tmp_path / "deck.pptx"))
+        assert reopened.slides[0].shapes.title.text == "Agenda"
+        assert reopened.slides[0].shapes.title.left == Inches(0.8)
+
+
+class TestAddSlides:
+    def _check(self, prs):
+        ids = [s.slide_id for s in prs.slides]
+        rIds = [sld_id.rId for sld_id in prs.slides._sldIdLst]
+        assert len(set(ids)) == len(ids) and len(set(rIds)) == len(rIds)
+        buf = io.BytesIO()
+        prs.save(buf)
+        reopened = Presentation(buf)
+        assert [s.slide_id for s in reopened.slides] == ids
+        return reopened
+
+    def test_reserves_many(self, prs):
+        slides = add_slides(prs, prs.slide_layouts[1], 50)
+        assert len(slides) == len(prs.slides) == 50
+        assert list(prs.slides) == slides
+        assert [s.slide_id for s in slides] == list(range(256, 306))
+        assert slides[0].shapes.title is not None  # layout placeholders cloned
+        self._check(prs)
+
+    def test_interleaved_with_python_pptx(self, prs):
+        layout = prs.slide_layouts[6]
+        add_slides(prs, layout, 3)
+        prs.slides.add_slide(layout)
+        add_slides(prs, layout, 2)
+        prs.slides.add_slide(layout)
+        assert len(self._check(prs).slides) == 7
+
+    def test_after_deleting_slides(self, prs):
+        layout = prs.slide_layouts[6]
+        add_slides(prs, layout, 4)
+        for sld_id in list(prs.slides._sldIdLst)[1::2]:  # drop the 2nd and the last
+            prs.part.drop_rel(sld_id.rId)
+            prs.slides._sldIdLst.remove(sld_id)
+        add_slides(prs, layout, 2)
+        assert len(self._check(prs).slides) == 4
+
+    def test_after_reordering_slides(self, prs):
+        layout = prs.slide_layouts[6]
+        add_slides(prs, layout, 3)
+        lst = prs.slides._sldIdLst
+        lst[:] = [lst[2], lst[0], lst[1]]  # the last slide now has the lowest id but one
+        add_slides(prs, layout, 2)
+        assert [s.slide_id for s in prs.slides] == [258, 256, 257, 259, 260]
+        self._check(prs)
+
+    def test_opened_deck(self, prs):
+        add_slides(prs, prs.slide_layouts[6], 3)
+        reopened = self._check(prs)
+        (slide,) = add_slides(reopened, reopened.slide_layouts[6])
+        assert slide.slide_id == 259
+        assert len(self._check(reopened).slides) == 4
+
+
 class TestSavePresentation:
     def test_save_adds_extension(self, prs, tmp_path):
         filepath = str(tmp_path / "test")
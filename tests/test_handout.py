@@ -0,0 +1,75 @@
+"""Tests for text handouts, from plans and from existing decks."""
+
+import io
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from slide_engine import render_plan_bytes
+from slide_engine.cli import main
+from slide_engine.handout import deck_slides, handout, plan_slides, write_handout
+from test_integration import GPEC_PLAN
+
+LAYOUTS = [spec["layout"] for spec in GPEC_PLAN["slides"]]
+BAR_CHART = LAYOUTS.index("bar_chart")
+
+
+@pytest.fixture(scope="module")
+def deck():
+    return render_plan_bytes(GPEC_PLAN)
+
+
+class TestHandout:
+    def test_plan_markdown(self):
+        md = "".join(handout(plan_slides(GPEC_PLAN), title="GPEC"))
+        assert md.startswith("# GPEC\n\n## 1. La GPEC comme levier")
+        assert md.count("\n## ") == len(GPEC_PLAN["slides"])
+        assert "- Approche quantitative\n  - Pyramide des âges\n" in md
+        assert "- RH : 8.5\n" in md
+        assert "> Processus itératif.\n" in md
+
+    def test_deck_matches_plan(self, deck):
+        from_plan, from_deck = list(plan_slides(GPEC_PLAN)), list(deck_slides(io.BytesIO(deck)))
+        assert [s.heading for s in from_deck] == [s.heading for s in from_plan]
+        assert [s.notes for s in from_deck] == [s.notes for s in from_plan]
+        assert from_deck[BAR_CHART].lines == from_plan[BAR_CHART].lines
+        assert "Vieillissement de la pyramide des âges" in [t for _, t in from_deck[4].lines]
+
+    def test_markdown_notes_from_deck(self):
+        plan = {"notes_markdown": True,
+                "slides": [{"layout": "section", "title": "S", "notes": "# Plan\n- **un** point"}]}
+        data = render_plan_bytes(plan)
+        slide = next(deck_slides(io.BytesIO(data)))
+        assert slide.notes == "Plan\n- un point"
+        text = "".join(handout(plan_slides(plan), "text"))
+        assert text == "1. S\n   Notes:\n     Plan\n     • un point\n\n"
+
+    def test_write_handout(self, deck, tmp_path):
+        path = write_handout(io.BytesIO(deck), str(tmp_path / "gpec.txt"))
+        text = open(path, encoding="utf-8").read()
+        assert text.startswith("1. La GPEC") and "\n## " not in text
+        with pytest.raises(ValueError, match="Unknown handout format"):
+            write_handout(GPEC_PLAN, str(tmp_path / "x.md"), fmt="html")
+
+
+class TestHandoutCli:
+    def test_handout_command(self, deck, tmp_path):
+        path = tmp_path / "gpec.pptx"
+        path.write_bytes(deck)
+        assert main(["handout", str(path)]) == 0
+        assert (tmp_path / "gpec.md").read_text(encoding="utf-8").startswith("## 1. La GPEC")
+
+    def test_render_and_stream(self, tmp_path, monkeypatch):
+        src = tmp_path / "gpec.json"
+        src.write_text(json.dumps(GPEC_PLAN), encoding="utf-8")
+        assert main(["render", str(src), "-o", str(tmp_path / "a.pptx"),
+                     "--handout", str(tmp_path / "a.md")]) == 0
+        monkeypatch.setattr(sys, "stdin", io.StringIO(json.dumps(GPEC_PLAN) + "\n"))
+        assert main(["stream", "--out-dir", str(tmp_path / "out"), "--handouts", "text"]) == 0
+        assert sorted(os.listdir(tmp_path / "out")) == ["deck-000001.pptx", "deck-000001.txt"]
+        assert "".join(handout(plan_slides(GPEC_PLAN), title=GPEC_PLAN["title"])) == \
+            (tmp_path / "a.md").read_text(encoding="utf-8")
@@ -0,0 +1,116 @@
+"""Tests for the SQLite slide library."""
+
+import io
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pptx import Presentation
+
+from slide_engine import PlanValidationError, render_plan
+from slide_engine.library import SlideLibrary
+from slide_engine.snapshot import snapshot_presentation
+from test_integration import GPEC_PLAN
+
+LAYOUTS = [spec["layout"] for spec in GPEC_PLAN["slides"]]
+BAR_CHART = LAYOUTS.index("bar_chart")
+
+
+@pytest.fixture(scope="module")
+def gpec():
+    return render_plan(GPEC_PLAN)
+
+
+@pytest.fixture
+def library(gpec):
+    with SlideLibrary() as library:
+        library.ingest(gpec, GPEC_PLAN, name="gpec.pptx")
+        yield library
+
+
+def _reopen(pkg):
+    out = io.BytesIO()
+    pkg.save(out)
+    out.seek(0)
+    return Presentation(out)
+
+
+class TestSlideLibrary:
+    def test_ingest_records_plan_fragments(self, library):
+        assert len(library) == len(GPEC_PLAN["slides"])
+        slide = library.get(BAR_CHART + 1)
+        assert slide.layout == "bar_chart"
+        assert slide.spec == GPEC_PLAN["slides"][BAR_CHART]
+        assert slide.title == "Taux de turnover par département"
+        assert slide.notes == GPEC_PLAN["slides"][BAR_CHART]["notes"]
+        assert slide.source == "gpec.pptx"
+        with pytest.raises(ValueError, match="Unknown library slide"):
+            library.get(999)
+
+    def test_template_stored_once(self, library, gpec):
+        library.ingest(gpec)
+        assert library.conn.execute("SELECT COUNT(*) FROM templates").fetchone()[0] == 1
+        assert library.get(len(GPEC_PLAN["slides"]) + 1).layout is None
+
+    def test_search(self, library):
+        hits = library.search("turnover")
+        assert hits[0].layout == "bar_chart"
+        assert [s.layout for s in library.search("precarite")] == ["pie_chart"]  # accents
+        assert [s.id for s in library.search("turnover", layout="matrix")] == \
+            [s.id for s in hits if s.layout == "matrix"]
+        assert library.search("notes:CDI")[0].layout == "pie_chart"
+
+    def test_render_plan_splices_slides(self, library, gpec):
+        plan = {"slides": [
+            {"layout": "title", "title": "Formation"},
+            {"layout": "library", "id": BAR_CHART + 1},
+            {"layout": "library", "id": 1},
+            {"layout": "bullets", "title": "Suite", "bullets": ["A"]},
+        ]}
+        prs = _reopen(library.render_plan(plan))
+        expected = snapshot_presentation(gpec)
+        rendered = snapshot_presentation(render_plan({"slides": [plan["slides"][0],
+                                                                 plan["slides"][3]]}))
+        assert snapshot_presentation(prs) == [rendered[0], expected[BAR_CHART], expected[0],
+                                              rendered[1]]
+        chart = next(s for s in prs.slides[1].shapes if s.has_chart).chart
+        assert chart.series[0].values == tuple(GPEC_PLAN["slides"][BAR_CHART]["values"])
+        assert prs.slides[1].notes_slide.notes_text_frame.text == \
+            GPEC_PLAN["slides"][BAR_CHART]["notes"]
+
+    def test_same_slide_twice(self, library):
+        pkg = library.render_plan({"slides": [{"layout": "library", "id": BAR_CHART + 1}] * 2})
+        prs = _reopen(pkg)
+        charts = [next(s for s in slide.shapes if s.has_chart).chart for slide in prs.slides]
+        assert charts[0].part is not charts[1].part
+
+    def test_links_to_other_slides_are_removed(self):
+        prs = render_plan(GPEC_PLAN)
+        prs.slides[0].shapes[0].click_action.target_slide = prs.slides[1]
+        with SlideLibrary() as library:
+            library.ingest(prs, GPEC_PLAN)
+            slide = _reopen(library.render_plan({"slides": [{"layout": "library", "id": 1}]}))
+        xml = slide.slides[0].part.blob.decode("utf-8")
+        assert "hlinkClick" not in xml
+        assert snapshot_presentation(slide) == snapshot_presentation(render_plan(GPEC_PLAN))[:1]
+
+    def test_plan_errors(self, library):
+        plan = {"slides": [{"layout": "library", "id": 999}, {"layout": "library"},
+                           {"layout": "bullets", "title": "T"}]}
+        with pytest.raises(PlanValidationError) as exc:
+            library.render_plan(plan)
+        assert exc.value.errors == [
+            "$.slides[2]: missing required field 'bullets'",
+            "$.slides[1].id: expected a library slide id (integer)",
+            "$.slides[0].id: no library slide with id 999",
+        ]
+
+    def test_persistent(self, gpec, tmp_path):
+        path = str(tmp_path / "slides.db")
+        with SlideLibrary(path) as library:
+            ids = library.ingest(gpec, GPEC_PLAN)
+        with SlideLibrary(path) as library:
+            assert library.search("SWOT")[0].id == ids[LAYOUTS.index("matrix")]
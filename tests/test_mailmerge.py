@@ -0,0 +1,101 @@
+"""Tests for mail merge — template plans rendered once per record."""
+
+import copy
+import io
+import os
+import sys
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pptx import Presentation
+
+from slide_engine import render_plan
+from slide_engine.mailmerge import MailMerge, fill, find_fields, mail_merge
+from slide_engine.snapshot import snapshot_presentation
+from test_integration import GPEC_PLAN
+
+RECORDS = [
+    {"name": "Marie Dupont", "score": "82%", "q1": 10, "q2": 30},
+    {"name": "Jean Martin", "score": "64%", "q1": 25, "q2": 5},
+    {"name": "Sophie Leclerc", "score": "91%", "q1": 7, "q2": 7},
+]
+
+
+def _template():
+    plan = copy.deepcopy(GPEC_PLAN)
+    plan["slides"][0]["subtitle"] = "Préparé pour {{name}}"
+    plan["slides"][3]["stat"] = "{{ score }}"
+    plan["slides"].insert(10, {"layout": "bar_chart", "title": "Objectifs de {{name}}",
+                               "categories": ["T1", "T2"], "values": ["{{q1}}", "{{q2}}"],
+                               "notes": "Résultats de {{name}}"})
+    return plan
+
+
+class TestPlaceholders:
+    def test_find_fields(self):
+        assert find_fields(_template()) == {"name", "score", "q1", "q2"}
+
+    def test_fill_keeps_whole_values(self):
+        assert fill({"v": ["{{q1}}", "x{{q1}}"]}, {"q1": 3}) == {"v": [3, "x3"]}
+
+    def test_missing_field(self):
+        with pytest.raises(ValueError, match="'name'"):
+            fill("{{name}}", {})
+
+
+class TestMailMerge:
+    def test_only_placeholder_slides_are_variant(self):
+        assert MailMerge(_template()).variant == [0, 3, 10]
+
+    def test_decks_match_full_render(self):
+        plan = _template()
+        decks = list(MailMerge(plan, batch=2).render_all(RECORDS, name="{name}"))
+        assert [name for name, _ in decks] == [r["name"] + ".pptx" for r in RECORDS]
+        for (_, data), record in zip(decks, RECORDS):
+            prs = Presentation(io.BytesIO(data))
+            assert snapshot_presentation(prs) == snapshot_presentation(render_plan(fill(plan, record)))
+            assert prs.slides[10].notes_slide.notes_text_frame.text == f"Résultats de {record['name']}"
+
+    def test_mail_merge_from_csv(self, tmp_path):
+        csv_path = tmp_path / "salaries.csv"
+        csv_path.write_text("name,score\nMarie,80%\nJean,70%\n", encoding="utf-8")
+        plan = {"slides": [{"layout": "key_stat", "stat": "{{score}}", "description": "{{name}}"},
+                           {"layout": "section", "title": "Fin"}]}
+        paths = mail_merge(plan, str(csv_path), str(tmp_path / "out"))
+        assert [os.path.basename(p) for p in paths] == ["deck-000001.pptx", "deck-000002.pptx"]
+        prs = Presentation(paths[1])
+        assert len(prs.slides) == 2
+        assert {sh.text_frame.text for sh in prs.slides[0].shapes} == {"70%", "Jean"}
+
+    def test_invalid_record_is_reported(self):
+        plan = {"slides": [{"layout": "bar_chart", "title": "t", "categories": ["a"],
+                            "values": ["{{v}}"]}]}
+        with pytest.raises(ValueError, match="expected a number"):
+            MailMerge(plan).render({"v": "douze"})
+
+    def test_csv_numbers_fill_number_fields(self, tmp_path):
+        csv_path = tmp_path / "objectifs.csv"
+        csv_path.write_text("index,q1,q2,stat\n7,12,3.5,42\n", encoding="utf-8")
+        plan = {"slides": [{"layout": "bar_chart", "title": "t", "categories": ["T1", "T2"],
+                            "values": ["{{q1}}", "{{q2}}"]},
+                           {"layout": "key_stat", "stat": "{{stat}}", "description": "d"}]}
+        (path,) = mail_merge(plan, str(csv_path), str(tmp_path / "out"),
+                             name="deck-{index}-{stat}")
+        assert os.path.basename(path) == "deck-1-42.pptx"  # index is the record position
+        prs = Presentation(path)
+        assert list(prs.slides[0].shapes[-1].chart.plots[0].series[0].values) == [12, 3.5]
+        assert "42" in {sh.text_frame.text for sh in prs.slides[1].shapes if sh.has_text_frame}
+
+    def test_markdown_notes_flag(self):
+        plan = {"notes_markdown": True, "slides": [
+            {"layout": "section", "title": "{{name}}", "notes": "- **{{name}}**"},
+            {"layout": "section", "title": "Fin", "notes": "# Fin"}]}
+        prs = Presentation(io.BytesIO(MailMerge(plan).render({"name": "Marie"})))
+        assert [s.notes_slide.notes_text_frame.text for s in prs.slides] == ["Marie", "Fin"]
+
+    def test_same_names_are_refused(self, tmp_path):
+        plan = {"slides": [{"layout": "section", "title": "{{name}}"}]}
+        records = [{"name": "Marie"}, {"name": "Marie"}]
+        with pytest.raises(ValueError, match="Records 1 and 2 are both named 'Marie.pptx'"):
+            mail_merge(plan, records, str(tmp_path / "out"), name="{name}")
@@ -0,0 +1,77 @@
+"""Tests for the tracemalloc memory profile and the soak run."""
+
+import gc
+import io
+import os
+import sys
+import tracemalloc
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pptx.dml.color import RGBColor
+
+from slide_engine import Theme, render_plan
+from slide_engine.memprofile import MemoryProfile, soak
+from slide_engine.samples import generate_plan
+from slide_engine.snapshot import snapshot_presentation
+from test_integration import GPEC_PLAN
+
+# Raise to run the soak over thousands of decks (as benchmarks/bench_memory.py does)
+SOAK_DECKS = int(os.environ.get("SLIDE_ENGINE_SOAK_DECKS", 60))
+
+BULLETS = {"slides": [{"layout": "bullets", "title": "Points", "bullets": ["A", "B"]}]}
+
+
+class TestMemoryProfile:
+    def test_attributes_helpers_to_layouts(self):
+        with MemoryProfile() as profile:
+            profile.save(profile.render(BULLETS), io.BytesIO())
+        assert profile.stats["bullets", None][0] == 1
+        assert profile.stats["bullets", "_add_titled_slide"][0] == 1
+        assert profile.stats["bullets", "_add_multiline_textbox"][1] > 0
+        assert profile.stats["save_presentation", None][0] == 1
+
+    def test_same_output_as_plain_render(self):
+        with MemoryProfile() as profile:
+            prs = profile.render(GPEC_PLAN)
+        assert snapshot_presentation(prs) == snapshot_presentation(render_plan(GPEC_PLAN))
+
+    def test_report(self, tmp_path):
+        with MemoryProfile() as profile:
+            profile.render(GPEC_PLAN)
+            profile.sample_residual()
+            path = profile.write_report(str(tmp_path / "mem.txt"))
+        report = open(path, encoding="utf-8").read()
+        assert "process_flow" in report and "  _add_chevron" in report
+        assert "create_presentation" in report
+        assert "Residual traced memory" in report
+        assert "allocation sites grown since start" in report
+
+    def test_restores_tracing_and_gc(self):
+        assert not tracemalloc.is_tracing() and gc.isenabled()
+        with MemoryProfile() as profile:
+            assert tracemalloc.is_tracing() and not gc.isenabled()
+        assert not tracemalloc.is_tracing() and gc.isenabled()
+        with pytest.raises(ValueError, match="not tracing"):
+            profile.render(BULLETS)
+
+    def test_theme(self):
+        teal = RGBColor(0x0F, 0x76, 0x6E)
+        with MemoryProfile(Theme(NAVY=teal)) as profile:
+            prs = profile.render(BULLETS)
+        assert str(teal) in prs.slides[0].slide_layout._element.xml
+
+
+class TestSoak:
+    def test_no_unbounded_growth(self, tmp_path):
+        plans = [generate_plan(seed, 2) for seed in range(20)]
+        sample_every = max(SOAK_DECKS // 6, 1)
+        profile = soak(plans, SOAK_DECKS, sample_every, report=str(tmp_path / "soak.txt"))
+        assert profile.decks == SOAK_DECKS
+        # Compare the second half only: the first decks import modules and fill caches
+        (mid_decks, mid), (end_decks, end) = profile.residual[len(profile.residual) // 2], \
+            profile.residual[-1]
+        assert (end - mid) / max(end_decks - mid_decks, 1) < 1024  # bytes kept per deck
+        assert (tmp_path / "soak.txt").exists()
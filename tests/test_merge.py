@@ -0,0 +1,110 @@
+"""Tests for merge_presentations — concatenating decks without re-rendering."""
+
+import os
+import sys
+import zipfile
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pptx import Presentation
+
+from slide_engine import (
+    create_presentation,
+    save_presentation,
+    merge_presentations,
+    add_title_slide,
+    add_bullets_slide,
+    add_bar_chart_slide,
+    add_pie_chart_slide,
+)
+from slide_engine.package import RT_SLIDE
+
+
+def _texts(slide):
+    return [shape.text for shape in slide.shapes if shape.has_text_frame]
+
+
+@pytest.fixture
+def decks(tmp_path):
+    rh = create_presentation()
+    add_title_slide(rh, "Département RH", notes="Notes RH")
+    add_bar_chart_slide(rh, "Turnover", ["RH", "IT"], [8.5, 15.2], notes="Graphique RH")
+
+    it = create_presentation()
+    add_bullets_slide(it, "Département IT", ["Cloud", "Sécurité"], notes="Notes IT")
+    add_pie_chart_slide(it, "Contrats", ["CDI", "CDD"], [80, 20])
+
+    return [
+        save_presentation(rh, str(tmp_path / "rh")),
+        save_presentation(it, str(tmp_path / "it")),
+    ]
+
+
+class TestMergePresentations:
+    def test_concatenates_slides_in_order(self, decks, tmp_path):
+        result = merge_presentations(decks, str(tmp_path / "exec"))
+        assert result.endswith(".pptx")
+        merged = Presentation(result)
+        assert len(merged.slides) == 4
+        assert "Département RH" in _texts(merged.slides[0])
+        assert "Département IT" in _texts(merged.slides[2])
+
+    def test_notes_are_copied(self, decks, tmp_path):
+        merged = Presentation(merge_presentations(decks, str(tmp_path / "exec")))
+        assert merged.slides[2].notes_slide.notes_text_frame.text == "Notes IT"
+        assert not merged.slides[3].has_notes_slide
+
+    def test_charts_keep_their_data(self, decks, tmp_path):
+        merged = Presentation(merge_presentations(decks, str(tmp_path / "exec")))
+        charts = [s.chart for slide in merged.slides for s in slide.shapes if s.has_chart]
+        assert len(charts) == 2
+        assert list(charts[1].plots[0].categories) == ["CDI", "CDD"]
+        assert charts[0].part.partname != charts[1].part.partname
+
+    def test_identical_masters_are_deduplicated(self, decks, tmp_path):
+        result = merge_presentations(decks + decks, str(tmp_path / "exec"))
+        merged = Presentation(result)
+        assert len(merged.slides) == 8
+        assert len(merged.slide_masters) == 1
+        with zipfile.ZipFile(result) as zf:
+            names = zf.namelist()
+        assert sum(n.startswith("ppt/slideLayouts/slideLayout") for n in names) == 12
+        assert sum(n.startswith("ppt/notesMasters/notesMaster") for n in names) == 1
+
+    def test_different_master_is_copied(self, decks, tmp_path):
+        other = create_presentation()
+        other.slide_master.name = "Client"
+        add_title_slide(other, "Autre charte")
+        path = save_presentation(other, str(tmp_path / "other"))
+
+        merged = Presentation(merge_presentations([decks[0], path], str(tmp_path / "exec")))
+        assert len(merged.slide_masters) == 2
+        assert merged.slides[2].slide_layout.slide_master.name == "Client"
+
+    def test_base_without_notes_gets_notes_master(self, decks, tmp_path):
+        bare = create_presentation()
+        add_title_slide(bare, "Sans notes")
+        merged = Presentation(merge_presentations([bare, decks[0]], str(tmp_path / "exec")))
+        assert merged.slides[1].notes_slide.notes_text_frame.text == "Notes RH"
+
+    def test_links_to_slides_left_out_are_removed(self, decks, tmp_path):
+        linked = create_presentation()
+        add_title_slide(linked, "Sommaire")
+        add_title_slide(linked, "Retirée")
+        linked.slides[0].shapes[0].click_action.target_slide = linked.slides[1]
+        # Drop the second slide from the slide list: its part is only reachable by the link
+        sld_id = linked.slides._sldIdLst[1]
+        linked.part.drop_rel(sld_id.rId)
+        linked.slides._sldIdLst.remove(sld_id)
+
+        merged = Presentation(merge_presentations([decks[0], linked], str(tmp_path / "exec")))
+        assert len(merged.slides) == 3
+        slide = merged.slides[2]
+        assert "Sommaire" in _texts(slide)
+        assert "hlinkClick" not in slide.part.blob.decode("utf-8")
+        assert all(rel.reltype != RT_SLIDE for rel in slide.part.rels.values())
+
+    def test_requires_a_source(self, tmp_path):
+        with pytest.raises(ValueError):
+            merge_presentations([], str(tmp_path / "exec"))
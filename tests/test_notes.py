@@ -0,0 +1,120 @@
+"""Tests for the bulk speaker notes writer."""
+
+import io
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lxml import etree
+from pptx import Presentation
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+
+from slide_engine import add_title_slide, create_presentation, render_plan, render_plan_bytes
+from slide_engine.engine import _add_blank_slide
+from slide_engine.notes import forget_notes_numbers, write_notes
+from slide_engine.plan import BACKENDS
+from test_integration import GPEC_PLAN
+
+A = "{http://schemas.openxmlformats.org/drawingml/2006/main}"
+
+
+def _slides(count):
+    prs = create_presentation()
+    return prs, [_add_blank_slide(prs) for _ in range(count)]
+
+
+def _paragraphs(slide):
+    return slide.notes_slide.notes_text_frame._txBody.findall(A + "p")
+
+
+class TestWriteNotes:
+    def test_same_xml_as_python_pptx(self):
+        text = "Première ligne\n\nTroisième < & >"
+        prs, (fast, slow) = _slides(2)
+        write_notes(prs, [(fast, text)], markdown=False)
+        slow.notes_slide.notes_text_frame.text = text
+        expected = etree.tostring(slow.notes_slide._element)
+        assert etree.tostring(fast.notes_slide._element) == expected
+
+    def test_partnames_relations_and_skipped_slides(self):
+        prs, slides = _slides(4)
+        created = write_notes(prs, [(slides[0], "A"), (slides[1], ""), (slides[3], "D")])
+        assert created == 2
+        assert [s.has_notes_slide for s in slides] == [True, False, False, True]
+        assert str(slides[3].notes_slide.part.partname) == "/ppt/notesSlides/notesSlide2.xml"
+        # python-pptx still finds a free partname after ours
+        slides[2].notes_slide.notes_text_frame.text = "C"
+        assert str(slides[2].notes_slide.part.partname) == "/ppt/notesSlides/notesSlide3.xml"
+        buf = io.BytesIO()
+        prs.save(buf)
+        reopened = Presentation(buf)
+        assert [s.notes_slide.notes_text_frame.text for s in reopened.slides] == \
+            ["A", "", "C", "D"]
+        masters = {s.notes_slide.part.part_related_by(RT.NOTES_MASTER)
+                   for s in reopened.slides}
+        assert masters == {reopened.part.notes_master_part}
+
+    def test_replaces_existing_notes(self):
+        prs, (slide,) = _slides(1)
+        slide.notes_slide.notes_text_frame.text = "Ancien"
+        assert write_notes(prs, [(slide, "Nouveau")]) == 0
+        assert slide.notes_slide.notes_text_frame.text == "Nouveau"
+
+    def test_markdown(self):
+        prs, (slide,) = _slides(1)
+        write_notes(prs, [(slide, "# Objectif\n- Point **clé** et *nuance*\n5 * 3 = 15")],
+                    markdown=True)
+        heading, bullet, plain = _paragraphs(slide)
+        assert [r.get("b") for r in heading.iter(A + "rPr")] == ["1"]
+        assert bullet.find(A + "pPr/" + A + "buChar").get("char") == "•"
+        runs = [(r.findtext(A + "t"), r.find(A + "rPr")) for r in bullet.iter(A + "r")]
+        assert [t for t, _ in runs] == ["Point ", "clé", " et ", "nuance"]
+        assert runs[1][1].get("b") == "1" and runs[3][1].get("i") == "1"
+        assert slide.notes_slide.notes_text_frame.text == \
+            "Objectif\nPoint clé et nuance\n5 * 3 = 15"
+
+    def test_plans_opt_in_to_markdown(self):
+        text = "- **Point** clé\n# Fin"
+        plan = {"slides": [{"layout": "section", "title": "S", "notes": text}]}
+        for backend in BACKENDS:
+            for flag, expected in ((None, text), (True, "Point clé\nFin")):
+                plan_ = dict(plan, notes_markdown=flag) if flag else plan
+                prs = Presentation(io.BytesIO(render_plan_bytes(plan_, backend=backend)))
+                assert prs.slides[0].notes_slide.notes_text_frame.text == expected
+
+    def test_slide_by_slide_scans_the_package_once(self, monkeypatch):
+        prs = create_presentation()
+        prs.part.notes_master_part  # created on first use, with a scan of its own
+        package_type, scans = type(prs.part.package), []
+        iter_parts = package_type.iter_parts
+        monkeypatch.setattr(package_type, "iter_parts",
+                            lambda self: scans.append(self) or iter_parts(self))
+        slides = [add_title_slide(prs, f"Titre {i}", notes=f"Notes {i}") for i in range(20)]
+        assert len(scans) == 1
+        names = {str(s.notes_slide.part.partname) for s in slides}
+        assert len(names) == 20
+
+    def test_forget_after_python_pptx_notes(self):
+        prs, slides = _slides(3)
+        write_notes(prs, [(slides[0], "A")])
+        slides[1].notes_slide.notes_text_frame.text = "B"  # python-pptx: notesSlide2
+        forget_notes_numbers(prs)
+        write_notes(prs, [(slides[2], "C")])
+        assert str(slides[2].notes_slide.part.partname) == "/ppt/notesSlides/notesSlide3.xml"
+
+    def test_control_characters_escaped_like_python_pptx(self):
+        prs, (slide,) = _slides(1)
+        write_notes(prs, [(slide, "a\x07b")])
+        assert slide.notes_slide.notes_text_frame.text == "a_x0007_b"
+
+
+class TestRenderPlan:
+    def test_notes_written_in_bulk(self):
+        prs = render_plan(GPEC_PLAN)
+        expected = [spec.get("notes", "") for spec in GPEC_PLAN["slides"]]
+        assert [s.notes_slide.notes_text_frame.text if s.has_notes_slide else ""
+                for s in prs.slides] == expected
+        names = sorted(str(s.notes_slide.part.partname) for s in prs.slides
+                       if s.has_notes_slide)
+        assert len(set(names)) == sum(1 for n in expected if n)
@@ -0,0 +1,69 @@
+"""Tests for the direct OOXML backend: same decks as the python-pptx engine."""
+
+import io
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pptx import Presentation
+from pptx.dml.color import RGBColor
+
+from slide_engine import Theme, render_plan, render_plan_bytes, render_plan_file
+from slide_engine.cli import main
+from slide_engine.ooxml import render_plan_ooxml
+from slide_engine.snapshot import snapshot_presentation
+from test_integration import GPEC_PLAN
+
+EDGE_PLAN = {"slides": [
+    {"layout": "section", "title": "R&D <interne>\nsuite", "subtitle": ""},
+    {"layout": "bullets", "title": "", "bullets": ["é", "a\vb", "tab\there"]},
+    {"layout": "bar_chart", "title": "A", "categories": ["x"], "values": [1]},
+    {"layout": "bar_chart", "title": "B", "categories": ["x", "y"], "values": [1, 2.5],
+     "notes": "# Titre\n- point"},
+    {"layout": "team_grid", "title": "Équipe", "members": [{"name": "Ana", "role": "DRH"}]},
+]}
+
+
+def _snapshot(data):
+    return snapshot_presentation(Presentation(io.BytesIO(data)))
+
+
+class TestOoxmlBackend:
+    def test_same_shapes_as_pptx(self):
+        data = render_plan_bytes(GPEC_PLAN, backend="ooxml")
+        assert _snapshot(data) == snapshot_presentation(render_plan(GPEC_PLAN))
+
+    @pytest.mark.parametrize("plan", [GPEC_PLAN, EDGE_PLAN], ids=["gpec", "edge"])
+    def test_same_bytes_as_pptx(self, plan):
+        assert render_plan_bytes(plan, deterministic=True, backend="ooxml") == \
+            render_plan_bytes(plan, deterministic=True)
+
+    def test_without_notes_no_notes_master(self):
+        plan = {"slides": [dict(s, notes="") for s in GPEC_PLAN["slides"]]}
+        pkg = render_plan_ooxml(plan).to_package()
+        assert not any(name.startswith("ppt/notesMasters/") for name in pkg.parts)
+        assert render_plan_bytes(plan, deterministic=True, backend="ooxml") == \
+            render_plan_bytes(plan, deterministic=True)
+
+    def test_theme(self):
+        theme = Theme("acme", NAVY=RGBColor(0x00, 0x80, 0x80), FONT_FAMILY="Arial")
+        assert render_plan_bytes(GPEC_PLAN, theme=theme, deterministic=True, backend="ooxml") \
+            == render_plan_bytes(GPEC_PLAN, theme=theme, deterministic=True)
+
+    def test_file_and_cli(self, tmp_path):
+        path = render_plan_file(GPEC_PLAN, str(tmp_path / "deck"), backend="ooxml")
+        assert path.endswith(".pptx")
+        src = tmp_path / "gpec.json"
+        src.write_text(json.dumps(GPEC_PLAN), encoding="utf-8")
+        assert main(["render", str(src), "-o", str(tmp_path / "cli.pptx"),
+                     "--backend", "ooxml"]) == 0
+        assert _snapshot((tmp_path / "cli.pptx").read_bytes()) == \
+            _snapshot(open(path, "rb").read())
+
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError, match="Unknown backend"):
+            render_plan_bytes(GPEC_PLAN, backend="odp")
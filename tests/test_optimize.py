@@ -0,0 +1,76 @@
+"""Tests for the output size optimiser."""
+
+import io
+import os
+import sys
+import zipfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pptx import Presentation
+
+from slide_engine import render_plan
+from slide_engine.cli import main
+from slide_engine.optimize import minify_xml, optimize_deck
+from slide_engine.snapshot import snapshot_presentation
+from test_integration import GPEC_PLAN
+
+
+def _optimize(prs, **options):
+    out = io.BytesIO()
+    report = optimize_deck(prs, out, **options)
+    out.seek(0)
+    return report, out
+
+
+class TestOptimizeDeck:
+    def test_same_slides_smaller_file(self):
+        prs = render_plan(GPEC_PLAN)
+        report, out = _optimize(prs)
+        assert report.after < report.before * 0.85
+        optimized = Presentation(out)
+        assert snapshot_presentation(optimized) == snapshot_presentation(prs)
+        assert [layout.name for layout in optimized.slide_layouts] == ["Blank", "HR Title"]
+
+    def test_unused_parts_removed(self):
+        report, out = _optimize(render_plan(GPEC_PLAN))
+        names = zipfile.ZipFile(out).namelist()
+        assert not any(n.startswith("ppt/printerSettings/") for n in names)
+        assert "docProps/thumbnail.jpeg" in names
+        removed = {p.name for p in report.parts if p.after is None}
+        assert "ppt/slideLayouts/slideLayout1.xml" in removed
+        master = zipfile.ZipFile(out).read("ppt/slideMasters/slideMaster1.xml")
+        assert b'type="dt"' not in master and b'type="title"' in master
+
+    def test_drop_thumbnail_and_level(self):
+        prs = render_plan(GPEC_PLAN)
+        fast, _ = _optimize(prs, level=1)
+        small, out = _optimize(prs, drop_thumbnail=True)
+        assert "docProps/thumbnail.jpeg" not in zipfile.ZipFile(out).namelist()
+        assert small.after < fast.after
+        assert "file: " in small.format() and "removed" in small.format(top=5)
+
+    def test_empty_deck_keeps_a_layout(self):
+        _, out = _optimize(render_plan({"slides": []}))
+        assert len(Presentation(out).slide_layouts) == 1
+
+
+class TestMinifyXml:
+    def test_keeps_significant_whitespace_and_ignorable_prefixes(self):
+        blob = (b'<p:sld xmlns:p="urn:p" xmlns:a="urn:a" xmlns:x="urn:x" xmlns:p14="urn:p14" '
+                b'xmlns:mc="http://schemas.openxmlformats.org/markup-compatibility/2006" '
+                b'mc:Ignorable="p14">\n  <a:r>\n    <a:t> </a:t>\n  </a:r>\n</p:sld>')
+        out = minify_xml(blob)
+        assert b"<a:r><a:t> </a:t></a:r></p:sld>" in out
+        assert b'xmlns:p14="urn:p14"' in out and b"xmlns:x" not in out
+
+
+class TestCli:
+    def test_optimize_in_place(self, tmp_path, capsys):
+        deck = str(tmp_path / "gpec.pptx")
+        render_plan(GPEC_PLAN).save(deck)
+        size = os.path.getsize(deck)
+        assert main(["optimize", deck, "--in-place"]) == 0
+        assert os.path.getsize(deck) < size
+        assert len(Presentation(deck).slides) == len(GPEC_PLAN["slides"])
+        assert f"{deck}: {size} -> " in capsys.readouterr().out
@@ -0,0 +1,108 @@
+"""Tests for targeted updates of existing decks."""
+
+import io
+import os
+import sys
+import zipfile
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pptx import Presentation
+
+from slide_engine import render_plan
+from slide_engine.package import Package
+from slide_engine.patch import open_for_patch, replace_text, set_chart_data, set_key_stat
+from test_integration import GPEC_PLAN
+
+LAYOUTS = [spec["layout"] for spec in GPEC_PLAN["slides"]]
+KEY_STAT = LAYOUTS.index("key_stat")
+BAR_CHART = LAYOUTS.index("bar_chart")
+PIE_CHART = LAYOUTS.index("pie_chart")
+
+
+@pytest.fixture(scope="module")
+def deck():
+    out = io.BytesIO()
+    render_plan(GPEC_PLAN).save(out)
+    return out.getvalue()
+
+
+def _save(pkg):
+    out = io.BytesIO()
+    pkg.save(out)
+    return out.getvalue()
+
+
+def _raw_members(data):
+    """{name: (compressed bytes, CRC)} of every member of a zip."""
+    with zipfile.ZipFile(io.BytesIO(data)) as zf:
+        infos = zf.infolist()
+    members = {}
+    for info in infos:
+        start = info.header_offset + 30 + int.from_bytes(
+            data[info.header_offset + 26:info.header_offset + 28], "little") + int.from_bytes(
+            data[info.header_offset + 28:info.header_offset + 30], "little")
+        members[info.filename] = (data[start:start + info.compress_size], info.CRC)
+    return members
+
+
+class TestPatch:
+    def test_key_stat(self, deck):
+        pkg = open_for_patch(io.BytesIO(deck))
+        set_key_stat(pkg, KEY_STAT, "42 %", "Nouvelle\nmesure")
+        slide = Presentation(io.BytesIO(_save(pkg))).slides[KEY_STAT]
+        texts = [shape.text_frame.text for shape in slide.shapes if shape.has_text_frame]
+        assert texts == ["42 %", "Nouvelle\vmesure"]
+        font = slide.shapes[0].text_frame.paragraphs[0].runs[0].font
+        assert font.size is None  # formatting stays on the paragraph defaults
+        with pytest.raises(ValueError, match="not a key_stat"):
+            set_key_stat(pkg, LAYOUTS.index("agenda"), "1")
+
+    def test_replace_text(self, deck):
+        pkg = open_for_patch(io.BytesIO(deck))
+        assert replace_text(pkg, 0, "GPEC", "Emplois") == 1
+        assert replace_text(pkg, 0, "absent", "x") == 0
+        title = Presentation(io.BytesIO(_save(pkg))).slides[0].shapes
+        assert any("Emplois" in s.text_frame.text for s in title if s.has_text_frame)
+        with pytest.raises(IndexError):
+            replace_text(pkg, len(LAYOUTS), "a", "b")
+
+    def test_chart_data(self, deck):
+        pkg = open_for_patch(io.BytesIO(deck))
+        set_chart_data(pkg, BAR_CHART, ["2023", "2024"], [12.5, 9.75])
+        set_chart_data(pkg, PIE_CHART, ["CDI", "CDD"], [80, 20])
+        prs = Presentation(io.BytesIO(_save(pkg)))
+        for index, categories, values in ((BAR_CHART, ["2023", "2024"], (12.5, 9.75)),
+                                          (PIE_CHART, ["CDI", "CDD"], (80, 20))):
+            chart = next(s for s in prs.slides[index].shapes if s.has_chart).chart
+            assert list(chart.plots[0].categories) == categories
+            assert chart.series[0].values == values
+            workbook = chart.part.chart_workbook.xlsx_part.blob
+            assert zipfile.ZipFile(io.BytesIO(workbook)).testzip() is None
+        with pytest.raises(IndexError, match="chart index"):
+            set_chart_data(pkg, BAR_CHART, ["a"], [1], chart=1)
+
+    def test_untouched_members_copied_as_stored(self, deck):
+        pkg = open_for_patch(io.BytesIO(deck))
+        set_key_stat(pkg, KEY_STAT, "42 %")
+        slide = f"ppt/slides/slide{KEY_STAT + 1}.xml"
+        assert slide in pkg.parts.loaded
+        assert not any(name.startswith(("ppt/slideLayouts/", "ppt/theme/", "docProps/"))
+                       for name in pkg.parts.loaded)
+        before, after = _raw_members(deck), _raw_members(_save(pkg))
+        assert set(after) == set(before)
+        changed = {name for name in before if before[name] != after[name]}
+        assert changed == {"[Content_Types].xml", slide} or changed == {slide}
+
+    def test_lazy_matches_eager(self, deck):
+        eager, lazy = Package.open(io.BytesIO(deck)), open_for_patch(io.BytesIO(deck))
+        for pkg in (eager, lazy):
+            replace_text(pkg, 0, "GPEC", "Emplois")
+            pkg.drop_part("docProps/thumbnail.jpeg")
+        assert list(lazy.parts) == list(eager.parts)
+        with zipfile.ZipFile(io.BytesIO(_save(eager))) as a, \
+                zipfile.ZipFile(io.BytesIO(_save(lazy))) as b:
+            assert a.namelist() == b.namelist()
+            assert all(a.read(name) == b.read(name) for name in a.namelist())
@@ -0,0 +1,99 @@
+"""Tests for render_plan — JSON plan dispatch onto the layout functions."""
+
+import hashlib
+import io
+import os
+import sys
+import time
+import zipfile
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pptx import Presentation
+
+from slide_engine import (
+    create_presentation, render_plan, render_plan_bytes, render_plan_file, render_slide,
+    save_presentation, LAYOUTS,
+)
+from slide_engine.package import FIXED_DATE_TIME
+from test_integration import GPEC_PLAN
+
+
+class TestRenderPlan:
+    def test_renders_every_slide(self):
+        prs = render_plan(GPEC_PLAN)
+        assert len(prs.slides) == len(GPEC_PLAN["slides"])
+
+    def test_appends_to_existing_presentation(self):
+        prs = create_presentation()
+        render_plan({"slides": [{"layout": "section", "title": "Partie I"}]}, prs)
+        render_plan({"slides": [{"layout": "section", "title": "Partie II"}]}, prs)
+        assert len(prs.slides) == 2
+
+    def test_notes_default_to_empty(self):
+        prs = create_presentation()
+        slide = render_slide(prs, {"layout": "key_stat", "stat": "42%", "description": "x"})
+        assert not slide.has_notes_slide
+
+    def test_unknown_layout(self):
+        with pytest.raises(ValueError, match="Unknown layout"):
+            render_slide(create_presentation(), {"layout": "gantt"})
+
+    def test_registry_covers_18_layouts(self):
+        assert len(LAYOUTS) == 18
+
+
+class TestRenderPlanOutput:
+    def test_bytes(self):
+        prs = Presentation(io.BytesIO(render_plan_bytes(GPEC_PLAN)))
+        assert len(prs.slides) == len(GPEC_PLAN["slides"])
+
+    def test_file(self, tmp_path):
+        path = render_plan_file({"slides": [{"layout": "section", "title": "x"}]},
+                                str(tmp_path / "deck"))
+        assert path.endswith("deck.pptx") and os.path.exists(path)
+
+
+class TestDeterministicOutput:
+    def test_same_plan_same_hash(self, monkeypatch):
+        first = render_plan_bytes(GPEC_PLAN, deterministic=True)
+        # Another day on the clock must not change the bytes
+        later = time.localtime(time.time() + 86400 * 400)
+        monkeypatch.setattr("slide_engine.package.time.localtime", lambda *a: later)
+        second = render_plan_bytes(GPEC_PLAN, deterministic=True)
+        assert hashlib.sha256(first).hexdigest() == hashlib.sha256(second).hexdigest()
+        assert len(Presentation(io.BytesIO(first)).slides) == len(GPEC_PLAN["slides"])
+
+    def test_fixed_dates_and_member_order(self):
+        archive = zipfile.ZipFile(io.BytesIO(render_plan_bytes(GPEC_PLAN, deterministic=True)))
+        names = archive.namelist()
+        assert names[0] == "[Content_Types].xml" and names[1:] == sorted(names[1:])
+        assert {info.date_time for info in archive.infolist()} == {FIXED_DATE_TIME}
+        workbooks = [n for n in names if n.startswith("ppt/embeddings/")]
+        assert workbooks
+        for name in workbooks:
+            embedded = zipfile.ZipFile(io.BytesIO(archive.read(name)))
+            assert {info.date_time for info in embedded.infolist()} == {FIXED_DATE_TIME}
+            assert b"1980-01-01T00:00:00Z" in embedded.read("docProps/core.xml")
+
+    def test_file(self, tmp_path):
+        paths = [render_plan_file(GPEC_PLAN, str(tmp_path / name), deterministic=True)
+                 for name in ("a", "b")]
+        assert open(paths[0], "rb").read() == open(paths[1], "rb").read()
+
+
+class TestThreadedSave:
+    def test_threads_do_not_change_bytes(self):
+        single = render_plan_bytes(GPEC_PLAN, deterministic=True)
+        assert render_plan_bytes(GPEC_PLAN, deterministic=True, threads=4) == single
+
+    def test_same_members_as_python_pptx(self, tmp_path):
+        prs = render_plan(GPEC_PLAN)
+        expected = io.BytesIO()
+        prs.save(expected)
+        path = save_presentation(prs, str(tmp_path / "threaded"), threads=3)
+        with zipfile.ZipFile(expected) as a, zipfile.ZipFile(path) as b:
+            assert b.testzip() is None
+            assert b.namelist() == a.namelist()
+            assert all(b.read(name) == a.read(name) for name in a.namelist())
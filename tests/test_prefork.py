@@ -0,0 +1,93 @@
+"""Tests for pre-fork render workers."""
+
+import asyncio
+import gc
+import json
+import os
+import sys
+import tarfile
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from slide_engine import AsyncRenderer, LAYOUTS, PlanValidationError, render_plan_bytes
+from slide_engine.cli import main
+from slide_engine.prefork import PreforkPool, warmup_plan
+from slide_engine.validate import validate_plan
+from test_integration import GPEC_PLAN
+
+
+class TestPreforkPool:
+    def test_warmup_plan_covers_every_layout(self):
+        plan = warmup_plan()
+        assert validate_plan(plan) == []
+        assert sorted(s["layout"] for s in plan["slides"]) == sorted(LAYOUTS)
+
+    def test_same_decks_and_recycled_workers(self):
+        expected = render_plan_bytes(GPEC_PLAN, deterministic=True)
+        with PreforkPool(jobs=1, max_decks=2) as pool:
+            assert pool.warm_time > 0
+            futures = [pool.submit(render_plan_bytes, GPEC_PLAN, deterministic=True)
+                       for _ in range(5)]
+            assert all(f.result() == expected for f in futures)
+        assert pool.tasks == 5
+        assert len(pool.spawn_times) == 3 and all(0 < t < 10 for t in pool.spawn_times)
+
+    def test_worker_errors_reach_the_caller(self):
+        with PreforkPool(jobs=1, warm=False) as pool:
+            future = pool.submit(render_plan_bytes, {"slides": [{"layout": "nope"}]})
+            with pytest.raises(PlanValidationError) as info:
+                future.result()
+        assert len(info.value.errors) == 1 and "unknown layout 'nope'" in info.value.errors[0]
+
+    def test_max_decks(self):
+        with pytest.raises(ValueError, match="max_decks"):
+            PreforkPool(jobs=1, max_decks=0, warm=False)
+
+
+class TestPreforkFrontEnds:
+    def test_stream(self, tmp_path):
+        src = tmp_path / "plans.ndjson"
+        plans = [dict(GPEC_PLAN, filename=f"p{i}") for i in range(4)]
+        src.write_text("".join(json.dumps(p) + "\n" for p in plans), encoding="utf-8")
+        out = tmp_path / "decks.tar"
+        assert main(["stream", str(src), "--jobs", "2", "--prefork", "1",
+                     "--tar", str(out)]) == 0
+        with tarfile.open(out) as tar:
+            assert tar.getnames() == [f"p{i}.pptx" for i in range(4)]
+
+    def test_async_renderer(self):
+        async def render():
+            async with AsyncRenderer(executor="prefork", max_workers=1, max_decks=1) as r:
+                return await asyncio.gather(r.render(GPEC_PLAN), r.render(GPEC_PLAN))
+        decks = asyncio.run(render())
+        assert len(decks) == 2 and all(d[:2] == b"PK" for d in decks)
+
+    def test_async_renderer_starts_off_the_loop(self):
+        async def render():
+            renderer = AsyncRenderer(executor="prefork", max_workers=1)
+            assert renderer._executor is None
+            ticks = 0
+
+            async def tick():
+                nonlocal ticks
+                while True:
+                    ticks += 1
+                    await asyncio.sleep(0)
+            ticker = asyncio.ensure_future(tick())
+            try:
+                decks = await asyncio.gather(renderer.render(GPEC_PLAN),
+                                             renderer.render(GPEC_PLAN))
+            finally:
+                ticker.cancel()
+                await renderer.aclose()
+            return ticks, decks
+        ticks, decks = asyncio.run(render())
+        assert ticks > 1 and all(d[:2] == b"PK" for d in decks)
+
+    def test_host_collector_is_not_frozen(self):
+        frozen = gc.get_freeze_count()
+        with PreforkPool(jobs=1, max_decks=1) as pool:
+            assert pool.submit(gc.get_freeze_count).result() > 0
+        assert gc.get_freeze_count() == frozen
@@ -0,0 +1,47 @@
+"""Tests for the HTML/SVG preview backend."""
+
+import os
+import re
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lxml import etree
+
+from slide_engine import render_plan, render_preview, save_preview
+from slide_engine.preview import EMU_PER_PX
+from test_integration import GPEC_PLAN
+
+
+def _svgs(html):
+    return [etree.fromstring(svg) for svg in re.findall(r"<svg.*?</svg>", html, re.S)]
+
+
+class TestRenderPreview:
+    def test_one_svg_per_slide(self):
+        svgs = _svgs(render_preview(GPEC_PLAN))
+        assert len(svgs) == len(GPEC_PLAN["slides"])
+
+    def test_same_geometry_as_pptx(self):
+        plan = {"slides": [{"layout": "bullets", "title": "Points", "bullets": ["A", "B"]}]}
+        shapes = list(render_plan(plan).slides[0].shapes)
+        svg = _svgs(render_preview(plan))[0]
+        boxes = svg.findall("{http://www.w3.org/2000/svg}foreignObject")
+        assert float(boxes[0].get("x")) == round(shapes[0].left / EMU_PER_PX, 2)
+        assert float(boxes[-1].get("y")) == round(shapes[-1].top / EMU_PER_PX, 2)
+
+    def test_design_tokens(self):
+        html = render_preview({"slides": [{"layout": "title", "title": "Titre"}]})
+        assert 'fill="#1B2A4A"' in html  # navy background
+        assert 'fill="#E87C3E"' in html  # orange accent line
+
+    def test_text_is_escaped_and_notes_shown(self):
+        plan = {"slides": [{"layout": "quote", "quote": "R&D <interne>", "notes": "À dire"}]}
+        html = render_preview(plan)
+        assert "R&amp;D &lt;interne&gt;" in html
+        assert "<aside>À dire</aside>" in html
+
+    def test_save_adds_extension(self, tmp_path):
+        result = save_preview(GPEC_PLAN, str(tmp_path / "preview"))
+        assert result.endswith(".html")
+        assert os.path.getsize(result) > 10000
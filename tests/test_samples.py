@@ -0,0 +1,26 @@
+"""Tests for the seeded sample slides and plans."""
+
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from slide_engine import LAYOUTS, validate_plan
+from slide_engine.samples import SLIDE_FACTORIES, generate_plan
+
+
+class TestSamples:
+    def test_every_layout_has_a_factory(self):
+        assert set(SLIDE_FACTORIES) == set(LAYOUTS)
+
+    def test_generated_plans_are_reproducible(self):
+        assert generate_plan(7) == generate_plan(7)
+        assert generate_plan(7) != generate_plan(8)
+
+    def test_samples_are_valid(self):
+        rng = random.Random(0)
+        slides = [dict(SLIDE_FACTORIES[layout](rng), layout=layout) for layout in LAYOUTS
+                  if layout not in ("bar_chart", "pie_chart")]
+        validate_plan({"slides": slides})
+        validate_plan(generate_plan(3, slides=20))
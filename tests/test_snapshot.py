@@ -0,0 +1,76 @@
+"""Geometry snapshot regression tests — golden files live in tests/snapshots/.
+
+Regenerate after an intentional visual change with:
+    SLIDE_ENGINE_UPDATE_SNAPSHOTS=1 python -m pytest tests/test_snapshot.py
+"""
+
+import json
+import os
+import sys
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from slide_engine import create_presentation, add_title_slide
+from slide_engine.snapshot import (
+    UPDATE_ENV,
+    assert_matches_golden,
+    diff_snapshots,
+    plan_digests,
+    snapshot_plan,
+    snapshot_presentation,
+)
+from test_integration import GPEC_PLAN
+
+SNAPSHOT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "snapshots")
+
+# Kept small so the suite stays fast; plan_digests(range(5000), jobs=8) scales up
+GENERATED_SEEDS = range(30)
+
+
+class TestSnapshot:
+    def test_entries_are_sorted_and_compact(self):
+        prs = create_presentation()
+        add_title_slide(prs, "Titre", "Sous-titre")
+        entries = snapshot_presentation(prs)[0]
+        assert entries == sorted(entries)
+        assert entries[0] == ["bg", 0, 0, 0, 0, "1B2A4A", ""]
+        assert all(len(entry) == 7 for entry in entries)
+
+    def test_text_hash_follows_text(self):
+        a = snapshot_plan({"slides": [{"layout": "section", "title": "A"}]})
+        b = snapshot_plan({"slides": [{"layout": "section", "title": "B"}]})
+        assert diff_snapshots(a, b)
+
+    def test_missing_golden_fails(self, tmp_path, monkeypatch):
+        monkeypatch.delenv(UPDATE_ENV, raising=False)
+        path = str(tmp_path / "golden.json")
+        with pytest.raises(AssertionError, match=UPDATE_ENV):
+            assert_matches_golden(snapshot_plan(GPEC_PLAN), path)
+        assert not os.path.exists(path)
+
+    def test_mismatch_is_reported(self, tmp_path, monkeypatch):
+        path = str(tmp_path / "golden.json")
+        monkeypatch.setenv(UPDATE_ENV, "1")
+        assert_matches_golden(snapshot_plan({"slides": [{"layout": "section", "title": "A"}]}), path)
+        monkeypatch.delenv(UPDATE_ENV)
+        with pytest.raises(AssertionError, match="snapshot difference"):
+            assert_matches_golden(snapshot_plan({"slides": [{"layout": "section", "title": "B"}]}), path)
+
+
+class TestGoldenSnapshots:
+    def test_gpec_plan(self):
+        assert_matches_golden(snapshot_plan(GPEC_PLAN), os.path.join(SNAPSHOT_DIR, "gpec.json"))
+
+    def test_generated_plans(self):
+        path = os.path.join(SNAPSHOT_DIR, "generated_plans.json")
+        digests = plan_digests(GENERATED_SEEDS)
+        if os.environ.get(UPDATE_ENV):
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(digests, f, indent=0, sort_keys=True)
+                f.write("\n")
+        assert os.path.exists(path), f"no golden digests; run with {UPDATE_ENV}=1 to create them"
+        with open(path, encoding="utf-8") as f:
+            golden = json.load(f)
+        changed = sorted((k for k in golden if golden[k] != digests.get(k)), key=int)
+        assert not changed, f"generated plans with shifted geometry (seeds): {changed}"
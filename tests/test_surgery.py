@@ -0,0 +1,99 @@
+"""Tests for slide surgery — duplicate, move, delete and export without re-rendering."""
+
+import io
+import os
+import sys
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pptx import Presentation
+
+from slide_engine import render_plan
+from slide_engine.package import RT_SLIDE
+from slide_engine.snapshot import snapshot_presentation
+from slide_engine.surgery import (
+    delete_slide, delete_slides, duplicate_slide, export_slides, move_slide, open_deck,
+)
+from test_integration import GPEC_PLAN
+
+CHART = [s["layout"] for s in GPEC_PLAN["slides"]].index("bar_chart")
+
+
+@pytest.fixture(scope="module")
+def gpec():
+    prs = render_plan(GPEC_PLAN)
+    return prs, snapshot_presentation(prs)
+
+
+def _reopen(pkg):
+    stream = io.BytesIO()
+    pkg.save(stream)
+    stream.seek(0)
+    return Presentation(stream)
+
+
+class TestSurgery:
+    def test_duplicate_copies_chart_and_notes(self, gpec):
+        prs, snapshot = gpec
+        pkg = open_deck(prs)
+        assert duplicate_slide(pkg, CHART) == CHART + 1
+        copy = _reopen(pkg)
+        result = snapshot_presentation(copy)
+        assert result[CHART + 1] == result[CHART] == snapshot[CHART]
+        original, clone = copy.slides[CHART], copy.slides[CHART + 1]
+        chart_parts = {sh.chart.part.partname for s in (original, clone)
+                       for sh in s.shapes if sh.has_chart}
+        assert len(chart_parts) == 2
+        assert clone.notes_slide.notes_text_frame.text == original.notes_slide.notes_text_frame.text
+        notes_part = clone.notes_slide.part
+        assert notes_part.part_related_by(RT_SLIDE) is clone.part
+
+    def test_move(self, gpec):
+        prs, snapshot = gpec
+        pkg = open_deck(prs)
+        move_slide(pkg, -1, 0)
+        assert snapshot_presentation(_reopen(pkg)) == snapshot[-1:] + snapshot[:-1]
+
+    def test_delete_drops_orphaned_parts(self, gpec):
+        prs, snapshot = gpec
+        pkg = open_deck(prs)
+        parts = set(pkg.parts)
+        duplicate_slide(pkg, CHART, 0)
+        dropped = delete_slide(pkg, 0)
+        assert any("charts/" in name for name in dropped)
+        assert any("embeddings/" in name for name in dropped)
+        assert set(pkg.parts) == parts
+        assert snapshot_presentation(_reopen(pkg)) == snapshot
+
+    def test_delete_several(self, gpec):
+        prs, snapshot = gpec
+        pkg = open_deck(prs)
+        delete_slides(pkg, [0, 1, -1])
+        assert snapshot_presentation(_reopen(pkg)) == snapshot[2:-1]
+
+    def test_export_subset_in_order(self, gpec, tmp_path):
+        prs, snapshot = gpec
+        path = export_slides(prs, [CHART, 0, 2], str(tmp_path / "subset"))
+        assert path.endswith("subset.pptx")
+        assert snapshot_presentation(Presentation(path)) == [snapshot[CHART], snapshot[0], snapshot[2]]
+        with pytest.raises(ValueError):
+            export_slides(prs, [1, 1], str(tmp_path / "dup"))
+
+    def test_export_from_empty_deck(self, tmp_path):
+        path = export_slides(Presentation(), [], str(tmp_path / "empty"))
+        assert len(Presentation(path).slides) == 0
+        with pytest.raises(IndexError):
+            export_slides(Presentation(), [0], str(tmp_path / "empty"))
+
+    def test_links_to_deleted_slides_are_removed(self, tmp_path):
+        prs = render_plan(GPEC_PLAN)
+        prs.slides[0].shapes[0].click_action.target_slide = prs.slides[1]
+        path = export_slides(prs, [0], str(tmp_path / "first"))
+        slide = Presentation(path).slides[0]
+        assert "hlinkClick" not in slide.part.blob.decode("utf-8")
+        assert all(rel.reltype != RT_SLIDE for rel in slide.part.rels.values())
+
+    def test_index_out_of_range(self, gpec):
+        with pytest.raises(IndexError):
+            move_slide(open_deck(gpec[0]), 99, 0)
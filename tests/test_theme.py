@@ -0,0 +1,67 @@
+"""Tests for runtime Theme objects."""
+
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lxml import etree
+from pptx.dml.color import RGBColor
+from pptx.util import Inches, Pt
+
+from slide_engine import Theme, render_plan
+from slide_engine import design as D
+from slide_engine.engine import _add_blank_slide, _add_textbox, create_presentation
+from slide_engine.snapshot import snapshot_presentation
+from test_integration import GPEC_PLAN
+
+TEAL = RGBColor(0x00, 0x80, 0x80)
+RED = RGBColor(0xCC, 0x00, 0x00)
+
+
+def _xml(prs):
+    """XML of every slide and of the layout it is drawn on."""
+    return "".join(etree.tostring(el).decode() for s in prs.slides
+                   for el in (s._element, s.slide_layout._element))
+
+
+class TestTheme:
+    def test_default_theme_matches_module_render(self):
+        assert (snapshot_presentation(render_plan(GPEC_PLAN, theme=Theme()))
+                == snapshot_presentation(render_plan(GPEC_PLAN)))
+
+    def test_overrides_reach_shapes_and_fonts(self):
+        xml = _xml(render_plan(GPEC_PLAN, theme=Theme("acme", NAVY=TEAL, FONT_FAMILY="Arial")))
+        assert str(TEAL) in xml and str(D.NAVY) not in xml
+        assert 'typeface="Arial"' in xml and 'typeface="Calibri"' not in xml
+
+    def test_palettes_follow_overridden_colours(self):
+        theme = Theme(NAVY=TEAL, ORANGE=RED)
+        assert theme.PROCESS_COLORS[:2] == [TEAL, RED]
+        assert theme.PYRAMID_COLORS[0] == TEAL
+        assert D.PROCESS_COLORS[0] == D.NAVY
+
+    def test_content_width_follows_margins(self):
+        theme = Theme(MARGIN_LEFT=D.MARGIN_LEFT * 2)
+        assert theme.CONTENT_WIDTH == D.CONTENT_WIDTH - D.MARGIN_LEFT
+
+    def test_themes_render_side_by_side(self):
+        themes = [Theme("teal", NAVY=TEAL), Theme("red", NAVY=RED)] * 3
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            decks = list(pool.map(lambda t: _xml(render_plan(GPEC_PLAN, theme=t)), themes))
+        for theme, xml in zip(themes, decks):
+            other = RED if theme.NAVY == TEAL else TEAL
+            assert str(theme.NAVY) in xml and str(other) not in xml
+
+    def test_helpers_take_the_theme_explicitly(self):
+        slide = _add_blank_slide(create_presentation())
+        box = _add_textbox(slide, 0, 0, Inches(2), Inches(1), "x",
+                           theme=Theme(BODY_SIZE=Pt(18), DARK_TEXT=RED, FONT_FAMILY="Arial"))
+        font = box.text_frame.paragraphs[0].font
+        assert (font.size, font.color.rgb, font.name) == (Pt(18), RED, "Arial")
+
+    def test_unknown_token(self):
+        with pytest.raises(ValueError, match="NAVVY"):
+            Theme(NAVVY=TEAL)
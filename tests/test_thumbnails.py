@@ -0,0 +1,66 @@
+"""Tests for the Pillow thumbnail rasteriser."""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PIL import Image
+
+from slide_engine import render_plan, save_presentation
+from slide_engine.thumbnails import (
+    rasterize_presentation,
+    save_thumbnails,
+    save_thumbnails_batch,
+)
+from test_integration import GPEC_PLAN
+
+
+def _deck(tmp_path, plan, name="deck"):
+    return save_presentation(render_plan(plan), str(tmp_path / name))
+
+
+class TestRasterize:
+    def test_one_image_per_slide(self, tmp_path):
+        images = rasterize_presentation(_deck(tmp_path, GPEC_PLAN), width=320)
+        assert len(images) == len(GPEC_PLAN["slides"])
+        assert images[0].size == (320, 180)
+
+    def test_background_and_accent_colors(self, tmp_path):
+        path = _deck(tmp_path, {"slides": [{"layout": "title", "title": "Titre"}]})
+        image = rasterize_presentation(path, width=1333)[0]
+        assert image.getpixel((5, 5)) == (0x1B, 0x2A, 0x4A)  # navy background
+        assert image.getpixel((666, 381)) == (0xE8, 0x7C, 0x3E)  # orange line at 3.8"
+
+    def test_bar_chart_is_drawn(self, tmp_path):
+        plan = {"slides": [{"layout": "bar_chart", "title": "T",
+                            "categories": ["A", "B"], "values": [10, 20]}]}
+        image = rasterize_presentation(_deck(tmp_path, plan), width=640)[0]
+        assert (0xE8, 0x7C, 0x3E) in {c for _, c in image.getcolors(1 << 16)}
+
+    def test_bar_chart_without_positive_values(self, tmp_path):
+        plan = {"slides": [{"layout": "bar_chart", "title": "Écarts",
+                            "categories": ["A", "B"], "values": [-3, -0.5]}]}
+        image = rasterize_presentation(_deck(tmp_path, plan), width=200)[0]
+        assert image.size == (200, 113)
+
+
+class TestSaveThumbnails:
+    def test_writes_pngs(self, tmp_path):
+        paths = save_thumbnails(_deck(tmp_path, GPEC_PLAN), str(tmp_path / "png"))
+        assert len(paths) == len(GPEC_PLAN["slides"])
+        assert Image.open(paths[0]).format == "PNG"
+
+    def test_batch_same_file_names(self, tmp_path):
+        decks = []
+        for folder in ("a", "b"):
+            (tmp_path / folder).mkdir()
+            decks.append(_deck(tmp_path / folder, {"slides": GPEC_PLAN["slides"][:1]}, "gpec"))
+        results = save_thumbnails_batch(decks, str(tmp_path / "png"), width=100, jobs=1)
+        assert [os.path.basename(p) for p, in results] == ["gpec-1.png", "gpec_2-1.png"]
+
+    def test_batch_across_processes(self, tmp_path):
+        decks = [_deck(tmp_path, GPEC_PLAN, f"deck{i}") for i in range(2)]
+        results = save_thumbnails_batch(decks, str(tmp_path / "png"), width=200, jobs=2)
+        assert [len(paths) for paths in results] == [len(GPEC_PLAN["slides"])] * 2
+        assert os.path.basename(results[1][0]) == "deck1-1.png"
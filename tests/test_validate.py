@@ -0,0 +1,74 @@
+"""Tests for the fail-fast plan validator."""
+
+import copy
+import os
+import sys
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from slide_engine import (
+    PlanValidationError, check_plan, render_plan, validate_plan, validate_plans, LAYOUTS,
+)
+from slide_engine.validate import SCHEMA
+from slide_engine.samples import generate_plan
+from test_integration import GPEC_PLAN
+
+
+class TestValidatePlan:
+    def test_gpec_plan_is_valid(self):
+        assert validate_plan(GPEC_PLAN) == []
+
+    def test_generated_plans_are_valid(self):
+        assert list(validate_plans(generate_plan(seed) for seed in range(50))) == []
+
+    def test_schema_covers_every_layout(self):
+        assert set(SCHEMA) == set(LAYOUTS)
+
+    def test_reports_every_error_with_path(self):
+        plan = copy.deepcopy(GPEC_PLAN)
+        plan["slides"][1]["items"] = "pas une liste"
+        del plan["slides"][4]["bullets"]
+        plan["slides"].append({"layout": "gantt"})
+        errors = validate_plan(plan)
+        assert errors[0] == "$.slides[1].items: expected a list, got str"
+        assert errors[1] == "$.slides[4]: missing required field 'bullets'"
+        assert errors[2].startswith(f"$.slides[{len(plan['slides']) - 1}].layout: unknown layout 'gantt'")
+
+    def test_non_string_layout(self):
+        plan = {"slides": [{"layout": ["bullets"]}, {"layout": {"name": "x"}}, {}]}
+        errors = validate_plan(plan)
+        assert [e.split(":")[0] for e in errors] == [
+            "$.slides[0].layout", "$.slides[1].layout", "$.slides[2].layout"]
+        assert "unknown layout ['bullets']" in errors[0]
+
+    def test_nested_paths_and_cross_field_checks(self):
+        plan = {"slides": [
+            {"layout": "bar_chart", "title": "T", "categories": ["a", "b"], "values": [1, "2", 3]},
+            {"layout": "timeline", "title": "T", "milestones": [["2024", "x"], ["2025"]]},
+            {"layout": "org_chart", "title": "T", "manager": {"name": "A"}, "reports": []},
+        ]}
+        assert validate_plan(plan) == [
+            "$.slides[0].values[1]: expected a number, got str",
+            "$.slides[0]: 'categories' has 2 item(s) but 'values' has 3",
+            "$.slides[1].milestones[1]: expected a [label, description] pair",
+            "$.slides[2].manager: missing required field 'title'",
+        ]
+
+    def test_not_a_plan(self):
+        assert validate_plan([]) == ["$: expected an object, got list"]
+        assert validate_plan({"title": "x"}) == ["$: missing required list 'slides'"]
+
+
+class TestFailFast:
+    def test_check_plan_raises_with_all_errors(self):
+        plan = {"slides": [{"layout": "bullets"}, {"layout": "quote", "quote": 3}]}
+        with pytest.raises(PlanValidationError) as exc:
+            check_plan(plan)
+        assert len(exc.value.errors) == 3
+        assert isinstance(exc.value, ValueError)
+
+    def test_render_plan_validates_before_rendering(self):
+        plan = {"slides": [{"layout": "section", "title": "ok"}, {"layout": "bullets", "title": "x"}]}
+        with pytest.raises(PlanValidationError, match=r"\$\.slides\[1\]"):
+            render_plan(plan)
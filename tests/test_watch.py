@@ -0,0 +1,135 @@
+"""Tests for watch mode: incremental rebuilds and atomic writes."""
+
+import json
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pptx import Presentation
+
+from slide_engine import PlanValidationError, render_plan
+from slide_engine.snapshot import snapshot_presentation
+from slide_engine import watch as watch_module
+from slide_engine.watch import IncrementalRenderer, watch, write_atomic
+from test_integration import GPEC_PLAN
+
+
+def _edited(plan, index, **changes):
+    slides = list(plan["slides"])
+    slides[index] = dict(slides[index], **changes)
+    return dict(plan, slides=slides)
+
+
+class TestIncrementalRenderer:
+    def test_only_changed_slides_rendered(self):
+        renderer = IncrementalRenderer()
+        assert renderer.update(GPEC_PLAN) == len(GPEC_PLAN["slides"])
+        assert renderer.update(GPEC_PLAN) == 0
+        edited = _edited(GPEC_PLAN, 3, title="Nouveau titre")
+        assert renderer.update(edited) == 1
+        assert snapshot_presentation(renderer.prs) == snapshot_presentation(render_plan(edited))
+
+    def test_insert_delete_reorder(self):
+        renderer = IncrementalRenderer()
+        renderer.update(GPEC_PLAN)
+        slides = GPEC_PLAN["slides"]
+        new = {"layout": "section", "title": "Insérée"}
+        plan = {"slides": [slides[5], new] + slides[:5] + slides[7:]}  # slide 6 deleted
+        assert renderer.update(plan) == 1
+        assert len(renderer.prs.slides) == len(plan["slides"])
+        assert snapshot_presentation(renderer.prs) == snapshot_presentation(render_plan(plan))
+        plan = {"slides": plan["slides"][::-1] + [dict(new, title="Encore")]}
+        assert renderer.update(plan) == 1
+        ids = [s.slide_id for s in renderer.prs.slides]
+        assert len(set(ids)) == len(ids) == len(plan["slides"])
+        assert snapshot_presentation(renderer.prs) == snapshot_presentation(render_plan(plan))
+
+    def test_markdown_notes(self):
+        plan = {"slides": [{"layout": "section", "title": "S", "notes": "- **Point**"}]}
+        renderer = IncrementalRenderer()
+        renderer.update(plan)
+        assert renderer.prs.slides[0].notes_slide.notes_text_frame.text == "- **Point**"
+        assert renderer.update(dict(plan, notes_markdown=True)) == 1
+        assert renderer.prs.slides[0].notes_slide.notes_text_frame.text == "Point"
+
+    def test_removed_slides_unlinked(self, tmp_path):
+        renderer = IncrementalRenderer()
+        renderer.update(GPEC_PLAN)
+        renderer.update({"slides": GPEC_PLAN["slides"][:2]})
+        path = write_atomic(renderer.prs, str(tmp_path / "deck.pptx"))
+        prs = Presentation(path)
+        assert len(prs.slides) == 2
+        parts = [str(p.partname) for p in prs.part.package.iter_parts()]
+        assert not any(p.startswith("/ppt/charts/") for p in parts)
+        assert sum(p.startswith("/ppt/slides/") for p in parts) == 2
+
+    def test_invalid_plan_keeps_deck(self):
+        renderer = IncrementalRenderer()
+        renderer.update(GPEC_PLAN)
+        with pytest.raises(PlanValidationError):
+            renderer.update({"slides": [{"layout": "bullets"}]})
+        assert len(renderer.prs.slides) == len(GPEC_PLAN["slides"])
+
+
+class TestWatch:
+    def test_rebuilds_on_change(self, tmp_path):
+        plan_path, output = tmp_path / "plan.json", tmp_path / "plan.pptx"
+        plan_path.write_text(json.dumps(GPEC_PLAN), encoding="utf-8")
+        stop, messages = threading.Event(), []
+        thread = threading.Thread(target=watch, args=(str(plan_path), str(output)),
+                                  kwargs={"interval": 0.01, "stop": stop,
+                                          "log": messages.append})
+        thread.start()
+        try:
+            _wait_for(lambda: output.exists())
+            first = output.stat().st_mtime_ns
+            plan_path.write_text("{not json", encoding="utf-8")
+            _wait_for(lambda: any("plan.json:" in m for m in messages))
+            edited = _edited(GPEC_PLAN, 0, title="Titre modifié")
+            plan_path.write_text(json.dumps(edited), encoding="utf-8")
+            _wait_for(lambda: sum("rendered" in m for m in messages) == 2)
+        finally:
+            stop.set()
+            thread.join()
+        assert output.stat().st_mtime_ns >= first
+        assert "1/%d slide(s) rendered" % len(GPEC_PLAN["slides"]) in messages[-1]
+        assert snapshot_presentation(Presentation(str(output))) == \
+            snapshot_presentation(render_plan(edited))
+        assert [p.name for p in tmp_path.iterdir() if p.name.startswith(".~")] == []
+
+    def test_render_error_keeps_watching(self, tmp_path, monkeypatch):
+        update = IncrementalRenderer.update
+
+        def failing_once(renderer, plan):
+            monkeypatch.setattr(watch_module.IncrementalRenderer, "update", update)
+            raise RuntimeError("boom")
+        monkeypatch.setattr(watch_module.IncrementalRenderer, "update", failing_once)
+        plan_path, output = tmp_path / "plan.json", tmp_path / "plan.pptx"
+        plan_path.write_text(json.dumps(GPEC_PLAN), encoding="utf-8")
+        stop, messages = threading.Event(), []
+        thread = threading.Thread(target=watch, args=(str(plan_path), str(output)),
+                                  kwargs={"interval": 0.01, "stop": stop,
+                                          "log": messages.append})
+        thread.start()
+        try:
+            _wait_for(lambda: messages)
+            plan_path.write_text(json.dumps(_edited(GPEC_PLAN, 0, title="Corrigé")),
+                                 encoding="utf-8")
+            _wait_for(lambda: output.exists())
+        finally:
+            stop.set()
+            thread.join()
+        assert messages[0].endswith("plan.json: RuntimeError: boom")
+        assert len(Presentation(str(output)).slides) == len(GPEC_PLAN["slides"])
+
+
+def _wait_for(condition, timeout=10):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.01)